@@ -6,8 +6,9 @@ This package provides ready-to-use agent implementations for specific domains:
 - General evolutionary algorithms
 """
 
-from . import math_agent
-from . import ml_agent
-from . import general_agent
+from loongflow._lazy import attach
 
 __all__ = ["math_agent", "ml_agent", "general_agent"]
+
+# A runner only imports the agent it runs
+__getattr__, __dir__ = attach(__name__, submodules=__all__)
@@ -17,3 +17,7 @@ class ClaudeAgentConfig:
     max_rounds: Optional[int] = None
     max_thinking_tokens: Optional[int] = None
     permission_mode: Optional[str] = "acceptEdits"
+    # Keep Claude sessions warm between the candidates of an iteration
+    reuse_sessions: Optional[bool] = True
+    # How skills are loaded into workspaces: "hardlink", "symlink" or "copy"
+    link_mode: Optional[str] = "hardlink"
@@ -112,7 +112,10 @@ class GeneralEvaluator(Evaluator):
             if self.config.evaluate_code:
                 # Custom Tool Mode: Run user's evaluation file in a subprocess
                 logger.debug(f"[{context.trace_id}] Evaluator: 🔧 Using custom evaluation file")
-                return await self._evaluate_with_custom_file(solution)
+                # Runs evaluation subprocesses, in a slot of the shared scheduler
+                return await self._scheduled(
+                    lambda: self._evaluate_with_custom_file(solution), message, context
+                )
             else:
                 # Self-Evaluation Mode: Use AI Agent to evaluate
                 logger.debug(f"[{context.trace_id}] Evaluator: 🤖 Using AI agent evaluation")
@@ -169,7 +172,11 @@ class GeneralEvaluator(Evaluator):
             try:
                 from .utils import load_skills
 
-                load_skills(skill_names=self.config.agent["skills"], work_dir=work_dir)
+                load_skills(
+                    skill_names=self.config.agent["skills"],
+                    work_dir=work_dir,
+                    link_mode=self.config.agent.get("link_mode"),
+                )
                 logger.debug(f"Evaluator: Successfully loaded skills: {self.config.agent['skills']}")
             except Exception as e:
                 logger.warning(f"Evaluator: Failed to load skills - {e}")
@@ -25,9 +25,16 @@ from loongflow.framework.claude_code import (
     GENERAL_EXECUTOR_SYSTEM,
     GENERAL_EXECUTOR_USER,
 )
-from loongflow.framework.pes.context import Context, Workspace
+from loongflow.framework.pes.context import (
+    Context,
+    PromptContextBuilder,
+    Workspace,
+    compact_evaluation,
+)
+from loongflow.framework.pes.executor import CandidateRecord, ResultChannel
 from loongflow.framework.pes.register import Worker
 from loongflow.framework.claude_code.claude_code_agent import ClaudeCodeAgent
+from loongflow.framework.claude_code.session_pool import ClaudeSessionPool
 
 logger = get_logger(__name__)
 
@@ -53,9 +60,26 @@ def _create_evaluation_tool(
     The tool will call the evaluator's evaluate method and save the result to disk.
     """
     # Pre-compute the evaluation file path
-    candidate_dir = Workspace.get_executor_candidate_path(
-        context, f"{round_idx}_{candidate_idx}"
-    )
+    candidate = f"{round_idx}_{candidate_idx}"
+    candidate_dir = Workspace.get_executor_candidate_path(context, candidate)
+
+    def publish(
+        random_str: str,
+        evaluation_file_path: str,
+        solution_file_path: str,
+        evaluation: Dict[str, Any],
+    ) -> None:
+        """Publish an evaluation to the result channel of the cycle."""
+        ResultChannel.for_context(context).publish(
+            CandidateRecord(
+                candidate=candidate,
+                attempt=random_str,
+                score=float(evaluation.get("score") or 0.0),
+                solution_file_path=solution_file_path,
+                evaluation_file_path=evaluation_file_path,
+                evaluation=evaluation,
+            )
+        )
 
     async def evaluate_candidate(solution_file_path: str):
         """Evaluate a candidate solution.
@@ -144,9 +168,12 @@ def _create_evaluation_tool(
                     "metrics": result.metrics,
                 }
 
-            # Save to disk for load_results_for_candidate to read
+            # Save to disk as the durable record, then publish it to the executor
             with open(evaluation_file_path, "w", encoding="utf-8") as f:
                 json.dump(eval_data, f, ensure_ascii=False, indent=2)
+            publish(
+                random_str, evaluation_file_path, actual_solution_file_path, eval_data
+            )
 
             logger.info(
                 f"[{context.trace_id}] Executor: Evaluation completed, score={result.score}"
@@ -165,6 +192,9 @@ def _create_evaluation_tool(
             try:
                 with open(evaluation_file_path, "w", encoding="utf-8") as f:
                     json.dump(error_data, f, ensure_ascii=False, indent=2)
+                publish(
+                    random_str, evaluation_file_path, actual_solution_file_path, error_data
+                )
             except:
                 pass
             return {**error_data}
@@ -271,11 +301,23 @@ class GeneralExecuteAgent(Worker):
             )
 
         self.evaluator = evaluator
+        self.session_pool = (
+            ClaudeSessionPool() if self.config.reuse_sessions else None
+        )
 
         logger.debug("Executor: Core configuration loaded successfully")
 
     async def run(self, context: Context, message: Message) -> Message:
         """Execute execution phase."""
+        try:
+            return await self._run(context, message)
+        finally:
+            ResultChannel.release(context)
+            if self.session_pool is not None:
+                # The sessions work in this iteration's workspace only
+                await self.session_pool.close()
+
+    async def _run(self, context: Context, message: Message) -> Message:
         logger.info(
             f"[{context.trace_id}] Executor: 🚀 Starting iteration {context.current_iteration}/{context.total_iterations}"
         )
@@ -306,6 +348,7 @@ class GeneralExecuteAgent(Worker):
                 load_skills(
                     skill_names=self.config.skills,
                     work_dir=work_dir,
+                    link_mode=self.config.link_mode,
                 )
                 logger.debug(
                     f"[{context.trace_id}] Executor: Successfully loaded skills: {self.config.skills}"
@@ -368,9 +411,10 @@ class GeneralExecuteAgent(Worker):
                 break
             else:
                 for result in disk_results:
+                    evaluation = compact_evaluation(result.reason)
                     previous_attempts += (
                         f"Round {round_idx}, Candidate {result.candidate_idx}, "
-                        + f"Evaluation: {result.reason}\n\n"
+                        + f"Evaluation: {json.dumps(evaluation, ensure_ascii=False)}\n\n"
                     )
                 logger.debug(
                     f"[{context.trace_id}] Executor: Round {round_idx} - No improvement"
@@ -513,6 +557,7 @@ class GeneralExecuteAgent(Worker):
             setting_sources=["project"],
             max_turns=self.config.max_turns,
             max_thinking_tokens=self.config.max_thinking_tokens,
+            session_pool=self.session_pool,
         )
 
         # Get the expected execute path
@@ -581,92 +626,32 @@ class GeneralExecuteAgent(Worker):
         candidate_idx: int,
         llm_out: str,
     ) -> List[CandidateResult]:
-        """Read a candidate folder and return all paired solution/evaluation results.
+        """Return the results published by the evaluations of a candidate this cycle.
 
-        Pairing logic: find all files matching solution*.md and evaluation*.json and pair
-        them by the suffix present in the filename. Example:
-            solution1_23.md <-> evaluation1_23.json  (suffix: '1_23' or '23' depending on naming)
+        Every evaluation publishes a record to the result channel of the cycle once its
+        actual_solution*.md and evaluation*.json files are written, results keep
+        source='disk' as these files back them.
 
         Returns list of CandidateResult with source='disk'. If none found, returns single
         CandidateResult with source='llm' containing the LLM status/reason as record.
         """
-        candidate_path = Workspace.get_executor_candidate_path(
-            context, f"{round_idx}_{candidate_idx}"
+        records = ResultChannel.for_context(context).records(
+            f"{round_idx}_{candidate_idx}"
         )
-        p = Path(candidate_path)
-
-        if not p.exists() or not p.is_dir():
-            # no folder -> return llm-only fallback
-            logger.debug(
-                f"[{context.trace_id}] Executor: Candidate folder not found: {candidate_path}"
-            )
-            return [
-                CandidateResult(
-                    round_idx=round_idx,
-                    candidate_idx=candidate_idx,
-                    solution_file_path="",
-                    evaluation_file_path="",
-                    score=0.0,
-                    reason=llm_out,
-                    source="llm",
-                )
-            ]
-
-        # gather files
-        solution_candidates = list(p.glob("actual_solution*.md"))
-        eval_candidates = list(p.glob("evaluation*.json"))
-
-        # Build maps keyed by extracted random_idx token
-        def extract_suffix(fp: Path, prefix: str):
-            name = fp.name
-            if not name.startswith(prefix):
-                return None
-            core = name[len(prefix) :]
-            core = core.rsplit(".", 1)[0]
-            return core
-
-        sol_map: Dict[str, Path] = {}
-        for s in solution_candidates:
-            key = extract_suffix(s, "actual_solution")
-            if key:
-                sol_map[key] = s
-
-        eval_map: Dict[str, Path] = {}
-        for e in eval_candidates:
-            key = extract_suffix(e, "evaluation")
-            if key:
-                eval_map[key] = e
-
-        paired_keys = sorted(set(sol_map.keys()) & set(eval_map.keys()))
-
-        results: List[CandidateResult] = []
-        for k in paired_keys:
-            s_path = str(sol_map[k])
-            e_path = str(eval_map[k])
-
-            try:
-                with open(e_path, "r", encoding="utf-8") as f:
-                    eval_data = json.load(f)
-            except Exception as e:
-                logger.warning(
-                    f"[{context.trace_id}] Executor: Failed to read evaluation file: {e}"
-                )
-                continue
-
-            score = float(eval_data.get("score", 0.0))
-
-            cr = CandidateResult(
+        results: List[CandidateResult] = [
+            CandidateResult(
                 round_idx=round_idx,
                 candidate_idx=candidate_idx,
-                solution_file_path=s_path,
-                evaluation_file_path=e_path,
-                score=score,
-                reason=json.dumps(eval_data),
+                solution_file_path=record.solution_file_path,
+                evaluation_file_path=record.evaluation_file_path,
+                score=record.score,
+                reason=json.dumps(record.evaluation),
                 source="disk",
             )
-            results.append(cr)
+            for record in records
+        ]
 
-        # If no pairs but LLM said something, return fallback single result with LLM info
+        # If no results but LLM said something, return fallback single result with LLM info
         if not results:
             return [
                 CandidateResult(
@@ -745,7 +730,8 @@ class GeneralExecuteAgent(Worker):
         return ExecutionContext(
             parent_info_file_path=parent_info_path,
             parent_core=float(parent_data.get("score", 0.0)),
-            parent_solution=json.dumps(parent_data),
+            # No shared base: the system prompt keys the warm session pool
+            parent_solution=PromptContextBuilder().pack(parent_data),
             stage1_plan=stage1_plan,
             stage1_plan_file_path=plan_path,
         )
@@ -13,7 +13,7 @@ from agents.general_agent.utils import build_custom_tools_from_function_tools, f
 from loongflow.agentsdk.logger import get_logger
 from loongflow.agentsdk.message import Message, MimeType, ContentElement
 from loongflow.framework.claude_code import GENERAL_PLANNER_USER, GENERAL_PLANNER_SYSTEM
-from loongflow.framework.pes.context import Context, Workspace
+from loongflow.framework.pes.context import Context, PromptContextBuilder, Workspace
 from loongflow.framework.pes.database import EvolveDatabase
 from loongflow.framework.pes.register import Worker
 from loongflow.framework.claude_code.claude_code_agent import ClaudeCodeAgent
@@ -48,18 +48,18 @@ class GeneralPlanAgent(Worker):
         self.database = db
 
         self.custom_tools = [
-            GetMemoryStatusTool(self.database.memory_status),
-            GetSolutionsTool(self.database.get_solutions),
-            GetBestSolutionsTool(self.database.get_best_solutions),
-            GetParentsByChildIdTool(self.database.get_parents_by_child_id),
-            GetChildsByParentTool(self.database.get_childs_by_parent_id),
+            GetMemoryStatusTool(self.database.amemory_status),
+            GetSolutionsTool(self.database.aget_solutions),
+            GetBestSolutionsTool(self.database.aget_leaderboard),
+            GetParentsByChildIdTool(self.database.aget_parents_by_child_id),
+            GetChildsByParentTool(self.database.aget_childs_by_parent_id),
         ]
 
         logger.debug("Planner: Core tools registered successfully")
 
     async def run(self, context: Context, message: Message) -> Message:
         """Execute planning phase."""
-        memory_status = self.database.memory_status()
+        memory_status = await self.database.amemory_status()
         logger.info(
             f"[{context.trace_id}] Planner: 📝 Starting iteration {context.current_iteration}/{context.total_iterations} (memory: {memory_status})"
         )
@@ -81,6 +81,7 @@ class GeneralPlanAgent(Worker):
                 load_skills(
                     skill_names=self.config.skills,
                     work_dir=work_dir,
+                    link_mode=self.config.link_mode,
                 )
                 logger.debug(
                     f"[{context.trace_id}] Planner: Successfully loaded skills: {self.config.skills}"
@@ -117,7 +118,7 @@ class GeneralPlanAgent(Worker):
         }
 
         # Sample parent from database
-        parent = self.database.sample_solution(context.island_id)
+        parent = await self.database.asample_solution(context.island_id)
         parent_dict = parent if parent else init_parent
 
         # Save parent info using Workspace
@@ -139,7 +140,7 @@ class GeneralPlanAgent(Worker):
 
         user_prompt = GENERAL_PLANNER_USER.format(
             task_info=context.task,
-            parent_solution=parent_json,
+            parent_solution=PromptContextBuilder().pack(parent_dict),
             workspace=f"{work_dir} (absolute path)",
             island_num=self.database.config.num_islands,
             parent_island=parent.get("island_id") if parent else 0,
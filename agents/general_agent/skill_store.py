@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Content-hashed store of the skills loaded into General Agent workspaces.
+
+``load_skills`` used to remove and copy every configured skill into the work
+directory of each component call, then walk the copy again to log its files.
+Skills are now snapshotted once per content into a read-only store:
+
+    {store_dir}/{digest}/...      files of a skill, read-only
+
+and materialized in work directories with hardlinks to the store files (a copy
+when the store is on another file system), a symlink to the snapshot with
+``link_mode="symlink"``, or writable copies with ``link_mode="copy"``. Links
+share the store files with every workspace, which only their read-only mode
+protects: the content of each snapshot is verified once per run, before it is
+first linked, and a snapshot edited in place is rebuilt from the source. Each
+work directory keeps a manifest of the skills it holds, so a skill whose digest
+did not change and whose files are still those of the store is skipped, and the
+skills listed in prompts are read from the manifest instead of parsing every
+SKILL.md again:
+
+    {work_dir}/.claude/skills/.loongflow_skills.json
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from loongflow.agentsdk.logger import get_logger
+
+logger = get_logger(__name__)
+
+SKILL_STORE_VERSION = 1
+MANIFEST_NAME = ".loongflow_skills.json"
+LINK_MODES = ("hardlink", "symlink", "copy")
+
+# (relative path, size, mtime_ns, executable) of the files of a skill
+Fingerprint = Tuple[Tuple[str, int, int, bool], ...]
+
+
+def parse_skill_frontmatter(content: str, skill_name: str) -> Optional[Tuple[str, str]]:
+    """
+    Name and description from the YAML frontmatter of a SKILL.md.
+
+    Returns None if the content has no frontmatter.
+    """
+    if not content.startswith("---"):
+        return None
+    parts = content.split("---", 2)
+    if len(parts) < 3:
+        return None
+    # Parse simple YAML-like frontmatter
+    name = skill_name
+    description = ""
+    for line in parts[1].strip().split("\n"):
+        if line.startswith("name:"):
+            name = line.split(":", 1)[1].strip().strip("\"'")
+        elif line.startswith("description:"):
+            description = line.split(":", 1)[1].strip().strip("\"'")
+    return name, description
+
+
+@dataclass
+class SkillSnapshot:
+    """A skill stored under the digest of its content."""
+
+    skill: str
+    digest: str
+    files: List[str]
+    # From the SKILL.md frontmatter, None if there is none
+    name: Optional[str] = None
+    description: Optional[str] = None
+
+
+def _skill_files(skill_dir: Path) -> List[Tuple[str, str, os.stat_result]]:
+    """
+    Relative path, path and stat of the files of a skill, following symlinks.
+
+    Walked with ``os.scandir``, as this runs for every load of every skill.
+    """
+    files = []
+
+    def scan(directory: str, prefix: str) -> None:
+        with os.scandir(directory) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                try:
+                    if entry.is_dir():
+                        scan(entry.path, f"{prefix}{entry.name}/")
+                    elif entry.is_file():
+                        files.append((prefix + entry.name, entry.path, entry.stat()))
+                except OSError:
+                    # Dangling symlinks are ignored
+                    continue
+
+    scan(str(skill_dir), "")
+    return files
+
+
+def _executable(mode: int) -> bool:
+    return bool(mode & stat.S_IXUSR)
+
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _files_at(root: str, relatives: List[str]) -> Optional[List[Tuple[str, str, os.stat_result]]]:
+    """The ``relatives`` files of ``root`` as listed by ``_skill_files``, None if one is missing."""
+    files = []
+    for relative in relatives:
+        path = os.path.join(root, relative)
+        try:
+            files.append((relative, path, os.stat(path)))
+        except OSError:
+            return None
+    return files
+
+
+def _content_digest(files: List[Tuple[str, str, os.stat_result]]) -> str:
+    digest = hashlib.sha256(f"skill-v{SKILL_STORE_VERSION}\n".encode("utf-8"))
+    for relative, path, st in files:
+        mode = "x" if _executable(st.st_mode) else "-"
+        digest.update(f"{relative}\0{mode}\0{_hash_file(path)}\n".encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+class SkillStore:
+    """Read-only snapshots of the skills of ``source_dir``, keyed by content."""
+
+    def __init__(self, source_dir: str, store_dir: str, link_mode: str = "hardlink"):
+        """
+        Args:
+            source_dir (str): Directory of the skills, e.g. ``.claude/skills``.
+            store_dir (str): Directory of the snapshots.
+            link_mode (str): How skills appear in work directories: ``hardlink``
+                (files are links to the store), ``symlink`` (the skill directory
+                is a link to its snapshot) or ``copy`` (writable copies).
+        """
+        if link_mode not in LINK_MODES:
+            raise ValueError(f"link_mode must be one of {LINK_MODES}, got {link_mode!r}")
+        self.source_dir = Path(source_dir)
+        self.store_dir = Path(store_dir)
+        self.link_mode = link_mode
+        # Snapshots of this run, by skill and fingerprint of its source files
+        self._snapshots: Dict[Tuple[str, Fingerprint], SkillSnapshot] = {}
+        # Snapshots whose stored content was verified by this run
+        self._verified: Set[str] = set()
+
+    def snapshot(self, skill: str) -> SkillSnapshot:
+        """
+        Snapshot of the current content of ``skill``.
+
+        The source files are hashed once per run and per change of their size or
+        modification time, and copied to the store once per content. The stored
+        content is verified once per run.
+        """
+        files = _skill_files(self.source_dir / skill)
+        fingerprint = tuple(
+            (relative, st.st_size, st.st_mtime_ns, _executable(st.st_mode))
+            for relative, _, st in files
+        )
+        snapshot = self._snapshots.get((skill, fingerprint))
+        if snapshot is None:
+            digest = _content_digest(files)
+            if digest not in self._verified:
+                if not self._intact(digest):
+                    # Missing, or edited in place through a link of a workspace
+                    self._store(digest, files)
+                self._verified.add(digest)
+            snapshot = SkillSnapshot(
+                skill=skill, digest=digest, files=[relative for relative, _, _ in files]
+            )
+            skill_md = self.snapshot_path(digest) / "SKILL.md"
+            if skill_md.is_file():
+                try:
+                    parsed = parse_skill_frontmatter(
+                        skill_md.read_text(encoding="utf-8"), skill
+                    )
+                    if parsed:
+                        snapshot.name, snapshot.description = parsed
+                except (OSError, UnicodeDecodeError) as e:
+                    logger.warning(f"Failed to read SKILL.md for '{skill}': {e}")
+            self._snapshots[(skill, fingerprint)] = snapshot
+        return snapshot
+
+    def snapshot_path(self, digest: str) -> Path:
+        """Directory of the snapshot ``digest``."""
+        return self.store_dir / digest
+
+    def materialize(self, skills: List[str], work_dir: str) -> Dict[str, bool]:
+        """
+        Make ``skills`` available in ``{work_dir}/.claude/skills``.
+
+        Returns, for each skill, whether it was (re)written, False if the work
+        directory already held the same content.
+        """
+        target_dir = Path(work_dir) / ".claude" / "skills"
+        target_dir.mkdir(parents=True, exist_ok=True)
+        manifest = read_skill_manifest(work_dir)
+        written = {}
+        for skill in skills:
+            snapshot = self.snapshot(skill)
+            target = target_dir / skill
+            entry = manifest.get(skill)
+            if (
+                entry is not None
+                and entry.get("digest") == snapshot.digest
+                and self._linked(snapshot, target)
+            ):
+                written[skill] = False
+                continue
+            self._link(snapshot, target)
+            manifest[skill] = asdict(snapshot)
+            written[skill] = True
+        if any(written.values()):
+            _write_json(target_dir / MANIFEST_NAME, manifest)
+        return written
+
+    def _intact(self, digest: str) -> bool:
+        """Whether the snapshot ``digest`` exists with its original content."""
+        path = self.snapshot_path(digest)
+        return path.is_dir() and _content_digest(_skill_files(path)) == digest
+
+    def _linked(self, snapshot: SkillSnapshot, target: Path) -> bool:
+        """
+        Whether ``target`` still holds the files of ``snapshot``.
+
+        Nothing is hashed: linked files are the store files, whose content
+        ``snapshot`` verified for this run, and copies are compared with them by
+        size and modification time.
+        """
+        source = self.snapshot_path(snapshot.digest)
+        if self.link_mode == "symlink" and not (
+            target.is_symlink() and Path(os.readlink(target)) == source
+        ):
+            return False
+        files = _files_at(str(target), snapshot.files)
+        if files is None:
+            return False
+        for relative, _, loaded in files:
+            try:
+                stored = os.stat(os.path.join(source, relative))
+            except OSError:
+                return False
+            same_file = (loaded.st_dev, loaded.st_ino) == (stored.st_dev, stored.st_ino)
+            if self.link_mode == "copy" and same_file:
+                # Linked by a run in another mode
+                return False
+            same_copy = (loaded.st_size, loaded.st_mtime_ns) == (
+                stored.st_size,
+                stored.st_mtime_ns,
+            )
+            if not (same_file or same_copy):
+                return False
+        return True
+
+    def _store(self, digest: str, files: List[Tuple[str, str, os.stat_result]]) -> None:
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.store_dir / f".{digest}.{uuid.uuid4().hex}"
+        for relative, path, st in files:
+            dst = tmp_path / relative
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(path, dst)
+            # Read-only, as work directories link to these files
+            os.chmod(dst, 0o555 if _executable(st.st_mode) else 0o444)
+        tmp_path.mkdir(parents=True, exist_ok=True)
+        path = self.snapshot_path(digest)
+        if path.exists():
+            # A damaged snapshot, or one stored concurrently
+            _remove(path)
+        try:
+            os.rename(tmp_path, path)
+        except OSError:
+            _remove(tmp_path)
+            if not self._intact(digest):
+                raise
+
+    def _link(self, snapshot: SkillSnapshot, target: Path) -> None:
+        source = self.snapshot_path(snapshot.digest)
+        tmp_path = target.with_name(f".{target.name}.{uuid.uuid4().hex}")
+        if self.link_mode == "symlink":
+            os.symlink(source, tmp_path, target_is_directory=True)
+        else:
+            created = set()
+            for relative in snapshot.files:
+                src, dst = os.path.join(source, relative), os.path.join(tmp_path, relative)
+                parent = os.path.dirname(dst)
+                if parent not in created:
+                    os.makedirs(parent, exist_ok=True)
+                    created.add(parent)
+                if self.link_mode == "hardlink":
+                    try:
+                        os.link(src, dst)
+                        continue
+                    except OSError:
+                        # Another file system, or links are not supported
+                        pass
+                shutil.copy2(src, dst)
+                # Copies belong to the workspace, unlike the store files
+                os.chmod(dst, os.stat(dst).st_mode | stat.S_IWUSR)
+            tmp_path.mkdir(parents=True, exist_ok=True)
+        if target.is_symlink() or target.exists():
+            _remove(target)
+        try:
+            os.rename(tmp_path, target)
+        except OSError:
+            # Materialized concurrently by another component
+            _remove(tmp_path)
+
+
+def read_skill_manifest(work_dir: str) -> Dict[str, Dict]:
+    """Snapshots of the skills materialized in ``work_dir``, by skill."""
+    path = Path(work_dir) / ".claude" / "skills" / MANIFEST_NAME
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _write_json(path: Path, data: Dict) -> None:
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _remove(path: Path) -> None:
+    if path.is_symlink() or path.is_file():
+        path.unlink()
+    else:
+        shutil.rmtree(path, ignore_errors=True)
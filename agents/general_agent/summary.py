@@ -232,6 +232,7 @@ class GeneralSummaryAgent(Worker):
                 load_skills(
                     skill_names=self.config.skills,
                     work_dir=work_dir,
+                    link_mode=self.config.link_mode,
                 )
                 logger.debug(
                     f"[{context.trace_id}] Summary: Loaded skills: {self.config.skills}"
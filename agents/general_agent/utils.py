@@ -8,25 +8,53 @@ custom_tools format, building database tools, and managing skills.
 """
 
 import json
-import os
-import shutil
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from agents.general_agent.skill_store import (
+    SkillStore,
+    parse_skill_frontmatter,
+    read_skill_manifest,
+)
 from loongflow.agentsdk.tools import FunctionTool
 from loongflow.agentsdk.logger import get_logger
 
 logger = get_logger(__name__)
 
+# utils.py is at agents/general_agent/utils.py, so we need to go up 3 levels
+PROJECT_ROOT = Path(__file__).parent.parent.parent
 
-def load_skills(skill_names: List[str], work_dir: str) -> None:
+# Stores of the skills of this run, by link mode
+_skill_stores: Dict[str, SkillStore] = {}
+
+
+def get_skill_store(link_mode: str = "hardlink") -> SkillStore:
+    """Store of the skills of the project root .claude/skills directory."""
+    store = _skill_stores.get(link_mode)
+    if store is None:
+        store = SkillStore(
+            source_dir=str(PROJECT_ROOT / ".claude" / "skills"),
+            store_dir=str(PROJECT_ROOT / ".claude" / "skill_store"),
+            link_mode=link_mode,
+        )
+        _skill_stores[link_mode] = store
+    return store
+
+
+def load_skills(
+    skill_names: List[str], work_dir: str, link_mode: Optional[str] = None
+) -> None:
     """
     Load skills from project root .claude/skills directory to working directory.
-    Copies ALL files and subdirectories from the skill directory recursively.
+    ALL files and subdirectories of the skill directory are linked from the
+    content-hashed skill store (or copied with ``link_mode="copy"``), skills
+    already loaded with the same content are skipped.
 
     Args:
         skill_names: List of skill directory names to load
-        work_dir: Target working directory to copy skills to
+        work_dir: Target working directory to load skills to
+        link_mode: ``hardlink`` (default), ``symlink`` or ``copy``, see
+            ``ClaudeAgentConfig.link_mode``
 
     Raises:
         FileNotFoundError: If skill directory not found
@@ -37,58 +65,40 @@ def load_skills(skill_names: List[str], work_dir: str) -> None:
         LoongFlow/.claude/skills/skill-creator/
         ├── SKILL.md
 
-        Will be copied to:
+        Will be linked to:
         {work_dir}/.claude/skills/skill-creator/ (with all contents)
     """
     if not skill_names or not isinstance(skill_names, list):
         raise ValueError("skill_names must be a non-empty list")
 
     # Use skills from project root .claude/skills directory
-    # Get the root directory of the LoongFlow project
-    # utils.py is at agents/general_agent/utils.py, so we need to go up 3 levels
-    project_root = Path(__file__).parent.parent.parent
-    base_skills_dir = project_root / ".claude" / "skills"
+    store = get_skill_store(link_mode or "hardlink")
+    base_skills_dir = store.source_dir
 
     if not base_skills_dir.exists():
         raise FileNotFoundError(
             f"Global skills directory not found: {base_skills_dir}. "
-            f"Please create skills in the project root: {project_root}/.claude/skills/"
+            f"Please create skills in the project root: {PROJECT_ROOT}/.claude/skills/"
         )
 
-    target_skills_dir = Path(work_dir) / ".claude" / "skills"
-    target_skills_dir.mkdir(parents=True, exist_ok=True)
-
     for skill_name in skill_names:
-        skill_src = base_skills_dir / skill_name
-        if not skill_src.exists():
+        if not (base_skills_dir / skill_name).exists():
             raise FileNotFoundError(
                 f"Skill '{skill_name}' not found in global skills directory: {base_skills_dir}. "
                 f"Available skills: {[d.name for d in base_skills_dir.iterdir() if d.is_dir()]}"
             )
 
-        skill_dst = target_skills_dir / skill_name
+    written = store.materialize(skill_names, work_dir)
 
-        # Remove existing skill directory if exists
-        if skill_dst.exists():
-            shutil.rmtree(skill_dst)
-
-        # Copy all contents recursively with full metadata
-        shutil.copytree(
-            src=skill_src,
-            dst=skill_dst,
-            symlinks=False,  # Copy actual files instead of symlinks
-            ignore=None,  # Copy everything
-            copy_function=shutil.copy2,  # Preserve file metadata
-            ignore_dangling_symlinks=True,
-        )
-
-        # Log copied files
-        copied_files = [
-            str(p.relative_to(skill_src)) for p in skill_src.glob("**/*") if p.is_file()
-        ]
+    for skill_name in skill_names:
+        if not written[skill_name]:
+            logger.debug(f"Skill '{skill_name}' is already loaded, skipping")
+            continue
+        # Log loaded files, as listed by the snapshot
+        loaded_files = store.snapshot(skill_name).files
         logger.info(
-            f"Loaded skill '{skill_name}' with {len(copied_files)} files: "
-            f"{', '.join(copied_files[:3])}" + ("..." if len(copied_files) > 3 else "")
+            f"Loaded skill '{skill_name}' with {len(loaded_files)} files: "
+            f"{', '.join(loaded_files[:3])}" + ("..." if len(loaded_files) > 3 else "")
         )
 
 
@@ -198,9 +208,10 @@ def format_loaded_skills(skill_names: Optional[List[str]], work_dir: str) -> str
     """
     Format loaded skills information for prompt injection.
 
-    This function reads the SKILL.md files from the workspace and extracts
-    the name and description from the YAML frontmatter to provide context
-    to the agent about available skills.
+    This function takes the name and description from the YAML frontmatter of
+    the SKILL.md files to provide context to the agent about available skills.
+    Skills loaded by ``load_skills`` are described by the manifest of the
+    workspace, other SKILL.md files are read from the workspace.
 
     Args:
         skill_names: List of skill names that were loaded, or None if no skills
@@ -217,29 +228,25 @@ def format_loaded_skills(skill_names: Optional[List[str]], work_dir: str) -> str
 
     skills_info = []
     skills_dir = Path(work_dir) / ".claude" / "skills"
+    manifest = read_skill_manifest(work_dir)
 
     for skill_name in skill_names:
         skill_md_path = skills_dir / skill_name / "SKILL.md"
+        entry = manifest.get(skill_name)
+
+        if entry is not None and entry.get("name") is not None:
+            skills_info.append(f"- **{entry['name']}**: {entry.get('description', '')}")
+            continue
 
         if skill_md_path.exists():
             try:
                 content = skill_md_path.read_text(encoding="utf-8")
                 # Extract YAML frontmatter (between --- markers)
-                if content.startswith("---"):
-                    parts = content.split("---", 2)
-                    if len(parts) >= 3:
-                        frontmatter = parts[1].strip()
-                        # Parse simple YAML-like frontmatter
-                        name = skill_name
-                        description = ""
-                        for line in frontmatter.split("\n"):
-                            if line.startswith("name:"):
-                                name = line.split(":", 1)[1].strip().strip('"\'')
-                            elif line.startswith("description:"):
-                                description = line.split(":", 1)[1].strip().strip('"\'')
-
-                        skills_info.append(f"- **{name}**: {description}")
-                        continue
+                parsed = parse_skill_frontmatter(content, skill_name)
+                if parsed:
+                    name, description = parsed
+                    skills_info.append(f"- **{name}**: {description}")
+                    continue
             except Exception as e:
                 logger.warning(f"Failed to read SKILL.md for '{skill_name}': {e}")
 
@@ -4,10 +4,8 @@ This module provides agents for mathematical discovery, algorithm optimization,
 and general evolutionary problem-solving tasks.
 """
 
-from . import executor
-from . import planner
-from . import prompt
-from . import summary
-from . import visualizer
+from loongflow._lazy import attach
 
 __all__ = ["executor", "planner", "prompt", "summary", "visualizer"]
+
+__getattr__, __dir__ = attach(__name__, submodules=__all__)
@@ -8,31 +8,36 @@ and best solution selection using ReActAgents and tool-based reasoning.
 import asyncio
 import json
 import os
-import subprocess
 import uuid
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, List, Optional
 
+from agents.math_agent.executor.execute_react.build_tool import publish_evaluation
 from agents.math_agent.executor.utils import (
     EPSILON,
     parse_full_rewrite,
     parse_missing_package,
 )
 from agents.math_agent.prompt.evolve_execute_prompt import (
-    EVOLVE_EXECUTOR_CHAT_PACKAGE_INSTALL,
     EVOLVE_EXECUTOR_CHAT_SYSTEM_PROMPT_WITH_PLAN,
     EVOLVE_EXECUTOR_CHAT_USER_PROMPT_WITH_PLAN,
 )
-from loongflow.agentsdk.logger import get_logger
+from loongflow.agentsdk.logger import get_logger, lazy
 from loongflow.agentsdk.message import ContentElement, Message
 from loongflow.agentsdk.message.elements import MimeType
 from loongflow.agentsdk.message.message import Role
-from loongflow.agentsdk.models import BaseLLMModel, CompletionRequest, LiteLLMModel
-from loongflow.framework.pes.context import Context, LLMConfig, Workspace
-from loongflow.framework.pes.evaluator import EvaluationResult
+from loongflow.agentsdk.models import BaseLLMModel, CompletionRequest
+from loongflow.framework.pes.context import (
+    Context,
+    LLMConfig,
+    PromptContextBuilder,
+    Workspace,
+)
+from loongflow.framework.pes.evaluator import ProvisionResult
 from loongflow.framework.pes.evaluator.evaluator import LoongFlowEvaluator
-from loongflow.framework.pes.register import Worker
+from loongflow.framework.pes.executor import ResultChannel
+from loongflow.framework.pes.register import ReusableWorker
 
 logger = get_logger(__name__)
 
@@ -81,6 +86,8 @@ class ExecutionContext:
     parent_solution: str
     stage1_plan: str
     stage1_plan_file_path: str
+    # Holds the parent code as the base of the system prompts
+    prompt_context: PromptContextBuilder = field(default_factory=PromptContextBuilder)
 
 
 @dataclass
@@ -98,7 +105,7 @@ class HistoryRecord:
         return self.records
 
 
-class EvolveExecuteAgentChat(Worker):
+class EvolveExecuteAgentChat(ReusableWorker):
     """Agent for iterative candidate generation and evaluation."""
 
     def __init__(self, config: Any, evaluator: LoongFlowEvaluator):
@@ -112,11 +119,20 @@ class EvolveExecuteAgentChat(Worker):
         self.model = self._init_model()
         logger.info(f"Executor: Agent Chat successfully initialized")
 
+    def reset(self, context: Context) -> None:
+        """The model is the only state kept between cycles, nothing to reset."""
+
     async def run(self, context: Context, message: Message) -> Message:
         """
         Perform multi-round candidate generation and evaluation until
          an improved solution is found or max rounds are reached.
         """
+        try:
+            return await self._run(context, message)
+        finally:
+            ResultChannel.release(context)
+
+    async def _run(self, context: Context, message: Message) -> Message:
         parent_ctx = self._parse_message_inputs(message)
         history = HistoryRecord()
         all_results: List[CandidateResult] = []
@@ -267,7 +283,7 @@ class EvolveExecuteAgentChat(Worker):
         candidate_path = Workspace.get_executor_candidate_path(
             context, f"{round_idx}_{candidate_idx}"
         )
-        system_prompt = (
+        system_prompt = parent_ctx.prompt_context.system_prompt(
             self.config.system_prompt or EVOLVE_EXECUTOR_CHAT_SYSTEM_PROMPT_WITH_PLAN
         )
         user_prompt = EVOLVE_EXECUTOR_CHAT_USER_PROMPT_WITH_PLAN.format(
@@ -329,23 +345,30 @@ class EvolveExecuteAgentChat(Worker):
             raise Exception("Evaluation returned None")
 
         logger.info(
-            f"Trace ID: {context.trace_id}: Executor Chat: candidate (round={round_idx}, idx={candidate_idx}), "
-            + f"Evaluation result: {json.dumps(json.loads(evaluation_result.to_json()), ensure_ascii=False)}",
+            "Trace ID: %s: Executor Chat: candidate (round=%s, idx=%s), Evaluation result: %s",
+            context.trace_id,
+            round_idx,
+            candidate_idx,
+            lazy(lambda: json.dumps(json.loads(evaluation_result.to_json()), ensure_ascii=False)),
         )
-        # Check for missing packages; invoke LLM to generate installation comman
+        # Check for missing packages; provision them for the next evaluations
         missing_pacakge = parse_missing_package(evaluation_result.summary)
         if missing_pacakge:
             logger.info(
                 f"Trace ID: {context.trace_id}: Executor Chat: candidate (round={round_idx}, "
                 + f"idx={candidate_idx}), Missing package: {missing_pacakge}"
             )
-            await self.install_missing_package(context, evaluation_result)
+            await self.install_missing_package(context, missing_pacakge)
 
         evaluation_result_json = json.dumps(evaluation_result.to_dict())
+        evaluation_json = evaluation_result.to_json()
         Workspace.write_executor_file(
             context,
             f"{candidate_path}/evaluation_{random_str}.json",
-            evaluation_result.to_json(),
+            evaluation_json,
+        )
+        publish_evaluation(
+            context, candidate_path, random_str, json.loads(evaluation_json)
         )
         return evaluation_result_json
 
@@ -355,6 +378,8 @@ class EvolveExecuteAgentChat(Worker):
         if not llm or not all([llm.model]):
             raise ValueError("model_name, url, and api_key are required in llm_config.")
 
+        from loongflow.agentsdk.models import LiteLLMModel
+
         return LiteLLMModel.from_config(llm.model_dump())
 
     def _parse_message_inputs(self, message: Message) -> ExecutionContext:
@@ -377,12 +402,16 @@ class EvolveExecuteAgentChat(Worker):
         with open(parent_info_path, "r", encoding="utf-8") as f:
             parent_data = json.load(f)
 
+        # Every candidate shares the system prompt holding the parent code, the
+        # user prompts only carry the compacted rest of the parent
+        prompt_context = PromptContextBuilder(parent_data.get("solution") or "")
         return ExecutionContext(
             parent_info_file_path=parent_info_path,
             parent_core=float(parent_data.get("score", 0.0)),
-            parent_solution=parent_data.get("solution", ""),
+            parent_solution=prompt_context.pack(parent_data),
             stage1_plan=stage1_plan,
             stage1_plan_file_path=plan_path,
+            prompt_context=prompt_context,
         )
 
     def _parse_message_to_llm_output(self, result_msg: Message) -> str:
@@ -399,94 +428,33 @@ class EvolveExecuteAgentChat(Worker):
         candidate_idx: int,
         llm_out: str,
     ) -> List[CandidateResult]:
-        """Read a candidate folder and return all paired solution/evaluation results.
+        """Return the results published by the evaluations of a candidate this cycle.
 
-        Pairing logic: find all files matching solution*.py and evaluation*.json and pair
-        them by the suffix present in the filename. Example:
-            solution1_23.py <-> evaluation1_23.json  (suffix: '1_23' or '23' depending on naming)
+        Every evaluation publishes a record to the result channel of the cycle once its
+        solution*.py and evaluation*.json files are written, results keep source='disk'
+        as these files back them.
 
         Returns list of CandidateResult with source='disk'. If none found, returns single
         CandidateResult with source='llm' containing the LLM status/reason as record.
         """
-        candidate_path = Workspace.get_executor_candidate_path(
-            context, f"{round_idx}_{candidate_idx}"
+        records = ResultChannel.for_context(context).records(
+            f"{round_idx}_{candidate_idx}"
         )
-        p = Path(candidate_path)
-
-        if not p.exists() or not p.is_dir():
-            # no folder -> return llm-only fallback
-            logger.warning(
-                f"Trace ID: {context.trace_id}: Executor Chat: Candidate folder not found: {candidate_path}"
-            )
-            return [
-                CandidateResult(
-                    round_idx=round_idx,
-                    candidate_idx=candidate_idx,
-                    solution_file_path="",
-                    evaluation_file_path="",
-                    score=0.0,
-                    reason=llm_out,
-                    source="llm",
-                )
-            ]
-
-        # gather files
-        solution_candidates = list(p.glob("solution*.py"))
-        eval_candidates = list(p.glob("evaluation*.json"))
-
-        # Build maps keyed by extracted random_idx token
-        def extract_suffix(fp: Path, prefix: str):
-            name = fp.name
-            if not name.startswith(prefix):
-                return None
-            core = name[len(prefix) :]
-            core = core.rsplit(".", 1)[0]
-            return core
-
-        sol_map: Dict[str, Path] = {}
-        for s in solution_candidates:
-            key = extract_suffix(s, "solution")
-            if key:
-                sol_map[key] = s
-
-        eval_map: Dict[str, Path] = {}
-        for e in eval_candidates:
-            key = extract_suffix(e, "evaluation")
-            if key:
-                eval_map[key] = e
-
-        paired_keys = sorted(set(sol_map.keys()) & set(eval_map.keys()))
-
-        results: List[CandidateResult] = []
-        for k in paired_keys:
-            s_path = str(sol_map[k])
-            e_path = str(eval_map[k])
-
-            try:
-                with open(e_path, "r", encoding="utf-8") as f:
-                    eval_data = json.load(f)
-            except Exception as e:
-                logger.warning(
-                    f"Trace ID: {context.trace_id}: Executor Chat: "
-                    + f"Failed to read evaluation file {e_path}: {e}"
-                )
-                continue
-
-            score = float(eval_data.get("score", 0.0))
-
-            cr = CandidateResult(
+        results: List[CandidateResult] = [
+            CandidateResult(
                 round_idx=round_idx,
                 candidate_idx=candidate_idx,
-                random_idx=str(k),
-                solution_file_path=s_path,
-                evaluation_file_path=e_path,
-                score=score,
+                random_idx=f"_{record.attempt}",
+                solution_file_path=record.solution_file_path,
+                evaluation_file_path=record.evaluation_file_path,
+                score=record.score,
                 reason=llm_out,
                 source="disk",
             )
-            results.append(cr)
+            for record in records
+        ]
 
-        # If no pairs but LLM said something, return fallback single result with LLM info
+        # If no results but LLM said something, return fallback single result with LLM info
         if not results:
             return [
                 CandidateResult(
@@ -536,58 +504,20 @@ class EvolveExecuteAgentChat(Worker):
         )
 
     async def install_missing_package(
-        self, context: Context, evaluation_result: EvaluationResult
-    ):
-        """Install missing package."""
-        user_message = Message.from_text(
-            sender="user",
-            role=Role.USER,
-            data=EVOLVE_EXECUTOR_CHAT_PACKAGE_INSTALL.format(
-                error_msg=evaluation_result.summary, language="python"
-            ),
+        self, context: Context, module: str
+    ) -> ProvisionResult:
+        """Provision the package of a missing module for the next evaluations."""
+        logger.info(
+            f"Trace ID: {context.trace_id}: Executor Chat: Installing missing package: {module}"
         )
-
-        llm_request = CompletionRequest(messages=[user_message])
-
-        resp_generator = self.model.generate(llm_request)
-        try:
-            resp = await anext(resp_generator)
-            if resp.error_code:
-                raise Exception(
-                    f"Error code: {resp.error_code}, error: {resp.error_message}"
-                )
-        finally:
-            # Make sure to consume the generator to avoid leaking resources
-            async for _ in resp_generator:
-                pass
-
-        cmd = ""
-        for element in resp.content:
-            if isinstance(element, ContentElement):
-                cmd = parse_full_rewrite(element.data)
-
-        if not cmd:
-            logger.warning(
-                f"Trace ID: {context.trace_id}: Executor Chat: No command generated"
-            )
-            return None
-
-        try:
+        result = await self.evaluator.provisioner.provision(module)
+        if result.success:
             logger.info(
-                f"Trace ID: {context.trace_id}: Executor Chat: Installing missing package: {cmd}"
-            )
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                check=True,
-                text=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                f"Trace ID: {context.trace_id}: Executor Chat: Installed result: {result.message}"
             )
-            logger.info(
-                f"Trace ID: {context.trace_id}: Executor Chat: Installed result: {result}"
-            )
-        except subprocess.CalledProcessError as e:
+        else:
             logger.error(
-                f"Trace ID: {context.trace_id}: Executor Chat: Error installing package: {e}"
+                f"Trace ID: {context.trace_id}: Executor Chat: Error installing package: "
+                + f"{result.message} {result.output[-2000:]}"
             )
+        return result
@@ -8,18 +8,17 @@ and best solution selection using ReActAgents and tool-based reasoning.
 import asyncio
 import json
 import os
-import subprocess
 import uuid
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from loongflow.agentsdk.logger import get_logger
 from loongflow.agentsdk.memory.grade import GradeMemory, MemoryConfig
 from loongflow.agentsdk.message import ContentElement, Message
 from loongflow.agentsdk.message.elements import MimeType
 from loongflow.agentsdk.message.message import Role
-from loongflow.agentsdk.models import BaseLLMModel, CompletionRequest, LiteLLMModel
+from loongflow.agentsdk.models import BaseLLMModel, CompletionRequest
 from loongflow.agentsdk.token import SimpleTokenCounter
 from loongflow.agentsdk.tools import Toolkit
 from agents.math_agent.executor.utils import (
@@ -32,7 +31,6 @@ from agents.math_agent.prompt.evolve_execute_prompt import (
     EVOLVE_EXECUTOR_REACT_USER_PROMPT,
     EVOLVE_EXECUTOR_CHAT_SYSTEM_PROMPT_WITH_PLAN,
     EVOLVE_EXECUTOR_CHAT_USER_PROMPT_WITH_PLAN,
-    EVOLVE_EXECUTOR_CHAT_PACKAGE_INSTALL,
     EVOLVE_EXECUTOR_REACT_SYSTEM_PROMPT,
 )
 
@@ -41,17 +39,28 @@ from agents.math_agent.executor.execute_react.execute_agent_observer import (
 )
 
 from agents.math_agent.executor.execute_react.build_tool import (
+    build_best_evaluations_tool,
     build_evaluator_solution_tool,
     build_executor_read_tool,
     build_install_package_tool,
     build_executor_write_tool,
     build_executor_ls_tool,
+    get_history_log_path,
+    publish_evaluation,
 )
+from agents.math_agent.executor.execute_react.history_store import EvaluationHistory
 from loongflow.framework.pes.compressor import EvolveCompressor
-from loongflow.framework.pes.context import Context, LLMConfig, Workspace
-from loongflow.framework.pes.evaluator import EvaluationResult
+from loongflow.framework.pes.context import (
+    Context,
+    LLMConfig,
+    PromptContextBuilder,
+    Workspace,
+    compact_evaluation,
+)
+from loongflow.framework.pes.evaluator import EvaluationResult, ProvisionResult
 from loongflow.framework.pes.evaluator.evaluator import LoongFlowEvaluator
-from loongflow.framework.pes.register import Worker
+from loongflow.framework.pes.executor import ResultChannel
+from loongflow.framework.pes.register import ReusableWorker
 from loongflow.framework.react import AgentContext, ReActAgent
 from loongflow.framework.react.components import (
     DefaultFinalizer,
@@ -62,6 +71,8 @@ from loongflow.framework.react.components import (
 
 logger = get_logger(__name__)
 
+RACING_POLICIES = ("wait_all", "first_improvement", "score_threshold")
+
 
 @dataclass
 class ExecuteAgentFuseConfig:
@@ -73,6 +84,28 @@ class ExecuteAgentFuseConfig:
     max_rounds: int = 1
     react_max_steps: int = 2
     score_threshold: float = 0.9
+    # Racing policy between the candidates of a round:
+    # - "wait_all": every candidate runs to completion.
+    # - "first_improvement": cancel the siblings once a candidate beats the parent
+    #   score by more than racing_margin.
+    # - "score_threshold": cancel the siblings once a candidate reaches racing_score_threshold.
+    racing_policy: str = "wait_all"
+    racing_margin: float = 0.0
+    racing_score_threshold: Optional[float] = None
+
+    def __post_init__(self):
+        if self.racing_policy not in RACING_POLICIES:
+            raise ValueError(
+                f"Unknown racing_policy '{self.racing_policy}', "
+                f"expected one of {RACING_POLICIES}."
+            )
+        if (
+            self.racing_policy == "score_threshold"
+            and self.racing_score_threshold is None
+        ):
+            raise ValueError(
+                "racing_score_threshold is required with the 'score_threshold' racing policy."
+            )
 
 
 @dataclass
@@ -96,6 +129,10 @@ class CandidateResult:
 
     source: str = "disk"
 
+    # True when the candidate was cancelled because a sibling won the round. Results
+    # it wrote to disk before cancellation are still loaded.
+    cancelled: bool = False
+
     def to_dict(self) -> dict:
         """Convert to plain dict."""
         return asdict(self)
@@ -110,6 +147,8 @@ class ExecutionContext:
     parent_solution: str
     stage1_plan: str
     stage1_plan_file_path: str
+    # Holds the parent code as the base of the system prompts
+    prompt_context: PromptContextBuilder = field(default_factory=PromptContextBuilder)
 
 
 @dataclass
@@ -127,7 +166,7 @@ class HistoryRecord:
         return self.records
 
 
-class EvolveExecuteAgentFuse(Worker):
+class EvolveExecuteAgentFuse(ReusableWorker):
     """Agent for iterative candidate generation and evaluation."""
 
     def __init__(self, config: Any, evaluator: LoongFlowEvaluator):
@@ -141,21 +180,30 @@ class EvolveExecuteAgentFuse(Worker):
         self.model = self._init_model()
         logger.info(f"Executor: Agent Fuse successfully initialized")
 
+    def reset(self, context: Context) -> None:
+        """The model is the only state kept between cycles, nothing to reset."""
+
     async def run(self, context: Context, message: Message) -> Message:
         """
         Perform multi-round candidate generation and evaluation until
          an improved solution is found or max rounds are reached.
         """
+        # The candidates of the run share one evaluation history until it ends
+        history_path = get_history_log_path(context)
+        EvaluationHistory.acquire(history_path)
+        try:
+            return await self._run(context, message)
+        finally:
+            ResultChannel.release(context)
+            EvaluationHistory.release(history_path)
+
+    async def _run(self, context: Context, message: Message) -> Message:
         parent_ctx = self._parse_message_inputs(message)
         history = HistoryRecord()
 
         # create a history.log file
         if parent_ctx.parent_core >= self.config.score_threshold:
-            history_log_file_path = (
-                f"{Workspace.get_executor_path(context)}/history.log"
-            )
-            with open(history_log_file_path, "w") as f:
-                pass
+            EvaluationHistory.reset(get_history_log_path(context))
 
         all_results: List[CandidateResult] = []
         init_parallel = 0
@@ -212,9 +260,10 @@ class EvolveExecuteAgentFuse(Worker):
                 break
             else:
                 for result in disk_results:
+                    evaluation = compact_evaluation(result.reason)
                     previous_attempts += (
                         f"Round {round_idx}, Candidate {result.candidate_idx}, "
-                        + f"Evaluation: {result.reason}\n\n"
+                        + f"Evaluation: {json.dumps(evaluation, ensure_ascii=False)}\n\n"
                     )
                 logger.info(
                     f"Trace ID: {context.trace_id}: Executor Fuse: ❌ [Round {round_idx}] "
@@ -259,17 +308,46 @@ class EvolveExecuteAgentFuse(Worker):
         """Generate multiple candidate slots concurrently.
 
         Concurrency strategy:
-        - Launch gen_one_candidate for each parallel slot concurrently.
+        - Launch gen_one_candidate for each parallel slot concurrently, as one task per
+          slot. In Chat Mode a slot is evaluated as soon as its solution is generated.
+          Once a candidate wins the round under the racing policy, the tasks of its
+          siblings are cancelled, with their in-flight LLM calls and evaluations.
         - Gather LLM outputs, then for each slot call load_results_for_candidate which reads disk files
           and attaches LLM status/reason to each disk entry. If load finds no disk pairs, a single
           LLM-only CandidateResult (source='llm') is returned for that slot.
         - Flatten results and return as list[CandidateResult].
         """
+        won = asyncio.Event()
+        winners = []
+
+        def make_on_evaluation(candidate_idx: int):
+            def on_evaluation(evaluation_result: EvaluationResult):
+                if self._wins_race(parent_ctx, evaluation_result.score):
+                    winners.append(candidate_idx)
+                    won.set()
+
+            return on_evaluation
+
         tasks = [
-            self.gen_one_candidate(context, parent_ctx, round_idx, i, previous_attempts)
+            asyncio.create_task(
+                self.gen_one_candidate(
+                    context,
+                    parent_ctx,
+                    round_idx,
+                    i,
+                    previous_attempts,
+                    on_evaluation=make_on_evaluation(i),
+                )
+            )
             for i in range(parallel_candidates)
         ]
-        llm_results = await asyncio.gather(*tasks, return_exceptions=True)
+        llm_results = await self._race_candidates(context, round_idx, tasks, won)
+        # The winner itself is short-circuited, its evaluated solution is on disk.
+        for idx in winners:
+            if isinstance(llm_results[idx], asyncio.CancelledError):
+                llm_results[idx] = json.dumps(
+                    {"content": "Candidate won the round and was stopped early."}
+                )
 
         final_results = {
             "candidates": [],
@@ -278,7 +356,13 @@ class EvolveExecuteAgentFuse(Worker):
         }
 
         for idx, llm_out in enumerate(llm_results):
-            llm_str = str(llm_out) if isinstance(llm_out, Exception) else llm_out
+            cancelled = isinstance(llm_out, asyncio.CancelledError)
+            if cancelled:
+                llm_str = json.dumps(
+                    {"content": "Candidate cancelled, a sibling candidate won the round."}
+                )
+            else:
+                llm_str = str(llm_out) if isinstance(llm_out, Exception) else llm_out
 
             llm_out_dict = {}
             try:
@@ -299,6 +383,8 @@ class EvolveExecuteAgentFuse(Worker):
                 slot_results = self.load_results_for_candidate(
                     context, round_idx, idx, llm_str
                 )
+                for slot_result in slot_results:
+                    slot_result.cancelled = cancelled
                 final_results["candidates"].extend(slot_results)
             except Exception as e:
                 logger.exception(
@@ -313,11 +399,64 @@ class EvolveExecuteAgentFuse(Worker):
                     score=0.0,
                     reason=llm_str,
                     source="llm",
+                    cancelled=cancelled,
                 )
                 final_results["candidates"].append(fallback)
 
         return final_results
 
+    def _wins_race(self, parent_ctx: ExecutionContext, score: float) -> bool:
+        """Whether a candidate score ends the round under the racing policy."""
+        policy = self.config.racing_policy
+        if policy == "first_improvement":
+            return score - parent_ctx.parent_core > max(EPSILON, self.config.racing_margin)
+        if policy == "score_threshold":
+            return score >= self.config.racing_score_threshold
+        return False
+
+    async def _race_candidates(
+        self,
+        context: Context,
+        round_idx: int,
+        tasks: List[asyncio.Task],
+        won: asyncio.Event,
+    ) -> List[Any]:
+        """Wait for the candidate tasks, cancelling the pending ones once the round is won.
+
+        Cancellation propagates into the in-flight LLM calls and evaluation processes
+        of the cancelled candidates. Returns one result per task like
+        asyncio.gather(return_exceptions=True), with a CancelledError instance for
+        the cancelled ones.
+        """
+        pending = set(tasks)
+        won_waiter = asyncio.create_task(won.wait())
+        try:
+            while pending and not won.is_set():
+                _, pending = await asyncio.wait(
+                    pending | {won_waiter}, return_when=asyncio.FIRST_COMPLETED
+                )
+                pending.discard(won_waiter)
+        finally:
+            won_waiter.cancel()
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if pending:
+            logger.info(
+                f"Trace ID: {context.trace_id}: Executor Fuse: [Round {round_idx}] "
+                + f"Racing policy '{self.config.racing_policy}' met, "
+                + f"stopped {len(pending)} candidates still running."
+            )
+
+        results: List[Any] = []
+        for task in tasks:
+            if task.cancelled():
+                results.append(asyncio.CancelledError())
+            else:
+                results.append(task.exception() or task.result())
+        return results
+
     async def gen_one_candidate(
         self,
         context: Context,
@@ -325,8 +464,13 @@ class EvolveExecuteAgentFuse(Worker):
         round_idx: int,
         candidate_idx: int,
         previous_attempts: str,
+        on_evaluation: Optional[Callable[[EvaluationResult], None]] = None,
     ) -> str:
-        """Generate a single candidate using ReActAgent."""
+        """Generate a single candidate using ReActAgent, or Chat Mode below the score threshold.
+
+        on_evaluation, if given, is called with every evaluation result of the candidate,
+        once the evaluation is saved.
+        """
         candidate_path = Workspace.get_executor_candidate_path(
             context, f"{round_idx}_{candidate_idx}"
         )
@@ -338,11 +482,9 @@ class EvolveExecuteAgentFuse(Worker):
                 + f"(round={round_idx}, idx={candidate_idx}) using React Mode"
             )
 
-            history_log_file_path = (
-                f"{Workspace.get_executor_path(context)}/history.log"
-            )
+            history_log_file_path = get_history_log_path(context)
             react_agent, rest_token = await self._create_react_agent(
-                context, candidate_path
+                context, candidate_path, on_evaluation, parent_ctx.prompt_context
             )
             user_prompt = EVOLVE_EXECUTOR_REACT_USER_PROMPT.format(
                 task=context.task,
@@ -384,125 +526,180 @@ class EvolveExecuteAgentFuse(Worker):
                 return json.dumps(result, ensure_ascii=False)
 
         else:  # Else use Chat Mode for faster generation
-            total_completion_tokens = 0
-            total_prompt_tokens = 0
-
-            logger.info(
-                f"Trace ID: {context.trace_id}: Executor Fuse: ▶️ Generating candidate "
-                + f"(round={round_idx}, idx={candidate_idx}) using Chat Mode"
+            generated = await self._generate_chat_solution(
+                context, parent_ctx, round_idx, candidate_idx, previous_attempts
             )
-            system_prompt = (
-                self.config.chat_system_prompt
-                or EVOLVE_EXECUTOR_CHAT_SYSTEM_PROMPT_WITH_PLAN
-            )
-            user_prompt = EVOLVE_EXECUTOR_CHAT_USER_PROMPT_WITH_PLAN.format(
-                task=context.task,
-                plan=parent_ctx.stage1_plan,
-                parent_solution=parent_ctx.parent_solution,
-                previous_attempts=previous_attempts,
+            if isinstance(generated, str):
+                return generated
+            # Through the shared evaluation scheduler, as soon as the solution is ready
+            evaluation_result = None
+            async for _, evaluation_result in self.evaluator.evaluate_many(
+                [generated["message"]], context
+            ):
+                pass
+            result = await self._finish_chat_candidate(
+                context, round_idx, candidate_idx, generated, evaluation_result
             )
-            if previous_attempts:
-                logger.debug(
-                    f"Trace ID: {context.trace_id}: Executor Fuse: ⚠️ Previous attempts: {previous_attempts}"
-                )
+            if on_evaluation is not None and evaluation_result is not None:
+                on_evaluation(evaluation_result)
+            return result
 
-            system_message = Message.from_text(
-                sender="system", role=Role.SYSTEM, data=system_prompt
-            )
-            user_message = Message.from_text(
-                sender="user", role=Role.USER, data=user_prompt
+    async def _generate_chat_solution(
+        self,
+        context: Context,
+        parent_ctx: ExecutionContext,
+        round_idx: int,
+        candidate_idx: int,
+        previous_attempts: str,
+    ) -> Any:
+        """Generate and save one Chat Mode solution.
+
+        Returns a dict with the solution message, its file suffix and token usage, or
+        the final LLM output string if no solution could be generated.
+        """
+        candidate_path = Workspace.get_executor_candidate_path(
+            context, f"{round_idx}_{candidate_idx}"
+        )
+        total_completion_tokens = 0
+        total_prompt_tokens = 0
+
+        logger.info(
+            f"Trace ID: {context.trace_id}: Executor Fuse: ▶️ Generating candidate "
+            + f"(round={round_idx}, idx={candidate_idx}) using Chat Mode"
+        )
+        system_prompt = parent_ctx.prompt_context.system_prompt(
+            self.config.chat_system_prompt
+            or EVOLVE_EXECUTOR_CHAT_SYSTEM_PROMPT_WITH_PLAN
+        )
+        user_prompt = EVOLVE_EXECUTOR_CHAT_USER_PROMPT_WITH_PLAN.format(
+            task=context.task,
+            plan=parent_ctx.stage1_plan,
+            parent_solution=parent_ctx.parent_solution,
+            previous_attempts=previous_attempts,
+        )
+        if previous_attempts:
+            logger.debug(
+                f"Trace ID: {context.trace_id}: Executor Fuse: ⚠️ Previous attempts: {previous_attempts}"
             )
 
-            token_counter = SimpleTokenCounter()
-            token_count = await token_counter.count([system_message, user_message])
-            if token_count > self.config.llm_config.context_length:
-                raise RuntimeError(
-                    f"Trace ID: {context.trace_id}: Executor Fuse: Not enough tokens to complete this request."
-                    + f"Please check your prompt tokens and current token usage: "
-                    + f"{self.config.llm_config.context_length}/{token_count}"
-                )
+        system_message = Message.from_text(
+            sender="system", role=Role.SYSTEM, data=system_prompt
+        )
+        user_message = Message.from_text(
+            sender="user", role=Role.USER, data=user_prompt
+        )
 
-            llm_request = CompletionRequest(messages=[system_message] + [user_message])
+        token_counter = SimpleTokenCounter()
+        token_count = await token_counter.count([system_message, user_message])
+        if token_count > self.config.llm_config.context_length:
+            raise RuntimeError(
+                f"Trace ID: {context.trace_id}: Executor Fuse: Not enough tokens to complete this request."
+                + f"Please check your prompt tokens and current token usage: "
+                + f"{self.config.llm_config.context_length}/{token_count}"
+            )
 
-            resp_generator = self.model.generate(llm_request)
-            try:
-                resp = await anext(resp_generator)
-                if resp.error_code:
-                    logger.exception(
-                        f"Trace ID: {context.trace_id}: Executor Fuse: {resp.error_message}"
-                    )
-                    result = {"content": resp.error_message}
-                    return json.dumps(result, ensure_ascii=False)
-            finally:
-                async for _ in resp_generator:
-                    pass
-
-            code = ""
-            for element in resp.content:
-                if isinstance(element, ContentElement):
-                    code = parse_full_rewrite(element.data, "python")
-
-            if not code:
-                logger.error(
-                    f"Trace ID: {context.trace_id}: Executor Fuse: Empty code from LLM: {resp}"
+        llm_request = CompletionRequest(messages=[system_message] + [user_message])
+
+        resp_generator = self.model.generate(llm_request)
+        try:
+            resp = await anext(resp_generator)
+            if resp.error_code:
+                logger.exception(
+                    f"Trace ID: {context.trace_id}: Executor Fuse: {resp.error_message}"
                 )
-                result = {"content": resp}
+                result = {"content": resp.error_message}
                 return json.dumps(result, ensure_ascii=False)
+        finally:
+            async for _ in resp_generator:
+                pass
 
-            logger.info(
-                f"Trace ID: {context.trace_id}: Executor Fuse: candidate (round={round_idx}, "
-                + f"idx={candidate_idx}), Successfully generated solution in Chat Mode"
+        code = ""
+        for element in resp.content:
+            if isinstance(element, ContentElement):
+                code = parse_full_rewrite(element.data, "python")
+
+        if not code:
+            logger.error(
+                f"Trace ID: {context.trace_id}: Executor Fuse: Empty code from LLM: {resp}"
             )
+            result = {"content": resp}
+            return json.dumps(result, ensure_ascii=False)
 
-            total_completion_tokens += resp.usage.completion_tokens
-            total_prompt_tokens += resp.usage.prompt_tokens
+        logger.info(
+            f"Trace ID: {context.trace_id}: Executor Fuse: candidate (round={round_idx}, "
+            + f"idx={candidate_idx}), Successfully generated solution in Chat Mode"
+        )
 
-            random_str = uuid.uuid4().hex[:3]
-            Workspace.write_executor_file(
-                context, f"{candidate_path}/solution_{random_str}.py", code
-            )
+        total_completion_tokens += resp.usage.completion_tokens
+        total_prompt_tokens += resp.usage.prompt_tokens
+
+        random_str = uuid.uuid4().hex[:3]
+        Workspace.write_executor_file(
+            context, f"{candidate_path}/solution_{random_str}.py", code
+        )
+
+        code_message = Message.from_text(
+            sender="assistant", role=Role.ASSISTANT, data=code
+        )
+        return {
+            "message": code_message,
+            "random_str": random_str,
+            "candidate_path": candidate_path,
+            "total_completion_tokens": total_completion_tokens,
+            "total_prompt_tokens": total_prompt_tokens,
+        }
 
-            code_message = Message.from_text(
-                sender="assistant", role=Role.ASSISTANT, data=code
+    async def _finish_chat_candidate(
+        self,
+        context: Context,
+        round_idx: int,
+        candidate_idx: int,
+        generated: Dict[str, Any],
+        evaluation_result: Optional[EvaluationResult],
+    ) -> str:
+        """Install missing packages and save the evaluation of a Chat Mode solution."""
+        candidate_path = generated["candidate_path"]
+        random_str = generated["random_str"]
+        total_completion_tokens = generated["total_completion_tokens"]
+        total_prompt_tokens = generated["total_prompt_tokens"]
+
+        if evaluation_result is None:
+            logger.error(
+                f"Trace ID: {context.trace_id}: Executor Fuse: Failed to get evaluation result: {evaluation_result}"
             )
-            evaluation_result = await self.evaluator.evaluate(code_message)
-            if evaluation_result is None:
-                logger.error(
-                    f"Trace ID: {context.trace_id}: Executor Fuse: Failed to get evaluation result: {evaluation_result}"
-                )
-                result = {"content": evaluation_result}
-                return json.dumps(result, ensure_ascii=False)
+            result = {"content": evaluation_result}
+            return json.dumps(result, ensure_ascii=False)
 
+        logger.info(
+            f"Trace ID: {context.trace_id}: Executor Fuse: Candidate (round={round_idx}, idx={candidate_idx}), "
+            + f"Chat Mode Get Evaluation Result: "
+            + f"{json.dumps(json.loads(evaluation_result.to_json()), ensure_ascii=False)}",
+        )
+        missing_pacakge = parse_missing_package(evaluation_result.summary)
+        if missing_pacakge:
             logger.info(
-                f"Trace ID: {context.trace_id}: Executor Fuse: Candidate (round={round_idx}, idx={candidate_idx}), "
-                + f"Chat Mode Get Evaluation Result: "
-                + f"{json.dumps(json.loads(evaluation_result.to_json()), ensure_ascii=False)}",
+                f"Trace ID: {context.trace_id}: Executor Fuse: Candidate (round={round_idx}, "
+                + f"idx={candidate_idx}), Missing package: {missing_pacakge}"
             )
-            missing_pacakge = parse_missing_package(evaluation_result.summary)
-            if missing_pacakge:
-                logger.info(
-                    f"Trace ID: {context.trace_id}: Executor Fuse: Candidate (round={round_idx}, "
-                    + f"idx={candidate_idx}), Missing package: {missing_pacakge}"
-                )
-                completion_tokens, prompt_tokens = await self.install_missing_package(
-                    context, evaluation_result
-                )
-                total_completion_tokens += completion_tokens
-                total_prompt_tokens += prompt_tokens
+            await self.install_missing_package(context, missing_pacakge)
 
-            Workspace.write_executor_file(
-                context,
-                f"{candidate_path}/evaluation_{random_str}.json",
-                evaluation_result.to_json(),
-            )
+        evaluation_json = evaluation_result.to_json()
+        Workspace.write_executor_file(
+            context,
+            f"{candidate_path}/evaluation_{random_str}.json",
+            evaluation_json,
+        )
+        publish_evaluation(
+            context, candidate_path, random_str, json.loads(evaluation_json)
+        )
 
-            result = {
-                "content": json.dumps(evaluation_result.to_dict()),
-                "total_completion_tokens": total_completion_tokens,
-                "total_prompt_tokens": total_prompt_tokens,
-            }
+        result = {
+            "content": json.dumps(evaluation_result.to_dict()),
+            "total_completion_tokens": total_completion_tokens,
+            "total_prompt_tokens": total_prompt_tokens,
+        }
 
-            return json.dumps(result, ensure_ascii=False)
+        return json.dumps(result, ensure_ascii=False)
 
     def _init_model(self) -> BaseLLMModel:
         """Initialize or reuse the LLM model."""
@@ -510,6 +707,8 @@ class EvolveExecuteAgentFuse(Worker):
         if not llm or not all([llm.model]):
             raise ValueError("model_name, url, and api_key are required in llm_config.")
 
+        from loongflow.agentsdk.models import LiteLLMModel
+
         return LiteLLMModel.from_config(llm.model_dump())
 
     def _parse_message_inputs(self, message: Message) -> ExecutionContext:
@@ -532,12 +731,16 @@ class EvolveExecuteAgentFuse(Worker):
         with open(parent_info_path, "r", encoding="utf-8") as f:
             parent_data = json.load(f)
 
+        # Every candidate and step shares the system prompt holding the parent
+        # code, the user prompts only carry the compacted rest of the parent
+        prompt_context = PromptContextBuilder(parent_data.get("solution") or "")
         return ExecutionContext(
             parent_info_file_path=parent_info_path,
             parent_core=float(parent_data.get("score", 0.0)),
-            parent_solution=json.dumps(parent_data),
+            parent_solution=prompt_context.pack(parent_data),
             stage1_plan=stage1_plan,
             stage1_plan_file_path=plan_path,
+            prompt_context=prompt_context,
         )
 
     def _parse_message_to_llm_output(self, result_msg: Message) -> str:
@@ -568,94 +771,33 @@ class EvolveExecuteAgentFuse(Worker):
         candidate_idx: int,
         llm_out: str,
     ) -> List[CandidateResult]:
-        """Read a candidate folder and return all paired solution/evaluation results.
+        """Return the results published by the evaluations of a candidate this cycle.
 
-        Pairing logic: find all files matching solution*.py and evaluation*.json and pair
-        them by the suffix present in the filename. Example:
-            solution1_23.py <-> evaluation1_23.json  (suffix: '1_23' or '23' depending on naming)
+        Every evaluation publishes a record to the result channel of the cycle once its
+        solution*.py and evaluation*.json files are written, results keep source='disk'
+        as these files back them.
 
         Returns list of CandidateResult with source='disk'. If none found, returns single
         CandidateResult with source='llm' containing the LLM status/reason as record.
         """
-        candidate_path = Workspace.get_executor_candidate_path(
-            context, f"{round_idx}_{candidate_idx}"
+        records = ResultChannel.for_context(context).records(
+            f"{round_idx}_{candidate_idx}"
         )
-        p = Path(candidate_path)
-
-        if not p.exists() or not p.is_dir():
-            # no folder -> return llm-only fallback
-            logger.warning(
-                f"Trace ID: {context.trace_id}: Executor Fuse: Candidate folder not found: {candidate_path}"
-            )
-            return [
-                CandidateResult(
-                    round_idx=round_idx,
-                    candidate_idx=candidate_idx,
-                    solution_file_path="",
-                    evaluation_file_path="",
-                    score=0.0,
-                    reason=llm_out,
-                    source="llm",
-                )
-            ]
-
-        # gather files
-        solution_candidates = list(p.glob("solution*.py"))
-        eval_candidates = list(p.glob("evaluation*.json"))
-
-        # Build maps keyed by extracted random_idx token
-        def extract_suffix(fp: Path, prefix: str):
-            name = fp.name
-            if not name.startswith(prefix):
-                return None
-            core = name[len(prefix) :]
-            core = core.rsplit(".", 1)[0]
-            return core
-
-        sol_map: Dict[str, Path] = {}
-        for s in solution_candidates:
-            key = extract_suffix(s, "solution")
-            if key:
-                sol_map[key] = s
-
-        eval_map: Dict[str, Path] = {}
-        for e in eval_candidates:
-            key = extract_suffix(e, "evaluation")
-            if key:
-                eval_map[key] = e
-
-        paired_keys = sorted(set(sol_map.keys()) & set(eval_map.keys()))
-
-        results: List[CandidateResult] = []
-        for k in paired_keys:
-            s_path = str(sol_map[k])
-            e_path = str(eval_map[k])
-
-            try:
-                with open(e_path, "r", encoding="utf-8") as f:
-                    eval_data = json.load(f)
-            except Exception as e:
-                logger.warning(
-                    f"Trace ID: {context.trace_id}: Executor Fuse: Failed to "
-                    + f"read evaluation file {e_path}: {e}"
-                )
-                continue
-
-            score = float(eval_data.get("score", 0.0))
-
-            cr = CandidateResult(
+        results: List[CandidateResult] = [
+            CandidateResult(
                 round_idx=round_idx,
                 candidate_idx=candidate_idx,
-                random_idx=str(k),
-                solution_file_path=s_path,
-                evaluation_file_path=e_path,
-                score=score,
-                reason=json.dumps(eval_data),
+                random_idx=f"_{record.attempt}",
+                solution_file_path=record.solution_file_path,
+                evaluation_file_path=record.evaluation_file_path,
+                score=record.score,
+                reason=json.dumps(record.evaluation),
                 source="disk",
             )
-            results.append(cr)
+            for record in records
+        ]
 
-        # If no pairs but LLM said something, return fallback single result with LLM info
+        # If no results but LLM said something, return fallback single result with LLM info
         if not results:
             return [
                 CandidateResult(
@@ -708,71 +850,33 @@ class EvolveExecuteAgentFuse(Worker):
         )
 
     async def install_missing_package(
-        self, context: Context, evaluation_result: EvaluationResult
-    ):
-        """Install missing package."""
-        user_message = Message.from_text(
-            sender="user",
-            role=Role.USER,
-            data=EVOLVE_EXECUTOR_CHAT_PACKAGE_INSTALL.format(
-                error_msg=evaluation_result.summary, language="python"
-            ),
+        self, context: Context, module: str
+    ) -> ProvisionResult:
+        """Provision the package of a missing module for the next evaluations."""
+        logger.info(
+            f"Trace ID: {context.trace_id}: Executor Fuse: Start Install missing package: {module}"
         )
-
-        llm_request = CompletionRequest(messages=[user_message])
-
-        resp_generator = self.model.generate(llm_request)
-        try:
-            resp = await anext(resp_generator)
-            if resp.error_code:
-                raise Exception(
-                    f"Error code: {resp.error_code}, error: {resp.error_message}"
-                )
-        finally:
-            async for _ in resp_generator:
-                pass
-
-        cmd = ""
-        for element in resp.content:
-            if isinstance(element, ContentElement):
-                cmd = parse_full_rewrite(element.data)
-
-        total_completion_tokens = resp.usage.completion_tokens or 0
-        total_prompt_tokens = resp.usage.prompt_tokens or 0
-
-        if not cmd:
-            logger.warning(
-                f"Trace ID: {context.trace_id}: Executor Fuse: No package install command generated"
-            )
-            return total_completion_tokens, total_prompt_tokens
-
-        try:
-            logger.info(
-                f"Trace ID: {context.trace_id}: Executor Fuse: Start Install missing package: {cmd}"
-            )
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                check=True,
-                text=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
+        result = await self.evaluator.provisioner.provision(module)
+        if result.success:
             logger.info(
-                f"Trace ID: {context.trace_id}: Executor Fuse: Install package result: {result}"
+                f"Trace ID: {context.trace_id}: Executor Fuse: Install package result: {result.message}"
             )
-        except subprocess.CalledProcessError as e:
+        else:
             logger.error(
-                f"Trace ID: {context.trace_id}: Executor Fuse: Error install package: {e}"
+                f"Trace ID: {context.trace_id}: Executor Fuse: Error install package: "
+                + f"{result.message} {result.output[-2000:]}"
             )
-
-        return total_completion_tokens, total_prompt_tokens
+        return result
 
     async def _create_react_agent(
-        self, context: Context, candidate_path: str
+        self,
+        context: Context,
+        candidate_path: str,
+        on_evaluation: Optional[Callable[[EvaluationResult], None]] = None,
+        prompt_context: Optional[PromptContextBuilder] = None,
     ) -> tuple[ReActAgent, int]:
         """Create and configure a ReActAgent for execution."""
-        system_prompt = (
+        system_prompt = (prompt_context or PromptContextBuilder()).system_prompt(
             self.config.react_system_prompt or EVOLVE_EXECUTOR_REACT_SYSTEM_PROMPT
         )
         system_message = [Message.from_text(system_prompt, role=Role.SYSTEM)]
@@ -793,7 +897,7 @@ class EvolveExecuteAgentFuse(Worker):
             ),
             config=memory_config,
         )
-        tool_kit = self._build_toolkit(context, candidate_path)
+        tool_kit = self._build_toolkit(context, candidate_path, on_evaluation)
         agent_context = AgentContext(
             agent_memory, toolkit=tool_kit, max_steps=self.config.react_max_steps
         )
@@ -826,14 +930,22 @@ class EvolveExecuteAgentFuse(Worker):
             token_threshold,
         )
 
-    def _build_toolkit(self, context: Context, candidate_path: str) -> Toolkit:
+    def _build_toolkit(
+        self,
+        context: Context,
+        candidate_path: str,
+        on_evaluation: Optional[Callable[[EvaluationResult], None]] = None,
+    ) -> Toolkit:
         """Register tools used by the ReActAgent."""
         toolkit = Toolkit()
         toolkit.register_tool(
-            build_evaluator_solution_tool(self.evaluator, context, candidate_path)
+            build_evaluator_solution_tool(
+                self.evaluator, context, candidate_path, on_evaluation
+            )
         )
         toolkit.register_tool(build_executor_read_tool(context, candidate_path))
-        toolkit.register_tool(build_install_package_tool())
+        toolkit.register_tool(build_install_package_tool(self.evaluator.provisioner))
         toolkit.register_tool(build_executor_write_tool(context, candidate_path))
         toolkit.register_tool(build_executor_ls_tool(context, candidate_path))
+        toolkit.register_tool(build_best_evaluations_tool(context))
         return toolkit
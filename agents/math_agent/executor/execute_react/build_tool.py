@@ -6,10 +6,9 @@ Tools for building tools for the executor.
 
 import json
 import os
-import subprocess
 import time
 import uuid
-from typing import Type, Optional
+from typing import Callable, Type, Optional
 
 from pydantic import BaseModel, Field
 
@@ -18,8 +17,14 @@ from loongflow.agentsdk.message import Message
 from loongflow.agentsdk.models.base_llm_model import BaseLLMModel
 from loongflow.agentsdk.tools import AgentTool, Toolkit, FunctionTool
 from loongflow.framework.pes.context import Context, Workspace
-from loongflow.framework.pes.evaluator.evaluator import LoongFlowEvaluator
+from loongflow.framework.pes.evaluator.evaluator import (
+    EvaluationResult,
+    LoongFlowEvaluator,
+)
+from loongflow.framework.pes.evaluator.provisioner import PackageProvisioner
+from loongflow.framework.pes.executor import CandidateRecord, ResultChannel
 from loongflow.framework.react import ReActAgent
+from agents.math_agent.executor.execute_react.history_store import EvaluationHistory
 
 logger = get_logger(__name__)
 
@@ -75,10 +80,38 @@ class ReActAgentInputSchema(BaseModel):
     request: str = Field(description="User query or task instruction text.")
 
 
+def publish_evaluation(
+    context: Context, candidate_path: str, random_str: str, evaluation: dict
+) -> None:
+    """
+    Publish the evaluation of a candidate solution to the result channel of the cycle.
+
+    Called once ``solution_{random_str}.py`` and ``evaluation_{random_str}.json``
+    are written to ``candidate_path``.
+    """
+    ResultChannel.for_context(context).publish(
+        CandidateRecord(
+            candidate=os.path.basename(candidate_path),
+            attempt=random_str,
+            score=float(evaluation.get("score") or 0.0),
+            solution_file_path=f"{candidate_path}/solution_{random_str}.py",
+            evaluation_file_path=f"{candidate_path}/evaluation_{random_str}.json",
+            evaluation=evaluation,
+        )
+    )
+
+
 def build_evaluator_solution_tool(
-    evaluator: LoongFlowEvaluator, context: Context, candidate_path: str
+    evaluator: LoongFlowEvaluator,
+    context: Context,
+    candidate_path: str,
+    on_evaluation: Optional[Callable[[EvaluationResult], None]] = None,
 ) -> FunctionTool:
-    """Build a FunctionTool for running LoongFlowEvaluator."""
+    """Build a FunctionTool for running LoongFlowEvaluator.
+
+    on_evaluation, if given, is called with every evaluation result once the
+    solution and evaluation files are written.
+    """
 
     async def evaluate_solution_func(code_file_path: str):
         """
@@ -170,6 +203,9 @@ def build_evaluator_solution_tool(
             Workspace.write_executor_file(
                 context, f"{candidate_path}/solution_{random_str}.py", code
             )
+            publish_evaluation(context, candidate_path, random_str, data)
+            if on_evaluation is not None and result is not None:
+                on_evaluation(result)
             logger.info(
                 "Trace ID: %s: Executor: React Mode Get Evaluation Result: %s, solution_file_path: %s",
                 context.trace_id,
@@ -177,25 +213,23 @@ def build_evaluator_solution_tool(
                 code_file_path,
             )
 
-            history_log_file_path = (
-                f"{Workspace.get_executor_path(context)}/history.log"
-            )
-            with open(history_log_file_path, "r") as f:
-                history_log = f.readlines()
-
+            history = EvaluationHistory.for_path(get_history_log_path(context))
             logger.debug(
                 f"Trace ID: {context.trace_id}: Executor: Update History log "
                 + f"with solution_file_path={code_file_path}"
             )
-            history = {
-                "solution_file_path": code_file_path,
-                "evaluation_result": json.dumps(data, indent=2),
-                "evaluate_timestamp": time.time(),
-            }
-
-            history_log.append(json.dumps(history, indent=2) + "\n")
-            with open(history_log_file_path, "w") as f:
-                f.writelines(history_log)
+            history.append(
+                {
+                    "solution_file_path": code_file_path,
+                    "evaluation_file_path": f"{candidate_path}/evaluation_{random_str}.json",
+                    "score": data.get("score"),
+                    "evaluation_result": json.dumps(data, indent=2),
+                    "evaluate_timestamp": time.time(),
+                }
+            )
+            best = history.best()
+            if best is not None:
+                data["best_score_so_far"] = best["score"]
 
             return {**data}
 
@@ -210,6 +244,46 @@ def build_evaluator_solution_tool(
     )
 
 
+def get_history_log_path(context: Context) -> str:
+    """Path of the evaluation history shared by the candidates of an executor run."""
+    return f"{Workspace.get_executor_path(context)}/history.log"
+
+
+class BestEvaluationsArgs(BaseModel):
+    """Arguments for the best evaluations tool."""
+
+    top_k: int = Field(
+        default=1, ge=1, description="Number of best evaluations to return."
+    )
+
+
+def build_best_evaluations_tool(context: Context) -> FunctionTool:
+    """Build a FunctionTool returning the best evaluations of all candidates so far."""
+
+    async def best_evaluations_func(top_k: int = 1) -> dict:
+        """
+        Get the best evaluations recorded by all candidates of this executor run.
+
+        Args:
+            top_k (int): Number of best evaluations to return.
+
+        Returns:
+            dict: {"total_evaluations": int, "best": [<history records>]}
+        """
+        history = EvaluationHistory.for_path(get_history_log_path(context))
+        return {"total_evaluations": len(history), "best": history.top(top_k)}
+
+    return FunctionTool(
+        func=best_evaluations_func,
+        args_schema=BestEvaluationsArgs,
+        name="get_best_evaluations",
+        description=(
+            "Get the best scoring solutions evaluated so far by all candidates, "
+            "with their solution and evaluation file paths."
+        ),
+    )
+
+
 def build_executor_write_tool(context: Context, candidate_path: str) -> FunctionTool:
     """Build a FunctionTool for writing executor files in LoongFlow framework.
 
@@ -517,14 +591,14 @@ class InstallPackageArgs(BaseModel):
     )
 
 
-def build_install_package_tool() -> FunctionTool:
-    """Build a FunctionTool for installing Python packages."""
+def build_install_package_tool(provisioner: PackageProvisioner) -> FunctionTool:
+    """Build a FunctionTool installing Python packages for the evaluations of the run."""
 
     async def install_package_func(
         package_name: str, version: Optional[str] = None, upgrade: bool = False
     ) -> dict:
         """
-        Install a Python package using pip.
+        Install a Python package with the package provisioner of the run.
 
         Args:
             package_name: Name of the package to install
@@ -542,27 +616,14 @@ def build_install_package_tool() -> FunctionTool:
         if version:
             package_spec = f"{package_name}=={version}"
 
-        command = ["pip", "install"]
-        if upgrade:
-            command.append("--upgrade")
-        command.append(package_spec)
-
-        try:
-            result = subprocess.run(command, capture_output=True, text=True, check=True)
-
-            return {
-                "success": True,
-                "message": f"Successfully installed {package_spec}",
-                "output": result.stdout,
-            }
-
-        except subprocess.CalledProcessError as e:
-            logger.error("Failed to install package %s: %s", package_spec, e.stderr)
-            return {
-                "success": False,
-                "message": f"Failed to install {package_spec}",
-                "output": e.stderr,
-            }
+        result = await provisioner.install(package_spec, upgrade=upgrade)
+        if not result.success:
+            logger.error("Failed to install package %s: %s", package_spec, result.output)
+        return {
+            "success": result.success,
+            "message": result.message,
+            "output": result.output,
+        }
 
     return FunctionTool(
         func=install_package_func,
@@ -10,18 +10,20 @@ import json
 import os
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, List, Optional
 
 from pydantic import BaseModel, Field
 
 from agents.math_agent.executor.execute_react.build_tool import (
     build_evaluator_solution_tool,
     build_install_package_tool,
+    get_history_log_path,
 )
 from agents.math_agent.executor.execute_react.execute_agent_observer import (
     ExecuteAgentObserver,
     ToolOutputException,
 )
+from agents.math_agent.executor.execute_react.history_store import EvaluationHistory
 from agents.math_agent.executor.utils import EPSILON
 from agents.math_agent.prompt.evolve_execute_prompt import (
     EVOLVE_EXECUTOR_REACT_SYSTEM_PROMPT,
@@ -30,11 +32,17 @@ from agents.math_agent.prompt.evolve_execute_prompt import (
 from loongflow.agentsdk.logger import get_logger
 from loongflow.agentsdk.memory.grade.memory import GradeMemory
 from loongflow.agentsdk.message import ContentElement, Message, MimeType, Role
-from loongflow.agentsdk.models import BaseLLMModel, LiteLLMModel
+from loongflow.agentsdk.models import BaseLLMModel
 from loongflow.agentsdk.tools import Toolkit
-from loongflow.framework.pes.context import Context, LLMConfig, Workspace
+from loongflow.framework.pes.context import (
+    Context,
+    LLMConfig,
+    PromptContextBuilder,
+    Workspace,
+)
 from loongflow.framework.pes.evaluator import LoongFlowEvaluator
-from loongflow.framework.pes.register import Worker
+from loongflow.framework.pes.executor import ResultChannel
+from loongflow.framework.pes.register import ReusableWorker
 from loongflow.framework.react import AgentContext, ReActAgent
 from loongflow.framework.react.components import (
     DefaultFinalizer,
@@ -105,6 +113,8 @@ class ExecutionContext:
     parent_solution: str
     stage1_plan: str
     stage1_plan_file_path: str
+    # Holds the parent code as the base of the system prompts
+    prompt_context: PromptContextBuilder = field(default_factory=PromptContextBuilder)
 
 
 @dataclass
@@ -120,7 +130,7 @@ class HistoryRecord:
         return self.records
 
 
-class EvolveExecuteAgentReact(Worker):
+class EvolveExecuteAgentReact(ReusableWorker):
     """Agent for iterative candidate generation and evaluation."""
 
     def __init__(self, config: Any, evaluator: LoongFlowEvaluator):
@@ -134,11 +144,24 @@ class EvolveExecuteAgentReact(Worker):
         self.model = self._init_model()
         logger.info(f"Executor: Agent React successfully initialized")
 
+    def reset(self, context: Context) -> None:
+        """The model is the only state kept between cycles, nothing to reset."""
+
     async def run(self, context: Context, message: Message) -> Message:
         """
         Perform multi-round candidate generation and evaluation until
          an improved solution is found or max rounds are reached.
         """
+        # The candidates of the run share one evaluation history until it ends
+        history_path = get_history_log_path(context)
+        EvaluationHistory.acquire(history_path)
+        try:
+            return await self._run(context, message)
+        finally:
+            ResultChannel.release(context)
+            EvaluationHistory.release(history_path)
+
+    async def _run(self, context: Context, message: Message) -> Message:
         parent_ctx = self._parse_message_inputs(message)
         history = HistoryRecord()
         all_results: List[CandidateResult] = []
@@ -274,7 +297,9 @@ class EvolveExecuteAgentReact(Worker):
         candidate_path = Workspace.get_executor_candidate_path(
             context, f"{round_idx}_{candidate_idx}"
         )
-        react_agent = self._create_react_agent(context, candidate_path)
+        react_agent = self._create_react_agent(
+            context, candidate_path, parent_ctx.prompt_context
+        )
         user_prompt = EVOLVE_EXECUTOR_REACT_USER_PROMPT.format(
             task=context.task,
             plan=parent_ctx.stage1_plan,
@@ -308,6 +333,8 @@ class EvolveExecuteAgentReact(Worker):
         if not llm or not all([llm.model]):
             raise ValueError("model_name, url, and api_key are required in llm_config.")
 
+        from loongflow.agentsdk.models import LiteLLMModel
+
         return LiteLLMModel.from_config(llm.model_dump())
 
     def _parse_message_inputs(self, message: Message) -> ExecutionContext:
@@ -332,12 +359,16 @@ class EvolveExecuteAgentReact(Worker):
         with open(parent_info_path, "r", encoding="utf-8") as f:
             parent_data = json.load(f)
 
+        # Every candidate and step shares the system prompt holding the parent
+        # code, the user prompts only carry the compacted rest of the parent
+        prompt_context = PromptContextBuilder(parent_data.get("solution") or "")
         return ExecutionContext(
             parent_info_file_path=parent_info_path,
             parent_core=float(parent_data.get("score", 0.0)),
-            parent_solution=parent_data.get("solution", ""),
+            parent_solution=prompt_context.pack(parent_data),
             stage1_plan=stage1_plan,
             stage1_plan_file_path=plan_path,
+            prompt_context=prompt_context,
         )
 
     def _parse_message_to_llm_output(self, result_msg: Message) -> str:
@@ -347,7 +378,12 @@ class EvolveExecuteAgentReact(Worker):
             return content[0].data
         return f"parse llm ContentElement failed, result_msg:{json.dumps(result_msg.to_dict(), ensure_ascii=False)}"
 
-    def _create_react_agent(self, context: Context, candidate_path: str) -> ReActAgent:
+    def _create_react_agent(
+        self,
+        context: Context,
+        candidate_path: str,
+        prompt_context: Optional[PromptContextBuilder] = None,
+    ) -> ReActAgent:
         """Create and configure a ReActAgent for execution."""
         agent_context = AgentContext(
             GradeMemory.create_default(self.model),
@@ -355,7 +391,7 @@ class EvolveExecuteAgentReact(Worker):
             max_steps=self.config.react_max_steps,
         )
 
-        system_prompt = (
+        system_prompt = (prompt_context or PromptContextBuilder()).system_prompt(
             self.config.system_prompt
             or EVOLVE_EXECUTOR_REACT_SYSTEM_PROMPT.format(
                 workspace=candidate_path,
@@ -398,7 +434,7 @@ class EvolveExecuteAgentReact(Worker):
         toolkit.register_tool(
             build_evaluator_solution_tool(self.evaluator, context, candidate_path)
         )
-        toolkit.register_tool(build_install_package_tool())
+        toolkit.register_tool(build_install_package_tool(self.evaluator.provisioner))
         return toolkit
 
     def load_results_for_candidate(
@@ -408,95 +444,33 @@ class EvolveExecuteAgentReact(Worker):
         candidate_idx: int,
         llm_out: str,
     ) -> List[CandidateResult]:
-        """Read a candidate folder and return all paired solution/evaluation results.
+        """Return the results published by the evaluations of a candidate this cycle.
 
-        Pairing logic: find all files matching solution*.py and evaluation*.json and pair
-        them by the suffix present in the filename. Example:
-            solution1_23.py <-> evaluation1_23.json  (suffix: '1_23' or '23' depending on naming)
+        Every evaluation publishes a record to the result channel of the cycle once its
+        solution*.py and evaluation*.json files are written, results keep source='disk'
+        as these files back them.
 
         Returns list of CandidateResult with source='disk'. If none found, returns single
         CandidateResult with source='llm' containing the LLM status/reason as record.
         """
-        candidate_path = Workspace.get_executor_candidate_path(
-            context, f"{round_idx}_{candidate_idx}"
+        records = ResultChannel.for_context(context).records(
+            f"{round_idx}_{candidate_idx}"
         )
-        p = Path(candidate_path)
-
-        if not p.exists() or not p.is_dir():
-            # no folder -> return llm-only fallback
-            logger.warning(
-                f"Trace ID: {context.trace_id}: Executor React: "
-                + f"Candidate folder not found: {candidate_path}"
-            )
-            return [
-                CandidateResult(
-                    round_idx=round_idx,
-                    candidate_idx=candidate_idx,
-                    solution_file_path="",
-                    evaluation_file_path="",
-                    score=0.0,
-                    reason=llm_out,
-                    source="llm",
-                )
-            ]
-
-        # gather files
-        solution_candidates = list(p.glob("solution*.py"))
-        eval_candidates = list(p.glob("evaluation*.json"))
-
-        # Build maps keyed by extracted random_idx token
-        def extract_suffix(fp: Path, prefix: str):
-            name = fp.name
-            if not name.startswith(prefix):
-                return None
-            core = name[len(prefix) :]
-            core = core.rsplit(".", 1)[0]
-            return core
-
-        sol_map: Dict[str, Path] = {}
-        for s in solution_candidates:
-            key = extract_suffix(s, "solution")
-            if key:
-                sol_map[key] = s
-
-        eval_map: Dict[str, Path] = {}
-        for e in eval_candidates:
-            key = extract_suffix(e, "evaluation")
-            if key:
-                eval_map[key] = e
-
-        paired_keys = sorted(set(sol_map.keys()) & set(eval_map.keys()))
-
-        results: List[CandidateResult] = []
-        for k in paired_keys:
-            s_path = str(sol_map[k])
-            e_path = str(eval_map[k])
-
-            try:
-                with open(e_path, "r", encoding="utf-8") as f:
-                    eval_data = json.load(f)
-            except Exception as e:
-                logger.warning(
-                    f"Trace ID: {context.trace_id}: Executor React: "
-                    + f"Failed to read evaluation file {e_path}: {e}"
-                )
-                continue
-
-            score = float(eval_data.get("score", 0.0))
-
-            cr = CandidateResult(
+        results: List[CandidateResult] = [
+            CandidateResult(
                 round_idx=round_idx,
                 candidate_idx=candidate_idx,
-                random_idx=str(k),
-                solution_file_path=s_path,
-                evaluation_file_path=e_path,
-                score=score,
+                random_idx=f"_{record.attempt}",
+                solution_file_path=record.solution_file_path,
+                evaluation_file_path=record.evaluation_file_path,
+                score=record.score,
                 reason=llm_out,
                 source="disk",
             )
-            results.append(cr)
+            for record in records
+        ]
 
-        # If no pairs but LLM said something, return fallback single result with LLM info
+        # If no results but LLM said something, return fallback single result with LLM info
         if not results:
             return [
                 CandidateResult(
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Append-only evaluation history shared by the executor tools.
+"""
+
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from loongflow.agentsdk.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class EvaluationHistory:
+    """
+    Append-only JSONL store of the evaluations made by the executor candidates.
+
+    Every record is written as one line with a single append, so parallel candidates
+    never rewrite each other's entries. Writes are flushed immediately and fsynced
+    in batches. The best record and the top-k records are kept in memory, so
+    best-so-far queries do not read the file.
+
+    Stores are shared per path inside the process, use ``for_path`` to get one.
+    Executors ``acquire`` the store of their run and ``release`` it when the run
+    ends, which closes it. At most ``MAX_OPEN_STORES`` stores that no run holds
+    stay open, the least recently used ones are closed and reloaded from their
+    file when needed again. Held stores are never evicted, so the candidates of a
+    run always share one instance.
+    """
+
+    MAX_OPEN_STORES = 32
+
+    _stores: "OrderedDict[str, EvaluationHistory]" = OrderedDict()
+    # Number of runs holding the store of a path
+    _holders: Dict[str, int] = {}
+    _stores_lock = threading.Lock()
+
+    def __init__(
+        self,
+        path: str,
+        top_k: int = 5,
+        fsync_every: int = 16,
+        fsync_interval: float = 1.0,
+    ):
+        """
+        Args:
+            path (str): Path of the JSONL history file, created if missing.
+            top_k (int): Number of best records kept in memory.
+            fsync_every (int): Fsync after this many unsynced records.
+            fsync_interval (float): Fsync when the last fsync is older than this, in seconds.
+        """
+        self.path = path
+        self.top_k = top_k
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        self._count = 0
+        self._best: Optional[dict] = None
+        self._top: List[tuple] = []
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+        self._load()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._fd: Optional[int] = self._open()
+
+    def _open(self) -> int:
+        return os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    @classmethod
+    def for_path(cls, path: str, **kwargs) -> "EvaluationHistory":
+        """Get the store of a history file, opening it on first use."""
+        with cls._stores_lock:
+            return cls._get(os.path.abspath(path), path, **kwargs)
+
+    @classmethod
+    def acquire(cls, path: str) -> None:
+        """Hold the store of a history file, opened on first use, until ``release``."""
+        key = os.path.abspath(path)
+        with cls._stores_lock:
+            cls._holders[key] = cls._holders.get(key, 0) + 1
+
+    @classmethod
+    def release(cls, path: str) -> None:
+        """Release a store held with ``acquire``, closing it once no run holds it."""
+        key = os.path.abspath(path)
+        with cls._stores_lock:
+            holders = cls._holders.get(key, 0) - 1
+            if holders > 0:
+                cls._holders[key] = holders
+                return
+            cls._holders.pop(key, None)
+            store = cls._stores.pop(key, None)
+        if store is not None:
+            store.close()
+
+    @classmethod
+    def _get(cls, key: str, path: str, **kwargs) -> "EvaluationHistory":
+        """The store of ``key``, opened if needed, must be called with the lock held."""
+        store = cls._stores.get(key)
+        if store is None:
+            store = cls(path, **kwargs)
+            cls._stores[key] = store
+            cls._evict()
+        cls._stores.move_to_end(key)
+        return store
+
+    @classmethod
+    def _evict(cls) -> None:
+        """Close the least recently used stores no run holds beyond ``MAX_OPEN_STORES``."""
+        idle = [key for key in cls._stores if key not in cls._holders]
+        for key in idle[: max(len(idle) - cls.MAX_OPEN_STORES, 0)]:
+            cls._stores.pop(key).close()
+            logger.debug(f"Closed evaluation history {key}.")
+
+    @classmethod
+    def reset(cls, path: str) -> None:
+        """Close the store of a history file and truncate the file."""
+        key = os.path.abspath(path)
+        with cls._stores_lock:
+            store = cls._stores.pop(key, None)
+            if store is not None:
+                store.close()
+            os.makedirs(os.path.dirname(key), exist_ok=True)
+            with open(path, "w"):
+                pass
+
+    def _load(self) -> None:
+        """Rebuild the in-memory summaries from an existing file."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Entries of the former pretty-printed format are skipped.
+                    continue
+                if isinstance(record, dict):
+                    self._index(record)
+
+    def _index(self, record: dict) -> None:
+        self._count += 1
+        score = record.get("score")
+        if not isinstance(score, (int, float)):
+            return
+        if self._best is None or score > self._best["score"]:
+            self._best = record
+        entry = (score, next(self._seq), record)
+        if len(self._top) < self.top_k:
+            heapq.heappush(self._top, entry)
+        elif score > self._top[0][0]:
+            heapq.heapreplace(self._top, entry)
+
+    def append(self, record: dict) -> None:
+        """
+        Append a record to the history.
+
+        Args:
+            record (dict): JSON serializable record. Its ``score`` field, if numeric,
+                is used for the best and top-k summaries.
+        """
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            if self._fd is None:
+                # Closed by eviction while still referenced, reopen for append.
+                self._fd = self._open()
+            os.write(self._fd, line)
+            self._index(record)
+            self._unsynced += 1
+            if (
+                self._unsynced >= self.fsync_every
+                or time.monotonic() - self._last_sync >= self.fsync_interval
+            ):
+                self._sync()
+
+    def _sync(self) -> None:
+        os.fsync(self._fd)
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def best(self) -> Optional[dict]:
+        """The record with the highest score so far, or None."""
+        return self._best
+
+    def top(self, k: Optional[int] = None) -> List[dict]:
+        """The best records so far, highest score first, at most ``top_k`` of them."""
+        with self._lock:
+            ranked = sorted(self._top, key=lambda e: (-e[0], e[1]))
+        return [record for _, _, record in ranked[:k]]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        """Fsync pending records and close the file."""
+        with self._lock:
+            if self._fd is None:
+                return
+            try:
+                self._sync()
+            finally:
+                os.close(self._fd)
+                self._fd = None
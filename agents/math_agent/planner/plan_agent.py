@@ -19,13 +19,18 @@ from agents.math_agent.prompt.evolve_plan_prompt import (
 from loongflow.agentsdk.logger import get_logger
 from loongflow.agentsdk.memory.grade import GradeMemory, MemoryConfig
 from loongflow.agentsdk.message import ContentElement, Message, MimeType, Role
-from loongflow.agentsdk.models import LiteLLMModel
+from loongflow.agentsdk.models import BaseLLMModel
 from loongflow.agentsdk.token import SimpleTokenCounter
 from loongflow.agentsdk.tools import (
     Toolkit,
 )
 from loongflow.framework.pes.compressor import EvolveCompressor
-from loongflow.framework.pes.context import Context, LLMConfig, Workspace
+from loongflow.framework.pes.context import (
+    Context,
+    LLMConfig,
+    PromptContextBuilder,
+    Workspace,
+)
 from loongflow.framework.pes.database import EvolveDatabase
 from loongflow.framework.pes.database.database_tool import (
     GetBestSolutionsTool,
@@ -34,7 +39,7 @@ from loongflow.framework.pes.database.database_tool import (
     GetParentsByChildIdTool,
     GetSolutionsTool,
 )
-from loongflow.framework.pes.register import Worker
+from loongflow.framework.pes.register import ReusableWorker
 from loongflow.framework.react import AgentContext, ReActAgent
 from loongflow.framework.react.components import (
     DefaultObserver,
@@ -54,16 +59,18 @@ class PlannerAgentConfig:
     react_max_steps: int = 10
 
 
-def _init_model(model_config: LLMConfig) -> LiteLLMModel:
+def _init_model(model_config: LLMConfig) -> BaseLLMModel:
     try:
         LLMConfig.model_validate(model_config)
     except ValidationError as e:
         raise ValueError(f"Response validation failed, error: {e}")
 
+    from loongflow.agentsdk.models import LiteLLMModel
+
     return LiteLLMModel.from_config(model_config.model_dump())
 
 
-class EvolvePlanAgent(Worker):
+class EvolvePlanAgent(ReusableWorker):
     """Plan Agent Class"""
 
     def __init__(self, config: Any, db: EvolveDatabase):
@@ -79,10 +86,11 @@ class EvolvePlanAgent(Worker):
 
         logger.info(f"Planner: Agent successfully initialized")
 
-    async def run(self, context: Context, message: Message) -> Message:
-        agent, rest_token = await self._create_agent()
-        agent.context.toolkit.register_tool(build_planner_write_tool(context))
+    def reset(self, context: Context) -> None:
+        """Drop the write tool bound to the previous cycle's workspace."""
+        self.tool_kit.unregister_tool("Write")
 
+    async def run(self, context: Context, message: Message) -> Message:
         """Main method"""
         task = context.task
         island_id = context.island_id
@@ -103,13 +111,13 @@ class EvolvePlanAgent(Worker):
             f"Trace ID: {context.trace_id}: Planner: Workspace is : {workspace}"
         )
 
-        memory_status = self.database.memory_status()
+        memory_status = await self.database.amemory_status()
         logger.info(
             f"Trace ID: {context.trace_id}: Planner: Current Iteration {context.current_iteration} "
             + f"Memory status: {memory_status}"
         )
 
-        parent = self.database.sample_solution(island_id)
+        parent = await self.database.asample_solution(island_id)
         logger.info(
             f"Trace ID: {context.trace_id}: Planner: Get sample parent solution: {parent}"
         )
@@ -123,9 +131,17 @@ class EvolvePlanAgent(Worker):
             f"Trace ID: {context.trace_id}: Planner: Write planner parent info to {parent_info_file_path}"
         )
 
+        # The parent code is the base of the system message, the user prompt holds
+        # the compacted rest of the parent
+        prompt_context = PromptContextBuilder(parent_dict.get("solution") or "")
+        agent, rest_token = await self._create_agent(prompt_context)
+        agent.context.toolkit.register_tool(build_planner_write_tool(context))
+
         user_prompt = EVOLVE_PLANNER_USER_PROMPT.format(
             task_info=task,
-            parent_solution=parent_json,
+            parent_solution=prompt_context.pack(
+                parent_dict, budget_tokens=rest_token // 2
+            ),
             workspace=workspace,
             island_num=self.database.config.num_islands,
             parent_island=parent.get("island_id") if parent else 0,
@@ -148,7 +164,8 @@ class EvolvePlanAgent(Worker):
         resp = await agent.run(
             initial_message,
             task=task,
-            parent_solution=parent_json,
+            # The finalizer has its own system message, without the base
+            parent_solution=PromptContextBuilder().pack(parent_dict),
             workspace=workspace,
             trace_id=context.trace_id,
         )
@@ -178,11 +195,11 @@ class EvolvePlanAgent(Worker):
 
     def _build_tool_kit(self) -> Toolkit:
         function_tool_list = [
-            GetMemoryStatusTool(self.database.memory_status),
-            GetSolutionsTool(self.database.get_solutions),
-            GetBestSolutionsTool(self.database.get_best_solutions),
-            GetParentsByChildIdTool(self.database.get_parents_by_child_id),
-            GetChildsByParentTool(self.database.get_childs_by_parent_id),
+            GetMemoryStatusTool(self.database.amemory_status),
+            GetSolutionsTool(self.database.aget_solutions),
+            GetBestSolutionsTool(self.database.aget_leaderboard),
+            GetParentsByChildIdTool(self.database.aget_parents_by_child_id),
+            GetChildsByParentTool(self.database.aget_childs_by_parent_id),
         ]
 
         tool_kit = Toolkit()
@@ -191,8 +208,12 @@ class EvolvePlanAgent(Worker):
 
         return tool_kit
 
-    async def _create_agent(self) -> tuple[ReActAgent, int]:
-        system_prompt = self.config.system_prompt or EVOLVE_PLANNER_SYSTEM_PROMPT
+    async def _create_agent(
+        self, prompt_context: PromptContextBuilder
+    ) -> tuple[ReActAgent, int]:
+        system_prompt = prompt_context.system_prompt(
+            self.config.system_prompt or EVOLVE_PLANNER_SYSTEM_PROMPT
+        )
         system_message = [Message.from_text(system_prompt, role=Role.SYSTEM)]
         token_counter = SimpleTokenCounter()
         system_token_count = await token_counter.count(system_message)
@@ -21,24 +21,29 @@ from agents.math_agent.prompt.evolve_summary_prompt import (
 from agents.math_agent.summary.summary_agent_finalizer import (
     SummaryAgentFinalizer,
 )
-from loongflow.agentsdk.logger import get_logger
+from loongflow.agentsdk.logger import get_logger, lazy
 from loongflow.agentsdk.memory.evolution import Solution
 from loongflow.agentsdk.memory.grade import GradeMemory, MemoryConfig
 from loongflow.agentsdk.message import ContentElement, Message, MimeType, Role
-from loongflow.agentsdk.models import LiteLLMModel
+from loongflow.agentsdk.models import BaseLLMModel
 from loongflow.agentsdk.token import SimpleTokenCounter
 from loongflow.agentsdk.tools import (
     Toolkit,
 )
 from loongflow.framework.pes.compressor import EvolveCompressor
-from loongflow.framework.pes.context import Context, LLMConfig, Workspace
+from loongflow.framework.pes.context import (
+    Context,
+    LLMConfig,
+    PromptContextBuilder,
+    Workspace,
+)
 from loongflow.framework.pes.database import EvolveDatabase
 from loongflow.framework.pes.database.database_tool import (
     GetChildsByParentTool,
     GetParentsByChildIdTool,
     GetSolutionsTool,
 )
-from loongflow.framework.pes.register import Worker
+from loongflow.framework.pes.register import ReusableWorker
 from loongflow.framework.react import AgentContext, ReActAgent
 from loongflow.framework.react.components import (
     DefaultObserver,
@@ -78,16 +83,18 @@ class Assessment(Enum):
     STALE = "stale"
 
 
-def _init_model(model_config: LLMConfig) -> LiteLLMModel:
+def _init_model(model_config: LLMConfig) -> BaseLLMModel:
     try:
         LLMConfig.model_validate(model_config)
     except ValidationError as e:
         raise ValueError(f"Response validation failed, error: {e}")
 
+    from loongflow.agentsdk.models import LiteLLMModel
+
     return LiteLLMModel.from_config(model_config.model_dump())
 
 
-class EvolveSummaryAgent(Worker):
+class EvolveSummaryAgent(ReusableWorker):
     """Summary Agent class"""
 
     def __init__(self, config: Any, db: EvolveDatabase):
@@ -99,12 +106,21 @@ class EvolveSummaryAgent(Worker):
         self.agent = None
         logger.info(f"Summary: Agent successfully initialized")
 
+    def reset(self, context: Context) -> None:
+        """Drop the ReAct agent created for the previous cycle."""
+        self.agent = None
+
     async def run(self, context: Context, message: Message) -> Message:
         """Main method"""
-        self.agent, rest_token = await self._create_agent()
         evidence = await self._gather(context, message)
+        # The parent code is the base of the system message, the user prompt holds
+        # the compacted parent and the current solution as a diff against it
+        prompt_context = PromptContextBuilder(evidence.parent_info.solution or "")
+        self.agent, rest_token = await self._create_agent(prompt_context)
         assessment = await self._assess(context, evidence)
-        analysis_str = await self._reflect(context, evidence, assessment, rest_token)
+        analysis_str = await self._reflect(
+            context, evidence, assessment, rest_token, prompt_context
+        )
         analysis = json.loads(analysis_str)
         await self._record(context, evidence, analysis.get("reflection", ""))
         return Message.from_elements(
@@ -221,14 +237,15 @@ class EvolveSummaryAgent(Worker):
         evidence: Evidence,
         assessment: Assessment,
         rest_token: int,
+        prompt_context: PromptContextBuilder,
     ) -> str:
         user_prompt = EVOLVE_SUMMARY_USER_PROMPT.format(
             task_info=context.task,
-            parent_solution=json.dumps(
-                evidence.parent_info.to_dict(), indent=2, ensure_ascii=False
+            parent_solution=prompt_context.pack(
+                evidence.parent_info.to_dict(), budget_tokens=rest_token // 4
             ),
-            current_solution=json.dumps(
-                evidence.current_solution.to_dict(), indent=2, ensure_ascii=False
+            current_solution=prompt_context.pack(
+                evidence.current_solution.to_dict(), budget_tokens=rest_token // 4
             ),
             assessment_result=assessment.value,
         )
@@ -303,8 +320,9 @@ class EvolveSummaryAgent(Worker):
         await self.db.add_solution(evidence.current_solution)
 
         logger.info(
-            f"Trace ID: {context.trace_id}: Summary: Successfully add new solution into database. "
-            + f"Solution: {evidence.current_solution.to_dict()}"
+            "Trace ID: %s: Summary: Successfully add new solution into database. Solution: %s",
+            context.trace_id,
+            lazy(evidence.current_solution.to_dict),
         )
 
         Workspace.write_summarizer_best_summary(context, reflection)
@@ -322,8 +340,12 @@ class EvolveSummaryAgent(Worker):
             toolkit.register_tool(tool)
         return toolkit
 
-    async def _create_agent(self) -> tuple[ReActAgent, int]:
-        system_prompt = self.config.system_prompt or EVOLVE_SUMMARY_SYSTEM_PROMPT
+    async def _create_agent(
+        self, prompt_context: PromptContextBuilder
+    ) -> tuple[ReActAgent, int]:
+        system_prompt = prompt_context.system_prompt(
+            self.config.system_prompt or EVOLVE_SUMMARY_SYSTEM_PROMPT
+        )
         system_message = [Message.from_text(system_prompt, role=Role.SYSTEM)]
         token_counter = SimpleTokenCounter()
         system_token_count = await token_counter.count(system_message)
@@ -353,7 +375,8 @@ class EvolveSummaryAgent(Worker):
         )
         finalizer = SummaryAgentFinalizer(
             model=self.model,
-            summarize_prompt=self.config.system_prompt or EVOLVE_SUMMARY_SYSTEM_PROMPT,
+            # The history it summarizes refers to the base solution
+            summarize_prompt=system_prompt,
             hint_message=hint_msg,
         )
 
@@ -4,12 +4,8 @@ This module provides agents specialized for Machine Learning competitions
 and AutoML tasks, including Kaggle competitions and MLE-Bench scenarios.
 """
 
-from . import evaluator
-from . import evocoder
-from . import executor
-from . import planner
-from . import prompt
-from . import summary
-from . import utils
-
-__all__ = ["evaluator", "evocoder", "executor", "planner", "prompt", "summary", "utils"]
\ No newline at end of file
+from loongflow._lazy import attach
+
+__all__ = ["evaluator", "evocoder", "executor", "planner", "prompt", "summary", "utils"]
+
+__getattr__, __dir__ = attach(__name__, submodules=__all__)
\ No newline at end of file
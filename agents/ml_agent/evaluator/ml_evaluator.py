@@ -119,6 +119,7 @@ class MLEvaluator(LoongFlowEvaluator):
                 json.dump(result_data, f, ensure_ascii=False, indent=2)
         except Exception as write_err:
             logger.error(f"[Child PID:{pid}] Failed to write result file: {write_err}")
+        LoongFlowEvaluator._report_resource_usage(base_dir)
 
         logger.debug(f"[Child PID:{pid}] Process logic finished. Forcing exit.")
 
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""
+This file define the dataset snapshot shared by the ML stage evaluators.
+
+Every stage evaluator used to call ``load_data.load_data(validation_mode=True)``
+in its own subprocess, parsing the raw files again for each EvoCoder attempt of
+each stage. After the first load, the ``(X, y, X_test, test_ids)`` tuple is saved
+under a key derived from the source of ``load_data.py``, one ``.npy`` file per
+array or column. Later evaluations attach to it with copy-on-write memory maps:
+nothing is parsed or copied up front, and in-place writes stay private to the
+evaluation process.
+
+Layout:
+{root}/{key}/manifest.json
+{root}/{key}/{part}.npy | {part}.{column}.npy | {part}.pkl
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sys
+import uuid
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from loongflow.agentsdk.logger.logger import get_logger
+
+logger = get_logger(__name__)
+
+SNAPSHOT_VERSION = 1
+PARTS = ("X", "y", "X_test", "test_ids")
+MANIFEST = "manifest.json"
+# dtype kinds stored as plain .npy files: bool, integers, floats, complex, dates
+MAPPABLE_KINDS = "biufcmM"
+
+
+def snapshot_key(load_data_path: str) -> str:
+    """Key of the data returned by a ``load_data.py``, the hash of its source."""
+    digest = hashlib.sha256(f"v{SNAPSHOT_VERSION}\n".encode("utf-8"))
+    with open(load_data_path, "rb") as f:
+        digest.update(f.read())
+    return digest.hexdigest()[:32]
+
+
+def _mappable(array: Any) -> bool:
+    return (
+        isinstance(array, np.ndarray)
+        and isinstance(array.dtype, np.dtype)
+        and array.dtype.kind in MAPPABLE_KINDS
+    )
+
+
+def _json_label(label: Any) -> bool:
+    return isinstance(label, (str, int)) and not isinstance(label, bool)
+
+
+class DatasetSnapshotStore:
+    """Snapshots of validation datasets, keyed by ``snapshot_key``."""
+
+    def __init__(self, root: str):
+        """
+        Args:
+            root (str): Directory of the snapshots, shared by the evaluators of a task.
+        """
+        self.root = root
+
+    def path(self, key: str) -> str:
+        """Directory of the snapshot ``key``."""
+        return os.path.join(self.root, key)
+
+    def exists(self, key: str) -> bool:
+        """Whether a complete snapshot is stored under ``key``."""
+        return os.path.isfile(os.path.join(self.path(key), MANIFEST))
+
+    def save(self, key: str, data: Tuple[Any, ...]) -> bool:
+        """
+        Store ``(X, y, X_test, test_ids)`` under ``key``.
+
+        The snapshot is written to a private directory and renamed into place, so
+        concurrent evaluators never see a partial snapshot. Returns False if the
+        snapshot could not be written, e.g. for lack of disk space or because
+        the data cannot be pickled.
+        """
+        if self.exists(key):
+            return True
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = os.path.join(self.root, f".{key}.{uuid.uuid4().hex}")
+        try:
+            os.makedirs(tmp_path)
+            manifest = {
+                "version": SNAPSHOT_VERSION,
+                "parts": {
+                    name: self._write(tmp_path, name, value)
+                    for name, value in zip(PARTS, data)
+                },
+            }
+            with open(os.path.join(tmp_path, MANIFEST), "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+            os.rename(tmp_path, self.path(key))
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            if self.exists(key):
+                # Another evaluator stored the same data first
+                return True
+            logger.warning(f"Failed to save dataset snapshot {key}: {e}")
+            return False
+        return True
+
+    def attach(self, key: str) -> Optional[Tuple[Any, ...]]:
+        """Load the snapshot ``key`` with memory maps, None if there is none."""
+        if not self.exists(key):
+            return None
+        path = self.path(key)
+        try:
+            with open(os.path.join(path, MANIFEST), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") != SNAPSHOT_VERSION:
+                return None
+            return tuple(
+                self._read(path, manifest["parts"][name]) for name in PARTS
+            )
+        except (OSError, ValueError, KeyError, pickle.UnpicklingError) as e:
+            logger.warning(f"Ignoring unreadable dataset snapshot {key}: {e}")
+            return None
+
+    def _write(self, path: str, name: str, value: Any) -> Dict[str, Any]:
+        if _mappable(value):
+            return self._write_array(path, name, value)
+        pd = sys.modules.get("pandas")
+        if pd is not None and isinstance(value, pd.DataFrame):
+            if value.columns.is_unique and all(map(_json_label, value.columns)):
+                return {
+                    "type": "dataframe",
+                    "columns": [
+                        [label, self._write_array(path, f"{name}.{i}", value[label])]
+                        for i, label in enumerate(value.columns)
+                    ],
+                    "index": self._write_index(path, f"{name}.index", value.index),
+                }
+        elif pd is not None and isinstance(value, pd.Series):
+            if value.name is None or _json_label(value.name):
+                return {
+                    "type": "series",
+                    "name": value.name,
+                    "values": self._write_array(path, name, value),
+                    "index": self._write_index(path, f"{name}.index", value.index),
+                }
+        return self._write_pickle(path, name, value)
+
+    def _write_array(self, path: str, name: str, value: Any) -> Dict[str, Any]:
+        """An array, or the values of a column if their dtype can be mapped."""
+        array = value if isinstance(value, np.ndarray) else value.to_numpy()
+        if not isinstance(value.dtype, np.dtype) or not _mappable(array):
+            # Strings, categories and other extension types
+            return self._write_pickle(path, name, value)
+        np.save(os.path.join(path, f"{name}.npy"), array, allow_pickle=False)
+        return {"type": "ndarray", "file": f"{name}.npy"}
+
+    def _write_index(self, path: str, name: str, index: Any) -> Dict[str, Any]:
+        pd = sys.modules["pandas"]
+        if isinstance(index, pd.RangeIndex) and index.name is None:
+            return {
+                "type": "range",
+                "start": index.start,
+                "stop": index.stop,
+                "step": index.step,
+            }
+        return self._write_pickle(path, name, index)
+
+    @staticmethod
+    def _write_pickle(path: str, name: str, value: Any) -> Dict[str, Any]:
+        with open(os.path.join(path, f"{name}.pkl"), "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return {"type": "pickle", "file": f"{name}.pkl"}
+
+    def _read(self, path: str, entry: Dict[str, Any]) -> Any:
+        kind = entry["type"]
+        if kind == "ndarray":
+            # Copy-on-write: pages are shared until an evaluation writes to them
+            return np.load(os.path.join(path, entry["file"]), mmap_mode="c")
+        if kind == "pickle":
+            with open(os.path.join(path, entry["file"]), "rb") as f:
+                return pickle.load(f)
+        import pandas as pd
+
+        if kind == "range":
+            return pd.RangeIndex(entry["start"], entry["stop"], entry["step"])
+        if kind == "series":
+            return pd.Series(
+                self._read(path, entry["values"]),
+                index=self._read(path, entry["index"]),
+                name=entry["name"],
+                copy=False,
+            )
+        if kind == "dataframe":
+            return pd.DataFrame(
+                {label: self._read(path, column) for label, column in entry["columns"]},
+                index=self._read(path, entry["index"]),
+                copy=False,
+            )
+        raise ValueError(f"Unknown snapshot entry type {kind!r}")
+
+
+def load_validation_data(
+    snapshot_root: Optional[str],
+    load_data_path: str,
+    loader: Callable[[], Tuple[Any, ...]],
+) -> Tuple[Any, ...]:
+    """
+    ``loader()``, i.e. ``load_data.load_data(validation_mode=True)``, served from
+    the snapshot of ``load_data_path`` when there is one. The loaded data is
+    snapshotted otherwise. Without ``snapshot_root``, ``loader`` is always called.
+    """
+    if not snapshot_root:
+        return loader()
+    store = DatasetSnapshotStore(snapshot_root)
+    key = snapshot_key(load_data_path)
+    data = store.attach(key)
+    if data is not None:
+        return data
+    data = loader()
+    if isinstance(data, (tuple, list)) and len(data) == len(PARTS):
+        store.save(key, data)
+    return data
@@ -11,6 +11,7 @@ import sys
 import time
 import traceback
 from dataclasses import dataclass
+from typing import Optional
 
 from loongflow.agentsdk.logger.logger import get_logger
 from loongflow.framework.pes.context import EvaluatorConfig
@@ -25,6 +26,12 @@ class EvoCoderEvaluatorConfig:
 
     workspace_path: str = None
     timeout: int = 1800
+    # Directory of the dataset snapshots shared by the stages of a task, see
+    # dataset_snapshot. None loads the data from scratch in every evaluation.
+    snapshot_path: Optional[str] = None
+    # Directory of the packages provisioned for missing modules, see
+    # PackageProvisioner. None keeps them in the workspace of the evaluator.
+    packages_path: Optional[str] = None
 
 
 class EvoCoderEvaluator(LoongFlowEvaluator, abc.ABC):
@@ -33,10 +40,12 @@ class EvoCoderEvaluator(LoongFlowEvaluator, abc.ABC):
     """
 
     def __init__(self, config: EvoCoderEvaluatorConfig):
+        self.snapshot_path = config.snapshot_path
         cfg = EvaluatorConfig(
             workspace_path=config.workspace_path,
             timeout=config.timeout,
             evaluate_code=self._get_evaluate_code(),
+            packages_path=config.packages_path,
         )
         super().__init__(cfg)
 
@@ -139,6 +148,7 @@ class EvoCoderEvaluator(LoongFlowEvaluator, abc.ABC):
                 json.dump(result_data, f, ensure_ascii=False, indent=2)
         except Exception as write_err:
             logger.error(f"[Child PID:{pid}] Failed to write result file: {write_err}")
+        LoongFlowEvaluator._report_resource_usage(base_dir)
 
         logger.debug(f"[Child PID:{pid}] Process logic finished. Forcing exit.")
 
@@ -231,6 +241,30 @@ def check_nan_inf_safe(data):
 """
 
 
+def dataset_snapshot_utils(snapshot_path: Optional[str]) -> str:
+    """Helpers of the evaluate code reading and writing the dataset snapshot."""
+    return f"""
+def load_validation_data(temp_dir):
+    import os
+    import load_data
+    from agents.ml_agent.evocoder.dataset_snapshot import load_validation_data as load
+
+    return load(
+        {snapshot_path!r},
+        os.path.join(temp_dir, "load_data.py"),
+        lambda: load_data.load_data(validation_mode=True),
+    )
+
+def save_validation_data(temp_dir, data):
+    import os
+    from agents.ml_agent.evocoder.dataset_snapshot import DatasetSnapshotStore, snapshot_key
+
+    if {snapshot_path!r}:
+        key = snapshot_key(os.path.join(temp_dir, "load_data.py"))
+        DatasetSnapshotStore({snapshot_path!r}).save(key, data)
+"""
+
+
 class EDAEvaluator(EvoCoderEvaluator):
     """evaluate eda code"""
 
@@ -285,7 +319,7 @@ class LoadDataEvaluator(EvoCoderEvaluator):
 import sys,traceback
 
 {COMMON_UTILS}
-
+{dataset_snapshot_utils(self.snapshot_path)}
 
 def evaluate(temp_dir):
     try:
@@ -363,6 +397,9 @@ def evaluate(temp_dir):
             except:
                 pass
 
+        # Later stages attach to the validated data instead of loading it again
+        save_validation_data(temp_dir, result)
+
         return {{
             "score": 1.0,
             "status": "success",
@@ -388,6 +425,7 @@ class CrossValidationEvaluator(EvoCoderEvaluator):
         return f"""
 import sys, traceback, numpy as np, pandas as pd
 {COMMON_UTILS}
+{dataset_snapshot_utils(self.snapshot_path)}
 
 def evaluate(temp_dir):
     try:
@@ -398,7 +436,7 @@ def evaluate(temp_dir):
         import load_data
         import cross_validation
 
-        X_sub, y_sub, _, _ = load_data.load_data(validation_mode=True)
+        X_sub, y_sub, _, _ = load_validation_data(temp_dir)
         
         try:
             splitter = cross_validation.cross_validation(X_sub, y_sub)
@@ -470,6 +508,7 @@ class CreateFeaturesEvaluator(EvoCoderEvaluator):
 import sys,traceback,copy,pandas as pd,numpy as np
 
 {COMMON_UTILS}
+{dataset_snapshot_utils(self.snapshot_path)}
 
 def evaluate(temp_dir):
     try:
@@ -482,7 +521,7 @@ def evaluate(temp_dir):
         import load_data
         import create_features
 
-        X_tr_in, y_tr_in, X_te_in, test_ids = load_data.load_data(validation_mode=True)
+        X_tr_in, y_tr_in, X_te_in, test_ids = load_validation_data(temp_dir)
 
         try:
             result = create_features.create_features(X_tr_in, y_tr_in, X_tr_in, y_tr_in, X_te_in)
@@ -570,6 +609,7 @@ class TrainAndPredictEvaluator(EvoCoderEvaluator):
 import numpy as np,sys,traceback
 
 {COMMON_UTILS}
+{dataset_snapshot_utils(self.snapshot_path)}
 
 def evaluate(temp_dir):
     try:
@@ -593,7 +633,7 @@ def evaluate(temp_dir):
         if not engines:
             return {{"score": 0.0, "status": "validation_failed", "summary": "PREDICTION_ENGINES is empty."}}
 
-        X_sub, y_sub, X_test_sub, _ = load_data.load_data(validation_mode=True)
+        X_sub, y_sub, X_test_sub, _ = load_validation_data(temp_dir)
         X_feat, y_feat, X_val, y_val, X_test_feat = create_features.create_features(X_sub, y_sub, X_sub, y_sub, X_test_sub)
 
         X_tr = X_feat
@@ -660,6 +700,7 @@ class EnsembleEvaluator(EvoCoderEvaluator):
 import sys, traceback, numpy as np, pandas as pd
 
 {COMMON_UTILS}
+{dataset_snapshot_utils(self.snapshot_path)}
 
 def evaluate(temp_dir):
     try:
@@ -675,7 +716,7 @@ def evaluate(temp_dir):
         import train_and_predict
         import ensemble
         
-        X_sub, y_sub, X_test_sub, _ = load_data.load_data(validation_mode=True)
+        X_sub, y_sub, X_test_sub, _ = load_validation_data(temp_dir)
 
         X_feat, y_feat, X_val, y_val, X_test_feat = create_features.create_features(
             X_sub, y_sub, X_sub, y_sub, X_test_sub
@@ -5,7 +5,6 @@ This file define EvoCoder
 
 import json
 import re
-import subprocess
 from dataclasses import dataclass
 from typing import Optional
 
@@ -15,10 +14,9 @@ from agents.ml_agent.evocoder.stage_context_provider import (
     StageContextProvider,
     TaskConfig,
 )
-from agents.ml_agent.prompt.evocoder import PackageInstallerPrompts
 from loongflow.agentsdk.logger import get_logger
 from loongflow.agentsdk.message import ContentElement, Message, MimeType, Role
-from loongflow.agentsdk.models import CompletionRequest, LiteLLMModel
+from loongflow.agentsdk.models import CompletionRequest
 from loongflow.framework.base import AgentBase
 from loongflow.framework.pes.context import LLMConfig
 from loongflow.framework.pes.evaluator.evaluator import (
@@ -53,6 +51,8 @@ class EvoCoder(AgentBase):
         """
         super().__init__()
         self.config = config
+        from loongflow.agentsdk.models import LiteLLMModel
+
         self.model = LiteLLMModel.from_config(config.llm_config.model_dump())
         self.context_provider = self.config.context_provider
         self.evaluator = self.config.evaluator
@@ -103,7 +103,7 @@ class EvoCoder(AgentBase):
                 )
                 continue
 
-            logger.info(f"EvoCoder: code for {stage}: {code}")
+            logger.info("EvoCoder: code for %s: %s", stage, code)
 
             # 3c: Evaluate the generated code
             all_codes = repr(
@@ -240,61 +240,24 @@ class EvoCoder(AgentBase):
         logger.info(
             f"Code evaluate for {stage} detect Missing package: {missing_package}, try to install it"
         )
-        result = await self.install_missing_package(eval_result)
+        result = await self.install_missing_package(missing_package)
         return Message.from_text(
             sender="EvoCoder",
             role=Role.USER,
             data=f"trying to install missing package: {missing_package}, install result: {result}",
         )
 
-    async def install_missing_package(self, evaluation_result: EvaluationResult):
-        """Install missing package."""
-        user_message = Message.from_text(
-            sender="user",
-            role=Role.USER,
-            data=PackageInstallerPrompts.USER.format(
-                error_msg=evaluation_result.summary, language="python"
-            ),
-        )
-
-        llm_request = CompletionRequest(messages=[user_message])
-
-        resp_generator = self.model.generate(llm_request)
-        try:
-            resp = await anext(resp_generator)
-            if resp.error_code:
-                raise Exception(
-                    f"Error code: {resp.error_code}, error: {resp.error_message}"
-                )
-        finally:
-            async for _ in resp_generator:
-                pass
-
-        cmd = ""
-        for element in resp.content:
-            if isinstance(element, ContentElement):
-                cmd = parse_full_rewrite(element.data)
-                break
-
-        if not cmd:
-            logger.warning(f"EvoCoder: No command generated")
-            return "No command generated, package not installed"
-        try:
-            logger.info(f"EvoCoder: Installing missing package: {cmd}")
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                check=True,
-                text=True,
-                timeout=600,  # set a default timeout
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+    async def install_missing_package(self, missing_package: str) -> str:
+        """Provision the package of a missing module for the next evaluations."""
+        logger.info(f"EvoCoder: Installing missing package: {missing_package}")
+        result = await self.evaluator.provisioner.provision(missing_package)
+        if not result.success:
+            logger.error(
+                f"EvoCoder: Error installing package: {result.message} {result.output[-2000:]}"
             )
-            logger.info(f"EvoCoder: Installed result: {result}")
-            return result
-        except Exception as e:
-            logger.error(f"EvoCoder: Error installing package: {e}")
-            return str(e)
+            return f"{result.message}\n{result.output[-2000:]}".strip()
+        logger.info(f"EvoCoder: Installed result: {result.message}")
+        return result.message
 
 
 def parse_full_rewrite(llm_response: str, language: str = "python") -> Optional[str]:
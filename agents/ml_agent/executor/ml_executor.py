@@ -302,6 +302,8 @@ class MLExecutorAgent(Worker):
                     utils.get_evocoder_evaluate_path(context, stage.value)
                 ),
                 timeout=self.config.evo_coder_timeout,
+                snapshot_path=str(utils.get_dataset_snapshot_path(context)),
+                packages_path=str(utils.get_packages_path(context)),
             )
         )
 
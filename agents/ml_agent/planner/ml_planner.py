@@ -26,10 +26,10 @@ from agents.ml_agent.prompt.ml_evolve import (
     ML_PLANNER_USER_PROMPT,
 )
 from agents.ml_agent.utils import solutions, utils
-from loongflow.agentsdk.logger import get_logger
+from loongflow.agentsdk.logger import get_logger, lazy
 from loongflow.agentsdk.memory.grade import GradeMemory, MemoryConfig
 from loongflow.agentsdk.message import ContentElement, Message, MimeType, Role
-from loongflow.agentsdk.models import LiteLLMModel
+from loongflow.agentsdk.models import BaseLLMModel
 from loongflow.agentsdk.token import SimpleTokenCounter
 from loongflow.agentsdk.tools import Toolkit
 from loongflow.framework.pes import Worker
@@ -108,6 +108,7 @@ class MLPlannerAgent(Worker):
                                 )
                             ),
                             timeout=self.config.evo_coder_timeout,
+                            packages_path=str(utils.get_packages_path(context)),
                         )
                     ),
                 ),
@@ -119,10 +120,12 @@ class MLPlannerAgent(Worker):
         # register get_best_solution with specific tool, to avoid search from other island
         agent.context.toolkit.register_tool(
             GetBestSolutionsTool(
-                solutions.simplify_solution(
-                    partial(
-                        self.database.get_best_solutions, island_id=context.island_id
-                    )
+                partial(
+                    self.database.get_leaderboard,
+                    island_id=context.island_id,
+                    default_fields=solutions.SIMPLIFIED_FIELDS,
+                    # The agent has no Get_Solutions tool to read cut texts
+                    default_max_chars=None,
                 )
             )
         )
@@ -132,13 +135,13 @@ class MLPlannerAgent(Worker):
             f"Trace ID: {context.trace_id}: MLPlanner: Workspace is : {workspace}"
         )
 
-        memory_status = self.database.memory_status()
+        memory_status = await self.database.amemory_status()
         logger.info(
             f"Trace ID: {context.trace_id}: MLPlanner: Current Iteration {context.current_iteration} "
             + f"Memory status: {memory_status}"
         )
 
-        parent = self.database.sample_solution(context.island_id)
+        parent = await self.database.asample_solution(context.island_id)
         logger.info(
             f"Trace ID: {context.trace_id}: MLPlanner: Get sample parent solution: {parent}"
         )
@@ -186,7 +189,9 @@ class MLPlannerAgent(Worker):
             )
             ml_plan = MLPlan()
         logger.info(
-            f"Trace ID: {context.trace_id}: MLPlanner: ml plan result: {ml_plan.model_dump()}"
+            "Trace ID: %s: MLPlanner: ml plan result: %s",
+            context.trace_id,
+            lazy(ml_plan.model_dump),
         )
 
         # save plan to data
@@ -220,15 +225,17 @@ class MLPlannerAgent(Worker):
             mime_type=MimeType.APPLICATION_JSON,
         )
 
-    def _init_model(self) -> LiteLLMModel:
+    def _init_model(self) -> BaseLLMModel:
         """Initialize or reuse the LLM model."""
         llm = self.config.llm_config
         if not llm or not all([llm.model]):
             raise ValueError("model_name, url, and api_key are required in llm_config.")
 
+        from loongflow.agentsdk.models import LiteLLMModel
+
         return LiteLLMModel.from_config(llm.model_dump())
 
-    async def _create_agent(self, model: LiteLLMModel) -> ReActAgent:
+    async def _create_agent(self, model: BaseLLMModel) -> ReActAgent:
         function_tool_list = [
             GetMemoryStatusTool(
                 solutions.simplify_solution(self.database.memory_status)
@@ -20,11 +20,11 @@ from agents.ml_agent.prompt.ml_evolve import (
 from agents.ml_agent.summary.analysis_tool import build_summary_analysis_tool
 from agents.ml_agent.summary.ml_summary_finalizer import MLSummaryFinalizer, Reflection
 from agents.ml_agent.utils import solutions
-from loongflow.agentsdk.logger import get_logger
+from loongflow.agentsdk.logger import get_logger, lazy
 from loongflow.agentsdk.memory.evolution import Solution
 from loongflow.agentsdk.memory.grade import GradeMemory, MemoryConfig
 from loongflow.agentsdk.message import ContentElement, Message, MimeType, Role
-from loongflow.agentsdk.models import LiteLLMModel
+from loongflow.agentsdk.models import BaseLLMModel
 from loongflow.agentsdk.token import SimpleTokenCounter
 from loongflow.agentsdk.tools import Toolkit
 from loongflow.framework.pes import Worker
@@ -85,15 +85,17 @@ class MLSummaryAgent(Worker):
 
         self.model = self._init_model()
 
-    def _init_model(self) -> LiteLLMModel:
+    def _init_model(self) -> BaseLLMModel:
         """Initialize or reuse the LLM model."""
         llm = self.config.llm_config
         if not llm or not all([llm.model, llm.url, llm.api_key]):
             raise ValueError("model_name, url, and api_key are required in llm_config.")
 
+        from loongflow.agentsdk.models import LiteLLMModel
+
         return LiteLLMModel.from_config(llm.model_dump())
 
-    async def _create_agent(self, model: LiteLLMModel) -> ReActAgent:
+    async def _create_agent(self, model: BaseLLMModel) -> ReActAgent:
         function_tool_list = [
             GetSolutionsTool(solutions.simplify_solution(self.db.get_solutions)),
             GetParentsByChildIdTool(
@@ -268,8 +270,12 @@ class MLSummaryAgent(Worker):
         try:
             agent.context.toolkit.register_tool(
                 GetBestSolutionsTool(
-                    solutions.simplify_solution(
-                        partial(self.db.get_best_solutions, island_id=context.island_id)
+                    partial(
+                        self.db.get_leaderboard,
+                        island_id=context.island_id,
+                        default_fields=solutions.SIMPLIFIED_FIELDS,
+                        # The agent has no Get_Solutions tool to read cut texts
+                        default_max_chars=None,
                     )
                 )
             )
@@ -287,7 +293,9 @@ class MLSummaryAgent(Worker):
             )
             reflection = Reflection()
         logger.info(
-            f"Trace ID: {context.trace_id}: Summary: reflection result: {reflection.model_dump()}"
+            "Trace ID: %s: Summary: reflection result: %s",
+            context.trace_id,
+            lazy(reflection.model_dump),
         )
         return reflection
 
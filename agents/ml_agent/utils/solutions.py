@@ -4,6 +4,18 @@ This file define solution utils
 """
 
 
+# Solution fields the ML agents see by default
+SIMPLIFIED_FIELDS = (
+    "solution_id",
+    "generate_plan",
+    "parent_id",
+    "island_id",
+    "score",
+    "evaluation",
+    "summary",
+)
+
+
 def simplify_solution(func, fields=None):
     """simply solution result"""
 
@@ -18,9 +30,7 @@ def simplify_solution(func, fields=None):
         if not fields:
             # keep default fields
             return [{k: v for k, v in item.items()
-                     if k in ["solution_id", "generate_plan", "parent_id",
-                              "island_id", "score", "evaluation", "summary"]
-                     and v is not None}
+                     if k in SIMPLIFIED_FIELDS and v is not None}
                     for item in data]
         else:
             # keep specified fields
@@ -53,6 +53,20 @@ def get_evocoder_evaluate_path(
     return path
 
 
+def get_dataset_snapshot_path(context: Context) -> Path:
+    """
+    get dataset snapshot path, shared by all iterations of the task
+    """
+    return Path(context.base_path) / str(context.task_id) / "dataset_snapshots"
+
+
+def get_packages_path(context: Context) -> Path:
+    """
+    get path of the packages provisioned for the evaluations, shared by all iterations of the task
+    """
+    return Path(context.base_path) / str(context.task_id) / "packages"
+
+
 def get_latest_eda_path(context: Context, create: bool = True) -> Path:
     """
     get latest eda path
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+This file provides lazy package exports.
+
+Package ``__init__`` files use ``attach`` to expose submodules and attributes that
+are only imported on first access, so that importing a package does not pull in
+the heavy dependencies (litellm, the Claude SDK, redis, Flask) of exports the
+caller never uses:
+
+    __getattr__, __dir__ = attach(
+        __name__, attributes={"LiteLLMModel": "loongflow.agentsdk.models.litellm_model"}
+    )
+
+``from package import LiteLLMModel`` keeps working, it triggers the import.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def attach(
+    package: str,
+    submodules: Iterable[str] = (),
+    attributes: Optional[Dict[str, str]] = None,
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the module level ``__getattr__`` and ``__dir__`` of a package.
+
+    Args:
+        package (str): Name of the package, its ``__name__``.
+        submodules (Iterable[str]): Submodules imported on first access.
+        attributes (Optional[Dict[str, str]]): Exported name to the module
+            defining it, imported on first access.
+    """
+    submodules = set(submodules)
+    attributes = dict(attributes or {})
+
+    def __getattr__(name: str) -> Any:
+        if name in submodules:
+            return importlib.import_module(f"{package}.{name}")
+        if name in attributes:
+            value = getattr(importlib.import_module(attributes[name]), name)
+            # Later accesses do not go through __getattr__
+            setattr(sys.modules[package], name, value)
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | submodules | set(attributes))
+
+    return __getattr__, __dir__
@@ -4,11 +4,9 @@ This module provides tools, memory management, logging, and other utilities
 for building autonomous agents.
 """
 
-from . import logger
-from . import memory  
-from . import message
-from . import models
-from . import token
-from . import tools
-
-__all__ = ["logger", "memory", "message", "models", "token", "tools"]
\ No newline at end of file
+from loongflow._lazy import attach
+
+__all__ = ["logger", "memory", "message", "models", "token", "tools"]
+
+# Subpackages are imported on first access, see loongflow._lazy
+__getattr__, __dir__ = attach(__name__, submodules=__all__)
\ No newline at end of file
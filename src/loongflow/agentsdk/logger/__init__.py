@@ -5,5 +5,26 @@ This file provides the entry of logger.
 
 from loongflow.agentsdk.logger.logger import get_logger
 from loongflow.agentsdk.logger.message_logger import print_message
+from loongflow.agentsdk.logger.message_trace import (
+    MessageTraceSink,
+    start_message_trace,
+    stop_message_trace,
+)
+from loongflow.agentsdk.logger.pipeline import (
+    lazy,
+    lazy_json,
+    start_log_pipeline,
+    stop_log_pipeline,
+)
 
-__all__ = ["get_logger", "print_message"]
+__all__ = [
+    "get_logger",
+    "print_message",
+    "lazy",
+    "lazy_json",
+    "start_log_pipeline",
+    "stop_log_pipeline",
+    "MessageTraceSink",
+    "start_message_trace",
+    "stop_message_trace",
+]
@@ -7,6 +7,9 @@ and tool components.
 Output mode can be controlled via:
     - Environment variable MESSAGE_LOG_MODE = "print" (default) or "logger"
     - Or explicit argument `use_logger=True` in function call
+
+While a message trace is started (see `message_trace`), messages are queued to
+its JSONL file instead of being rendered.
 """
 
 from __future__ import annotations
@@ -17,6 +20,8 @@ from datetime import datetime
 from typing import List, Union
 
 from loongflow.agentsdk.logger import get_logger
+from loongflow.agentsdk.logger.message_trace import get_message_trace
+from loongflow.agentsdk.logger.pipeline import lazy
 from loongflow.agentsdk.message import (ContentElement, Message, ThinkElement,
                               ToolCallElement, ToolOutputElement, ToolStatus)
 
@@ -50,6 +55,11 @@ def print_message(
         stream: If True, suppress final newline (useful for streaming).
         use_logger: Force logging mode (True/False). If None, read from env var MESSAGE_LOG_MODE.
     """
+    trace = get_message_trace()
+    if trace is not None and not use_logger:
+        for msg in msg_or_msgs if isinstance(msg_or_msgs, list) else [msg_or_msgs]:
+            trace.record(msg, show_metadata=show_metadata)
+        return
 
     if isinstance(msg_or_msgs, list):
         for msg in msg_or_msgs:
@@ -66,22 +76,28 @@ def _handle_single_message(
 ) -> None:
     """Internal dispatcher: choose print or logger."""
     if use_logger:
-        log_data = {
-            "id": str(msg.id),
-            "role": msg.role,
-            "sender": getattr(msg, "sender", None),
-            "timestamp": getattr(msg, "timestamp", datetime.now()).isoformat(),
-            "metadata": msg.metadata if show_metadata else None,
-            "content": [
-                c.model_dump() if hasattr(c, "model_dump") else str(c)
-                for c in msg.content
-            ],
-        }
-        _logger.info(json.dumps(log_data, ensure_ascii=False, default=_json_serializer))
+        # Only serialized if INFO is enabled, on the calling thread
+        _logger.info("%s", lazy(_render_log_data, msg, show_metadata))
     else:
         _print_single_message(msg, show_metadata=show_metadata, stream=stream)
 
 
+def _render_log_data(msg: Message, show_metadata: bool) -> str:
+    """Serialize a Message for logging mode."""
+    log_data = {
+        "id": str(msg.id),
+        "role": msg.role,
+        "sender": getattr(msg, "sender", None),
+        "timestamp": getattr(msg, "timestamp", datetime.now()).isoformat(),
+        "metadata": msg.metadata if show_metadata else None,
+        "content": [
+            c.model_dump() if hasattr(c, "model_dump") else str(c)
+            for c in msg.content
+        ],
+    }
+    return json.dumps(log_data, ensure_ascii=False, default=_json_serializer)
+
+
 def _print_single_message(msg: Message, *, show_metadata: bool, stream: bool) -> None:
     """Pretty print a single Message to console."""
     header = f"[{msg.role}] {getattr(msg, 'sender', 'Anonymous')}"
@@ -126,7 +142,9 @@ def _print_content(elem: ContentElement) -> None:
     if elem.mime_type == "text/plain":
         text = str(elem.data)
     elif isinstance(elem.data, bytes):
-        text = f"[{elem.mime_type}] (base64): {base64.b64encode(elem.data).decode('utf-8')}"
+        text = f"[{elem.mime_type}] <{len(elem.data)} bytes>"
+    elif isinstance(elem.data, str):
+        text = f"[{elem.mime_type}] {elem.data}"
     else:
         text = f"[{elem.mime_type}] <{type(elem.data).__name__}>"
     (
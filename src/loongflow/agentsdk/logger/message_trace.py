@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""
+This file provides the message trace sink, a compact record of the messages passed
+to ``print_message``.
+
+Rendering every message as ``rich`` panels or indented JSON on the calling thread
+dominates the step time of concurrent agent runs and produces huge logs. While a
+trace is started, ``print_message`` only queues the message: a writer thread
+serializes it to one compact JSON line, rotates the trace file by size, and moves
+large payloads (bytes, long texts) to a content-addressed side store, referenced
+from the line by their sha256. Messages can be sampled per role. The pretty form
+is rendered offline:
+
+    start_message_trace("logs/messages.jsonl", sample_rates={"tool": 0.2})
+    print_message(msg)  # queued, written by the trace thread
+    stop_message_trace()
+
+    python -m loongflow.agentsdk.logger.message_trace logs/messages.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import hashlib
+import json
+import os
+import queue
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from loongflow.agentsdk.logger.logger import get_logger
+from loongflow.agentsdk.message import Message
+
+logger = get_logger(__name__)
+
+# Keys of the JSON object standing for an offloaded payload in a trace line
+BLOB_KEY = "$blob"
+TEXT_KEY = "$text"
+
+_STOP = object()
+
+
+class PayloadStore:
+    """
+    Content-addressed store of offloaded payloads, one file per sha256 digest.
+
+    The same payload is written once, however many messages carry it.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+
+    def path(self, digest: str) -> Path:
+        """Path of the payload with ``digest``."""
+        return self.root / digest[:2] / digest
+
+    def put(self, data: bytes) -> str:
+        """Store ``data`` if it is not already, returning its digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        return digest
+
+    def get(self, digest: str) -> Optional[bytes]:
+        """The payload with ``digest``, None if it is not stored."""
+        try:
+            return self.path(digest).read_bytes()
+        except FileNotFoundError:
+            return None
+
+
+class MessageTraceSink:
+    """
+    Writes messages as JSON lines from a dedicated thread.
+
+    ``record`` only decides on sampling and enqueues the message, the
+    serialization, payload offloading and file writes happen on the trace thread.
+    When the bounded queue is full, messages are dropped and counted rather than
+    blocking the caller.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: int = 64 * 1024 * 1024,
+        backup_count: int = 5,
+        sample_rates: Optional[Dict[str, float]] = None,
+        payload_threshold: int = 4096,
+        payload_dir: Optional[Union[str, Path]] = None,
+        queue_size: int = 10000,
+    ):
+        """
+        Args:
+            path (str | Path): Trace file, rotated to ``path.1`` ... ``path.N``.
+            max_bytes (int): Size of the trace file above which it is rotated,
+                0 disables rotation.
+            backup_count (int): Number of rotated files kept.
+            sample_rates (Optional[Dict[str, float]]): Fraction of the messages of
+                each role kept, 1.0 for roles not listed. Sampling is decided by
+                message id, so it is the same in every process.
+            payload_threshold (int): Texts longer than this many characters are
+                offloaded, bytes always are.
+            payload_dir (Optional[str | Path]): Payload store, defaults to the
+                ``payloads`` directory next to the trace file.
+            queue_size (int): Maximum number of messages buffered.
+        """
+        if queue_size <= 0:
+            raise ValueError(f"Trace queue size must be positive, got {queue_size}.")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.sample_rates = dict(sample_rates or {})
+        self.payload_threshold = payload_threshold
+        self.store = PayloadStore(
+            payload_dir if payload_dir is not None else self.path.parent / "payloads"
+        )
+        self.queue: queue.Queue = queue.Queue(queue_size)
+        self.written = 0
+        self.sampled_out = 0
+        self.dropped = 0
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._thread = threading.Thread(
+            target=self._drain, name="message-trace", daemon=True
+        )
+        self._thread.start()
+
+    def keeps(self, msg: Message) -> bool:
+        """Whether ``msg`` is kept by the sampling of its role."""
+        rate = self.sample_rates.get(str(getattr(msg.role, "value", msg.role)), 1.0)
+        if rate >= 1.0:
+            return True
+        return zlib.crc32(msg.id.bytes) < rate * 0x100000000
+
+    def record(self, msg: Message, show_metadata: bool = True) -> bool:
+        """Queue ``msg`` for writing, returning whether it was queued."""
+        if not self.keeps(msg):
+            self.sampled_out += 1
+            return False
+        try:
+            self.queue.put_nowait((msg, show_metadata))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def flush(self) -> None:
+        """Wait until the queued messages are written."""
+        self.queue.join()
+        self._file.flush()
+
+    def close(self) -> None:
+        """Write the queued messages and stop the trace thread."""
+        if not self._thread.is_alive():
+            return
+        self.queue.put(_STOP)
+        self._thread.join()
+        self._file.close()
+        if self.dropped:
+            logger.warning(
+                f"Message trace dropped {self.dropped} messages under backpressure."
+            )
+
+    def stats(self) -> Dict[str, int]:
+        """Written, sampled out, queued and dropped message counts."""
+        return {
+            "written": self.written,
+            "sampled_out": self.sampled_out,
+            "queued": self.queue.qsize(),
+            "dropped": self.dropped,
+        }
+
+    def _drain(self) -> None:
+        while True:
+            item = self.queue.get()
+            try:
+                if item is _STOP:
+                    return
+                self._write(*item)
+            except Exception as e:
+                logger.error(f"Failed to write message trace: {e}")
+            finally:
+                self.queue.task_done()
+
+    def _write(self, msg: Message, show_metadata: bool) -> None:
+        data = msg.model_dump(exclude=None if show_metadata else {"metadata"})
+        line = json.dumps(
+            self._offload(data),
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=str,
+        )
+        self._file.write(line + "\n")
+        self.written += 1
+        if self.max_bytes > 0 and self._file.tell() >= self.max_bytes:
+            self._rotate()
+        elif self.queue.qsize() == 0:
+            self._file.flush()
+
+    def _offload(self, value: Any) -> Any:
+        """Replace large payloads of ``value`` by references to the store."""
+        if isinstance(value, (bytes, bytearray)):
+            return {BLOB_KEY: self.store.put(bytes(value)), "size": len(value)}
+        if isinstance(value, str):
+            if len(value) <= self.payload_threshold:
+                return value
+            return {TEXT_KEY: self.store.put(value.encode("utf-8")), "size": len(value)}
+        if isinstance(value, dict):
+            return {k: self._offload(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self._offload(v) for v in value]
+        return value
+
+    def _rotate(self) -> None:
+        self._file.close()
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = self.path.with_name(f"{self.path.name}.{index}")
+                if source.exists():
+                    os.replace(source, self.path.with_name(f"{self.path.name}.{index + 1}"))
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+
+_sink: Optional[MessageTraceSink] = None
+_sink_lock = threading.Lock()
+_atexit_registered = False
+
+
+def start_message_trace(path: Union[str, Path], **kwargs) -> MessageTraceSink:
+    """
+    Record the messages passed to ``print_message`` to ``path`` instead of
+    rendering them. A running trace is stopped first. The trace is flushed at exit.
+    Keyword arguments are those of ``MessageTraceSink``.
+    """
+    global _sink, _atexit_registered
+    with _sink_lock:
+        if _sink is not None:
+            _sink.close()
+        _sink = MessageTraceSink(path, **kwargs)
+        if not _atexit_registered:
+            atexit.register(stop_message_trace)
+            _atexit_registered = True
+        return _sink
+
+
+def stop_message_trace() -> None:
+    """Flush and stop the running trace, if any."""
+    global _sink
+    with _sink_lock:
+        if _sink is not None:
+            _sink.close()
+            _sink = None
+
+
+def get_message_trace() -> Optional[MessageTraceSink]:
+    """The running trace, if any."""
+    return _sink
+
+
+def _restore(value: Any, store: Optional[PayloadStore]) -> Any:
+    """Replace the payload references of ``value`` by the stored payloads."""
+    if isinstance(value, dict):
+        for key in (BLOB_KEY, TEXT_KEY):
+            if key in value:
+                data = store.get(value[key]) if store is not None else None
+                if data is None:
+                    unit = "bytes" if key == BLOB_KEY else "chars"
+                    return f"<{value.get('size')} {unit} sha256:{value[key][:12]}>"
+                return data if key == BLOB_KEY else data.decode("utf-8")
+        return {k: _restore(v, store) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_restore(v, store) for v in value]
+    return value
+
+
+def read_message_trace(
+    path: Union[str, Path],
+    payload_dir: Optional[Union[str, Path]] = None,
+    resolve_payloads: bool = True,
+) -> Iterator[Message]:
+    """
+    Read the messages of a trace file, restoring the offloaded payloads unless
+    ``resolve_payloads`` is False or they are missing from the store.
+    """
+    path = Path(path)
+    store = None
+    if resolve_payloads:
+        store = PayloadStore(payload_dir if payload_dir is not None else path.parent / "payloads")
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield Message.model_validate(_restore(json.loads(line), store))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Render trace files in the pretty form of ``print_message``."""
+    from loongflow.agentsdk.logger.message_logger import _print_single_message
+
+    parser = argparse.ArgumentParser(description="Render a message trace.")
+    parser.add_argument("paths", nargs="+", help="Trace files, oldest first.")
+    parser.add_argument("--payload-dir", default=None, help="Payload store directory.")
+    parser.add_argument("--role", action="append", help="Only show messages of this role.")
+    parser.add_argument("--no-payloads", action="store_true", help="Do not load offloaded payloads.")
+    parser.add_argument("--metadata", action="store_true", help="Show message metadata.")
+    args = parser.parse_args(argv)
+
+    for path in args.paths:
+        for msg in read_message_trace(path, args.payload_dir, not args.no_payloads):
+            if args.role and str(getattr(msg.role, "value", msg.role)) not in args.role:
+                continue
+            _print_single_message(msg, show_metadata=args.metadata, stream=False)
+
+
+if __name__ == "__main__":
+    main()
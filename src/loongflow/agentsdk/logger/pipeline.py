@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+This file provides the non-blocking logging pipeline and lazy payload helpers.
+
+Records are rendered on the calling thread, then formatted and written by the
+handlers on a dedicated writer thread, so slow handlers (files, terminals) no
+longer block the event loop. Large payloads should be passed as logging arguments,
+wrapped with ``lazy`` or ``lazy_json`` when they need work to render, so nothing
+is serialized for disabled levels or shed records:
+
+    logger.debug("Request: %s", lazy_json(messages, max_chars=4000))
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from loongflow.agentsdk.logger.logger import TraceIdFilter
+
+# Fill ratio of the queue above which records below the drop level are sampled.
+SAMPLING_THRESHOLD = 0.8
+
+
+class LazyText:
+    """A log argument rendered on first use, i.e. only if the record is emitted."""
+
+    __slots__ = ("_render", "_text")
+
+    def __init__(self, render: Callable[[], str]):
+        self._render = render
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = str(self._render())
+        return self._text
+
+    __repr__ = __str__
+
+
+def truncate(text: str, max_chars: Optional[int]) -> str:
+    """Cut ``text`` to ``max_chars`` characters, noting how much was left out."""
+    if max_chars is None or len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}... [{len(text) - max_chars} chars truncated]"
+
+
+def lazy(
+    func: Callable[..., Any], *args, max_chars: Optional[int] = None, **kwargs
+) -> LazyText:
+    """
+    Defer ``str(func(*args, **kwargs))`` until the record is emitted.
+
+    Args:
+        func (Callable): Function building the payload.
+        max_chars (Optional[int]): Truncate the rendered text to this many characters.
+    """
+    return LazyText(lambda: truncate(str(func(*args, **kwargs)), max_chars))
+
+
+def lazy_json(obj: Any, max_chars: Optional[int] = None, **dumps_kwargs) -> LazyText:
+    """
+    Defer the JSON serialization of ``obj`` until the record is emitted.
+
+    Objects that are not JSON serializable are rendered with ``str``.
+    """
+    dumps_kwargs.setdefault("ensure_ascii", False)
+    dumps_kwargs.setdefault("default", str)
+    return lazy(json.dumps, obj, max_chars=max_chars, **dumps_kwargs)
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler with a bounded buffer and a load shedding policy.
+
+    Records at or above ``drop_level`` are always enqueued, blocking if the queue
+    is full. Below it, only one of every ``sample_every`` records is kept while the
+    queue is more than ``SAMPLING_THRESHOLD`` full, and records are dropped when it
+    is full. The number of shed records is logged once the queue drains.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        drop_level: int = logging.WARNING,
+        sample_every: int = 10,
+    ):
+        super().__init__(log_queue)
+        self.drop_level = drop_level
+        self.sample_every = max(1, sample_every)
+        self._sampling_size = int(log_queue.maxsize * SAMPLING_THRESHOLD)
+        self._sampled = 0
+        self.dropped = 0
+        self._reported = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Enqueue a record following the load shedding policy. Shed records are
+        dropped before ``prepare``, so their lazy payloads are never rendered.
+        """
+        try:
+            if record.levelno < self.drop_level and not self._admit(record):
+                return
+            self.enqueue(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+    def _admit(self, record: logging.LogRecord) -> bool:
+        """Whether a record below the drop level is kept, sampling a busy queue."""
+        if self.queue.maxsize > 0 and self.queue.qsize() >= self._sampling_size:
+            self._sampled += 1
+            if self._sampled % self.sample_every:
+                self.dropped += 1
+                return False
+        elif self.dropped > self._reported:
+            self._report_dropped(record)
+        return True
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue a prepared record, dropping it on a full queue if sheddable."""
+        if record.levelno >= self.drop_level:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _report_dropped(self, record: logging.LogRecord) -> None:
+        count = self.dropped - self._reported
+        self._reported = self.dropped
+        notice = logging.LogRecord(
+            name=__name__,
+            level=logging.WARNING,
+            pathname=__file__,
+            lineno=0,
+            msg=f"Log pipeline dropped {count} records below "
+            f"{logging.getLevelName(self.drop_level)} under backpressure.",
+            args=None,
+            exc_info=None,
+        )
+        notice.log_id = getattr(record, "log_id", None)
+        self.queue.put(notice)
+
+
+class LogPipeline:
+    """
+    Moves the handlers of a logger behind a bounded queue drained by a writer thread.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        queue_size: int = 10000,
+        drop_level: int = logging.WARNING,
+        sample_every: int = 10,
+    ):
+        """
+        Args:
+            logger (logging.Logger): Logger whose handlers are moved, usually root.
+            queue_size (int): Maximum number of records buffered.
+            drop_level (int): Records below this level may be sampled or dropped.
+            sample_every (int): Keep one of every ``sample_every`` sheddable
+                records while the queue is nearly full.
+        """
+        if queue_size <= 0:
+            raise ValueError(f"Log queue size must be positive, got {queue_size}.")
+        self.logger = logger
+        self.handlers: List[logging.Handler] = list(logger.handlers)
+        self.queue: queue.Queue = queue.Queue(queue_size)
+        self.handler = BoundedQueueHandler(self.queue, drop_level, sample_every)
+        # The log id lives in a context variable, it must be read by the caller
+        self.handler.addFilter(TraceIdFilter())
+        self.listener = logging.handlers.QueueListener(
+            self.queue, *self.handlers, respect_handler_level=True
+        )
+
+    def start(self) -> None:
+        """Swap the handlers for the queue handler and start the writer thread."""
+        self.listener.start()
+        for handler in self.handlers:
+            self.logger.removeHandler(handler)
+        self.logger.addHandler(self.handler)
+
+    def detach(self) -> None:
+        """
+        Put the handlers back without touching the writer thread, for a forked
+        child where the thread does not exist and nothing would drain the queue.
+        """
+        if self.handler in self.logger.handlers:
+            self.logger.removeHandler(self.handler)
+            for handler in self.handlers:
+                self.logger.addHandler(handler)
+
+    def stop(self) -> None:
+        """Flush the queue, stop the writer thread and restore the handlers."""
+        # Handlers replaced by the owner of the logger in the meantime are kept
+        self.detach()
+        self.listener.stop()
+        for handler in self.handlers:
+            handler.flush()
+
+    def stats(self) -> Dict[str, int]:
+        """Queued and dropped record counts."""
+        return {"queued": self.queue.qsize(), "dropped": self.handler.dropped}
+
+
+_pipeline: Optional[LogPipeline] = None
+_pipeline_lock = threading.Lock()
+_atexit_registered = False
+
+
+def start_log_pipeline(
+    logger: Optional[logging.Logger] = None,
+    queue_size: int = 10000,
+    drop_level: int = logging.WARNING,
+    sample_every: int = 10,
+) -> LogPipeline:
+    """
+    Route the current handlers of ``logger`` (root by default) through a writer
+    thread. A running pipeline is stopped first. The pipeline is flushed at exit.
+    """
+    global _pipeline, _atexit_registered
+    with _pipeline_lock:
+        if _pipeline is not None:
+            _pipeline.stop()
+        _pipeline = LogPipeline(
+            logger or logging.getLogger(), queue_size, drop_level, sample_every
+        )
+        _pipeline.start()
+        if not _atexit_registered:
+            atexit.register(stop_log_pipeline)
+            _atexit_registered = True
+        return _pipeline
+
+
+def _detach_in_child() -> None:
+    """
+    Forked children, e.g. evaluation processes, have no writer thread: they log
+    straight to the original handlers.
+    """
+    global _pipeline, _pipeline_lock
+    # The lock may have been held by another thread of the parent at fork time
+    _pipeline_lock = threading.Lock()
+    if _pipeline is not None:
+        _pipeline.detach()
+        _pipeline = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_detach_in_child)
+
+
+def stop_log_pipeline() -> None:
+    """Flush and stop the running pipeline, if any, restoring its handlers."""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is not None:
+            _pipeline.stop()
+            _pipeline = None
@@ -5,9 +5,33 @@ This file provides the initialization for evolution memory module.
 """
 #!/usr/bin/python3
 
+from typing import TYPE_CHECKING
+
+from loongflow._lazy import attach
+
 from .base_memory import EvolveMemory, Solution
-from .in_memory import InMemory
-from .memory_factory import MemoryFactory
-from .redis_memory import RedisMemory
+from .lineage import LineageIndex
+
+if TYPE_CHECKING:
+    from .in_memory import InMemory
+    from .memory_factory import MemoryFactory
+    from .redis_memory import RedisMemory
+
+# The implementations import numpy and redis, Solution alone does not need them
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "InMemory": f"{__name__}.in_memory",
+        "MemoryFactory": f"{__name__}.memory_factory",
+        "RedisMemory": f"{__name__}.redis_memory",
+    },
+)
 
-__all__ = ["EvolveMemory", "Solution", "InMemory", "RedisMemory", "MemoryFactory"]
+__all__ = [
+    "EvolveMemory",
+    "Solution",
+    "InMemory",
+    "RedisMemory",
+    "MemoryFactory",
+    "LineageIndex",
+]
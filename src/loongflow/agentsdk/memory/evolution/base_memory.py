@@ -6,43 +6,14 @@ This file provide base memory interface
 
 from __future__ import annotations
 
-import math
+import asyncio
 import time
 import uuid
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass, field, fields
-from typing import Any, Dict, Optional, Tuple
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Optional, Tuple, Union
 
-import numpy as np
-
-
-def clean_nan_values(obj: Any) -> Any:
-    """
-    Recursively clean NaN values from a data structure, replacing them with
-    None. This ensures JSON serialization works correctly.
-    """
-    if isinstance(obj, dict):
-        return {key: clean_nan_values(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [clean_nan_values(item) for item in obj]
-    elif isinstance(obj, tuple):
-        return tuple(clean_nan_values(item) for item in obj)
-    elif isinstance(obj, float) and (math.isnan(obj) or math.isinf(obj)):
-        return None
-    elif isinstance(obj, np.floating) and (np.isnan(obj) or np.isinf(obj)):
-        return None
-    elif hasattr(obj, "dtype") and np.issubdtype(obj.dtype, np.floating):
-        # Handle numpy arrays and scalars
-        if np.isscalar(obj):
-            if np.isnan(obj) or np.isinf(obj):
-                return None
-            else:
-                return float(obj)
-        else:
-            # For numpy arrays, convert to list and clean recursively
-            return clean_nan_values(obj.tolist())
-    else:
-        return obj
+from loongflow.agentsdk.serialization import clean_nan_values, dumps, loads
 
 
 @dataclass
@@ -90,18 +61,24 @@ class Solution:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation"""
-        data = asdict(self)
-        return clean_nan_values(data)
+        # A single copying pass, instead of a deep copy followed by the NaN clean-up
+        return clean_nan_values({name: getattr(self, name) for name in _FIELD_NAMES})
+
+    def to_json(self, indent: Optional[int] = None) -> bytes:
+        """Serialize to JSON with the default codec, NaN values written as null."""
+        return dumps({name: getattr(self, name) for name in _FIELD_NAMES}, indent)
+
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> "Solution":
+        """Create from the JSON written by ``to_json`` or ``json.dumps(to_dict())``."""
+        return cls.from_dict(loads(data))
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Solution":
         """Create from dictionary representation"""
-        # Get the valid field names for the Program dataclass
-        valid_fields = {f.name for f in fields(cls)}
-
         # Filter the data to only include valid fields
         if isinstance(data, dict):
-            filtered_data = {k: v for k, v in data.items() if k in valid_fields}
+            filtered_data = {k: v for k, v in data.items() if k in _FIELD_NAMES}
         else:
             # Handle case where data is not a dictionary
             filtered_data = {}
@@ -127,6 +104,9 @@ class Solution:
         return cls(**filtered_data)
 
 
+_FIELD_NAMES = tuple(f.name for f in fields(Solution))
+
+
 class EvolveMemory(ABC):
     """Abstract base class for EvolveMemory implementations.
 
@@ -189,6 +169,59 @@ class EvolveMemory(ABC):
         """Update a solution's properties in the memory."""
         ...
 
+    def stats_version(self) -> Optional[int]:
+        """
+        Return a counter changing whenever the population changes, so callers can
+        skip re-reading an unchanged ``memory_status``. None if not supported, the
+        status must then always be re-read.
+        """
+        return None
+
+    # Async variants of the read operations. The defaults run the synchronous
+    # implementation in a worker thread, so lock waits and CPU heavy work never block
+    # the event loop, they serve InMemory. RedisMemory overrides all of them with
+    # its redis.asyncio client.
+
+    async def aget_solutions(self, *args: Any, **kwargs: Any) -> list[Solution]:
+        """Async variant of ``get_solutions``."""
+        return await asyncio.to_thread(self.get_solutions, *args, **kwargs)
+
+    async def alist_solutions(self, *args: Any, **kwargs: Any) -> list[Solution]:
+        """Async variant of ``list_solutions``."""
+        return await asyncio.to_thread(self.list_solutions, *args, **kwargs)
+
+    async def aget_best_solutions(self, *args: Any, **kwargs: Any) -> list[Solution]:
+        """Async variant of ``get_best_solutions``."""
+        return await asyncio.to_thread(self.get_best_solutions, *args, **kwargs)
+
+    async def asample(self, *args: Any, **kwargs: Any) -> Optional[Solution]:
+        """Async variant of ``sample``."""
+        return await asyncio.to_thread(self.sample, *args, **kwargs)
+
+    async def amemory_status(self, *args: Any, **kwargs: Any) -> dict:
+        """Async variant of ``memory_status``."""
+        return await asyncio.to_thread(self.memory_status, *args, **kwargs)
+
+    async def astats_version(self) -> Optional[int]:
+        """Async variant of ``stats_version``."""
+        return await asyncio.to_thread(self.stats_version)
+
+    async def aload_checkpoint(self, *args: Any, **kwargs: Any) -> None:
+        """Async variant of ``load_checkpoint``."""
+        return await asyncio.to_thread(self.load_checkpoint, *args, **kwargs)
+
+    async def aget_parents_by_child_id(
+        self, *args: Any, **kwargs: Any
+    ) -> list[Solution]:
+        """Async variant of ``get_parents_by_child_id``."""
+        return await asyncio.to_thread(self.get_parents_by_child_id, *args, **kwargs)
+
+    async def aget_childs_by_parent_id(
+        self, *args: Any, **kwargs: Any
+    ) -> list[Solution]:
+        """Async variant of ``get_childs_by_parent_id``."""
+        return await asyncio.to_thread(self.get_childs_by_parent_id, *args, **kwargs)
+
     def _calculate_feature_coords(
         self,
         solution: Solution,
@@ -4,6 +4,7 @@
 This file provide in-memory implementation of evolution memory.
 """
 
+import asyncio
 import heapq
 import json
 import logging
@@ -11,22 +12,99 @@ import os
 import threading
 import time
 import uuid
+from collections.abc import Mapping
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from itertools import chain
 from operator import attrgetter
-from typing import Dict, Optional, Set
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from loongflow.agentsdk.serialization import dump_file, load_file
 
 from .base_memory import EvolveMemory, Solution
 from .boltzmann import select_parents_with_dynamic_temperature
+from .lineage import LineageIndex, migration_source
+from .population_stats import ScoreStats, ScoreSummary
 
 logger = logging.getLogger(__name__)
 
 
+class _PopulationView(Mapping):
+    """
+    Read-only population of a snapshot, the union of its per-island member dicts.
+
+    Snapshots share the member dicts of the islands a write did not touch, so a
+    write copies the members of its island only.
+    """
+
+    def __init__(self, shards: Tuple[Dict[str, Solution], ...]):
+        self._shards = shards
+        self._len = sum(len(shard) for shard in shards)
+
+    def __getitem__(self, solution_id: str) -> Solution:
+        for shard in self._shards:
+            solution = shard.get(solution_id)
+            if solution is not None:
+                return solution
+        raise KeyError(solution_id)
+
+    def __contains__(self, solution_id: object) -> bool:
+        return any(solution_id in shard for shard in self._shards)
+
+    def __iter__(self) -> Iterator[str]:
+        return chain.from_iterable(self._shards)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def values(self) -> Iterator[Solution]:
+        return chain.from_iterable(shard.values() for shard in self._shards)
+
+
+@dataclass(frozen=True)
+class _PopulationSnapshot:
+    """
+    Immutable view of the population, replaced after every write. The members of
+    each island are copied on write, see ``InMemory._publish_snapshot``.
+    """
+
+    population: Mapping
+    islands: Tuple[Tuple[Solution, ...], ...]
+    elites: Tuple[Solution, ...]
+    # Members of each island, then the population members in no island
+    shards: Tuple[Dict[str, Solution], ...] = ()
+    stats: ScoreSummary = ScoreSummary()
+    island_stats: Tuple[ScoreSummary, ...] = ()
+    elite_threshold: Optional[float] = None
+    # Leaderboard: the best solutions of the population and of each island, best
+    # first, materialized from the running statistics on every write
+    leaders: Tuple[Solution, ...] = ()
+    island_leaders: Tuple[Tuple[Solution, ...], ...] = ()
+    # Incremented with every published snapshot
+    version: int = 0
+
+
 class InMemory(EvolveMemory):
     """In-memory implementation of Evolution Memory storage.
 
     Features:
-    - Thread-safe operations
+    - Thread-safe operations, sharded by island
+    - Lock-free reads from an immutable population snapshot
     - Memory-efficient data structures
     - Optimized for high-frequency access
+
+    Locking: each island lock guards the MAP-Elites feature map of its island,
+    ``_feature_lock`` guards the feature statistics and the diversity cache and
+    ``_lock`` guards the shared registries (solutions, populations, island sets,
+    elites and counters) for short critical sections only. Operations spanning
+    every feature map (population limit, checkpoints) hold all the locks, while
+    migration only touches the registries and holds ``_lock`` alone.
+    Locks are always taken in the same order to avoid deadlocks: island locks by
+    ascending island id, then ``_feature_lock``, then ``_lock``.
+
+    Async variants: there is no IO to await, so the CPU heavy ones (adds,
+    checkpoints, reads missing the snapshot) run the blocking implementation in a
+    worker thread with ``asyncio.to_thread``, the others are plain snapshot reads.
     """
 
     def __init__(
@@ -43,6 +121,8 @@ class InMemory(EvolveMemory):
         use_sampling_weight: bool = True,
         sampling_weight_power: float = 1.0,
         output_path: str = "output",
+        compact_checkpoints: bool = False,
+        leaderboard_size: int = 50,
     ):
         super().__init__()
         if feature_dimensions is None:
@@ -57,6 +137,10 @@ class InMemory(EvolveMemory):
         self.use_sampling_weight: bool = use_sampling_weight
         self.sampling_weight_power: float = sampling_weight_power
         self.output_path: str = output_path
+        # Write checkpoint files without indentation, smaller and faster to load
+        self.compact_checkpoints: bool = compact_checkpoints
+        # Number of best solutions materialized per island and globally
+        self.leaderboard_size: int = leaderboard_size
         self.best_solution_id: str = ""
         self.last_iteration: int = 0
         self.current_island: int = 0
@@ -91,6 +175,14 @@ class InMemory(EvolveMemory):
         self.diversity_reference_set: list[str] = []
         self.solutions: Dict[str, Solution] = {}
         self.populations: Dict[str, Solution] = {}
+        # Parent/children index of every generated solution, guarded by ``_lock``
+        self.lineage = LineageIndex()
+        # Running score statistics of the population and of each island, guarded
+        # by ``_lock``
+        self.score_stats = ScoreStats()
+        self.island_score_stats: list[ScoreStats] = [
+            ScoreStats() for _ in range(num_islands)
+        ]
 
         self.last_migration_generation: int = 0  # Initialize missing attribute
 
@@ -99,11 +191,25 @@ class InMemory(EvolveMemory):
         self._island_locks: Dict[int, threading.RLock] = {
             i: threading.RLock() for i in range(num_islands)
         }
+        self._feature_lock = threading.RLock()
+        self._snapshot = _PopulationSnapshot(
+            population=_PopulationView(()),
+            islands=tuple(() for _ in range(num_islands)),
+            elites=(),
+            island_stats=tuple(ScoreSummary() for _ in range(num_islands)),
+        )
+        # Shards of the snapshot changed since it was published (island ids, and
+        # the number of islands for the members in no island), None for all of
+        # them. Guarded by ``_lock``.
+        self._dirty_shards: Optional[Set[int]] = None
 
     async def add_solution(self, solution: Solution) -> str:
         """
         Add solution to memory with optimized workflow.
 
+        MAP-Elites placement, elite and population updates and migration are CPU
+        heavy, they run in a worker thread to keep the event loop responsive.
+
         Args:
             solution: Solution to add
 
@@ -112,42 +218,153 @@ class InMemory(EvolveMemory):
         """
         if not isinstance(solution, Solution):
             raise ValueError("solution must be an instance of Solution")
+        return await asyncio.to_thread(self._add_solution, solution)
+
+    def _add_solution(self, solution: Solution) -> str:
+        """Add a solution, blocking the calling thread."""
         with self._lock:
             self._prepare_solution(solution)
             self.solutions[solution.solution_id] = solution
+            self.lineage.add(solution.solution_id, solution.parent_id, solution.score)
 
-            if not solution.score:
-                logger.warning(
-                    f"WARNING: No score found for solution {solution.solution_id}. Skipping."
-                )
-                return solution.solution_id
+        if not solution.score:
+            logger.warning(
+                f"WARNING: No score found for solution {solution.solution_id}. Skipping."
+            )
+            return solution.solution_id
 
-            # Process solution through memory components
+        island_id = solution.island_id
+        with self._island_locks[island_id]:
+            # Process solution through memory components, only its island is locked
             map_elites_feature = self._calculate_MAP_Elites(solution)
             solution.metadata["MAP_Elite_feature"] = map_elites_feature
-            self.populations[solution.solution_id] = solution
-            self.solutions[solution.solution_id] = solution
-
-            self._update_island(solution)
-            self._update_elites(solution)
-
-            # Enforce limits before final updates
-            self._enforce_population_limit(exclude_solution_id=solution.solution_id)
+            with self._lock:
+                self.populations[solution.solution_id] = solution
+                self._update_island(solution)
+                self._update_elites(solution)
+
+        # Enforce limits before final updates
+        if len(self.populations) > self.population_size:
+            with self._all_islands_locked():
+                self._enforce_population_limit(
+                    exclude_solution_id=solution.solution_id
+                )
 
+        with self._island_locks[island_id], self._lock:
             # Update tracking
             self._update_best_solution(solution)
-            self._update_island_best_solution(solution, solution.island_id)
+            self._update_island_best_solution(solution, island_id)
+            self._publish_snapshot()
 
-            # Check Migration
-            await self._check_migration()
+        # Check Migration, a batched step over every island
+        if self._migration_due():
+            with self._lock:
+                self._check_migration()
 
-            # Final update of island capacity after migration
-            self.island_capacity[solution.island_id] = len(
-                self.islands[solution.island_id]
-            )
+        # Final update of island capacity after migration
+        with self._lock:
+            self.island_capacity[island_id] = len(self.islands[island_id])
 
         return solution.solution_id
 
+    @contextmanager
+    def _all_islands_locked(self) -> Iterator[None]:
+        """Hold every lock of the memory, taken in the fixed lock order."""
+        with ExitStack() as stack:
+            for island_id in sorted(self._island_locks):
+                stack.enter_context(self._island_locks[island_id])
+            stack.enter_context(self._feature_lock)
+            stack.enter_context(self._lock)
+            yield
+
+    def _publish_snapshot(self) -> None:
+        """
+        Replace the read snapshot with the current population. Must hold ``_lock``.
+
+        Readers take the snapshot reference without locking, so it is never mutated
+        once published. The members of the islands marked with ``_mark_dirty`` are
+        copied, the others are shared with the previous snapshot, so adding a
+        solution costs the size of its island rather than of the population.
+        """
+        populations = self.populations
+        shards = self._snapshot.shards
+        dirty = self._dirty_shards
+        if dirty is None or len(shards) != len(self.islands) + 1:
+            assigned = set().union(*self.islands)
+            shards = tuple(
+                {sid: populations[sid] for sid in island if sid in populations}
+                for island in self.islands
+            ) + ({sid: s for sid, s in populations.items() if sid not in assigned},)
+            islands = tuple(tuple(shard.values()) for shard in shards[:-1])
+        else:
+            shards, islands = list(shards), list(self._snapshot.islands)
+            for shard_id in dirty:
+                members = self.islands[shard_id] if shard_id < len(islands) else shards[-1]
+                shards[shard_id] = {
+                    sid: populations[sid] for sid in members if sid in populations
+                }
+                if shard_id < len(islands):
+                    islands[shard_id] = tuple(shards[shard_id].values())
+            shards, islands = tuple(shards), tuple(islands)
+        self._dirty_shards = set()
+
+        elites = tuple(populations[sid] for sid in self.elites if sid in populations)
+        elite_threshold = None
+        if elites and len(elites) >= self.elite_archive_size:
+            elite_threshold = min(s.score for s in elites)
+        self._snapshot = _PopulationSnapshot(
+            population=_PopulationView(shards),
+            islands=islands,
+            shards=shards,
+            elites=elites,
+            stats=self.score_stats.summary(),
+            island_stats=tuple(s.summary() for s in self.island_score_stats),
+            elite_threshold=elite_threshold,
+            leaders=self._leaders(self.score_stats),
+            island_leaders=tuple(self._leaders(s) for s in self.island_score_stats),
+            version=self._snapshot.version + 1,
+        )
+
+    def _mark_dirty(self, island_id: Optional[int] = None) -> None:
+        """
+        Mark the members of an island as changed for the next snapshot, or every
+        member if ``island_id`` is None. Must hold ``_lock``.
+        """
+        if island_id is None:
+            self._dirty_shards = None
+        elif self._dirty_shards is not None:
+            self._dirty_shards.add(island_id)
+
+    def _leaders(self, stats: ScoreStats) -> Tuple[Solution, ...]:
+        """Best population members of ``stats``, in O(leaderboard_size). Must hold ``_lock``."""
+        populations = self.populations
+        return tuple(
+            populations[sid]
+            for sid in stats.top_ids(self.leaderboard_size)
+            if sid in populations
+        )
+
+    def _track_score(self, solution: Solution, island_id: Optional[int]) -> None:
+        """Add a population member to the running statistics. Must hold ``_lock``."""
+        self.score_stats.add(
+            solution.solution_id, solution.score, solution.iteration
+        )
+        if island_id is not None:
+            self.island_score_stats[island_id].add(
+                solution.solution_id, solution.score, solution.iteration
+            )
+
+    def _rebuild_stats(self) -> None:
+        """Recompute the running statistics from scratch. Must hold ``_lock``."""
+        self.score_stats = ScoreStats()
+        self.island_score_stats = [ScoreStats() for _ in self.islands]
+        for solution in self.populations.values():
+            self._track_score(solution, None)
+        for island_id, island in enumerate(self.islands):
+            for sid in island:
+                if sid in self.populations:
+                    self._track_score(self.populations[sid], island_id)
+
     async def update_solution(self, solution_id: str, **kwargs) -> str:
         """
         Update solution in memory with optimized workflow.
@@ -172,6 +389,16 @@ class InMemory(EvolveMemory):
         with self._lock:
             self.solutions[solution_id] = updated_solution
             self.populations[solution_id] = updated_solution
+            self.lineage.update_score(solution_id, updated_solution.score)
+            self._track_score(updated_solution, None)
+            # In no island, it is among the members of the last shard
+            changed_shard = len(self.islands)
+            for island_id, island in enumerate(self.islands):
+                if solution_id in island:
+                    self._track_score(updated_solution, island_id)
+                    changed_shard = island_id
+            self._mark_dirty(changed_shard)
+            self._publish_snapshot()
 
         return solution_id
 
@@ -210,20 +437,18 @@ class InMemory(EvolveMemory):
             raise ValueError("filter_type must be 'asc' or 'desc'")
 
         with self._lock:
-            # Use generator to avoid full list copy
-            solutions = (s for s in self.solutions.values())
-
-            # Optimized sorting with key function caching
-            key_func = attrgetter("timestamp")
-            if limit is None or limit >= len(self.solutions):
-                return sorted(solutions, key=key_func, reverse=(filter_type == "desc"))
-
-            # Use nsmallest/nlargest with generator for better memory efficiency
-            return (
-                heapq.nsmallest(limit, solutions, key=key_func)
-                if filter_type == "asc"
-                else heapq.nlargest(limit, solutions, key=key_func)
-            )
+            solutions = list(self.solutions.values())
+
+        # Optimized sorting with key function caching, outside of the lock
+        key_func = attrgetter("timestamp")
+        if limit is None or limit >= len(solutions):
+            return sorted(solutions, key=key_func, reverse=(filter_type == "desc"))
+
+        return (
+            heapq.nsmallest(limit, solutions, key=key_func)
+            if filter_type == "asc"
+            else heapq.nlargest(limit, solutions, key=key_func)
+        )
 
     def get_best_solutions(
         self, island_id: Optional[int] = None, top_k: Optional[int] = None
@@ -240,19 +465,50 @@ class InMemory(EvolveMemory):
         """
         top_k = 1 if top_k is None else top_k
 
-        with self._lock:
-            # Use generator expression for memory efficiency
-            solutions = (
-                (
-                    self.populations[sid]
-                    for sid in self.islands[island_id]
-                    if sid in self.populations
-                )
-                if island_id is not None
-                else self.populations.values()
-            )
+        # Lock-free read from the published snapshot
+        snapshot = self._snapshot
+        leaders = self._served_leaders(snapshot, island_id, top_k)
+        if leaders is not None:
+            return leaders
+        solutions = (
+            snapshot.islands[island_id]
+            if island_id is not None
+            else snapshot.population.values()
+        )
+
+        return heapq.nlargest(top_k, solutions, key=attrgetter("score"))
 
-            return heapq.nlargest(top_k, solutions, key=attrgetter("score"))
+    async def aget_best_solutions(
+        self, island_id: Optional[int] = None, top_k: Optional[int] = None
+    ) -> list[Solution]:
+        """
+        Async variant of ``get_best_solutions``, a plain read when the leaderboard
+        holds the requested solutions.
+        """
+        leaders = self._served_leaders(
+            self._snapshot, island_id, 1 if top_k is None else top_k
+        )
+        if leaders is not None:
+            return leaders
+        return await asyncio.to_thread(self.get_best_solutions, island_id, top_k)
+
+    @staticmethod
+    def _served_leaders(
+        snapshot: _PopulationSnapshot, island_id: Optional[int], top_k: int
+    ) -> Optional[list[Solution]]:
+        """
+        The ``top_k`` best solutions from the leaderboard of ``snapshot``, None if it
+        does not hold them all.
+        """
+        if island_id is not None:
+            if not 0 <= island_id < len(snapshot.island_leaders):
+                return None
+            leaders, members = snapshot.island_leaders[island_id], snapshot.islands[island_id]
+        else:
+            leaders, members = snapshot.leaders, snapshot.population
+        if top_k <= len(leaders) or len(leaders) == len(members):
+            return list(leaders[:top_k])
+        return None
 
     def sample(
         self, island_id: Optional[int] = None, exploration_rate: float = 0.2
@@ -270,25 +526,19 @@ class InMemory(EvolveMemory):
         Returns:
             Optional[Solution]: The sampled solution, or None if no solutions available.
         """
-        solutions = list(self.populations.values())
-
+        # Lock-free read from the published snapshot, writers never wait on sampling
+        snapshot = self._snapshot
         if island_id is not None:
-            island_sids = list(self.islands[island_id])
-            solutions = [
-                self.populations[sid] for sid in island_sids if sid in self.populations
-            ]
-
-        elites = []
-        for elite_id in self.elites:
-            elite = self.populations[elite_id]
-            elites.append(elite)
+            solutions = list(snapshot.islands[island_id])
+        else:
+            solutions = list(snapshot.population.values())
 
         if not solutions:
             return None
 
         return select_parents_with_dynamic_temperature(
             solutions=solutions,
-            elites=elites,
+            elites=list(snapshot.elites),
             initial_temp=self.boltzmann_temperature,
             use_sampling_weight=self.use_sampling_weight,
             sampling_weight_power=self.sampling_weight_power,
@@ -326,51 +576,63 @@ class InMemory(EvolveMemory):
 
         logger.info(f"Checkpointing memory to {checkpoint_path}")
 
+        # Serializing every solution is CPU and disk heavy, keep it off the event loop.
+        await asyncio.to_thread(self._save_checkpoint, checkpoint_path, tag)
+
+    def _save_checkpoint(self, checkpoint_path: str, tag: str) -> None:
+        """Write the checkpoint files, blocking the calling thread."""
+        # Copy a consistent state under the locks, write the files after releasing
+        # them so that cycles are not stalled by disk I/O.
+        with self._all_islands_locked():
+            solution_dicts = [solution.to_dict() for solution in self.solutions.values()]
+            metadata = {
+                "total_generated_solutions": len(self.solutions),
+                "total_valid_solutions": len(self.populations),
+                "island_feature_map": [dict(m) for m in self.island_feature_maps],
+                "islands": [list(island) for island in self.islands],
+                "elites": list(self.elites),
+                "best_solution_id": self.best_solution_id,
+                "island_best_solution": [sid for sid in self.island_best_solution],
+                "last_iteration": self.last_iteration,
+                "current_island": self.current_island,
+                "island_capacity": [length for length in self.island_capacity],
+                "last_migration_generation": self.last_migration_generation,
+                "feature_stats": self._serialize_feature_stats(self.feature_stats),
+            }
+            population_count = len(self.populations)
+
+            # Save best solution found so far
+            if self.best_solution_id:
+                best_solution = self.populations.get(self.best_solution_id)
+            else:
+                best_solutions = self.get_best_solutions()
+                best_solution = best_solutions[0] if len(best_solutions) > 0 else None
+            best_solution_dict = best_solution.to_dict() if best_solution else None
+
         # Save solutions
-        for solution in self.solutions.values():
-            solutions_path = os.path.join(checkpoint_path, "solutions")
+        solutions_path = os.path.join(checkpoint_path, "solutions")
+        if solution_dicts:
             os.makedirs(solutions_path, exist_ok=True)
-
-            # Save solution
-            solution_dict = solution.to_dict()
-            solution_path = os.path.join(solutions_path, f"{solution.solution_id}.json")
-            with open(solution_path, "w") as f:
-                json.dump(solution_dict, f, indent=4)
+        for solution_dict in solution_dicts:
+            solution_path = os.path.join(
+                solutions_path, f"{solution_dict['solution_id']}.json"
+            )
+            dump_file(solution_dict, solution_path, self.compact_checkpoints)
 
         # Save metadata
-        metadata = {
-            "total_generated_solutions": len(self.solutions),
-            "total_valid_solutions": len(self.populations),
-            "island_feature_map": self.island_feature_maps,
-            "islands": [list(island) for island in self.islands],
-            "elites": list(self.elites),
-            "best_solution_id": self.best_solution_id,
-            "island_best_solution": [sid for sid in self.island_best_solution],
-            "last_iteration": self.last_iteration,
-            "current_island": self.current_island,
-            "island_capacity": [length for length in self.island_capacity],
-            "last_migration_generation": self.last_migration_generation,
-            "feature_stats": self._serialize_feature_stats(self.feature_stats),
-        }
-
-        with open(os.path.join(checkpoint_path, "metadata.json"), "w") as f:
-            json.dump(metadata, f, indent=4)
+        dump_file(
+            metadata,
+            os.path.join(checkpoint_path, "metadata.json"),
+            self.compact_checkpoints,
+        )
 
         logger.info(
-            f"Saved checkpoint with {len(self.populations)} programs to {checkpoint_path}"
+            f"Saved checkpoint with {population_count} programs to {checkpoint_path}"
         )
 
-        # Save best solution found so far
-        if self.best_solution_id:
-            best_solution = self.populations.get(self.best_solution_id)
-        else:
-            best_solutions = self.get_best_solutions()
-            best_solution = best_solutions[0] if len(best_solutions) > 0 else None
-
-        if best_solution:
+        if best_solution_dict:
             best_solution_path = os.path.join(checkpoint_path, "best_solution.json")
-            with open(best_solution_path, "w") as f:
-                json.dump(best_solution.to_dict(), f, indent=4)
+            dump_file(best_solution_dict, best_solution_path, self.compact_checkpoints)
 
         logger.info(f"Saved checkpoint with tag {tag} to {checkpoint_path}")
 
@@ -388,11 +650,10 @@ class InMemory(EvolveMemory):
                 f"Checkpoint path {checkpoint_path} does not exist."
             )
 
-        with self._lock:
+        with self._all_islands_locked():
             logger.info(f"Loading checkpoint from {checkpoint_path}")
 
-            with open(os.path.join(checkpoint_path, "metadata.json"), "r") as f:
-                metadata = json.load(f)
+            metadata = load_file(os.path.join(checkpoint_path, "metadata.json"))
 
             self.island_feature_maps = metadata.get(
                 "island_feature_map", [{} for _ in range(self.num_islands)]
@@ -419,11 +680,9 @@ class InMemory(EvolveMemory):
                 if file_name.endswith(".json"):
                     file_path = os.path.join(solutions_path, file_name)
                     try:
-                        with open(file_path, "r") as f:
-                            solution_dict = json.load(f)
-                            solution = Solution.from_dict(solution_dict)
-                            self.populations[solution.solution_id] = solution
-                            self.solutions[solution.solution_id] = solution
+                        solution = Solution.from_dict(load_file(file_path))
+                        self.populations[solution.solution_id] = solution
+                        self.solutions[solution.solution_id] = solution
                     except Exception as e:
                         logger.error(
                             f"Failed to load solution from {file_path}: {str(e)}"
@@ -431,6 +690,16 @@ class InMemory(EvolveMemory):
                         raise e
 
             self._reconstruct_islands(saved_islands)
+            self._rebuild_stats()
+            self.lineage = LineageIndex.build(
+                (
+                    sid,
+                    s.parent_id,
+                    s.score,
+                    migration_source(sid, s.metadata),
+                )
+                for sid, s in self.solutions.items()
+            )
 
             if len(self.island_capacity) != len(self.islands):
                 self.island_capacity = [len(island) for island in self.islands]
@@ -438,99 +707,70 @@ class InMemory(EvolveMemory):
             if len(self.island_best_solution) != len(self.islands):
                 self.island_best_solution = [None] * len(self.islands)
 
+            # The checkpoint may hold more islands than configured
+            for island_id in range(len(self.islands)):
+                self._island_locks.setdefault(island_id, threading.RLock())
+            self._mark_dirty()
+            self._publish_snapshot()
+
     def memory_status(self, island_id: int = None) -> dict:
         """Return the status of the memory"""
-        top_3_solutions = self.get_best_solutions(top_k=3)
-        top_3_iterations = [
-            top_3_solutions[i].iteration
-            for i in range(min(3, len(top_3_solutions)))
-            if top_3_solutions[i]
-        ]
-
-        best_solution = top_3_solutions[0] if len(top_3_solutions) > 0 else None
-        population_scores = [
-            solution.score for solution in self.populations.values() if solution
-        ]
-        avg_score = (
-            sum(population_scores) / len(population_scores)
-            if len(population_scores) > 0
-            else 0
-        )
-        better_ratio = (
-            len([s for s in population_scores if s > avg_score])
-            / len(population_scores)
-            if len(population_scores) > 0
-            else 0
-        )
-
+        # Every figure comes from the running statistics of one lock-free snapshot,
+        # so they are consistent and cost O(1) whatever the population size
+        snapshot = self._snapshot
         result = {
             "global_status": {
                 "current_iteration": self.last_iteration,
-                "is_full": len(population_scores) == self.population_size,
-                "top_3_iterations": top_3_iterations,
-                "best_score": best_solution.score if best_solution else 0,
-                "best_iteration": best_solution.iteration if best_solution else 0,
-                "avg_score": round(avg_score, 6),
-                "better_ratio": round(better_ratio, 2),
+                "is_full": snapshot.stats.count == self.population_size,
+                **snapshot.stats.status(),
             },
         }
 
-        if island_id and len(self.islands[island_id]) > 0:
-            island_metrics = {"island_id": island_id}
-            island_top_3_solutions = self.get_best_solutions(
-                island_id=island_id, top_k=3
-            )
-
-            if len(island_top_3_solutions) < 1:
-                return result
-
-            island_top_3_iterations = [
-                island_top_3_solutions[i].iteration
-                for i in range(min(3, len(island_top_3_solutions)))
-                if island_top_3_solutions[i]
-            ]
-
-            island_metrics["top_3_iterations"] = island_top_3_iterations
-            island_best_solution = island_top_3_solutions[0]
-            island_metrics["best_score"] = (
-                island_best_solution.score if island_best_solution else 0
-            )
-            island_metrics["best_iteration"] = (
-                island_best_solution.iteration if island_best_solution else 0
-            )
-
-            island_solutions = [
-                self.populations.get(solution_id)
-                for solution_id in self.islands[island_id]
-            ]
-            island_scores = [
-                solution.score for solution in island_solutions if solution
-            ]
-            island_metrics["avg_score"] = round(
-                (
-                    sum(island_scores) / len(island_scores)
-                    if len(island_scores) > 0
-                    else 0
-                ),
-                6,
-            )
-            island_metrics["better_ratio"] = round(
-                (
-                    len([s for s in island_scores if s > island_metrics["avg_score"]])
-                    / len(island_scores)
-                    if len(island_scores) > 0
-                    else 0
-                ),
-                2,
-            )
+        if island_id and snapshot.island_stats[island_id].count > 0:
             island_feature_map = self.island_feature_maps[island_id]
             total_possible_cells = self.feature_bins ** len(self.feature_dimensions)
             coverage = (len(island_feature_map) + 1) / total_possible_cells
-            island_metrics["map_elites_feature_ratio"] = coverage
-            result["island_status"] = island_metrics
+            result["island_status"] = {
+                "island_id": island_id,
+                **snapshot.island_stats[island_id].status(),
+                "map_elites_feature_ratio": coverage,
+            }
 
         return result
 
+    def population_stats(self) -> dict:
+        """
+        Return the running score statistics of the population.
+
+        Returns:
+            dict: ``stats_version``, the ``elite_threshold`` (lowest elite score once
+                the archive is full, None before), and the count, mean, variance,
+                min, max and score histogram of the population (``global``) and of
+                each island (``islands``).
+        """
+        snapshot = self._snapshot
+        return {
+            "stats_version": snapshot.version,
+            "elite_threshold": snapshot.elite_threshold,
+            "global": snapshot.stats.to_dict(),
+            "islands": [stats.to_dict() for stats in snapshot.island_stats],
+        }
+
+    def stats_version(self) -> int:
+        """
+        Return a counter changing whenever the population changes, so callers can
+        skip re-reading an unchanged ``memory_status``.
+        """
+        return self._snapshot.version
+
+    async def astats_version(self) -> int:
+        """Async variant of ``stats_version``, a plain read."""
+        return self._snapshot.version
+
+    async def amemory_status(self, island_id: int = None) -> dict:
+        """Async variant of ``memory_status``, a plain read of the snapshot."""
+        return self.memory_status(island_id)
+
     def get_parents_by_child_id(self, child_id: str, parent_cnt: int) -> list[Solution]:
         """
         Get parents by child id
@@ -546,26 +786,17 @@ class InMemory(EvolveMemory):
             if child_id not in self.solutions:
                 raise ValueError(f"Child solution with id '{child_id}' not found.")
 
-            parents = []
-            while len(parents) < parent_cnt:
-                child = self.solutions.get(child_id, None)
-                if child is None:
-                    break
-
-                parent_id = child.parent_id
-                parent = self.solutions.get(parent_id, None)
-                if parent is None:
-                    break
-
-                parents.append(parent)
-                child_id = parent_id
-
-            return parents
+            return [
+                self.solutions[sid]
+                for sid in self.lineage.ancestors(child_id, parent_cnt)
+            ]
 
     def get_childs_by_parent_id(self, parent_id: str, child_cnt: int) -> list[Solution]:
         """
         Get childs by parent id
 
+        Children generated on every island are returned, migrated copies excluded.
+
         Args:
             parent_id (int): Parent solution id
             child_cnt (int): Number of children to retrieve
@@ -577,20 +808,85 @@ class InMemory(EvolveMemory):
             if parent_id not in self.solutions:
                 raise ValueError(f"Parent solution with id '{parent_id}' not found.")
 
-            childs = []
-            parent = self.solutions.get(parent_id, None)
-            if parent is None:
-                return childs
+            return [
+                self.solutions[sid]
+                for sid in self.lineage.children(parent_id, child_cnt)
+            ]
 
-            island_solutions = [
-                self.solutions[sid] for sid in self.islands[parent.island_id]
+    def get_ancestors(
+        self, solution_id: str, limit: Optional[int] = None
+    ) -> list[Solution]:
+        """
+        Get the ancestor chain of a solution, nearest first.
+
+        Args:
+            solution_id (str): Solution id
+            limit (Optional[int]): Maximum number of ancestors, all if None
+
+        Returns:
+            list[Solution]: Ancestor solutions
+        """
+        with self._lock:
+            self._check_in_lineage(solution_id)
+            return [
+                self.solutions[sid] for sid in self.lineage.ancestors(solution_id, limit)
             ]
-            for child_solution in island_solutions:
-                if child_solution.parent_id == parent.solution_id:
-                    childs.append(child_solution)
-                    if len(childs) == child_cnt:
-                        break
-            return childs
+
+    def get_subtree(
+        self, solution_id: str, max_depth: Optional[int] = None
+    ) -> list[Solution]:
+        """
+        Get the descendants of a solution in breadth-first order.
+
+        Descendants bred from migrated copies of the solution are included.
+
+        Args:
+            solution_id (str): Solution id
+            max_depth (Optional[int]): Only descendants at most this many generations
+                below the solution, all if None
+
+        Returns:
+            list[Solution]: Descendant solutions
+        """
+        with self._lock:
+            self._check_in_lineage(solution_id)
+            return [
+                self.solutions[sid]
+                for sid in self.lineage.subtree(solution_id, max_depth)
+            ]
+
+    def get_lineage_depth(self, solution_id: str) -> int:
+        """
+        Get the number of generations between a solution and its lineage root.
+
+        Args:
+            solution_id (str): Solution id
+
+        Returns:
+            int: Depth of the solution, 0 for a root
+        """
+        with self._lock:
+            self._check_in_lineage(solution_id)
+            return self.lineage.depth(solution_id)
+
+    def get_best_in_subtree(self, solution_id: str) -> Optional[Solution]:
+        """
+        Get the best scored solution among a solution and its descendants.
+
+        Args:
+            solution_id (str): Solution id
+
+        Returns:
+            Optional[Solution]: Best solution, None if none of them is scored
+        """
+        with self._lock:
+            self._check_in_lineage(solution_id)
+            best_id = self.lineage.best_in_subtree(solution_id)
+            return self.solutions[best_id] if best_id else None
+
+    def _check_in_lineage(self, solution_id: str) -> None:
+        if solution_id not in self.lineage:
+            raise ValueError(f"Solution with id '{solution_id}' not found.")
 
     def _reconstruct_islands(self, saved_islands: list[list[str]]) -> None:
         """
@@ -702,16 +998,20 @@ class InMemory(EvolveMemory):
         Args:
             solution: The solution to add to the MAP-Elites grid
         """
-        feature_coords, self.diversity_reference_set = self._calculate_feature_coords(
-            solution,
-            self.populations,
-            self.feature_stats,
-            self.feature_bins_per_dim,
-            self.feature_bins,
-            self.feature_dimensions,
-            self.diversity_cache,
-            self.diversity_reference_set,
-        )
+        with self._feature_lock:
+            (
+                feature_coords,
+                self.diversity_reference_set,
+            ) = self._calculate_feature_coords(
+                solution,
+                self._snapshot.population,
+                self.feature_stats,
+                self.feature_bins_per_dim,
+                self.feature_bins,
+                self.feature_dimensions,
+                self.diversity_cache,
+                self.diversity_reference_set,
+            )
 
         logger.debug(
             "Calculated feature coords for %s: %s",
@@ -775,27 +1075,30 @@ class InMemory(EvolveMemory):
                     )
 
                     # use MAP-Elites to manage archive
-                    if existing_solution_id in self.elites:
-                        self.elites.discard(existing_solution_id)
-                        self.elites.add(solution.solution_id)
+                    with self._lock:
+                        if existing_solution_id in self.elites:
+                            self.elites.discard(existing_solution_id)
+                            self.elites.add(solution.solution_id)
 
             island_feature_map[feature_key] = solution.solution_id
         return json.dumps(feature_coords)
 
     def _update_island(self, solution: Solution) -> None:
         """
-        Update the island of the given solution based on its island_id.
+        Update the island of the given solution based on its island_id. The caller
+        holds the island lock and ``_lock``.
 
         Args:
             solution: Solution to update island for.
         """
         island_id = solution.island_id
 
-        with self._island_locks[island_id]:
-            # Update storage
-            self.populations[solution.solution_id] = solution
-            self.islands[island_id].add(solution.solution_id)
-            self.island_capacity[island_id] += 1
+        # Update storage
+        self.populations[solution.solution_id] = solution
+        self.islands[island_id].add(solution.solution_id)
+        self.island_capacity[island_id] += 1
+        self._track_score(solution, island_id)
+        self._mark_dirty(island_id)
 
         logger.debug(
             f"Solution {solution.solution_id} assigned to island {solution.island_id}"
@@ -901,6 +1204,12 @@ class InMemory(EvolveMemory):
                 island.difference_update(solution_ids_to_remove)
 
             self.elites.difference_update(solution_ids_to_remove)
+            self._mark_dirty()
+
+            for sid in solution_ids_to_remove:
+                self.score_stats.discard(sid)
+                for stats in self.island_score_stats:
+                    stats.discard(sid)
 
         logger.debug(f"Removed solutions: {sorted(solution_ids_to_remove)[:5]}...")
         logger.info(f"Population after cleanup: {len(self.populations)}")
@@ -1054,26 +1363,36 @@ class InMemory(EvolveMemory):
             solution, self.island_best_solution, island_id, f"island {island_id} best"
         )
 
-    async def _check_migration(self) -> None:
+    def _check_migration(self) -> None:
         """
         Adapted from algorithmicsuperintelligence/openevolve (Apache-2.0 License)
         Original source: https://github.com/algorithmicsuperintelligence/openevolve/blob/a7428efeb5a30b7968975f182d5fb7060b36e978/openevolve/database.py#L1755
 
         Enhanced migration with adaptive triggering and targeted transfer.
-        """
-        # Adaptive migration trigger based on island diversity
-        should_migrate = False
-        if (
-            max(self.island_capacity) - self.last_migration_generation
-            >= self.migration_interval
-        ):
-            should_migrate = True
 
-        if not should_migrate or len(self.islands) < 2:
+        Runs as one batch holding ``_lock``. It only touches the shared registries,
+        not the feature maps, so the island locks are not taken and cycles keep
+        placing their solutions on their islands meanwhile. The code of each island
+        is indexed once per batch for the duplicate check, and the snapshot is
+        published once at the end, copying the members of the target islands only.
+        """
+        # Re-check under the locks, another cycle may have migrated meanwhile
+        if not self._migration_due():
             return
 
         logger.info("Performing adaptive migration between islands")
 
+        island_codes: Dict[int, Set[str]] = {}
+
+        def codes_of(island_idx: int) -> Set[str]:
+            if island_idx not in island_codes:
+                island_codes[island_idx] = {
+                    self.populations[sid].solution
+                    for sid in self.islands[island_idx]
+                    if sid in self.populations
+                }
+            return island_codes[island_idx]
+
         for i, island in enumerate(self.islands):
             if len(island) <= 1:
                 continue
@@ -1094,14 +1413,7 @@ class InMemory(EvolveMemory):
                 if migrant.metadata.get("migrated", False):
                     continue
                 for target_island in target_islands:
-                    target_island_programs = [
-                        self.populations[sid]
-                        for sid in self.islands[target_island]
-                        if sid in self.populations
-                    ]
-                    has_duplicate_code = any(
-                        s.solution == migrant.solution for s in target_island_programs
-                    )
+                    has_duplicate_code = migrant.solution in codes_of(target_island)
                     if has_duplicate_code:
                         logger.debug(
                             f"Skipping migration of {migrant.solution_id} to \
@@ -1125,11 +1437,29 @@ class InMemory(EvolveMemory):
                     )
                     self.populations[migrant_copy.solution_id] = migrant_copy
                     self.solutions[migrant_copy.solution_id] = migrant_copy
+                    self.lineage.add(
+                        migrant_copy.solution_id,
+                        migrant_copy.parent_id,
+                        migrant_copy.score,
+                        source_id=migrant.solution_id,
+                    )
                     self.islands[target_island].add(migrant_copy.solution_id)
+                    self._track_score(migrant_copy, target_island)
+                    self._mark_dirty(target_island)
+                    codes_of(target_island).add(migrant_copy.solution)
                     self.island_capacity[target_island] += 1
                     self._update_island_best_solution(migrant_copy, target_island)
 
         self.last_migration_generation = max(self.island_capacity)
+        self._publish_snapshot()
         logger.info(
             f"Migration completed at generation {self.last_migration_generation}"
         )
+
+    def _migration_due(self) -> bool:
+        """Adaptive migration trigger based on the island capacities."""
+        return (
+            len(self.islands) >= 2
+            and max(self.island_capacity) - self.last_migration_generation
+            >= self.migration_interval
+        )
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This file provides the lineage index of the evolution memory.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Marker of the solution ids of migrated copies, see ``InMemory._check_migration``.
+MIGRATED_MARKER = "_migrated_"
+
+
+def migration_source(solution_id: str, metadata: Optional[dict] = None) -> Optional[str]:
+    """
+    Get the id of the solution a migrated copy was made from.
+
+    Args:
+        solution_id (str): Id of the solution.
+        metadata (Optional[dict]): Metadata of the solution, copies are flagged
+            with ``migrated``.
+
+    Returns:
+        Optional[str]: Id of the source solution, None if not a migrated copy.
+    """
+    if metadata is not None and not metadata.get("migrated", False):
+        return None
+    if MIGRATED_MARKER not in solution_id:
+        return None
+    return solution_id.rsplit(MIGRATED_MARKER, 1)[0]
+
+
+class LineageIndex:
+    """
+    Parent/children adjacency index of the solutions with incremental aggregates.
+
+    Every generated solution is a node, eviction from the population does not cut
+    the lineage. A migrated copy is an alias of its source: it keeps its own parent
+    link for ancestor chains, but it adds no node, and children generated from it
+    are attached to the source. So the subtree of a solution covers the
+    descendants bred on every island.
+
+    The depth of each node and the best scored node of each subtree are maintained
+    on insertion. Depth costs O(1) and the best is propagated up the ancestors
+    only while it improves on theirs. Subtree listings cost O(subtree) and ancestor
+    chains O(depth).
+
+    The index is not thread-safe, the owning memory serializes access.
+    """
+
+    def __init__(self):
+        # Raw parent id of every recorded id, migrated copies included
+        self._parent: Dict[str, Optional[str]] = {}
+        # Migrated copy id -> source id
+        self._alias: Dict[str, str] = {}
+        # Node id -> ids of its direct children, in insertion order
+        self._children: Dict[str, List[str]] = {}
+        self._score: Dict[str, Optional[float]] = {}
+        self._depth: Dict[str, int] = {}
+        # Node id -> (score, id) of the best scored node of its subtree
+        self._best: Dict[str, Tuple[float, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._score)
+
+    def __contains__(self, solution_id: str) -> bool:
+        return solution_id in self._parent
+
+    def canonical(self, solution_id: str) -> str:
+        """Resolve a migrated copy to its source, other ids map to themselves."""
+        return self._alias.get(solution_id, solution_id)
+
+    def add(
+        self,
+        solution_id: str,
+        parent_id: Optional[str],
+        score: Optional[float],
+        source_id: Optional[str] = None,
+    ) -> None:
+        """
+        Record a solution.
+
+        Args:
+            solution_id (str): Id of the solution.
+            parent_id (Optional[str]): Id of its parent, may be recorded later.
+            score (Optional[float]): Score of the solution, None if unscored.
+            source_id (Optional[str]): Source of a migrated copy.
+        """
+        if solution_id in self._parent:
+            self.update_score(solution_id, score)
+            return
+
+        self._parent[solution_id] = parent_id or None
+        if source_id is not None:
+            source = self.canonical(source_id)
+            self._alias[solution_id] = source
+            # Children bred from the copy before it was recorded move to the source
+            adopted = self._children.pop(solution_id, None)
+            if adopted:
+                self._children.setdefault(source, []).extend(adopted)
+                self._shift_depths(adopted, self._depth.get(source, 0) + 1)
+                self._recompute_best(source)
+                parent = self._node_parent(source)
+                if parent is not None and source in self._best:
+                    self._propagate_best(parent, self._best[source])
+            return
+
+        self._score[solution_id] = score
+        parent = self._node_parent(solution_id)
+        self._depth[solution_id] = 0 if parent is None else self._depth.get(parent, 0) + 1
+        if parent is not None:
+            self._children.setdefault(parent, []).append(solution_id)
+
+        # Children recorded before their parent, e.g. out of order loads
+        orphans = self._children.get(solution_id)
+        if orphans:
+            self._shift_depths(orphans, self._depth[solution_id] + 1)
+        self._recompute_best(solution_id)
+        if parent is not None and solution_id in self._best:
+            self._propagate_best(parent, self._best[solution_id])
+
+    def update_score(self, solution_id: str, score: Optional[float]) -> None:
+        """Update the score of a recorded solution and the affected aggregates."""
+        node = self.canonical(solution_id)
+        if node not in self._score or self._score[node] == score:
+            return
+        old = self._score[node]
+        self._score[node] = score
+        if score is not None and (old is None or score > old):
+            self._propagate_best(node, (score, node))
+            return
+        # A lower score may change the best of every ancestor it was the best of
+        while node is not None:
+            previous = self._best.get(node)
+            self._recompute_best(node)
+            if self._best.get(node) == previous:
+                break
+            node = self._node_parent(node)
+
+    def parent(self, solution_id: str) -> Optional[str]:
+        """Raw parent id of a recorded solution."""
+        return self._parent.get(solution_id)
+
+    def children(self, solution_id: str, limit: Optional[int] = None) -> List[str]:
+        """Ids of the direct children, children of migrated copies included."""
+        children = self._children.get(self.canonical(solution_id), [])
+        return list(children[:limit] if limit is not None else children)
+
+    def ancestors(self, solution_id: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Ids of the ancestors, nearest first, following the raw parent links.
+
+        The chain stops at the first parent that is not recorded.
+        """
+        chain = []
+        seen = {solution_id}
+        current = self._parent.get(solution_id)
+        while current is not None and current in self._parent:
+            if limit is not None and len(chain) >= limit or current in seen:
+                break
+            chain.append(current)
+            seen.add(current)
+            current = self._parent[current]
+        return chain
+
+    def depth(self, solution_id: str) -> Optional[int]:
+        """Number of recorded ancestors of a solution, None if not recorded."""
+        return self._depth.get(self.canonical(solution_id))
+
+    def subtree(self, solution_id: str, max_depth: Optional[int] = None) -> List[str]:
+        """
+        Ids of the descendants in breadth-first order, the solution excluded.
+
+        Args:
+            solution_id (str): Id of the root of the subtree.
+            max_depth (Optional[int]): Only descendants at most this many
+                generations below the root.
+        """
+        root = self.canonical(solution_id)
+        result = []
+        frontier = deque([(root, 0)])
+        while frontier:
+            node, level = frontier.popleft()
+            if max_depth is not None and level >= max_depth:
+                continue
+            for child in self._children.get(node, ()):
+                result.append(child)
+                frontier.append((child, level + 1))
+        return result
+
+    def best_in_subtree(self, solution_id: str) -> Optional[str]:
+        """Id of the best scored solution of the subtree, the root included."""
+        best = self._best.get(self.canonical(solution_id))
+        return best[1] if best else None
+
+    @classmethod
+    def build(
+        cls, records: Iterable[Tuple[str, Optional[str], Optional[float], Optional[str]]]
+    ) -> "LineageIndex":
+        """
+        Build an index in O(n) from ``(solution_id, parent_id, score, source_id)``
+        records given in any order.
+        """
+        index = cls()
+        nodes = []
+        for solution_id, parent_id, score, source_id in records:
+            index._parent[solution_id] = parent_id or None
+            if source_id is not None:
+                index._alias[solution_id] = source_id
+            else:
+                index._score[solution_id] = score
+                nodes.append(solution_id)
+        for copy_id, source_id in index._alias.items():
+            while source_id in index._alias and source_id != copy_id:
+                source_id = index._alias[source_id]
+            index._alias[copy_id] = source_id
+
+        roots = []
+        for node in nodes:
+            parent = index._node_parent(node)
+            if parent is None:
+                roots.append(node)
+            else:
+                index._children.setdefault(parent, []).append(node)
+
+        # Depths top-down, then the best of each subtree bottom-up
+        order = []
+        frontier = deque(roots)
+        for root in roots:
+            index._depth[root] = 0
+        while frontier:
+            node = frontier.popleft()
+            order.append(node)
+            for child in index._children.get(node, ()):
+                if child not in index._depth:
+                    index._depth[child] = index._depth[node] + 1
+                    frontier.append(child)
+        # Nodes on a parent cycle have no root, give them a depth anyway
+        for node in nodes:
+            if node not in index._depth:
+                index._depth[node] = 0
+                order.append(node)
+        for node in reversed(order):
+            index._recompute_best(node)
+        return index
+
+    def _node_parent(self, node: str) -> Optional[str]:
+        """Parent node of a node, resolving migrated copies, None for roots."""
+        parent = self._parent.get(node)
+        if parent is None:
+            return None
+        parent = self.canonical(parent)
+        return None if parent == node else parent
+
+    def _recompute_best(self, node: str) -> None:
+        score = self._score.get(node)
+        best = (score, node) if score is not None else None
+        for child in self._children.get(node, ()):
+            child_best = self._best.get(child)
+            if child_best is not None and (best is None or child_best[0] > best[0]):
+                best = child_best
+        if best is None:
+            self._best.pop(node, None)
+        else:
+            self._best[node] = best
+
+    def _propagate_best(self, node: Optional[str], best: Tuple[float, str]) -> None:
+        seen = set()
+        while node is not None and node not in seen:
+            current = self._best.get(node)
+            if current is not None and current[0] >= best[0] and current[1] != best[1]:
+                break
+            self._best[node] = best
+            seen.add(node)
+            node = self._node_parent(node)
+
+    def _shift_depths(self, nodes: List[str], depth: int) -> None:
+        frontier = deque((node, depth) for node in nodes)
+        seen = set()
+        while frontier:
+            node, node_depth = frontier.popleft()
+            if node in seen:
+                continue
+            seen.add(node)
+            self._depth[node] = node_depth
+            for child in self._children.get(node, ()):
+                frontier.append((child, node_depth + 1))
@@ -5,15 +5,17 @@ This file provide factory pattern for evolution memory.
 """
 
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from loongflow.agentsdk.memory.evolution.base_memory import Solution
 
 logger = logging.getLogger(__name__)
 
-from .redis_memory import RedisMemory
 from .in_memory import InMemory
 
+if TYPE_CHECKING:
+    from .redis_memory import RedisMemory
+
 
 class MemoryFactory:
     """Factory class that provides unified interface for different memory implementations."""
@@ -48,7 +50,7 @@ class MemoryFactory:
             self._redis_url = redis_url
             self._kwargs = kwargs
 
-        self._memory: Optional[InMemory | RedisMemory] = None
+        self._memory: Optional["InMemory | RedisMemory"] = None
 
         # Initialize with specified storage type
         self._init_memory()
@@ -58,6 +60,9 @@ class MemoryFactory:
         logger.debug(f"Initializing memory with type: {self._storage_type}")
 
         if self._storage_type == "redis":
+            # The redis client is only imported when it is used
+            from .redis_memory import RedisMemory
+
             self._memory = RedisMemory(redis_url=self._redis_url, **self._kwargs)
         else:
             self._memory = InMemory(**self._kwargs)
@@ -82,6 +87,10 @@ class MemoryFactory:
         """
         return self._memory.get_solutions(solution_ids)
 
+    async def aget_solutions(self, solution_ids: list[str]):
+        """Async variant of ``get_solutions``."""
+        return await self._memory.aget_solutions(solution_ids)
+
     def list_solutions(self, filter_type: str = "asc", limit: int = None):
         """
         List solutions with optional filtering and limit.
@@ -93,6 +102,10 @@ class MemoryFactory:
         """
         return self._memory.list_solutions(filter_type, limit)
 
+    async def alist_solutions(self, filter_type: str = "asc", limit: int = None):
+        """Async variant of ``list_solutions``."""
+        return await self._memory.alist_solutions(filter_type, limit)
+
     def get_best_solutions(self, island_id: int = None, top_k: int = None):
         """
         Get the best solutions globally or per island.
@@ -104,6 +117,10 @@ class MemoryFactory:
         """
         return self._memory.get_best_solutions(island_id, top_k)
 
+    async def aget_best_solutions(self, island_id: int = None, top_k: int = None):
+        """Async variant of ``get_best_solutions``."""
+        return await self._memory.aget_best_solutions(island_id, top_k)
+
     def sample(self, island_id: Optional[int] = None, exploration_rate: float = 0.2) -> Solution:
         """
         Sample a solution from memory.
@@ -112,6 +129,12 @@ class MemoryFactory:
         """
         return self._memory.sample(island_id, exploration_rate)
 
+    async def asample(
+        self, island_id: Optional[int] = None, exploration_rate: float = 0.2
+    ) -> Solution:
+        """Async variant of ``sample``."""
+        return await self._memory.asample(island_id, exploration_rate)
+
     async def save_checkpoint(self, path=None, tag=None):
         """
         Create a checkpoint of the current memory state.
@@ -129,12 +152,36 @@ class MemoryFactory:
         """
         return self._memory.load_checkpoint(path)
 
+    async def aload_checkpoint(self, path: str):
+        """Async variant of ``load_checkpoint``."""
+        return await self._memory.aload_checkpoint(path)
+
     def memory_status(self, island_id: Optional[int] = None) -> dict:
         """
         Return the status of the memory
         """
         return self._memory.memory_status(island_id)
 
+    async def amemory_status(self, island_id: Optional[int] = None) -> dict:
+        """Async variant of ``memory_status``."""
+        return await self._memory.amemory_status(island_id)
+
+    def population_stats(self) -> dict:
+        """
+        Return the running score statistics of the population.
+        """
+        return self._memory.population_stats()
+
+    def stats_version(self) -> Optional[int]:
+        """
+        Return a counter changing whenever the population changes.
+        """
+        return self._memory.stats_version()
+
+    async def astats_version(self) -> Optional[int]:
+        """Async variant of ``stats_version``."""
+        return await self._memory.astats_version()
+
     async def update_solution(self, solution_id: str, **kwargs) -> str:
         """
         Update an existing solution in memory.
@@ -158,6 +205,10 @@ class MemoryFactory:
         """
         return self._memory.get_parents_by_child_id(child_id, parent_cnt)
 
+    async def aget_parents_by_child_id(self, child_id: str, parent_cnt: int):
+        """Async variant of ``get_parents_by_child_id``."""
+        return await self._memory.aget_parents_by_child_id(child_id, parent_cnt)
+
     def get_childs_by_parent_id(self, parent_id: str, child_cnt: int):
         """
         Get children of a given solution based on its ID.
@@ -169,6 +220,52 @@ class MemoryFactory:
         """
         return self._memory.get_childs_by_parent_id(parent_id, child_cnt)
 
+    async def aget_childs_by_parent_id(self, parent_id: str, child_cnt: int):
+        """Async variant of ``get_childs_by_parent_id``."""
+        return await self._memory.aget_childs_by_parent_id(parent_id, child_cnt)
+
+    def get_ancestors(self, solution_id: str, limit: Optional[int] = None):
+        """
+        Get the ancestor chain of a solution, nearest first.
+        Args:
+            solution_id: ID of the solution
+            limit: Maximum number of ancestors, all if None
+        Returns:
+            List of ancestor solution objects
+        """
+        return self._memory.get_ancestors(solution_id, limit)
+
+    def get_subtree(self, solution_id: str, max_depth: Optional[int] = None):
+        """
+        Get the descendants of a solution in breadth-first order.
+        Args:
+            solution_id: ID of the solution
+            max_depth: Maximum number of generations below the solution, all if None
+        Returns:
+            List of descendant solution objects
+        """
+        return self._memory.get_subtree(solution_id, max_depth)
+
+    def get_lineage_depth(self, solution_id: str) -> int:
+        """
+        Get the number of generations between a solution and its lineage root.
+        Args:
+            solution_id: ID of the solution
+        Returns:
+            Depth of the solution, 0 for a root
+        """
+        return self._memory.get_lineage_depth(solution_id)
+
+    def get_best_in_subtree(self, solution_id: str):
+        """
+        Get the best scored solution among a solution and its descendants.
+        Args:
+            solution_id: ID of the solution
+        Returns:
+            Best solution object, None if none of them is scored
+        """
+        return self._memory.get_best_in_subtree(solution_id)
+
     @property
     def storage_type(self):
         """Get current storage type"""
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This file provides the running population statistics of the evolution memory.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Number of equal width bins of the score histograms, spanning [min, max] score.
+HISTOGRAM_BINS = 10
+
+
+def histogram_edges(low: float, high: float, bins: int = HISTOGRAM_BINS) -> List[float]:
+    """Inner edges of ``bins`` equal width bins over [low, high]."""
+    width = (high - low) / bins
+    return [low + width * i for i in range(1, bins)]
+
+
+@dataclass(frozen=True)
+class ScoreSummary:
+    """Statistics of the scores of a set of solutions at one point in time."""
+
+    count: int = 0
+    mean: float = 0.0
+    variance: float = 0.0
+    min: Optional[float] = None
+    max: Optional[float] = None
+    # Number of scores strictly above the mean
+    above_mean: int = 0
+    # (score, iteration) of the best solutions, best first
+    top: Tuple[Tuple[float, Optional[int]], ...] = ()
+    # Counts of the HISTOGRAM_BINS bins over [min, max], the last bin is closed
+    histogram: Tuple[int, ...] = ()
+
+    def status(self) -> dict:
+        """Fields of a ``memory_status`` section."""
+        best_score, best_iteration = self.top[0] if self.top else (0, 0)
+        return {
+            "top_3_iterations": [iteration for _, iteration in self.top[:3]],
+            "best_score": best_score,
+            "best_iteration": best_iteration,
+            "avg_score": round(self.mean, 6),
+            "better_ratio": round(self.above_mean / self.count, 2) if self.count else 0,
+        }
+
+    def to_dict(self) -> dict:
+        """Plain statistics, as returned by ``population_stats``."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "variance": self.variance,
+            "min": self.min,
+            "max": self.max,
+            "histogram": list(self.histogram),
+        }
+
+
+def summarize(
+    count: int,
+    total: float,
+    total_squares: float,
+    low: Optional[float],
+    high: Optional[float],
+    above_mean: int,
+    top: Iterable[Tuple[float, Optional[int]]],
+    histogram: Iterable[int],
+) -> ScoreSummary:
+    """Build a summary from running sums, shared by the memory backends."""
+    if not count:
+        return ScoreSummary()
+    mean = total / count
+    return ScoreSummary(
+        count=count,
+        mean=mean,
+        # Running sums drift a little with removals, never report a negative variance
+        variance=max(0.0, total_squares / count - mean * mean),
+        min=low,
+        max=high,
+        above_mean=above_mean,
+        top=tuple(top),
+        histogram=tuple(histogram),
+    )
+
+
+class ScoreStats:
+    """
+    Running statistics of the scores of a set of solutions.
+
+    Scores are kept sorted, so insertions and removals cost O(log n) comparisons,
+    and a summary costs O(bins * log n) whatever the number of solutions.
+    """
+
+    def __init__(self):
+        self._ranked: List[Tuple[float, str]] = []
+        # Solution id -> (score, iteration)
+        self._entries: Dict[str, Tuple[float, Optional[int]]] = {}
+        self._sum = 0.0
+        self._sum_squares = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, solution_id: str) -> bool:
+        return solution_id in self._entries
+
+    def add(
+        self, solution_id: str, score: Optional[float], iteration: Optional[int] = None
+    ) -> None:
+        """Add a solution, replacing its previous score. Unscored ones are dropped."""
+        self.discard(solution_id)
+        if score is None:
+            return
+        insort(self._ranked, (score, solution_id))
+        self._entries[solution_id] = (score, iteration)
+        self._sum += score
+        self._sum_squares += score * score
+
+    def discard(self, solution_id: str) -> None:
+        """Remove a solution if present."""
+        entry = self._entries.pop(solution_id, None)
+        if entry is None:
+            return
+        score = entry[0]
+        del self._ranked[bisect_left(self._ranked, (score, solution_id))]
+        self._sum -= score
+        self._sum_squares -= score * score
+
+    def top_ids(self, top_k: int) -> List[str]:
+        """Ids of the ``top_k`` best solutions, best first, in O(top_k)."""
+        return [solution_id for _, solution_id in reversed(self._ranked[-top_k:])]
+
+    def summary(self, top_k: int = 3) -> ScoreSummary:
+        """Summarize the current scores."""
+        count = len(self._ranked)
+        if not count:
+            return ScoreSummary()
+        score_of = itemgetter(0)
+        low, high = self._ranked[0][0], self._ranked[-1][0]
+        edges = histogram_edges(low, high)
+        bounds = [0] + [bisect_left(self._ranked, e, key=score_of) for e in edges]
+        bounds.append(count)
+        mean = self._sum / count
+        return summarize(
+            count=count,
+            total=self._sum,
+            total_squares=self._sum_squares,
+            low=low,
+            high=high,
+            above_mean=count - bisect_right(self._ranked, mean, key=score_of),
+            top=[
+                self._entries[solution_id]
+                for _, solution_id in reversed(self._ranked[-top_k:])
+            ],
+            histogram=[b - a for a, b in zip(bounds, bounds[1:])],
+        )
@@ -4,6 +4,8 @@
 This file provide in-memory implementation of evolution memory.
 """
 
+import asyncio
+import gzip
 import heapq
 import json
 import logging
@@ -11,31 +13,139 @@ import os
 import threading
 import time
 import uuid
+import weakref
 from operator import attrgetter
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Generator, Optional
 
 from redis import Redis, ConnectionPool
+from redis.asyncio import Redis as AsyncRedis
+
+from loongflow.agentsdk.serialization import dump_file, dumps, load_file, loads
 
 from .base_memory import EvolveMemory, Solution
 from .boltzmann import select_parents_with_dynamic_temperature
+from .lineage import LineageIndex, migration_source
+from .population_stats import (
+    HISTOGRAM_BINS,
+    ScoreSummary,
+    histogram_edges,
+    summarize,
+)
+from .solution_cache import INVALIDATE_ALL, SolutionCache
 
 logger = logging.getLogger(__name__)
 
-update_list_lua_script = """
-redis.call('DEL', KEYS[1])
-for _, value in ipairs(ARGV) do
-    redis.call('RPUSH', KEYS[1], value)
-end
-"""
-
 reset_island_lua_script = """
 redis.call('SREM', KEYS[1], ARGV[1])
 redis.call('SADD', KEYS[1], ARGV[2])
 """
 
+REDIS_POOL_OPTIONS = dict(
+    max_connections=64,  # Increased from default 10
+    socket_keepalive=True,
+    socket_timeout=30,
+    retry_on_timeout=True,
+    health_check_interval=30,
+)
+
+# Number of solutions per HSCAN / pipeline round trip when checkpointing.
+DEFAULT_BATCH_SIZE = 1000
+ARCHIVE_FILENAME = "memory.jsonl.gz"
+ARCHIVE_FORMAT = "loongflow-redis-memory"
+ARCHIVE_VERSION = 1
+# Seconds between two progress log lines of a checkpoint transfer.
+PROGRESS_LOG_INTERVAL = 5.0
+
+
+def _decode(value):
+    """Decode a Redis reply to str, leaving None and str untouched."""
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _lineage_entry(solution_id: str, solution_dict: dict) -> str:
+    """Encode the lineage hash entry of a solution: [parent_id, score, source_id]."""
+    return json.dumps(
+        [
+            solution_dict.get("parent_id"),
+            solution_dict.get("score"),
+            migration_source(solution_id, solution_dict.get("metadata") or {}),
+        ]
+    )
+
+
+def _write_text(path: str, text: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _bytes_encoder(obj):
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8", errors="replace")
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+class _TransferProgress:
+    """Count solutions moved by a checkpoint transfer and log the throughput."""
+
+    def __init__(self, action: str, total: Optional[int] = None):
+        self.action = action
+        self.total = total
+        self.count = 0
+        self._start = time.monotonic()
+        self._last_log = self._start
+
+    def advance(self, n: int) -> None:
+        self.count += n
+        now = time.monotonic()
+        if now - self._last_log >= PROGRESS_LOG_INTERVAL:
+            self._last_log = now
+            total = f"/{self.total}" if self.total is not None else ""
+            logger.info(
+                f"{self.action} {self.count}{total} solutions "
+                f"({self.count / (now - self._start):.0f} solutions/s)"
+            )
+
+    def finish(self) -> dict:
+        """
+        Log and return the final statistics.
+
+        Returns:
+            dict: ``solutions`` moved, elapsed ``seconds`` and ``solutions_per_second``.
+        """
+        seconds = time.monotonic() - self._start
+        rate = self.count / seconds if seconds > 0 else float(self.count)
+        logger.info(
+            f"{self.action} {self.count} solutions in {seconds:.2f}s "
+            f"({rate:.0f} solutions/s)"
+        )
+        return {
+            "solutions": self.count,
+            "seconds": seconds,
+            "solutions_per_second": rate,
+        }
+
+
+class _Blocking:
+    """
+    Step of blocking work other than Redis commands, e.g. checkpoint file IO. Its
+    return value is sent back to the steps.
+    """
+
+    def __init__(self, func: Callable[[], Any]):
+        self.func = func
+
 
 class RedisMemory(EvolveMemory):
-    """Redis-based implementation of Evolution Memory storage."""
+    """
+    Redis-based implementation of Evolution Memory storage.
+
+    Operations are written once as steps (see ``_run_steps``) and run either with
+    the blocking client or, for the async variants, with a native redis.asyncio
+    client, so awaiting them never parks a worker thread on Redis round trips.
+    Only the checkpoint file IO of the async variants runs in a worker thread.
+    Writes are serialized by ``_lock`` for the blocking variants and by an
+    asyncio lock per event loop for the async ones.
+    """
 
     def __init__(
         self,
@@ -52,9 +162,24 @@ class RedisMemory(EvolveMemory):
         sampling_weight_power: float = 1.0,
         output_path: str = "output",
         redis_url: str = "redis://localhost:6379/0",
+        memory_id: Optional[str] = None,
+        cache_size: int = 10000,
+        compact_checkpoints: bool = False,
     ):
-        """Initialize Redis connection and data structures"""
+        """
+        Initialize Redis connection and data structures
+
+        Args:
+            memory_id: Id of an existing memory to attach to, so several processes
+                can share one memory. A new id is generated if None.
+            cache_size: Number of deserialized solutions kept in the client-side
+                cache, 0 disables caching.
+            compact_checkpoints: Write checkpoint files without indentation,
+                smaller and faster to load.
+        """
         super().__init__()
+        if memory_id:
+            self.memory_id = memory_id
         if feature_dimensions is None:
             feature_dimensions = ["complexity", "diversity", "score"]
         self.num_islands: int = num_islands
@@ -67,6 +192,7 @@ class RedisMemory(EvolveMemory):
         self.use_sampling_weight: bool = use_sampling_weight
         self.sampling_weight_power: float = sampling_weight_power
         self.output_path: str = output_path
+        self.compact_checkpoints: bool = compact_checkpoints
 
         # Calculate feature_bins if not provided
         if feature_bins is None:
@@ -82,14 +208,8 @@ class RedisMemory(EvolveMemory):
         self.feature_scaling_method: str = feature_scaling_method
 
         # Redis connection with optimized pool settings
-        self.redis_pool = ConnectionPool.from_url(
-            redis_url,
-            max_connections=64,  # Increased from default 10
-            socket_keepalive=True,
-            socket_timeout=30,
-            retry_on_timeout=True,
-            health_check_interval=30,
-        )
+        self.redis_url = redis_url
+        self.redis_pool = ConnectionPool.from_url(redis_url, **REDIS_POOL_OPTIONS)
         self.redis = Redis(
             connection_pool=self.redis_pool,
             decode_responses=True,  # Keep bytes for performance
@@ -107,12 +227,27 @@ class RedisMemory(EvolveMemory):
             f"evolution:diversity_reference_set:{self.memory_id}"
         )
         self.metadata_key = f"evolution:metadata:{self.memory_id}"
-
-        # Thread safety with optimized locking
+        self.changelog_key = f"evolution:changelog:{self.memory_id}"
+        self.lineage_key = f"evolution:lineage:{self.memory_id}"
+        # Score sorted sets of the population and of each island (":{island_id}"),
+        # with their running sums, see ``_index_scores``
+        self.scores_key = f"evolution:scores:{self.memory_id}"
+        self.score_sums_key = f"evolution:score_sums:{self.memory_id}"
+
+        # Serializes the writes of the blocking variants
         self._lock = threading.RLock()
-        self._island_locks: Dict[int, threading.Lock] = {  # Changed to simpler Lock
-            i: threading.Lock() for i in range(num_islands)  # Lighter than RLock
-        }
+
+        self.cache_size = cache_size
+        self._cache = SolutionCache(self.redis, self.changelog_key, cache_size)
+        # Native asyncio clients serving the async variants, and the locks
+        # serializing their writes, one per event loop.
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._async_locks = weakref.WeakKeyDictionary()
+        # Client-side lineage index rebuilt from the lineage hash and kept up to date
+        # with the changelog, see ``_sync_lineage_steps``.
+        self._lineage: Optional[LineageIndex] = None
+        self._lineage_version = 0
+        self._lineage_lock = threading.RLock()
 
         # Initialize metadata
         self._init_metadata()
@@ -150,43 +285,63 @@ class RedisMemory(EvolveMemory):
         """
         if not isinstance(solution, Solution):
             raise ValueError("solution must be an instance of Solution")
+        async with self._async_lock():
+            return await self._arun_steps(self._add_solution_steps(solution))
+
+    def _add_solution(self, solution: Solution) -> str:
+        """Add a solution, blocking the calling thread."""
         with self._lock:
-            self._prepare_solution(solution)
-            solution_dict = solution.to_dict()
-            solution_json = json.dumps(solution_dict)
+            return self._run_steps(self._add_solution_steps(solution))
+
+    def _add_solution_steps(self, solution: Solution) -> Generator:
+        yield from self._prepare_solution_steps(solution)
+        solution_dict = solution.to_dict()
+        solution_json = dumps(solution_dict)
+
+        # Store in both solutions and populations
+        def queue_solution(pipe):
+            pipe.hset(self.solutions_key, solution.solution_id, solution_json)
+            pipe.hset(
+                self.lineage_key,
+                solution.solution_id,
+                _lineage_entry(solution.solution_id, solution_dict),
+            )
 
-            # Store in both solutions and populations
-            self.redis.hset(self.solutions_key, solution.solution_id, solution_json)
+        yield queue_solution
 
-            if not solution.score:
-                logger.warning(
-                    f"WARNING: No score found for solution {solution.solution_id}. Skipping."
-                )
-                return solution.solution_id
-
-            # These operations can be done outside the pipeline as they have their own locking
-            map_elites_feature = self._calculate_MAP_Elites(solution)
-            solution.metadata["MAP_Elite_feature"] = map_elites_feature
-            solution_dict = solution.to_dict()
-            solution_json = json.dumps(solution_dict)
-            self.redis.hset(self.populations_key, solution.solution_id, solution_json)
-            self.redis.hset(self.solutions_key, solution.solution_id, solution_json)
-
-            self._update_island(solution)
-            self._update_elites(solution)
-
-            # Enforce population limits
-            self._enforce_population_limit(
-                exclude_solution_id=solution.solution_id,
+        if not solution.score:
+            logger.warning(
+                f"WARNING: No score found for solution {solution.solution_id}. Skipping."
             )
+            yield self._publish_step([solution.solution_id])
+            return solution.solution_id
 
-            # Update tracking with another pipeline
-            self._update_best_solution(solution)
-            self._update_island_best_solution(solution, solution.island_id)
-            await self._check_migration()
+        map_elites_feature = yield from self._calculate_MAP_Elites_steps(solution)
+        solution.metadata["MAP_Elite_feature"] = map_elites_feature
+        solution_json = dumps(solution.to_dict())
 
-            logger.debug(f"Added solution {solution.solution_id} to memory")
-            return solution.solution_id
+        def queue_population(pipe):
+            pipe.hset(self.populations_key, solution.solution_id, solution_json)
+            pipe.hset(self.solutions_key, solution.solution_id, solution_json)
+
+        yield queue_population
+
+        yield from self._update_island_steps(solution)
+        yield from self._update_elites_steps(solution)
+
+        # Enforce population limits
+        yield from self._enforce_population_limit_steps(
+            exclude_solution_id=solution.solution_id,
+        )
+
+        yield from self._update_best_solution_steps(solution)
+        yield from self._update_island_best_solution_steps(solution, solution.island_id)
+        yield from self._check_migration_steps()
+        # Published last, readers must not cache the state of a half done add.
+        yield self._publish_step([solution.solution_id])
+
+        logger.debug(f"Added solution {solution.solution_id} to memory")
+        return solution.solution_id
 
     async def update_solution(self, solution_id: str, **kwargs) -> str:
         """
@@ -199,27 +354,62 @@ class RedisMemory(EvolveMemory):
         Returns:
             Updated solution ID
         """
-        # Get all solutions from Redis
-        if self.redis.hget(self.solutions_key, solution_id) is None:
+        async with self._async_lock():
+            return await self._arun_steps(
+                self._update_solution_steps(solution_id, **kwargs)
+            )
+
+    def _update_solution(self, solution_id: str, **kwargs) -> str:
+        """Update a solution, blocking the calling thread."""
+        with self._lock:
+            return self._run_steps(self._update_solution_steps(solution_id, **kwargs))
+
+    def _update_solution_steps(self, solution_id: str, **kwargs) -> Generator:
+        (solution_ori,) = yield lambda pipe: pipe.hget(self.solutions_key, solution_id)
+        if solution_ori is None:
             raise ValueError("solution_id does not exist in memory")
 
         for k, v in kwargs.items():
             if k == "island_id" or k == "parent_id":
                 raise ValueError("Cannot update island_id or parent_id directly")
 
-        solution_ori = self.redis.hget(self.solutions_key, solution_id)
-        solution = Solution.from_dict(json.loads(solution_ori.decode("utf-8")))
+        solution = Solution.from_json(solution_ori)
         updated_solution = solution.copy()
         updated_solution.update(**kwargs)
+        solution_dict = updated_solution.to_dict()
+        solution_json = dumps(solution_dict)
+
+        def queue_indexed_scores(pipe):
+            pipe.zscore(self.scores_key, solution_id)
+            if solution.island_id is not None:
+                pipe.zscore(f"{self.scores_key}:{solution.island_id}", solution_id)
+
+        indexed, *island_score = yield queue_indexed_scores
+        in_island = bool(island_score) and island_score[0] is not None
+
+        # Store in both solutions and populations, in one transaction with the
+        # changelog append
+        def queue_update(pipe):
+            pipe.multi()
+            if indexed is not None:
+                # Unindex the solution with the score it was indexed with
+                solution.score = indexed
+                self._index_scores(
+                    pipe, solution, solution.island_id if in_island else None, -1
+                )
+            self._index_scores(
+                pipe, updated_solution, solution.island_id if in_island else None
+            )
+            pipe.hset(self.solutions_key, solution.solution_id, solution_json)
+            pipe.hset(self.populations_key, solution.solution_id, solution_json)
+            pipe.hset(
+                self.lineage_key,
+                solution.solution_id,
+                _lineage_entry(solution.solution_id, solution_dict),
+            )
+            self._cache.publish([solution.solution_id], pipe)
 
-        with self._lock:
-            solution_dict = updated_solution.to_dict()
-            solution_json = json.dumps(solution_dict)
-
-            # Store in both solutions and populations
-            self.redis.hset(self.solutions_key, solution.solution_id, solution_json)
-            self.redis.hset(self.populations_key, solution.solution_id, solution_json)
-
+        yield queue_update
         return solution_id
 
     def get_solutions(self, solution_ids: Optional[list[str]] = None) -> list[Solution]:
@@ -237,24 +427,47 @@ class RedisMemory(EvolveMemory):
 
         try:
             with self._lock:
-                results = self.redis.hmget(self.solutions_key, solution_ids)
-                solutions = []
-                for s in results:
-                    if s is not None:
-                        try:
-                            solutions.append(
-                                Solution.from_dict(json.loads(s.decode("utf-8")))
-                            )
-                        except (json.JSONDecodeError, TypeError) as e:
-                            logger.error(
-                                f"Failed to parse solution from Redis: {str(e)}"
-                            )
-                            continue
-                return solutions
+                self._cache.validate()
+                cached, missing = self._cache.get_many(solution_ids)
+                if missing:
+                    results = self.redis.hmget(self.solutions_key, missing)
+                    self._merge_fetched(cached, results)
+                return [cached[sid] for sid in solution_ids if sid in cached]
         except Exception as e:
             logger.error(f"Error retrieving solutions from Redis: {str(e)}")
             raise
 
+    async def aget_solutions(
+        self, solution_ids: Optional[list[str]] = None
+    ) -> list[Solution]:
+        """Async variant of ``get_solutions`` using the asyncio Redis client."""
+        if not solution_ids:
+            raise ValueError("No solution IDs provided")
+
+        try:
+            aredis = self._async_redis()
+            await self._cache.avalidate(aredis)
+            cached, missing = self._cache.get_many(solution_ids)
+            if missing:
+                results = await aredis.hmget(self.solutions_key, missing)
+                self._merge_fetched(cached, results)
+            return [cached[sid] for sid in solution_ids if sid in cached]
+        except Exception as e:
+            logger.error(f"Error retrieving solutions from Redis: {str(e)}")
+            raise
+
+    def _merge_fetched(self, cached: Dict[str, Solution], results: list) -> None:
+        """Parse solutions fetched from Redis into the cache and the result map."""
+        for s in results:
+            if s is not None:
+                try:
+                    solution = Solution.from_json(s)
+                except (json.JSONDecodeError, TypeError) as e:
+                    logger.error(f"Failed to parse solution from Redis: {str(e)}")
+                    continue
+                self._cache.put(solution)
+                cached[solution.solution_id] = solution.copy()
+
     def list_solutions(
         self, filter_type: str = "asc", limit: Optional[int] = None
     ) -> list[Solution]:
@@ -272,24 +485,36 @@ class RedisMemory(EvolveMemory):
             raise ValueError("filter_type must be 'asc' or 'desc'")
 
         with self._lock:
-            # Get all solutions from Redis
-            solutions = [
-                Solution.from_dict(json.loads(s.decode("utf-8")))
-                for s in self.redis.hvals(self.solutions_key)
-            ]
+            self._cache.validate()
+            return self._order_by_timestamp(self._solutions_view(), filter_type, limit)
 
-            # Optimized sorting with key function caching
-            key_func = attrgetter("timestamp")
-            solutions_len = self.redis.hlen(self.solutions_key)
-            if limit is None or limit >= solutions_len:
-                return sorted(solutions, key=key_func, reverse=(filter_type == "desc"))
-
-            # Use nsmallest/nlargest with generator for better memory efficiency
-            return (
-                heapq.nsmallest(limit, solutions, key=key_func)
-                if filter_type == "asc"
-                else heapq.nlargest(limit, solutions, key=key_func)
-            )
+    async def alist_solutions(
+        self, filter_type: str = "asc", limit: Optional[int] = None
+    ) -> list[Solution]:
+        """Async variant of ``list_solutions`` using the asyncio Redis client."""
+        if filter_type not in ("asc", "desc"):
+            raise ValueError("filter_type must be 'asc' or 'desc'")
+
+        aredis = self._async_redis()
+        await self._cache.avalidate(aredis)
+        solutions = await self._asolutions_view(aredis)
+        return self._order_by_timestamp(solutions, filter_type, limit)
+
+    @staticmethod
+    def _order_by_timestamp(
+        solutions: list[Solution], filter_type: str, limit: Optional[int]
+    ) -> list[Solution]:
+        # Optimized sorting with key function caching
+        key_func = attrgetter("timestamp")
+        if limit is None or limit >= len(solutions):
+            return sorted(solutions, key=key_func, reverse=(filter_type == "desc"))
+
+        # Use nsmallest/nlargest with generator for better memory efficiency
+        return (
+            heapq.nsmallest(limit, solutions, key=key_func)
+            if filter_type == "asc"
+            else heapq.nlargest(limit, solutions, key=key_func)
+        )
 
     def get_best_solutions(
         self, island_id: Optional[int] = None, top_k: Optional[int] = None
@@ -307,24 +532,31 @@ class RedisMemory(EvolveMemory):
         top_k = 1 if top_k is None else top_k
 
         with self._lock:
+            self._cache.validate()
             if island_id is not None:
                 # Get solutions from specific island
-                island_key = f"{self.islands_key}:{island_id}"
-                solution_ids = self.redis.smembers(island_key)
-                solutions = [
-                    Solution.from_dict(json.loads(s.decode("utf-8")))
-                    for s in self.redis.hmget(self.populations_key, list(solution_ids))
-                    if s
-                ]
+                solutions = self._island_view(island_id)
             else:
                 # Get all solutions
-                solutions = [
-                    Solution.from_dict(json.loads(s.decode("utf-8")))
-                    for s in self.redis.hvals(self.populations_key)
-                ]
+                solutions = self._population_view()
 
             return heapq.nlargest(top_k, solutions, key=attrgetter("score"))
 
+    async def aget_best_solutions(
+        self, island_id: Optional[int] = None, top_k: Optional[int] = None
+    ) -> list[Solution]:
+        """Async variant of ``get_best_solutions`` using the asyncio Redis client."""
+        top_k = 1 if top_k is None else top_k
+
+        aredis = self._async_redis()
+        await self._cache.avalidate(aredis)
+        if island_id is not None:
+            solutions = await self._aisland_view(aredis, island_id)
+        else:
+            solutions = await self._apopulation_view(aredis)
+
+        return heapq.nlargest(top_k, solutions, key=attrgetter("score"))
+
     def sample(
         self, island_id: Optional[int] = None, exploration_rate: float = 0.2
     ) -> Optional[Solution]:
@@ -342,50 +574,185 @@ class RedisMemory(EvolveMemory):
             Optional[Solution]: The sampled solution, or None if no solutions available.
         """
         with self._lock:
-            # Sample from all solutions
-            solutions = [
-                Solution.from_dict(json.loads(s.decode("utf-8")))
-                for s in self.redis.hvals(self.populations_key)
-            ]
-
+            self._cache.validate()
             if island_id is not None:
-                solutions = [
-                    Solution.from_dict(
-                        json.loads(
-                            self.redis.hget(self.populations_key, v).decode("utf-8")
-                        )
-                    )
-                    for v in self.redis.smembers(f"{self.islands_key}:{island_id}")
-                ]
+                solutions = self._island_view(island_id)
+            else:
+                # Sample from all solutions
+                solutions = self._population_view()
 
             if not solutions:
                 return None
 
-            elites = []
-            elites_ids = self.redis.smembers(self.elites_key)
-            for elite_id in elites_ids:
-                elite = Solution.from_dict(
-                    json.loads(
-                        self.redis.hget(self.populations_key, elite_id).decode("utf-8")
-                    )
-                )
-                elites.append(elite)
-
-            return select_parents_with_dynamic_temperature(
-                solutions=solutions,
-                elites=elites,
-                initial_temp=self.boltzmann_temperature,
-                use_sampling_weight=self.use_sampling_weight,
-                sampling_weight_power=self.sampling_weight_power,
-                exploration_rate=exploration_rate,
-            )
+            elites = self._elites_view()
+
+            return self._select_parent(solutions, elites, exploration_rate)
+
+    async def asample(
+        self, island_id: Optional[int] = None, exploration_rate: float = 0.2
+    ) -> Optional[Solution]:
+        """Async variant of ``sample`` using the asyncio Redis client."""
+        aredis = self._async_redis()
+        await self._cache.avalidate(aredis)
+        if island_id is not None:
+            solutions = await self._aisland_view(aredis, island_id)
+        else:
+            solutions = await self._apopulation_view(aredis)
+
+        if not solutions:
+            return None
+
+        elites = await self._aelites_view(aredis)
+
+        return self._select_parent(solutions, elites, exploration_rate)
+
+    def _select_parent(
+        self, solutions: list[Solution], elites: list[Solution], exploration_rate: float
+    ) -> Optional[Solution]:
+        return select_parents_with_dynamic_temperature(
+            solutions=solutions,
+            elites=elites,
+            initial_temp=self.boltzmann_temperature,
+            use_sampling_weight=self.use_sampling_weight,
+            sampling_weight_power=self.sampling_weight_power,
+            exploration_rate=exploration_rate,
+        )
+
+    def cache_stats(self, reset: bool = False) -> dict:
+        """
+        Get the counters of the client-side solution cache.
+
+        Args:
+            reset: Start counting from zero again after reading.
+
+        Returns:
+            dict: See ``SolutionCache.stats``.
+        """
+        return self._cache.stats(reset)
+
+    def _solutions_view(self) -> list[Solution]:
+        """All solutions, including the ones without a score."""
+        return self._cache.view(
+            "solutions",
+            lambda: self._parse_solutions(self.redis.hvals(self.solutions_key)),
+            round_trips=1,
+        )
+
+    def _population_view(self) -> list[Solution]:
+        """Solutions of the population."""
+        return self._cache.view(
+            "population",
+            lambda: self._parse_solutions(self.redis.hvals(self.populations_key)),
+            round_trips=1,
+        )
+
+    def _island_view(self, island_id: int) -> list[Solution]:
+        """Solutions of the population assigned to an island."""
+        return self._cache.view(
+            ("island", island_id),
+            lambda: self._load_members(f"{self.islands_key}:{island_id}"),
+            round_trips=2,
+        )
+
+    def _elites_view(self) -> list[Solution]:
+        """Solutions of the elite archive."""
+        return self._cache.view(
+            "elites", lambda: self._load_members(self.elites_key), round_trips=2
+        )
+
+    def _load_members(self, set_key: str) -> list[Solution]:
+        """Load the population solutions whose ids are in a set."""
+        solution_ids = list(self.redis.smembers(set_key))
+        if not solution_ids:
+            return []
+        return self._parse_solutions(
+            self.redis.hmget(self.populations_key, solution_ids)
+        )
+
+    async def _asolutions_view(self, aredis: AsyncRedis) -> list[Solution]:
+        async def load():
+            return self._parse_solutions(await aredis.hvals(self.solutions_key))
+
+        return await self._cache.aview("solutions", load, round_trips=1)
+
+    async def _apopulation_view(self, aredis: AsyncRedis) -> list[Solution]:
+        async def load():
+            return self._parse_solutions(await aredis.hvals(self.populations_key))
+
+        return await self._cache.aview("population", load, round_trips=1)
+
+    async def _aisland_view(self, aredis: AsyncRedis, island_id: int) -> list[Solution]:
+        return await self._cache.aview(
+            ("island", island_id),
+            lambda: self._aload_members(aredis, f"{self.islands_key}:{island_id}"),
+            round_trips=2,
+        )
+
+    async def _aelites_view(self, aredis: AsyncRedis) -> list[Solution]:
+        return await self._cache.aview(
+            "elites",
+            lambda: self._aload_members(aredis, self.elites_key),
+            round_trips=2,
+        )
+
+    async def _aload_members(self, aredis: AsyncRedis, set_key: str) -> list[Solution]:
+        solution_ids = list(await aredis.smembers(set_key))
+        if not solution_ids:
+            return []
+        return self._parse_solutions(
+            await aredis.hmget(self.populations_key, solution_ids)
+        )
+
+    def _async_redis(self) -> AsyncRedis:
+        """
+        Get the asyncio Redis client of the running event loop.
+
+        asyncio connections are bound to the loop that opened them, so one client
+        is kept per loop.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = AsyncRedis.from_url(self.redis_url, **REDIS_POOL_OPTIONS)
+            self._async_clients[loop] = client
+        return client
+
+    def _async_lock(self) -> asyncio.Lock:
+        """
+        Get the lock serializing the async writes made from the running event loop.
+
+        asyncio locks are bound to the loop they are used on, so one lock is kept
+        per loop, like the clients.
+        """
+        loop = asyncio.get_running_loop()
+        lock = self._async_locks.get(loop)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._async_locks[loop] = lock
+        return lock
+
+    @staticmethod
+    def _parse_solutions(values) -> list[Solution]:
+        return [
+            Solution.from_json(value)
+            for value in values
+            if value
+        ]
 
     async def save_checkpoint(
-        self, path: Optional[str] = None, tag: Optional[str] = None
+        self,
+        path: Optional[str] = None,
+        tag: Optional[str] = None,
+        archive: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ) -> None:
         """
         Save the complete memory state to disk from Redis.
 
+        Solutions are streamed with HSCAN in batches of ``batch_size``, so the
+        population is never held in client memory as a whole. Redis is read with
+        the asyncio client, only the file writes run in a worker thread.
+
         Args:
             path: Optional directory path to save the checkpoint.
                  If None, uses the output_path specified in constructor.
@@ -393,349 +760,860 @@ class RedisMemory(EvolveMemory):
             tag: Optional identifier for the checkpoint.
                 If None, uses current timestamp as identifier.
                 Must be a valid filename string without special characters.
+            archive: If True, write the solutions and metadata to a single compact
+                archive (see ``export_archive``) instead of one file per solution.
+            batch_size: Number of solutions fetched per HSCAN round trip.
 
         Returns:
             None: This method does not return anything but saves checkpoint files to disk.
         """
+        async with self._async_lock():
+            await self._arun_steps(
+                self._save_checkpoint_steps(path, tag, archive, batch_size)
+            )
+
+    def _save_checkpoint_steps(
+        self,
+        path: Optional[str],
+        tag: Optional[str],
+        archive: bool,
+        batch_size: int,
+    ) -> Generator:
         save_path = path or self.output_path
         if not save_path:
             raise ValueError("Path cannot be empty.")
 
-        os.makedirs(save_path, exist_ok=True)
-
-        checkpoint_dir = os.path.join(save_path, "checkpoints")
-        os.makedirs(checkpoint_dir, exist_ok=True)
-
         tag = tag if tag else time.strftime("%Y%m%d-%H%M%S")
-        checkpoint_path = os.path.join(checkpoint_dir, f"checkpoint-{tag}")
-        os.makedirs(checkpoint_path, exist_ok=True)
+        checkpoint_path = os.path.join(save_path, "checkpoints", f"checkpoint-{tag}")
+        yield _Blocking(lambda: os.makedirs(checkpoint_path, exist_ok=True))
 
         logger.info(f"Checkpointing Redis memory to {checkpoint_path}")
 
-        with self._lock:
-            # Save solutions
+        if archive:
+            stats = yield from self._export_archive_steps(
+                os.path.join(checkpoint_path, ARCHIVE_FILENAME), batch_size
+            )
+            saved = stats["solutions"]
+        else:
             solutions_path = os.path.join(checkpoint_path, "solutions")
-            os.makedirs(solutions_path, exist_ok=True)
+            yield _Blocking(lambda: os.makedirs(solutions_path, exist_ok=True))
+
+            (total,) = yield lambda pipe: pipe.hlen(self.solutions_key)
+            progress = _TransferProgress("Saved", total)
+            cursor = 0
+            while True:
+                cursor, batch = yield from self._hscan_step(
+                    self.solutions_key, cursor, batch_size
+                )
+                if batch:
+                    yield _Blocking(
+                        lambda: self._write_solution_files(solutions_path, batch)
+                    )
+                    progress.advance(len(batch))
+                if not cursor:
+                    break
+            saved = progress.finish()["solutions"]
+
+            metadata = yield from self._checkpoint_metadata_steps()
+            metadata["total_generated_solutions"] = saved
+            metadata_json = json.dumps(
+                metadata,
+                indent=None if self.compact_checkpoints else 4,
+                default=_bytes_encoder,
+            )
+            metadata_path = os.path.join(checkpoint_path, "metadata.json")
+            yield _Blocking(lambda: _write_text(metadata_path, metadata_json))
+
+        logger.info(f"Saved checkpoint with {saved} programs to {checkpoint_path}")
 
-            # Get all solutions from Redis
-            solutions = [
-                Solution.from_dict(json.loads(s.decode("utf-8")))
-                for s in self.redis.hvals(self.solutions_key)
+        # Save best solution found so far
+        (best_solution_id,) = yield lambda pipe: pipe.hget(
+            self.metadata_key, "best_solution_id"
+        )
+        best_solution_id = _decode(best_solution_id)
+        best_solution_json = None
+        if best_solution_id:
+            (best_solution_json,) = yield lambda pipe: pipe.hget(
+                self.populations_key, best_solution_id
+            )
+        if best_solution_json:
+            best_solution = Solution.from_json(best_solution_json)
+        else:
+            (values,) = yield lambda pipe: pipe.hvals(self.populations_key)
+            best_solution = max(
+                self._parse_solutions(values), key=attrgetter("score"), default=None
+            )
+
+        if best_solution:
+            best_solution_path = os.path.join(checkpoint_path, "best_solution.json")
+            yield _Blocking(
+                lambda: dump_file(
+                    best_solution.to_dict(),
+                    best_solution_path,
+                    self.compact_checkpoints,
+                )
+            )
+
+        logger.info(f"Saved checkpoint with tag {tag} to {checkpoint_path}")
+
+    def _write_solution_files(
+        self, solutions_path: str, batch: list[tuple[str, str]]
+    ) -> None:
+        """Write a batch of solutions to one file each."""
+        for solution_id, solution_json in batch:
+            solution_path = os.path.join(solutions_path, f"{solution_id}.json")
+            if self.compact_checkpoints:
+                # Stored compact already, no need to parse it
+                _write_text(solution_path, solution_json)
+            else:
+                dump_file(loads(solution_json), solution_path)
+
+    def load_checkpoint(
+        self, checkpoint_path: str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> None:
+        """
+        Load the memory state from disk.
+
+        Solutions are written with pipelined multi-field HSETs of ``batch_size``
+        solutions each, instead of one round trip per solution.
+
+        Args:
+            checkpoint_path: Directory path where the checkpoint is stored, or the
+                path of an archive written by ``export_archive``.
+            batch_size: Number of solutions written per pipeline.
+        Returns:
+            None: This method does not return anything but loads checkpoint data into memory.
+        """
+        with self._lock:
+            self._run_steps(self._load_checkpoint_steps(checkpoint_path, batch_size))
+
+    async def aload_checkpoint(
+        self, checkpoint_path: str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> None:
+        """
+        Async variant of ``load_checkpoint`` using the asyncio Redis client, only
+        the file reads run in a worker thread.
+        """
+        async with self._async_lock():
+            await self._arun_steps(
+                self._load_checkpoint_steps(checkpoint_path, batch_size)
+            )
+
+    def _load_checkpoint_steps(
+        self, checkpoint_path: str, batch_size: int
+    ) -> Generator:
+        archive_path = (
+            os.path.join(checkpoint_path, ARCHIVE_FILENAME)
+            if os.path.isdir(checkpoint_path)
+            else checkpoint_path
+        )
+        if os.path.isfile(archive_path):
+            yield from self._import_archive_steps(archive_path, batch_size)
+            return
+
+        logger.info(f"Loading checkpoint from {checkpoint_path}")
+
+        metadata = yield _Blocking(
+            lambda: load_file(os.path.join(checkpoint_path, "metadata.json"))
+        )
+        yield lambda pipe: self._queue_checkpoint_metadata(pipe, metadata)
+
+        # Load solutions
+        solutions_path = os.path.join(checkpoint_path, "solutions")
+        filenames = yield _Blocking(
+            lambda: [f for f in os.listdir(solutions_path) if f.endswith(".json")]
+        )
+        progress = _TransferProgress("Loaded", len(filenames))
+        for start in range(0, len(filenames), batch_size):
+            paths = [
+                os.path.join(solutions_path, filename)
+                for filename in filenames[start : start + batch_size]
             ]
+            batch = yield _Blocking(lambda: self._read_solution_files(paths))
+            yield lambda pipe: self._queue_solutions(pipe, batch, batch)
+            progress.advance(len(batch))
+        progress.finish()
+
+        yield from self._reconstruct_islands_steps(metadata.get("islands", []))
+        yield from self._rebuild_score_index_steps()
+        yield self._publish_step([INVALIDATE_ALL])
+
+    @staticmethod
+    def _read_solution_files(paths: list[str]) -> Dict[str, str]:
+        """Read a batch of solution files into solution JSONs by id."""
+        batch: Dict[str, str] = {}
+        for file_path in paths:
+            try:
+                solution_dict = load_file(file_path)
+                solution = Solution.from_dict(solution_dict)
+            except Exception as e:
+                logger.error(f"Failed to load solution from {file_path}: {str(e)}")
+                raise e
+            batch[solution.solution_id] = json.dumps(solution_dict)
+        return batch
+
+    def export_archive(
+        self, archive_path: str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> dict:
+        """
+        Stream the memory state to a single gzip compressed JSONL archive.
+
+        The first line holds the checkpoint metadata, each following line one
+        solution as stored in Redis, and the last line the number of solutions so
+        truncated archives are detected on import. Solutions are read with HSCAN in
+        batches of ``batch_size``, so client memory stays bounded by the batch size.
+
+        Args:
+            archive_path: Path of the archive file, replaced atomically.
+            batch_size: Number of solutions fetched per HSCAN round trip.
 
-            # Save each solution
-            for solution in solutions:
-                solution_path = os.path.join(
-                    solutions_path, f"{solution.solution_id}.json"
+        Returns:
+            dict: Transfer statistics, see ``_TransferProgress.finish``.
+        """
+        with self._lock:
+            return self._run_steps(self._export_archive_steps(archive_path, batch_size))
+
+    def _export_archive_steps(self, archive_path: str, batch_size: int) -> Generator:
+        directory = os.path.dirname(os.path.abspath(archive_path))
+        tmp_path = f"{archive_path}.tmp"
+
+        metadata = yield from self._checkpoint_metadata_steps()
+        metadata["total_generated_solutions"] = metadata["total_valid_solutions"]
+        header = {
+            "format": ARCHIVE_FORMAT,
+            "version": ARCHIVE_VERSION,
+            "memory_id": self.memory_id,
+            "metadata": metadata,
+        }
+        progress = _TransferProgress("Exported", metadata["total_generated_solutions"])
+
+        def open_archive():
+            os.makedirs(directory, exist_ok=True)
+            f = gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6)
+            f.write(json.dumps(header, default=_bytes_encoder) + "\n")
+            return f
+
+        f = yield _Blocking(open_archive)
+        try:
+            cursor = 0
+            while True:
+                cursor, batch = yield from self._hscan_step(
+                    self.solutions_key, cursor, batch_size
                 )
-                with open(solution_path, "w") as f:
-                    json.dump(solution.to_dict(), f, indent=4)
-
-            feature_stats_raw = self.redis.hgetall(self.feature_stats_key)
-            # Convert bytes to string keys and values
-            feature_stats = {}
-            for key, value in feature_stats_raw.items():
-                key_str = key.decode("utf-8") if isinstance(key, bytes) else key
-                if value:
-                    try:
-                        # Try to parse JSON first, then fallback to string
-                        value_str = (
-                            value.decode("utf-8") if isinstance(value, bytes) else value
-                        )
-                        feature_stats[key_str] = json.loads(value_str)
-                    except (json.JSONDecodeError, UnicodeDecodeError):
-                        # If JSON parsing fails, use string value
-                        feature_stats[key_str] = value_str
-                else:
-                    feature_stats[key_str] = value
+                if batch:
+
+                    def queue_membership(pipe):
+                        for solution_id, _ in batch:
+                            pipe.hexists(self.populations_key, solution_id)
+
+                    in_population = yield queue_membership
+                    # Values are already JSON, embed them without re-encoding.
+                    lines = "".join(
+                        f'{{"population": {json.dumps(bool(population))}, '
+                        f'"solution": {solution_json}}}\n'
+                        for (_, solution_json), population in zip(batch, in_population)
+                    )
+                    yield _Blocking(lambda: f.write(lines))
+                    progress.advance(len(batch))
+                if not cursor:
+                    break
+            trailer = json.dumps({"end": {"solutions": progress.count}}) + "\n"
+            yield _Blocking(lambda: f.write(trailer))
+        finally:
+            f.close()
+        yield _Blocking(lambda: os.replace(tmp_path, archive_path))
+
+        stats = progress.finish()
+        stats["bytes"] = yield _Blocking(lambda: os.path.getsize(archive_path))
+        return stats
+
+    def import_archive(
+        self, archive_path: str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> dict:
+        """
+        Load the memory state from an archive written by ``export_archive``.
 
-            island_best_solution = []
-            for i in range(self.num_islands):
-                island_best_solution_key = f"{self.islands_key}:{i}:best"
-                best_solution_id = self.redis.hget(
-                    island_best_solution_key, "best_solution_id"
+        The archive is first read through once to check it is complete, so a
+        truncated or corrupt archive is rejected before anything is written. It
+        is then read again line by line and solutions are written with pipelined
+        multi-field HSETs of ``batch_size`` solutions each.
+
+        Args:
+            archive_path: Path of the archive file.
+            batch_size: Number of solutions written per pipeline.
+
+        Returns:
+            dict: Transfer statistics, see ``_TransferProgress.finish``.
+
+        Raises:
+            ValueError: If the file is not a complete memory archive.
+        """
+        with self._lock:
+            return self._run_steps(self._import_archive_steps(archive_path, batch_size))
+
+    def _import_archive_steps(self, archive_path: str, batch_size: int) -> Generator:
+        logger.info(f"Importing memory archive {archive_path}")
+
+        metadata = yield _Blocking(lambda: self._check_archive(archive_path))
+        progress = _TransferProgress(
+            "Imported", metadata.get("total_generated_solutions")
+        )
+
+        def open_archive():
+            f = gzip.open(archive_path, "rt", encoding="utf-8")
+            f.readline()
+            return f
+
+        f = yield _Blocking(open_archive)
+        try:
+            done = False
+            while not done:
+                solutions, populations, done = yield _Blocking(
+                    lambda: self._read_archive_batch(f, batch_size)
                 )
-                # Convert bytes to string if needed
-                if isinstance(best_solution_id, bytes):
-                    island_best_solution.append(best_solution_id.decode("utf-8"))
-                else:
-                    island_best_solution.append(best_solution_id)
-
-            # Save metadata
-            metadata = {
-                "total_generated_solutions": len(solutions),
-                "total_valid_solutions": self.redis.hlen(self.solutions_key),
-                "islands": [
-                    [
-                        member.decode("utf-8") if isinstance(member, bytes) else member
-                        for member in self.redis.smembers(f"{self.islands_key}:{i}")
-                    ]
-                    for i in range(self.num_islands)
-                ],
-                "island_feature_map": {
-                    i: {
-                        key.decode("utf-8") if isinstance(key, bytes) else key: (
-                            value.decode("utf-8") if isinstance(value, bytes) else value
-                        )
-                        for key, value in self.redis.hgetall(
-                            f"{self.island_feature_maps_key}:{i}"
-                        ).items()
-                    }
-                    for i in range(self.num_islands)
-                },
-                "elites": [
-                    member.decode("utf-8") if isinstance(member, bytes) else member
-                    for member in self.redis.smembers(self.elites_key)
-                ],
-                "best_solution_id": (
-                    self.redis.hget(self.metadata_key, "best_solution_id").decode(
-                        "utf-8"
+                if solutions:
+                    yield lambda pipe: self._queue_solutions(
+                        pipe, solutions, populations
                     )
-                ),
-                "island_best_solution": island_best_solution,
-                "last_iteration": int(
-                    self.redis.hget(self.metadata_key, "last_iteration").decode("utf-8")
-                    or 0
-                ),
-                "current_island": int(
-                    self.redis.hget(self.metadata_key, "current_island").decode("utf-8")
-                    or 0
-                ),
-                "last_migration_generation": int(
-                    self.redis.hget(
-                        self.metadata_key, "last_migration_generation"
-                    ).decode("utf-8")
-                    or 0
-                ),
-                "island_capacity": [
-                    self.redis.scard(f"{self.islands_key}:{i}")
-                    for i in range(self.num_islands)
+                    progress.advance(len(solutions))
+        finally:
+            f.close()
+
+        yield lambda pipe: self._queue_checkpoint_metadata(pipe, metadata)
+        yield from self._reconstruct_islands_steps(metadata.get("islands", []))
+        yield from self._rebuild_score_index_steps()
+        yield self._publish_step([INVALIDATE_ALL])
+
+        return progress.finish()
+
+    @staticmethod
+    def _read_archive_batch(f, batch_size: int) -> tuple:
+        """
+        Read up to ``batch_size`` solutions of an open archive.
+
+        Returns:
+            tuple: The solution JSONs by id, those of the population, and whether
+                the end of the archive was reached.
+        """
+        solutions: Dict[str, str] = {}
+        populations: Dict[str, str] = {}
+        while len(solutions) < batch_size:
+            line = f.readline()
+            if not line:
+                return solutions, populations, True
+            record = json.loads(line)
+            if "end" in record:
+                return solutions, populations, True
+            solution = record["solution"]
+            solution_json = json.dumps(solution)
+            solutions[solution["solution_id"]] = solution_json
+            if record.get("population"):
+                populations[solution["solution_id"]] = solution_json
+        return solutions, populations, False
+
+    @staticmethod
+    def _check_archive(archive_path: str) -> dict:
+        """
+        Read a memory archive through, checking its header, its records and its
+        trailer, without keeping the solutions in memory.
+
+        Returns:
+            dict: The checkpoint metadata of the archive.
+        """
+        count = 0
+        end = None
+        try:
+            with gzip.open(archive_path, "rt", encoding="utf-8") as f:
+                header = json.loads(f.readline() or "{}")
+                if header.get("format") != ARCHIVE_FORMAT:
+                    raise ValueError(f"{archive_path} is not a memory archive")
+                if header.get("version", 0) > ARCHIVE_VERSION:
+                    raise ValueError(
+                        f"Unsupported memory archive version {header['version']} "
+                        f"in {archive_path}"
+                    )
+                for line in f:
+                    record = json.loads(line)
+                    if "end" in record:
+                        end = record["end"]
+                        break
+                    if not isinstance(record["solution"]["solution_id"], str):
+                        raise TypeError("solution id is not a string")
+                    count += 1
+        except (OSError, EOFError, KeyError, TypeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Memory archive {archive_path} is corrupt: {e}") from e
+
+        if end is None or end.get("solutions") != count:
+            raise ValueError(
+                f"Memory archive {archive_path} is truncated, read {count} solutions"
+            )
+        return header.get("metadata", {})
+
+    def _hscan_step(self, key: str, cursor: int, batch_size: int) -> Generator:
+        """
+        Read one HSCAN batch of a hash.
+
+        Returns:
+            tuple: The next cursor, 0 once the scan is done, and the batch of
+                (field, value) pairs.
+        """
+        ((cursor, batch),) = yield lambda pipe: pipe.hscan(
+            key, cursor=cursor, count=batch_size
+        )
+        return int(cursor), [(_decode(k), _decode(v)) for k, v in batch.items()]
+
+    def _queue_solutions(
+        self, pipe, solutions: Dict[str, str], populations: Dict[str, str]
+    ) -> None:
+        """Queue the writes of a batch of solution JSONs."""
+        lineage = {
+            solution_id: _lineage_entry(solution_id, json.loads(solution_json))
+            for solution_id, solution_json in solutions.items()
+        }
+        pipe.hset(self.solutions_key, mapping=solutions)
+        pipe.hset(self.lineage_key, mapping=lineage)
+        if populations:
+            pipe.hset(self.populations_key, mapping=populations)
+
+    def _checkpoint_metadata_steps(self) -> Generator:
+        """Read the non-solution memory state saved with checkpoints."""
+
+        def queue_metadata(pipe):
+            pipe.hgetall(self.feature_stats_key)
+            pipe.hlen(self.solutions_key)
+            pipe.smembers(self.elites_key)
+            pipe.hmget(
+                self.metadata_key,
+                [
+                    "best_solution_id",
+                    "last_iteration",
+                    "current_island",
+                    "last_migration_generation",
                 ],
-                "feature_stats": self._serialize_feature_stats(feature_stats),
-            }
+            )
+            for i in range(self.num_islands):
+                pipe.hget(f"{self.islands_key}:{i}:best", "best_solution_id")
+                pipe.smembers(f"{self.islands_key}:{i}")
+                pipe.hgetall(f"{self.island_feature_maps_key}:{i}")
 
-            def bytes_encoder(obj):
-                if isinstance(obj, bytes):
-                    return obj.decode("utf-8", errors="replace")
-                raise TypeError(
-                    f"Object of type {obj.__class__.__name__} is not JSON serializable"
+        feature_stats_raw, total_valid, elites, meta, *per_island = (
+            yield queue_metadata
+        )
+
+        # Convert bytes to string keys and values
+        feature_stats = {}
+        for key, value in feature_stats_raw.items():
+            key_str = _decode(key)
+            if value:
+                value_str = _decode(value)
+                try:
+                    # Try to parse JSON first, then fallback to string
+                    feature_stats[key_str] = json.loads(value_str)
+                except json.JSONDecodeError:
+                    # If JSON parsing fails, use string value
+                    feature_stats[key_str] = value_str
+            else:
+                feature_stats[key_str] = value
+
+        island_bests = per_island[0::3]
+        islands = per_island[1::3]
+        feature_maps = per_island[2::3]
+        best_solution_id, last_iteration, current_island, last_migration = meta
+        return {
+            "total_valid_solutions": total_valid,
+            "islands": [sorted(_decode(m) for m in members) for members in islands],
+            "island_feature_map": {
+                i: {_decode(k): _decode(v) for k, v in feature_map.items()}
+                for i, feature_map in enumerate(feature_maps)
+            },
+            "elites": sorted(_decode(m) for m in elites),
+            "best_solution_id": _decode(best_solution_id) or "",
+            "island_best_solution": [_decode(best) for best in island_bests],
+            "last_iteration": int(_decode(last_iteration) or 0),
+            "current_island": int(_decode(current_island) or 0),
+            "last_migration_generation": int(_decode(last_migration) or 0),
+            "island_capacity": [len(members) for members in islands],
+            "feature_stats": self._serialize_feature_stats(feature_stats),
+        }
+
+    def _queue_checkpoint_metadata(self, pipe, metadata: dict) -> None:
+        """Queue the writes of the non-solution memory state of a checkpoint."""
+        island_feature_map = metadata.get("island_feature_map", {})
+        for i in range(self.num_islands):
+            # JSON turns the island index keys into strings.
+            feature_map = island_feature_map.get(str(i), island_feature_map.get(i, {}))
+            if feature_map:
+                pipe.hset(f"{self.island_feature_maps_key}:{i}", mapping=feature_map)
+
+        elites = metadata.get("elites", [])
+        if elites:
+            pipe.sadd(self.elites_key, *elites)
+        pipe.hset(
+            self.metadata_key,
+            mapping={
+                "best_solution_id": metadata.get("best_solution_id", ""),
+                "last_iteration": metadata.get("last_iteration", 0),
+                "current_island": metadata.get("current_island", 0),
+                "last_migration_generation": metadata.get(
+                    "last_migration_generation", 0
+                ),
+            },
+        )
+        feature_stats = self._deserialize_feature_stats(
+            metadata.get("feature_stats", {})
+        )
+        if feature_stats:
+            pipe.hset(
+                self.feature_stats_key,
+                mapping={
+                    k: json.dumps(v) if isinstance(v, (dict, list)) else str(v)
+                    for k, v in feature_stats.items()
+                },
+            )
+
+        for i, best_solution_id in enumerate(metadata.get("island_best_solution", [])):
+            if best_solution_id:
+                pipe.hset(
+                    f"{self.islands_key}:{i}:best",
+                    "best_solution_id",
+                    best_solution_id,
                 )
 
-            with open(os.path.join(checkpoint_path, "metadata.json"), "w") as f:
-                json.dump(metadata, f, indent=4, default=bytes_encoder)
+    def memory_status(self, island_id: int = None) -> dict:
+        """Return the status of the memory"""
+        with self._lock:
+            current_iteration, feature_map_len, summaries = self._run_steps(
+                self._status_steps(island_id)
+            )
+        result = self._build_status(
+            current_iteration, island_id, summaries, feature_map_len
+        )
+        self._log_cache_stats()
+        return result
+
+    async def amemory_status(self, island_id: int = None) -> dict:
+        """Async variant of ``memory_status`` using the asyncio Redis client."""
+        current_iteration, feature_map_len, summaries = await self._arun_steps(
+            self._status_steps(island_id)
+        )
+        result = self._build_status(
+            current_iteration, island_id, summaries, feature_map_len
+        )
+        self._log_cache_stats()
+        return result
+
+    def population_stats(self) -> dict:
+        """
+        Return the running score statistics of the population.
+
+        Returns:
+            dict: ``stats_version``, the ``elite_threshold`` (lowest elite score once
+                the archive is full, None before), and the count, mean, variance,
+                min, max and score histogram of the population (``global``) and of
+                each island (``islands``).
+        """
+        with self._lock:
+            return self._run_steps(self._population_stats_steps())
+
+    def stats_version(self) -> int:
+        """
+        Return a counter changing whenever the population changes, so callers can
+        skip re-reading an unchanged ``memory_status``. It is the version of the
+        changelog, shared by every client of the memory, one round trip.
+        """
+        return int(self.redis.get(self._cache.version_key) or 0)
+
+    async def astats_version(self) -> int:
+        """Async variant of ``stats_version`` using the asyncio Redis client."""
+        return int(await self._async_redis().get(self._cache.version_key) or 0)
+
+    # Operations are written once as generators yielding functions that queue the
+    # commands of one pipelined round trip and receiving the replies. Functions whose
+    # commands must apply together start with ``pipe.multi()``. Generators may also
+    # yield None to ask for the score index to be rebuilt, or a ``_Blocking`` step
+    # for other blocking work. ``_run_steps`` drives them with the blocking client
+    # and ``_arun_steps`` with the asyncio client, running the blocking steps in a
+    # worker thread.
+
+    def _run_steps(self, steps: Generator):
+        """Drive pipelined steps with the blocking client."""
+        try:
+            step = next(steps)
+            while True:
+                if step is None:
+                    self._rebuild_score_index()
+                    result = None
+                elif isinstance(step, _Blocking):
+                    result = step.func()
+                else:
+                    with self.redis.pipeline(transaction=False) as pipe:
+                        step(pipe)
+                        result = pipe.execute()
+                step = steps.send(result)
+        except StopIteration as stop:
+            return stop.value
+
+    async def _arun_steps(self, steps: Generator):
+        """Drive pipelined steps with the asyncio client."""
+        aredis = self._async_redis()
+        try:
+            step = next(steps)
+            while True:
+                if step is None:
+                    async with self._async_lock():
+                        await self._arun_steps(self._rebuild_score_index_steps())
+                    result = None
+                elif isinstance(step, _Blocking):
+                    result = await asyncio.to_thread(step.func)
+                else:
+                    async with aredis.pipeline(transaction=False) as pipe:
+                        step(pipe)
+                        result = await pipe.execute()
+                step = steps.send(result)
+        except StopIteration as stop:
+            return stop.value
+
+    def _publish_step(self, solution_ids: list[str]) -> Callable:
+        """Step appending solution ids to the changelog in one transaction."""
+
+        def queue_publish(pipe):
+            pipe.multi()
+            self._cache.publish(solution_ids, pipe)
+
+        return queue_publish
+
+    def _status_steps(self, island_id: Optional[int]) -> Generator:
+        """Read the iteration, feature map size and score summaries of a status."""
+
+        def queue_metadata(pipe):
+            pipe.hget(self.metadata_key, "last_iteration")
+            pipe.hlen(f"{self.island_feature_maps_key}:{island_id}")
+
+        scopes = [None, island_id] if island_id else [None]
+        extra, summaries = yield from self._score_summary_steps(scopes, queue_metadata)
+        return extra[0], extra[1], summaries
+
+    def _population_stats_steps(self) -> Generator:
+        """Read every score summary and the elite threshold."""
+
+        def queue_elites(pipe):
+            pipe.smembers(self.elites_key)
+
+        scopes = [None] + list(range(self.num_islands))
+        (elites,), summaries = yield from self._score_summary_steps(
+            scopes, queue_elites
+        )
+
+        def queue_elite_scores(pipe):
+            pipe.get(self._cache.version_key)
+            if elites:
+                pipe.zmscore(self.scores_key, list(elites))
+
+        stats_version, *elite_scores = yield queue_elite_scores
+        stats_version = int(stats_version or 0)
+        scores = [s for s in (elite_scores or [[]])[0] if s is not None]
+        elite_threshold = None
+        if scores and len(scores) >= self.elite_archive_size:
+            elite_threshold = min(scores)
+        return {
+            "stats_version": stats_version,
+            "elite_threshold": elite_threshold,
+            "global": summaries[None].to_dict(),
+            "islands": [summaries[i].to_dict() for i in range(self.num_islands)],
+        }
+
+    def _score_summary_steps(
+        self, scopes: list[Optional[int]], queue_extra: Callable
+    ) -> Generator:
+        """
+        Read the score summaries of the population (scope None) and of islands in
+        two round trips, O(log n) work per scope on the server.
 
-            logger.info(
-                f"Saved checkpoint with {len(solutions)} programs to {checkpoint_path}"
-            )
+        ``queue_extra`` queues more commands on the first round trip, their replies
+        are returned with the summaries. Yields None to ask for the score index to
+        be rebuilt when it was never built, e.g. for a memory written by an older
+        version.
+        """
+        keys = [self._scores_key_of(scope) for scope in scopes]
+
+        def queue_ranges(pipe):
+            queue_extra(pipe)
+            pipe.hgetall(self.score_sums_key)
+            for key in keys:
+                pipe.zcard(key)
+                pipe.zrange(key, 0, 0, withscores=True)
+                pipe.zrevrange(key, 0, 2, withscores=True)
+
+        replies = yield queue_ranges
+        sums = {_decode(k): float(v) for k, v in replies[-1 - 3 * len(keys)].items()}
+        if "indexed" not in sums:
+            yield None
+            replies = yield queue_ranges
+            sums = {
+                _decode(k): float(v) for k, v in replies[-1 - 3 * len(keys)].items()
+            }
+        extra = replies[: -1 - 3 * len(keys)]
+        ranges = [replies[-3 * len(keys) + 3 * i :][:3] for i in range(len(keys))]
 
-            # Save best solution found so far
-            best_solution_id = self.redis.hget(
-                self.metadata_key, "best_solution_id"
-            ).decode("utf-8")
-            if best_solution_id:
-                best_solution = Solution.from_dict(
-                    json.loads(
-                        self.redis.hget(self.populations_key, best_solution_id).decode(
-                            "utf-8"
-                        )
-                    )
+        def queue_counts(pipe):
+            for key, scope, (count, lowest, top) in zip(keys, scopes, ranges):
+                if not count:
+                    continue
+                prefix = "" if scope is None else f"{scope}:"
+                mean = sums.get(f"{prefix}sum", 0.0) / count
+                pipe.zcount(key, f"({mean!r}", "+inf")
+                bounds = (
+                    ["-inf"]
+                    + [repr(e) for e in histogram_edges(lowest[0][1], top[0][1])]
+                    + ["+inf"]
                 )
-            else:
-                best_solutions = self.get_best_solutions()
-                best_solution = best_solutions[0] if len(best_solutions) > 0 else None
-
-            if best_solution:
-                best_solution_path = os.path.join(checkpoint_path, "best_solution.json")
-                with open(best_solution_path, "w") as f:
-                    json.dump(best_solution.to_dict(), f, indent=4)
+                for low, high in zip(bounds, bounds[1:]):
+                    pipe.zcount(key, low, high if high == "+inf" else f"({high}")
+                pipe.hmget(self.populations_key, [member for member, _ in top])
+
+        counts = iter((yield queue_counts) if any(r[0] for r in ranges) else [])
+        summaries = {}
+        for scope, (count, lowest, top) in zip(scopes, ranges):
+            if not count:
+                summaries[scope] = ScoreSummary()
+                continue
+            prefix = "" if scope is None else f"{scope}:"
+            above_mean = next(counts)
+            histogram = [next(counts) for _ in range(HISTOGRAM_BINS)]
+            iterations = [
+                json.loads(s).get("iteration") if s else None for s in next(counts)
+            ]
+            summaries[scope] = summarize(
+                count=count,
+                total=sums.get(f"{prefix}sum", 0.0),
+                total_squares=sums.get(f"{prefix}sum_squares", 0.0),
+                low=lowest[0][1],
+                high=top[0][1],
+                above_mean=above_mean,
+                top=[(score, it) for (_, score), it in zip(top, iterations)],
+                histogram=histogram,
+            )
+        return extra, summaries
 
-            logger.info(f"Saved checkpoint with tag {tag} to {checkpoint_path}")
+    def _scores_key_of(self, island_id: Optional[int]) -> str:
+        """Key of the score sorted set of an island, or of the population if None."""
+        if island_id is None:
+            return self.scores_key
+        return f"{self.scores_key}:{island_id}"
 
-    def load_checkpoint(self, checkpoint_path: str) -> None:
+    def _index_scores(
+        self, pipe, solution: Solution, island_id: Optional[int], sign: int = 1
+    ) -> None:
         """
-        Load the memory state from disk.
+        Queue the score index update of a solution joining (``sign`` 1) or leaving
+        (``sign`` -1) the population and optionally an island.
 
-        Args:
-            checkpoint_path: Directory path where the checkpoint is stored.
-        Returns:
-            None: This method does not return anything but loads checkpoint data into memory.
+        The score of a leaving solution must be the score it was indexed with.
         """
-        logger.info(f"Loading checkpoint from {checkpoint_path}")
+        if solution.score is None:
+            return
+        score = float(solution.score)
+        scopes = [None] if island_id is None else [None, island_id]
+        for scope in scopes:
+            key = self._scores_key_of(scope)
+            prefix = "" if scope is None else f"{scope}:"
+            if sign > 0:
+                pipe.zadd(key, {solution.solution_id: score})
+            else:
+                pipe.zrem(key, solution.solution_id)
+            pipe.hincrbyfloat(self.score_sums_key, f"{prefix}sum", sign * score)
+            pipe.hincrbyfloat(
+                self.score_sums_key, f"{prefix}sum_squares", sign * score * score
+            )
 
+    def _rebuild_score_index(self) -> None:
+        """Rebuild the score index, blocking the calling thread."""
         with self._lock:
-            with open(os.path.join(checkpoint_path, "metadata.json"), "r") as f:
-                metadata = json.load(f)
+            self._run_steps(self._rebuild_score_index_steps())
 
-            island_feature_map = metadata.get(
-                "island_feature_map", [{} for _ in range(self.num_islands)]
-            )
+    def _rebuild_score_index_steps(self) -> Generator:
+        """Rebuild the score sorted sets and sums from the population and islands."""
+
+        def queue_islands(pipe):
             for i in range(self.num_islands):
-                island_feature_map_key = f"{self.island_feature_maps_key}:{i}"
-                for k, v in island_feature_map.get(i, {}).items():
-                    self.redis.hset(island_feature_map_key, k, v)
+                pipe.smembers(f"{self.islands_key}:{i}")
 
-            saved_islands = metadata.get("islands", [])
+        island_members = yield queue_islands
+        island_of = {
+            _decode(sid): i for i, members in enumerate(island_members) for sid in members
+        }
 
-            elites = metadata.get("elites", [])
-            if elites:
-                self.redis.sadd(self.elites_key, *elites)
-            self.redis.hset(
-                self.metadata_key,
-                mapping={
-                    "best_solution_id": metadata.get("best_solution_id", ""),
-                    "last_iteration": metadata.get("last_iteration", 0),
-                    "current_island": metadata.get("current_island", 0),
-                    "last_migration_generation": metadata.get(
-                        "last_migration_generation", 0
-                    ),
-                },
-            )
-            feature_stats = self._deserialize_feature_stats(
-                metadata.get("feature_stats", {})
+        sums: Dict[str, float] = {"indexed": 1}
+        scopes: Dict[Optional[int], Dict[str, float]] = {}
+        cursor = 0
+        while True:
+            cursor, batch = yield from self._hscan_step(
+                self.populations_key, cursor, DEFAULT_BATCH_SIZE
             )
-            for k, v in feature_stats.items():
-                if isinstance(v, (dict, list)):
-                    self.redis.hset(self.feature_stats_key, k, json.dumps(v))
-                else:
-                    self.redis.hset(self.feature_stats_key, k, str(v))
-
-            island_best_solution = metadata.get(
-                "island_best_solution", [None] * len(saved_islands)
+            for solution_id, solution_json in batch:
+                score = json.loads(solution_json).get("score")
+                if score is None:
+                    continue
+                for scope in {None, island_of.get(solution_id)}:
+                    scopes.setdefault(scope, {})[solution_id] = float(score)
+            if not cursor:
+                break
+
+        for scope, members in scopes.items():
+            prefix = "" if scope is None else f"{scope}:"
+            sums[f"{prefix}sum"] = sum(members.values())
+            sums[f"{prefix}sum_squares"] = sum(v * v for v in members.values())
+
+        def queue_index(pipe):
+            pipe.delete(
+                self.score_sums_key,
+                *[self._scores_key_of(s) for s in [None, *range(self.num_islands)]],
             )
-            for i, best_solution_id in enumerate(island_best_solution):
-                if best_solution_id:
-                    island_best_solution_key = f"{self.islands_key}:{i}:best"
-                    self.redis.hset(
-                        island_best_solution_key,
-                        "best_solution_id",
-                        best_solution_id,
-                    )
-
-            # Load solutions
-            solutions_path = os.path.join(checkpoint_path, "solutions")
-            for filename in os.listdir(solutions_path):
-                if filename.endswith(".json"):
-                    file_path = os.path.join(solutions_path, filename)
-                    try:
-                        with open(file_path, "r") as f:
-                            solution_dict = json.load(f)
-                            solution = Solution.from_dict(solution_dict)
-                            solution_json = json.dumps(solution_dict)
-                            self.redis.hset(
-                                self.solutions_key, solution.solution_id, solution_json
-                            )
-                            self.redis.hset(
-                                self.populations_key,
-                                solution.solution_id,
-                                solution_json,
-                            )
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to load solution from {file_path}: {str(e)}"
-                        )
-                        raise e
-
-            self._reconstruct_islands(saved_islands)
-
-    def memory_status(self, island_id: int = None) -> dict:
-        """Return the status of the memory"""
-        top_3_solutions = self.get_best_solutions(top_k=3)
-        top_3_iterations = [
-            top_3_solutions[i].iteration
-            for i in range(min(3, len(top_3_solutions)))
-            if top_3_solutions[i]
-        ]
+            for scope, members in scopes.items():
+                pipe.zadd(self._scores_key_of(scope), members)
+            pipe.hset(self.score_sums_key, mapping=sums)
 
-        best_solution = top_3_solutions[0] if len(top_3_solutions) > 0 else None
-        populations_raw = self.redis.hgetall(self.populations_key)
-        population_scores = []
-        for key, values in populations_raw.items():
-            value_str = values.decode("utf-8")
-            population = Solution.from_dict(json.loads(value_str))
-            population_scores.append(population.score)
-
-        avg_score = (
-            sum(population_scores) / len(population_scores)
-            if len(population_scores) > 0
-            else 0
-        )
-        better_ratio = (
-            len([s for s in population_scores if s > avg_score])
-            / len(population_scores)
-            if len(population_scores) > 0
-            else 0
-        )
+        yield queue_index
 
+    def _build_status(
+        self,
+        current_iteration: bytes,
+        island_id: Optional[int],
+        summaries: Dict[Optional[int], ScoreSummary],
+        feature_map_len: int,
+    ) -> dict:
+        """Assemble the memory status from the score summaries."""
+        population = summaries[None]
         result = {
             "global_status": {
-                "current_iteration": int(
-                    self.redis.hget(self.metadata_key, "last_iteration").decode("utf-8")
-                ),
-                "is_full": len(population_scores) == self.population_size,
-                "top_3_iterations": top_3_iterations,
-                "best_score": best_solution.score if best_solution else 0,
-                "best_iteration": (best_solution.iteration if best_solution else 0),
-                "avg_score": round(avg_score, 6),
-                "better_ratio": round(better_ratio, 2),
+                "current_iteration": int(current_iteration.decode("utf-8")),
+                "is_full": population.count == self.population_size,
+                **population.status(),
             },
         }
 
-        if island_id:
-            island_solution_ids = self.redis.smembers(f"{self.islands_key}:{island_id}")
-            if len(island_solution_ids) < 1:
-                return result
-
-            island_metrics = {"island_id": island_id}
-            island_top_3_solutions = self.get_best_solutions(
-                island_id=island_id, top_k=3
-            )
-            island_top_3_iterations = [
-                island_top_3_solutions[j].iteration
-                for j in range(min(3, len(island_top_3_solutions)))
-            ]
-            island_metrics["top_3_iterations"] = island_top_3_iterations
-
-            island_best_solution = island_top_3_solutions[0]
-            island_metrics["best_score"] = (
-                island_best_solution.score if island_best_solution else 0
-            )
-            island_metrics["best_iteration"] = (
-                island_best_solution.iteration if island_best_solution else 0
-            )
-
-            island_solutions = [
-                Solution.from_dict(
-                    json.loads(self.redis.hget(self.populations_key, v).decode("utf-8"))
-                )
-                for v in island_solution_ids
-            ]
-            island_scores = [solution.score for solution in island_solutions]
-            island_metrics["avg_score"] = round(
-                (
-                    round(sum(island_scores) / len(island_scores), 6)
-                    if len(island_scores) > 0
-                    else 0
-                ),
-                6,
-            )
-            island_metrics["better_ratio"] = round(
-                (
-                    len([s for s in island_scores if s > island_metrics["avg_score"]])
-                    / len(island_scores)
-                    if len(island_scores) > 0
-                    else 0
-                ),
-                2,
-            )
-            island_feature_maps_key = f"{self.island_feature_maps_key}:{island_id}"
+        if island_id and summaries[island_id].count:
             total_possible_cells = self.feature_bins ** len(self.feature_dimensions)
-            feature_map_len = self.redis.hlen(island_feature_maps_key)
             coverage = (feature_map_len + 1) / total_possible_cells
-            island_metrics["map_elites_feature_ratio"] = coverage
-            result["island_status"] = island_metrics
+            result["island_status"] = {
+                "island_id": island_id,
+                **summaries[island_id].status(),
+                "map_elites_feature_ratio": coverage,
+            }
 
         return result
 
+    def _log_cache_stats(self) -> None:
+        """Report the cache efficiency since the previous status."""
+        stats = self._cache.stats(reset=True)
+        if stats["hits"] or stats["misses"]:
+            logger.info(
+                f"Solution cache: hit ratio {stats['hit_ratio']:.1%} "
+                f"({stats['hits']} hits, {stats['misses']} misses), "
+                f"{stats['round_trips_saved']} Redis round trips saved, "
+                f"{stats['round_trips']} made since last status"
+            )
+
     def get_parents_by_child_id(self, child_id: str, parent_cnt: int) -> list[Solution]:
         """
         Get parents by child id
@@ -747,31 +1625,19 @@ class RedisMemory(EvolveMemory):
         Returns:
             list[Solution]: Parent solutions
         """
-        with self._lock:
-            if self.redis.hget(self.solutions_key, child_id) is None:
-                raise ValueError(f"Child solution with id '{child_id}' not found.")
-
-            parents = []
-            while len(parents) < parent_cnt:
-                child_ori = self.redis.hget(self.solutions_key, child_id)
-                if child_ori is None:
-                    break
-
-                child = Solution.from_dict(json.loads(child_ori.decode("utf-8")))
-                parent_id = child.parent_id
-                parent_ori = self.redis.hget(self.solutions_key, parent_id)
-                if parent_ori is None:
-                    break
+        if self.redis.hget(self.solutions_key, child_id) is None:
+            raise ValueError(f"Child solution with id '{child_id}' not found.")
 
-                parent = Solution.from_dict(json.loads(parent_ori.decode("utf-8")))
-                parents.append(parent)
-
-            return parents
+        with self._lineage_lock:
+            parent_ids = self._sync_lineage().ancestors(child_id, parent_cnt)
+        return self.get_solutions(parent_ids) if parent_ids else []
 
     def get_childs_by_parent_id(self, parent_id: str, child_cnt: int) -> list[Solution]:
         """
         Get childs by parent id
 
+        Children generated on every island are returned, migrated copies excluded.
+
         Args:
             parent_id (str): Parent solution id
             child_cnt (int): Number of children to retrieve
@@ -779,29 +1645,217 @@ class RedisMemory(EvolveMemory):
         Returns:
             list[Solution]: Child solutions
         """
-        with self._lock:
-            if self.redis.hget(self.solutions_key, parent_id) is None:
-                raise ValueError(f"Parent solution with id '{parent_id}' not found.")
-
-            childs = []
-            parent_ori = self.redis.hget(self.solutions_key, parent_id)
-            if parent_ori is None:
-                return childs
-
-            parent = Solution.from_dict(json.loads(parent_ori.decode("utf-8")))
-            island_solutions = [
-                Solution.from_dict(
-                    json.loads(self.redis.hget(self.populations_key, v).decode("utf-8"))
+        if self.redis.hget(self.solutions_key, parent_id) is None:
+            raise ValueError(f"Parent solution with id '{parent_id}' not found.")
+
+        with self._lineage_lock:
+            child_ids = self._sync_lineage().children(parent_id, child_cnt)
+        return self.get_solutions(child_ids) if child_ids else []
+
+    async def aget_parents_by_child_id(
+        self, child_id: str, parent_cnt: int
+    ) -> list[Solution]:
+        """Async variant of ``get_parents_by_child_id`` using the asyncio Redis client."""
+        if await self._async_redis().hget(self.solutions_key, child_id) is None:
+            raise ValueError(f"Child solution with id '{child_id}' not found.")
+
+        lineage = await self._arun_steps(self._sync_lineage_steps())
+        with self._lineage_lock:
+            parent_ids = lineage.ancestors(child_id, parent_cnt)
+        return await self.aget_solutions(parent_ids) if parent_ids else []
+
+    async def aget_childs_by_parent_id(
+        self, parent_id: str, child_cnt: int
+    ) -> list[Solution]:
+        """Async variant of ``get_childs_by_parent_id`` using the asyncio Redis client."""
+        if await self._async_redis().hget(self.solutions_key, parent_id) is None:
+            raise ValueError(f"Parent solution with id '{parent_id}' not found.")
+
+        lineage = await self._arun_steps(self._sync_lineage_steps())
+        with self._lineage_lock:
+            child_ids = lineage.children(parent_id, child_cnt)
+        return await self.aget_solutions(child_ids) if child_ids else []
+
+    def get_ancestors(
+        self, solution_id: str, limit: Optional[int] = None
+    ) -> list[Solution]:
+        """
+        Get the ancestor chain of a solution, nearest first.
+
+        Args:
+            solution_id (str): Solution id
+            limit (Optional[int]): Maximum number of ancestors, all if None
+
+        Returns:
+            list[Solution]: Ancestor solutions
+        """
+        with self._lineage_lock:
+            ids = self._lineage_of(solution_id).ancestors(solution_id, limit)
+        return self.get_solutions(ids) if ids else []
+
+    def get_subtree(
+        self, solution_id: str, max_depth: Optional[int] = None
+    ) -> list[Solution]:
+        """
+        Get the descendants of a solution in breadth-first order.
+
+        Descendants bred from migrated copies of the solution are included.
+
+        Args:
+            solution_id (str): Solution id
+            max_depth (Optional[int]): Only descendants at most this many generations
+                below the solution, all if None
+
+        Returns:
+            list[Solution]: Descendant solutions
+        """
+        with self._lineage_lock:
+            ids = self._lineage_of(solution_id).subtree(solution_id, max_depth)
+        return self.get_solutions(ids) if ids else []
+
+    def get_lineage_depth(self, solution_id: str) -> int:
+        """
+        Get the number of generations between a solution and its lineage root.
+
+        Args:
+            solution_id (str): Solution id
+
+        Returns:
+            int: Depth of the solution, 0 for a root
+        """
+        with self._lineage_lock:
+            return self._lineage_of(solution_id).depth(solution_id)
+
+    def get_best_in_subtree(self, solution_id: str) -> Optional[Solution]:
+        """
+        Get the best scored solution among a solution and its descendants.
+
+        Args:
+            solution_id (str): Solution id
+
+        Returns:
+            Optional[Solution]: Best solution, None if none of them is scored
+        """
+        with self._lineage_lock:
+            best_id = self._lineage_of(solution_id).best_in_subtree(solution_id)
+        if best_id is None:
+            return None
+        best = self.get_solutions([best_id])
+        return best[0] if best else None
+
+    def _lineage_of(self, solution_id: str) -> LineageIndex:
+        """Synced lineage index holding ``solution_id``. Must hold ``_lineage_lock``."""
+        lineage = self._sync_lineage()
+        if solution_id not in lineage:
+            raise ValueError(f"Solution with id '{solution_id}' not found.")
+        return lineage
+
+    def _sync_lineage(self) -> LineageIndex:
+        """Synced lineage index. Must hold ``_lineage_lock``."""
+        return self._run_steps(self._sync_lineage_steps())
+
+    def _sync_lineage_steps(self) -> Generator:
+        """
+        Catch the client-side lineage index up with the changelog.
+
+        The changed ids are read with ``SolutionCache.changes_steps`` and their
+        lineage entries in one HMGET, so a query costs a few round trips whatever
+        the memory size. The index is rebuilt from the lineage hash on first use,
+        after checkpoint loads and when it fell behind the changelog window.
+
+        ``_lineage_lock`` is only taken to snapshot and to commit, as async callers
+        cannot hold it across round trips. The catch up starts over if another
+        caller committed meanwhile.
+        """
+        while True:
+            with self._lineage_lock:
+                current, since = self._lineage, self._lineage_version
+            lineage = current
+            if lineage is None:
+                lineage, since = yield from self._load_lineage_steps()
+            version, changes = yield from self._cache.changes_steps(since)
+            records = []
+            if changes is None or INVALIDATE_ALL in changes:
+                lineage, version = yield from self._load_lineage_steps()
+            elif changes:
+                records = yield from self._lineage_records_steps(
+                    list(dict.fromkeys(changes))
                 )
-                for v in self.redis.smembers(f"{self.islands_key}:{parent.island_id}")
-            ]
-            for child_solution in island_solutions:
-                if child_solution.parent_id == parent_id:
-                    childs.append(child_solution)
 
-            return childs
+            with self._lineage_lock:
+                if self._lineage is not current or (
+                    current is not None and self._lineage_version != since
+                ):
+                    continue
+                for record in records:
+                    lineage.add(*record)
+                self._lineage = lineage
+                self._lineage_version = max(version, since)
+                return lineage
+
+    def _lineage_records_steps(self, changed: list[str]) -> Generator:
+        """Read the (id, parent id, score, source id) lineage records of solutions."""
+        (entries,) = yield lambda pipe: pipe.hmget(self.lineage_key, changed)
+        missing = [sid for sid, entry in zip(changed, entries) if entry is None]
+        if missing:
+            # Written without a lineage entry, derive it from the solution
+            (values,) = yield lambda pipe: pipe.hmget(self.solutions_key, missing)
+            fallback = dict(zip(missing, values))
+        records = []
+        for solution_id, entry in zip(changed, entries):
+            if entry is None:
+                solution_json = fallback[solution_id]
+                if solution_json is None:
+                    continue
+                entry = _lineage_entry(solution_id, json.loads(solution_json))
+            parent_id, score, source_id = json.loads(entry)
+            records.append((solution_id, parent_id, score, source_id))
+        return records
+
+    def _load_lineage_steps(self) -> Generator:
+        """
+        Build a lineage index from the lineage hash, backfilling it if short.
+
+        Returns:
+            tuple: The index and the changelog version it was built at.
+        """
+
+        # Changes made during the scan are replayed, re-adding a solution is a no-op
+        def queue_sizes(pipe):
+            pipe.get(self._cache.version_key)
+            pipe.hlen(self.lineage_key)
+            pipe.hlen(self.solutions_key)
+
+        version, lineage_len, solutions_len = yield queue_sizes
+        if lineage_len < solutions_len:
+            cursor = 0
+            while True:
+                cursor, batch = yield from self._hscan_step(
+                    self.solutions_key, cursor, DEFAULT_BATCH_SIZE
+                )
+                if batch:
+                    entries = {
+                        sid: _lineage_entry(sid, json.loads(solution_json))
+                        for sid, solution_json in batch
+                    }
+                    yield lambda pipe: pipe.hset(self.lineage_key, mapping=entries)
+                if not cursor:
+                    break
 
-    def _reconstruct_islands(self, saved_islands: list[list[str]]) -> None:
+        records = []
+        cursor = 0
+        while True:
+            cursor, batch = yield from self._hscan_step(
+                self.lineage_key, cursor, DEFAULT_BATCH_SIZE
+            )
+            for solution_id, entry in batch:
+                parent_id, score, source_id = json.loads(entry)
+                records.append((solution_id, parent_id, score, source_id))
+            if not cursor:
+                break
+        return LineageIndex.build(records), int(version or 0)
+
+    def _reconstruct_islands_steps(self, saved_islands: list[list[str]]) -> Generator:
         """
         Reconstruct island assignments from saved metadata
 
@@ -813,13 +1867,16 @@ class RedisMemory(EvolveMemory):
         islands = [set() for _ in range(num_islands)]
         missing_solutions = []
 
-        populations_raw = self.redis.hgetall(self.populations_key)
-        populations = {}
-        for key, values in populations_raw.items():
-            key_str = key.decode("utf-8")
-            value_str = values.decode("utf-8")
-            population = Solution.from_dict(json.loads(value_str))
-            populations[key_str] = population
+        # Only the ids are needed, do not fetch the solutions themselves.
+        def queue_ids(pipe):
+            pipe.hkeys(self.populations_key)
+            pipe.smembers(self.elites_key)
+            pipe.hget(self.metadata_key, "best_solution_id")
+            for i in range(num_islands):
+                pipe.hgetall(f"{self.island_feature_maps_key}:{i}")
+
+        population_ids, elites, best_solution_id, *feature_maps = yield queue_ids
+        populations = {_decode(key) for key in population_ids}
 
         # Restore island assignments
         for island_idx, solution_ids in enumerate(saved_islands):
@@ -829,134 +1886,135 @@ class RedisMemory(EvolveMemory):
             for solution_id in solution_ids:
                 if solution_id in populations:
                     # Solution exists, add to island
-                    island_key = f"{self.islands_key}:{island_idx}"
-                    self.redis.sadd(island_key, solution_id)
                     islands[island_idx].add(solution_id)
                 else:
                     # Solution missing, track it
                     missing_solutions.append((island_idx, solution_id))
 
         # Clean up archive - remove missing solutions
-        elites = self.redis.smembers(self.elites_key)
-        for sid in elites:
-            if sid not in populations:
-                self.redis.srem(self.elites_key, sid)
+        stale_elites = [sid for sid in elites if _decode(sid) not in populations]
 
         # Clean up island_feature_maps - remove missing programs
         feature_keys_to_remove = []
-        for i in range(num_islands):
+        for i, feature_map in enumerate(feature_maps):
             island_feature_map_key = f"{self.island_feature_maps_key}:{i}"
-            feature_map = self.redis.hgetall(island_feature_map_key)
             for feature_key_raw, solution_id_raw in feature_map.items():
-                feature_key = (
-                    feature_key_raw.decode("utf-8")
-                    if isinstance(feature_key_raw, bytes)
-                    else feature_key_raw
-                )
-                solution_id = (
-                    solution_id_raw.decode("utf-8")
-                    if isinstance(solution_id_raw, bytes)
-                    else solution_id_raw
-                )
-                if solution_id not in populations:
-                    feature_keys_to_remove.append((island_feature_map_key, feature_key))
-                    self.redis.hdel(island_feature_map_key, feature_key)
-
-        # Clean up island the best solutions - remove stale references
-        self._cleanup_stale_island_bests()
+                if _decode(solution_id_raw) not in populations:
+                    feature_keys_to_remove.append(
+                        (island_feature_map_key, _decode(feature_key_raw))
+                    )
 
         # Check best solution
-        best_solution_id = self.redis.hget(self.metadata_key, "best_solution_id")
         if best_solution_id:
             best_solution_id = best_solution_id.decode("utf-8")
-        if best_solution_id and best_solution_id not in populations:
+        clear_best = bool(best_solution_id) and best_solution_id not in populations
+        if clear_best:
             logger.warning(
                 f"Best solution {best_solution_id} not found, will recalculate"
             )
-            self.redis.hset(self.metadata_key, "best_solution_id", "")
+
+        def queue_cleanup(pipe):
+            for island_idx, island in enumerate(islands):
+                if island:
+                    pipe.sadd(f"{self.islands_key}:{island_idx}", *island)
+            if stale_elites:
+                pipe.srem(self.elites_key, *stale_elites)
+            for island_feature_map_key, feature_key in feature_keys_to_remove:
+                pipe.hdel(island_feature_map_key, feature_key)
+            if clear_best:
+                pipe.hset(self.metadata_key, "best_solution_id", "")
+
+        yield queue_cleanup
+
+        # Clean up island the best solutions - remove stale references
+        yield from self._cleanup_stale_island_bests_steps()
 
         # If we have solutions but no island assignments, distribute them
         if populations and sum(len(island) for island in islands) == 0:
             logger.info(
                 "No island assignments found, distributing programs across islands"
             )
-            solution_ids = list(populations.keys())
-            for i, solution_id in enumerate(solution_ids):
-                island_idx = i % len(islands)
-                island_key = f"{self.islands_key}:{island_idx}"
-                self.redis.sadd(island_key, solution_id)
-
-    def _get_current_island(self) -> int:
-        """Get current island ID from Redis"""
-        return int(
-            self.redis.hget(self.metadata_key, "current_island").decode("utf-8") or 0
-        )
 
-    def _prepare_solution(self, solution: Solution) -> None:
+            def queue_distribution(pipe):
+                for i, solution_id in enumerate(populations):
+                    island_idx = i % len(islands)
+                    island_key = f"{self.islands_key}:{island_idx}"
+                    pipe.sadd(island_key, solution_id)
+
+            yield queue_distribution
+
+    def _prepare_solution_steps(self, solution: Solution) -> Generator:
         """Prepare solution for addition"""
-        with self._lock:
-            last_iteration = int(
-                self.redis.hget(self.metadata_key, "last_iteration").decode("utf-8"), 0
+
+        def queue_metadata(pipe):
+            pipe.hget(self.metadata_key, "last_iteration")
+            pipe.hget(self.metadata_key, "current_island")
+            pipe.hget(self.metadata_key, "current_island_counter")
+            pipe.hget(self.metadata_key, "solutions_per_island")
+            for i in range(self.num_islands):
+                pipe.scard(f"{self.islands_key}:{i}")
+
+        (
+            last_iteration,
+            current_island,
+            current_island_counter,
+            solutions_per_island,
+            *island_sizes,
+        ) = yield queue_metadata
+        last_iteration = int(last_iteration.decode("utf-8"), 0)
+        if not solution.iteration:
+            (last_iteration,) = yield lambda pipe: pipe.hincrby(
+                self.metadata_key, "last_iteration", 1
             )
-            if not solution.iteration:
-                last_iteration = self.redis.hincrby(
-                    self.metadata_key, "last_iteration", 1
-                )
-                solution.iteration = last_iteration
+            solution.iteration = last_iteration
 
-            last_iteration = max(last_iteration, solution.iteration)
-            self.redis.hset(self.metadata_key, "last_iteration", last_iteration)
+        last_iteration = max(last_iteration, solution.iteration)
+        yield lambda pipe: pipe.hset(
+            self.metadata_key, "last_iteration", last_iteration
+        )
 
-            if not solution.solution_id:
-                solution.solution_id = uuid.uuid4().hex[:8]
+        if not solution.solution_id:
+            solution.solution_id = uuid.uuid4().hex[:8]
 
-            # if island_id already set, respect it
-            if solution.island_id:
-                return
+        # if island_id already set, respect it
+        if solution.island_id:
+            return
 
-            # Assign to island with no programs first
-            island_without_program = []
-            for i in range(self.num_islands):
-                island_key = f"{self.islands_key}:{i}"
-                if self.redis.scard(island_key) == 0:
-                    island_without_program.append(i)
+        # Assign to island with no programs first
+        island_without_program = [
+            i for i, size in enumerate(island_sizes) if size == 0
+        ]
 
-            if island_without_program:
-                solution.island_id = min(island_without_program)
-                return
+        if island_without_program:
+            solution.island_id = min(island_without_program)
+            return
 
-            # If parent solution exists, inherit island and increment generation
-            parent_solution_obj = self.redis.hget(
-                self.solutions_key, solution.parent_id
-            )
-            if parent_solution_obj:
-                parent_solution = Solution.from_dict(json.loads(parent_solution_obj))
-                solution.generation = parent_solution.generation + 1
-                solution.island_id = parent_solution.island_id
-                return
-
-            # Finally, Round-robin assignment
-            current_island = self._get_current_island()
-            solution.island_id = current_island
-            current_island_counter = int(
-                self.redis.hget(self.metadata_key, "current_island_counter").decode(
-                    "utf-8"
-                )
-                or 0
-            )
-            solutions_per_island = int(
-                self.redis.hget(self.metadata_key, "solutions_per_island").decode(
-                    "utf-8"
-                )
-                or 1
-            )
-            if current_island_counter >= solutions_per_island:
-                # Move to next island
-                new_island = (current_island + 1) % self.num_islands
-                self.redis.hset(self.metadata_key, "current_island", new_island)
-                self.redis.hset(self.metadata_key, "current_island_counter", 0)
+        # If parent solution exists, inherit island and increment generation
+        (parent_solution_obj,) = yield lambda pipe: pipe.hget(
+            self.solutions_key, solution.parent_id
+        )
+        if parent_solution_obj:
+            parent_solution = Solution.from_json(parent_solution_obj)
+            solution.generation = parent_solution.generation + 1
+            solution.island_id = parent_solution.island_id
+            return
+
+        # Finally, Round-robin assignment
+        current_island = int(current_island.decode("utf-8") or 0)
+        solution.island_id = current_island
+        current_island_counter = int(current_island_counter.decode("utf-8") or 0)
+        solutions_per_island = int(solutions_per_island.decode("utf-8") or 1)
+        if current_island_counter >= solutions_per_island:
+            # Move to next island
+            new_island = (current_island + 1) % self.num_islands
+
+            def queue_next_island(pipe):
+                pipe.hset(self.metadata_key, "current_island", new_island)
+                pipe.hset(self.metadata_key, "current_island_counter", 0)
+
+            yield queue_next_island
 
-    def _calculate_MAP_Elites(self, solution: Solution) -> str:
+    def _calculate_MAP_Elites_steps(self, solution: Solution) -> Generator:
         """
         Adapted from algorithmicsuperintelligence/openevolve (Apache-2.0 License)
         Original source: https://github.com/algorithmicsuperintelligence/openevolve/blob/a7428efeb5a30b7968975f182d5fb7060b36e978/openevolve/database.py#L221
@@ -966,44 +2024,57 @@ class RedisMemory(EvolveMemory):
         Args:
             solution: The solution to add to the MAP-Elites grid
         """
-        with self.redis.pipeline() as pipe:
-            # 1. Batch read existing data
+
+        # 1. Batch read existing data
+        def queue_reads(pipe):
             pipe.hgetall(self.populations_key)
             pipe.hgetall(self.feature_stats_key)
             pipe.hgetall(self.diversity_cache_key)
             pipe.lrange(self.diversity_reference_set_key, 0, -1)
-            populations_raw, feature_stats, diversity_cache, diversity_reference_set = (
-                pipe.execute()
-            )
-            populations = {
-                key.decode("utf-8"): Solution.from_dict(
-                    json.loads(value.decode("utf-8"))
-                )
-                for key, value in populations_raw.items()
-            }
 
-            # Repair the diversity_reference_set data type conversion issue
-            if diversity_reference_set:
-                diversity_reference_set = [
-                    ref.decode("utf-8") if isinstance(ref, bytes) else str(ref)
-                    for ref in diversity_reference_set
-                ]
-            else:
-                diversity_reference_set = []
-
-            # 2. Calculate new feature coords and diversity reference set
-            feature_coords, diversity_reference_set = self._calculate_feature_coords(
-                solution,
-                populations,
-                feature_stats,
-                self.feature_bins_per_dim,
-                self.feature_bins,
-                self.feature_dimensions,
-                diversity_cache,
-                diversity_reference_set,
-            )
+        (
+            populations_raw,
+            feature_stats,
+            diversity_cache,
+            diversity_reference_set,
+        ) = yield queue_reads
+        populations = {
+            key.decode("utf-8"): Solution.from_json(value)
+            for key, value in populations_raw.items()
+        }
+
+        # Repair the diversity_reference_set data type conversion issue
+        if diversity_reference_set:
+            diversity_reference_set = [
+                ref.decode("utf-8") if isinstance(ref, bytes) else str(ref)
+                for ref in diversity_reference_set
+            ]
+        else:
+            diversity_reference_set = []
+
+        # 2. Calculate new feature coords and diversity reference set
+        feature_coords, diversity_reference_set = self._calculate_feature_coords(
+            solution,
+            populations,
+            feature_stats,
+            self.feature_bins_per_dim,
+            self.feature_bins,
+            self.feature_dimensions,
+            diversity_cache,
+            diversity_reference_set,
+        )
+
+        logger.debug(
+            "Calculated feature coords for %s: %s",
+            solution.solution_id[:6],
+            feature_coords,
+        )
+
+        feature_key = self._feature_coords_to_key(feature_coords)
+        island_feature_maps_key = f"{self.island_feature_maps_key}:{solution.island_id}"
 
-            # 3. Batch write updated data
+        # 3. Batch write updated data, reading the feature map cell on the way
+        def queue_writes(pipe):
             if feature_stats:
                 for k, v in feature_stats.items():
                     if isinstance(v, (dict, list)):
@@ -1018,25 +2089,13 @@ class RedisMemory(EvolveMemory):
                     else:
                         pipe.hset(self.diversity_cache_key, k, str(v))
             if diversity_reference_set:  # Update diversity reference set
-                pipe.eval(
-                    update_list_lua_script,
-                    1,
-                    self.diversity_reference_set_key,
-                    *diversity_reference_set,
-                )
-
-            pipe.execute()
+                pipe.delete(self.diversity_reference_set_key)
+                pipe.rpush(self.diversity_reference_set_key, *diversity_reference_set)
+            pipe.hget(island_feature_maps_key, feature_key)
 
-        logger.debug(
-            "Calculated feature coords for %s: %s",
-            solution.solution_id[:6],
-            feature_coords,
-        )
+        *_, existing_solution_id = yield queue_writes
 
         # Add to feature map (replacing existing if better)
-        feature_key = self._feature_coords_to_key(feature_coords)
-        island_feature_maps_key = f"{self.island_feature_maps_key}:{solution.island_id}"
-        existing_solution_id = self.redis.hget(island_feature_maps_key, feature_key)
         should_replace = existing_solution_id is None
 
         logger.debug(
@@ -1066,13 +2125,15 @@ class RedisMemory(EvolveMemory):
                 logger.info("New MAP-Elites cell occupied: %s", feature_coords)
                 # Check coverage milestone
                 total_possible_cells = self.feature_bins ** len(self.feature_dimensions)
-                feature_map_len = self.redis.hlen(island_feature_maps_key)
+                (feature_map_len,) = yield lambda pipe: pipe.hlen(
+                    island_feature_maps_key
+                )
                 coverage = (feature_map_len + 1) / total_possible_cells
                 if coverage in [0.1, 0.25, 0.5, 0.75, 0.9]:
                     logger.info(
                         "MAP-Elites coverage reached %.1f%% (%d/%d cells)",
                         coverage * 100,
-                        self.redis.hlen(island_feature_maps_key) + 1,
+                        feature_map_len + 1,
                         total_possible_cells,
                     )
             else:
@@ -1089,14 +2150,21 @@ class RedisMemory(EvolveMemory):
                     )
 
                     # use MAP-Elites to manage archive
-                    if existing_solution_id in self.redis.smembers(self.elites_key):
-                        self.redis.srem(self.elites_key, existing_solution_id)
-                        self.redis.sadd(self.elites_key, solution.solution_id)
+                    (elites,) = yield lambda pipe: pipe.smembers(self.elites_key)
+                    if existing_solution_id in elites:
+
+                        def queue_elite_swap(pipe):
+                            pipe.srem(self.elites_key, existing_solution_id)
+                            pipe.sadd(self.elites_key, solution.solution_id)
+
+                        yield queue_elite_swap
 
-            self.redis.hset(island_feature_maps_key, feature_key, solution.solution_id)
+            yield lambda pipe: pipe.hset(
+                island_feature_maps_key, feature_key, solution.solution_id
+            )
         return json.dumps(feature_coords)
 
-    def _update_island(self, solution: Solution) -> None:
+    def _update_island_steps(self, solution: Solution) -> Generator:
         """
         Update the island of the given solution based on its island_id.
 
@@ -1104,16 +2172,19 @@ class RedisMemory(EvolveMemory):
             solution: Solution to update island for.
         """
         island_id = solution.island_id
+        island_key = f"{self.islands_key}:{island_id}"
+
+        def queue_island(pipe):
+            pipe.sadd(island_key, solution.solution_id)
+            self._index_scores(pipe, solution, island_id)
 
-        with self._island_locks[island_id]:
-            island_key = f"{self.islands_key}:{island_id}"
-            self.redis.sadd(island_key, solution.solution_id)
+        yield queue_island
 
         logger.debug(
             f"Solution {solution.solution_id} assigned to island {solution.island_id}"
         )
 
-    def _update_elites(self, solution: Solution) -> None:
+    def _update_elites_steps(self, solution: Solution) -> Generator:
         """
         Update the elite archive with the new solution. Only better programs are added.
 
@@ -1121,32 +2192,39 @@ class RedisMemory(EvolveMemory):
             solution: Solution to consider for elite archive.
         """
         # If elites not full, add program
-        if self.redis.scard(self.elites_key) < self.elite_archive_size:
-            self.redis.sadd(self.elites_key, solution.solution_id)
+        (elites_len,) = yield lambda pipe: pipe.scard(self.elites_key)
+        if elites_len < self.elite_archive_size:
+            yield lambda pipe: pipe.sadd(self.elites_key, solution.solution_id)
             return
 
         # Clean up stale references and get valid archive programs
         valid_elites_solutions = []
         stale_ids = []
 
-        populations = self.redis.hgetall(self.populations_key)
-        for pid in self.redis.smembers(self.elites_key):
+        def queue_elites(pipe):
+            pipe.hgetall(self.populations_key)
+            pipe.smembers(self.elites_key)
+
+        populations, elites = yield queue_elites
+        for pid in elites:
             if pid in populations:
-                valid_solution = Solution.from_dict(
-                    json.loads(populations[pid].decode("utf-8"))
-                )
+                valid_solution = Solution.from_json(populations[pid])
                 valid_elites_solutions.append(valid_solution)
             else:
                 stale_ids.append(pid)
 
         # Remove stale references from archive
-        for stale_id in stale_ids:
-            self.redis.srem(self.elites_key, stale_id)
-            logger.debug(f"Removing stale solution {stale_id} from elites")
+        def queue_cleanup(pipe):
+            for stale_id in stale_ids:
+                pipe.srem(self.elites_key, stale_id)
+                logger.debug(f"Removing stale solution {stale_id} from elites")
+            pipe.scard(self.elites_key)
+
+        *_, elites_len = yield queue_cleanup
 
         # If archive is now not full after cleanup, just add the new program
-        if self.redis.scard(self.elites_key) < self.elite_archive_size:
-            self.redis.sadd(self.elites_key, solution.solution_id)
+        if elites_len < self.elite_archive_size:
+            yield lambda pipe: pipe.sadd(self.elites_key, solution.solution_id)
             return
 
         # Find worst program among valid programs
@@ -1155,74 +2233,87 @@ class RedisMemory(EvolveMemory):
 
             # Replace if new program is better
             if self._is_better(solution, worst_solution):
-                self.redis.srem(self.elites_key, worst_solution.solution_id)
-                self.redis.sadd(self.elites_key, solution.solution_id)
+
+                def queue_replace(pipe):
+                    pipe.srem(self.elites_key, worst_solution.solution_id)
+                    pipe.sadd(self.elites_key, solution.solution_id)
+
+                yield queue_replace
         else:
             # No valid programs in archive, just add the new one
-            self.redis.sadd(self.elites_key, solution.solution_id)
+            yield lambda pipe: pipe.sadd(self.elites_key, solution.solution_id)
 
     def _enforce_population_limit(self, exclude_solution_id: str = None) -> None:
+        """Enforce the population size limit, blocking the calling thread."""
+        with self._lock:
+            self._run_steps(self._enforce_population_limit_steps(exclude_solution_id))
+
+    def _enforce_population_limit_steps(
+        self, exclude_solution_id: str = None
+    ) -> Generator:
         """
         Enforce population size limit by removing the worst solutions using heap.
 
         Args:
             exclude_solution_id: Solution ID to protect from removal
         """
-        population_len = self.redis.hlen(self.populations_key)
+        (population_len,) = yield lambda pipe: pipe.hlen(self.populations_key)
         if population_len <= self.population_size:
             return
 
         num_to_remove = population_len - self.population_size
         logger.debug(f"Removing {num_to_remove} solutions to enforce population limit")
 
-        protected_ids = {
-            self.redis.hget(self.metadata_key, "best_solution_id"),
-            exclude_solution_id,
-        } - {None}
+        def queue_reads(pipe):
+            pipe.hget(self.metadata_key, "best_solution_id")
+            pipe.hgetall(self.populations_key)
+            for island_idx in range(self.num_islands):
+                pipe.hgetall(f"{self.island_feature_maps_key}:{island_idx}")
+
+        best_solution_id, populations, *island_maps = yield queue_reads
+        protected_ids = {best_solution_id, exclude_solution_id} - {None}
 
         # Sort solutions by score (ascending) to remove the worst ones first
-        populations = self.redis.hgetall(self.populations_key)
         solutions = [
-            Solution.from_dict(json.loads(s.decode("utf-8")))
-            for s in populations.values()
-            if Solution.from_dict(json.loads(s.decode("utf-8"))).solution_id
-            not in protected_ids
+            solution
+            for solution in map(Solution.from_json, populations.values())
+            if solution.solution_id not in protected_ids
         ]
         solutions_sorted = sorted(solutions, key=lambda s: s.score)
         solution_ids_to_remove = {
             s.solution_id for s in solutions_sorted[:num_to_remove]
         }
 
-        with self._lock:
+        def queue_removal(pipe):
             for sid in solution_ids_to_remove:
-                self.redis.hdel(self.populations_key, sid)
+                pipe.hdel(self.populations_key, sid)
 
             # Remove from feature map
-            for island_idx in range(self.num_islands):
+            for island_idx, island_map in enumerate(island_maps):
                 island_map_key = f"{self.island_feature_maps_key}:{island_idx}"
-                island_map = self.redis.hgetall(island_map_key)
-                keys_to_remove = [
-                    key
-                    for key, sid in island_map.items()
-                    if sid in solution_ids_to_remove
-                ]
-                for key in keys_to_remove:
-                    self.redis.hdel(island_map_key, key)
+                for key, sid in island_map.items():
+                    if sid in solution_ids_to_remove:
+                        pipe.hdel(island_map_key, key)
 
             # Remove from islands and elites using set difference
             for sid in solution_ids_to_remove:
                 for i in range(self.num_islands):
                     island_key = f"{self.islands_key}:{i}"
-                    self.redis.srem(island_key, sid)
+                    pipe.srem(island_key, sid)
+
+                pipe.srem(self.elites_key, sid)
 
-                self.redis.srem(self.elites_key, sid)
+            for solution in solutions_sorted[:num_to_remove]:
+                self._index_scores(pipe, solution, solution.island_id, -1)
+
+        yield queue_removal
 
         logger.debug(f"Removed solutions: {sorted(solution_ids_to_remove)[:5]}...")
 
         # Clean up stale references
-        self._cleanup_stale_island_bests()
+        yield from self._cleanup_stale_island_bests_steps()
 
-    def _cleanup_stale_island_bests(self) -> None:
+    def _cleanup_stale_island_bests_steps(self) -> Generator:
         """
         Remove stale island best solution references
 
@@ -1231,65 +2322,79 @@ class RedisMemory(EvolveMemory):
         """
         cleaned_count = 0
 
-        island_best_solution: list[str] = [
-            self.redis.hget(f"{self.islands_key}:{i}:best", "best_solution_id")
-            for i in range(self.num_islands)
-        ]
+        def queue_bests(pipe):
+            for i in range(self.num_islands):
+                pipe.hget(f"{self.islands_key}:{i}:best", "best_solution_id")
+
+        island_best_solution: list[str] = yield queue_bests
 
+        def queue_checks(pipe):
+            for i, best_id in enumerate(island_best_solution):
+                if best_id is not None:
+                    pipe.hexists(self.populations_key, best_id)
+                    pipe.smembers(f"{self.islands_key}:{i}")
+
+        checks = iter((yield queue_checks))
+        cleared = []
         for i, best_id in enumerate(island_best_solution):
             if best_id is not None:
                 should_clear = False
+                exists, island_members = next(checks), next(checks)
 
                 # Check if program still exists
-                if best_id not in self.redis.hgetall(self.populations_key):
+                if not exists:
                     logger.debug(
                         f"Clearing stale island {i} best solution {best_id} (solution deleted)"
                     )
                     should_clear = True
                 # Check if program still exists in island
-                elif best_id not in self.redis.smembers(f"{self.islands_key}:{i}"):
+                elif best_id not in island_members:
                     logger.debug(
                         f"Clearing stale island {i} best solution {best_id} (not in island)"
                     )
                     should_clear = True
 
                 if should_clear:
-                    self.redis.hset(
-                        f"{self.islands_key}:{i}:best",
-                        "best_solution_id",
-                        "",
-                    )
+                    cleared.append(i)
                     cleaned_count += 1
 
         if cleaned_count > 0:
+
+            def queue_clear(pipe):
+                for i in cleared:
+                    pipe.hset(f"{self.islands_key}:{i}:best", "best_solution_id", "")
+
+            yield queue_clear
+
             logger.info(
                 f"Cleaned up {cleaned_count} stale island best solution references"
             )
 
             # Recalculate best programs for islands that were cleared
-            island_best_solution = [
-                self.redis.hget(f"{self.islands_key}:{i}:best", "best_solution_id")
-                for i in range(self.num_islands)
-            ]
+            def queue_islands(pipe):
+                for i in range(self.num_islands):
+                    pipe.hget(f"{self.islands_key}:{i}:best", "best_solution_id")
+                    pipe.smembers(f"{self.islands_key}:{i}")
+
+            replies = yield queue_islands
+            island_best_solution = replies[0::2]
+            island_members = replies[1::2]
 
             for i, best_id in enumerate(island_best_solution):
-                if best_id is None and self.redis.scard(f"{self.islands_key}:{i}") > 0:
+                if best_id is None and island_members[i]:
                     # Find new best program for this island
-                    island_solutions = [
-                        Solution.from_dict(
-                            json.loads(
-                                self.redis.hget(self.populations_key, v).decode("utf-8")
-                            )
-                        )
-                        for v in self.redis.smembers(f"{self.islands_key}:{i}")
-                    ]
+                    members = list(island_members[i])
+                    (values,) = yield lambda pipe: pipe.hmget(
+                        self.populations_key, members
+                    )
+                    island_solutions = [Solution.from_json(v) for v in values]
                     if island_solutions:
                         # Sort by fitness and update
                         best_solution = max(
                             island_solutions,
                             key=lambda s: s.score,
                         )
-                        self.redis.hset(
+                        yield lambda pipe: pipe.hset(
                             f"{self.islands_key}:{i}:best",
                             "best_solution_id",
                             best_solution.solution_id,
@@ -1298,32 +2403,40 @@ class RedisMemory(EvolveMemory):
                             f"Recalculated island {i} best solution: {best_solution.solution_id}"
                         )
 
-    def _update_best_solution(self, solution: Solution) -> None:
+    def _update_best_solution_steps(self, solution: Solution) -> Generator:
         """
         Update the best solution tracking
 
         Args:
             solution: The solution to consider as best
         """
-        best_sid = self.redis.hget(self.metadata_key, "best_solution_id")
+
+        def queue_best(pipe):
+            pipe.hget(self.metadata_key, "best_solution_id")
+            pipe.hgetall(self.populations_key)
+
+        best_sid, populations = yield queue_best
         if best_sid is None:
-            self.redis.hset(self.metadata_key, "best_solution_id", solution.solution_id)
+            yield lambda pipe: pipe.hset(
+                self.metadata_key, "best_solution_id", solution.solution_id
+            )
             logger.debug(f"Set initial best solution to {solution.solution_id}")
             return
 
         # Check if previous best exists
-        populations = self.redis.hgetall(self.populations_key)
         if best_sid not in populations:
             logger.debug(f"Previous best solution {best_sid} no longer exists")
-            self.redis.hset(self.metadata_key, "best_solution_id", solution.solution_id)
+            yield lambda pipe: pipe.hset(
+                self.metadata_key, "best_solution_id", solution.solution_id
+            )
             return
 
-        current_best = Solution.from_dict(
-            json.loads(populations[best_sid].decode("utf-8"))
-        )
+        current_best = Solution.from_json(populations[best_sid])
         if self._is_better(solution, current_best):
             old_id = best_sid.decode("utf-8")
-            self.redis.hset(self.metadata_key, "best_solution_id", solution.solution_id)
+            yield lambda pipe: pipe.hset(
+                self.metadata_key, "best_solution_id", solution.solution_id
+            )
 
             if solution.score is not None and current_best.score is not None:
                 logger.info(  # Changed from debug to info for important events
@@ -1331,7 +2444,9 @@ class RedisMemory(EvolveMemory):
                     f"(score: {current_best.score:.4f} → {solution.score:.4f})"
                 )
 
-    def _update_island_best_solution(self, solution: Solution, island_id: int) -> None:
+    def _update_island_best_solution_steps(
+        self, solution: Solution, island_id: int
+    ) -> Generator:
         """
         Update island's best solution tracking
 
@@ -1344,38 +2459,46 @@ class RedisMemory(EvolveMemory):
             return
 
         best_key = f"{self.islands_key}:{island_id}:best"
-        best_sid = self.redis.hget(best_key, "best_solution_id")
+
+        def queue_best(pipe):
+            pipe.hget(best_key, "best_solution_id")
+            pipe.hgetall(self.populations_key)
+
+        best_sid, populations = yield queue_best
 
         if best_sid is None:
             # If no best solution exists, set this one as best
             logger.info(  # Changed from debug to info for important events
                 f"Set initial island {island_id} best solution to {solution.solution_id}"
             )
-            self.redis.hset(best_key, "best_solution_id", solution.solution_id)
+            yield lambda pipe: pipe.hset(
+                best_key, "best_solution_id", solution.solution_id
+            )
             return
 
         # Check if previous best exists
-        populations = self.redis.hgetall(self.populations_key)
         if best_sid not in populations:
             logger.info(  # Changed from debug to info for important events
                 f"Previous island {island_id} best solution {best_sid} no longer exists"
             )
-            self.redis.hset(best_key, "best_solution_id", solution.solution_id)
+            yield lambda pipe: pipe.hset(
+                best_key, "best_solution_id", solution.solution_id
+            )
             return
 
-        current_best = Solution.from_dict(
-            json.loads(populations[best_sid].decode("utf-8"))
-        )
+        current_best = Solution.from_json(populations[best_sid])
         if self._is_better(solution, current_best):
             old_id = best_sid.decode("utf-8")
-            self.redis.hset(best_key, "best_solution_id", solution.solution_id)
+            yield lambda pipe: pipe.hset(
+                best_key, "best_solution_id", solution.solution_id
+            )
             if solution.score is not None and current_best.score is not None:
                 logger.info(  # Changed from debug to info for important events
                     f"New island {island_id} best solution {solution.solution_id} replaces {old_id} "
                     f"(score: {current_best.score:.4f} → {solution.score:.4f})"
                 )
 
-    async def _check_migration(self) -> None:
+    def _check_migration_steps(self) -> Generator:
         """
         Adapted from algorithmicsuperintelligence/openevolve (Apache-2.0 License)
         Original source: https://github.com/algorithmicsuperintelligence/openevolve/blob/a7428efeb5a30b7968975f182d5fb7060b36e978/openevolve/database.py#L1755
@@ -1385,18 +2508,14 @@ class RedisMemory(EvolveMemory):
         should_migrate = False
 
         # Get current generation from Redis
-        max_island_capacity = max(
-            [
-                self.redis.scard(f"{self.islands_key}:{i}")
-                for i in range(self.num_islands)
-            ]
-        )
-        last_migration = int(
-            self.redis.hget(self.metadata_key, "last_migration_generation").decode(
-                "utf-8"
-            )
-            or 0
-        )
+        def queue_generation(pipe):
+            for i in range(self.num_islands):
+                pipe.scard(f"{self.islands_key}:{i}")
+            pipe.hget(self.metadata_key, "last_migration_generation")
+
+        *island_sizes, last_migration = yield queue_generation
+        max_island_capacity = max(island_sizes)
+        last_migration = int(last_migration.decode("utf-8") or 0)
 
         # Check if should migrate based on interval or high variance
         if max_island_capacity - last_migration >= self.migration_interval:
@@ -1409,15 +2528,15 @@ class RedisMemory(EvolveMemory):
 
         for src_island in range(self.num_islands):
             island_key = f"{self.islands_key}:{src_island}"
-            solution_ids = list(self.redis.smembers(island_key))
+            (solution_ids,) = yield lambda pipe: pipe.smembers(island_key)
+            solution_ids = list(solution_ids)
             if not solution_ids:
                 continue
 
-            island_solutions = [
-                Solution.from_dict(json.loads(s.decode("utf-8")))
-                for s in self.redis.hmget(self.populations_key, solution_ids)
-                if s
-            ]
+            (values,) = yield lambda pipe: pipe.hmget(
+                self.populations_key, solution_ids
+            )
+            island_solutions = [Solution.from_json(s) for s in values if s]
 
             if not island_solutions:
                 continue
@@ -1437,15 +2556,14 @@ class RedisMemory(EvolveMemory):
                     continue
                 for target_island in taget_islands:
                     target_island_key = f"{self.islands_key}:{target_island}"
-                    target_island_solutions_ids = list(
-                        self.redis.smembers(target_island_key)
+                    (target_island_solutions_ids,) = yield lambda pipe: pipe.smembers(
+                        target_island_key
                     )
-                    target_island_solutions = [
-                        Solution.from_dict(json.loads(s.decode("utf-8")))
-                        for s in self.redis.hmget(
-                            self.populations_key, target_island_solutions_ids
-                        )
-                    ]
+                    target_island_solutions_ids = list(target_island_solutions_ids)
+                    (values,) = yield lambda pipe: pipe.hmget(
+                        self.populations_key, target_island_solutions_ids
+                    )
+                    target_island_solutions = [Solution.from_json(s) for s in values]
                     has_duplicate_code = any(
                         s.solution == migrant.solution for s in target_island_solutions
                     )
@@ -1469,20 +2587,38 @@ class RedisMemory(EvolveMemory):
                         evaluation=migrant.evaluation,
                         metadata={**migrant.metadata, "migrated": True},
                     )
-                    migrant_copy_json = json.dumps(migrant_copy.to_dict())
-                    self.redis.hset(
-                        self.populations_key,
-                        migrant_copy.solution_id,
-                        migrant_copy_json,
-                    )
-                    self.redis.hset(
-                        self.solutions_key, migrant_copy.solution_id, migrant_copy_json
+                    migrant_copy_json = migrant_copy.to_json()
+
+                    def queue_migrant(pipe):
+                        pipe.multi()
+                        pipe.hset(
+                            self.populations_key,
+                            migrant_copy.solution_id,
+                            migrant_copy_json,
+                        )
+                        pipe.hset(
+                            self.solutions_key,
+                            migrant_copy.solution_id,
+                            migrant_copy_json,
+                        )
+                        pipe.hset(
+                            self.lineage_key,
+                            migrant_copy.solution_id,
+                            json.dumps(
+                                [migrant.parent_id, migrant.score, migrant.solution_id]
+                            ),
+                        )
+                        self._cache.publish([migrant_copy.solution_id], pipe)
+                        pipe.sadd(target_island_key, migrant_copy.solution_id)
+                        self._index_scores(pipe, migrant_copy, target_island)
+
+                    yield queue_migrant
+                    yield from self._update_island_best_solution_steps(
+                        migrant_copy, target_island
                     )
-                    self.redis.sadd(target_island_key, migrant_copy.solution_id)
-                    self._update_island_best_solution(migrant_copy, target_island)
 
         # Update last migration generation
-        self.redis.hset(
+        yield lambda pipe: pipe.hset(
             self.metadata_key, "last_migration_generation", max_island_capacity
         )
 
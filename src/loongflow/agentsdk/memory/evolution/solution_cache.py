@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This file provides the client-side solution cache of the redis evolution memory.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+
+from .base_memory import Solution
+
+# Changelog entry asking every cache to drop everything, e.g. after a checkpoint load.
+INVALIDATE_ALL = "*"
+# Number of latest changelog entries kept in Redis.
+CHANGELOG_WINDOW = 10000
+
+
+class SolutionCache:
+    """
+    Read-through cache of deserialized solutions and derived views of a RedisMemory.
+
+    Solutions are kept in an LRU keyed by solution id, views (population, islands,
+    elites) are kept until the memory changes. Coherence between processes sharing
+    one Redis relies on a changelog list: every write appends the ids it touched
+    and counts them in the ``:version`` key, the version of the memory, while the
+    list is trimmed to its latest ``changelog_window`` entries. Before serving a
+    read the cache fetches the version and the entries appended since its own
+    version, in one round trip for up to one change and two otherwise, evicts the
+    listed solutions and drops the views when anything changed. A cache further
+    behind than the window drops everything.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        changelog_key: str,
+        max_solutions: int = 10000,
+        changelog_window: int = CHANGELOG_WINDOW,
+    ):
+        """
+        Args:
+            redis (Redis): Client of the memory.
+            changelog_key (str): Key of the changelog list of the memory.
+            max_solutions (int): Maximum number of solutions kept in the LRU.
+            changelog_window (int): Number of latest changelog entries kept.
+        """
+        self.redis = redis
+        self.changelog_key = changelog_key
+        self.version_key = f"{changelog_key}:version"
+        self.max_solutions = max_solutions
+        self.changelog_window = changelog_window
+
+        self._lock = threading.Lock()
+        self._version = 0
+        self._solutions: "OrderedDict[str, Solution]" = OrderedDict()
+        self._views: Dict[Hashable, Any] = {}
+        self._stats = _empty_stats()
+
+    def publish(self, solution_ids: Iterable[str], pipe=None) -> None:
+        """
+        Append changed solution ids to the changelog.
+
+        Args:
+            solution_ids (Iterable[str]): Ids of the written solutions, or
+                ``INVALIDATE_ALL`` to drop every cached entry.
+            pipe: Optional transaction to queue the append on.
+        """
+        solution_ids = list(solution_ids)
+        if not solution_ids:
+            return
+        if pipe is None:
+            with self.redis.pipeline() as pipe:
+                self._queue_publish(pipe, solution_ids)
+                pipe.execute()
+        else:
+            self._queue_publish(pipe, solution_ids)
+
+    def _queue_publish(self, pipe, solution_ids: List[str]) -> None:
+        # Run in one transaction, the version always counts the entries of the list
+        pipe.rpush(self.changelog_key, *solution_ids)
+        pipe.ltrim(self.changelog_key, -self.changelog_window, -1)
+        pipe.incrby(self.version_key, len(solution_ids))
+
+    def changes(self, since: int) -> Tuple[int, Optional[List[str]]]:
+        """
+        Read the changelog entries appended since a version.
+
+        Args:
+            since (int): Version the caller is at.
+
+        Returns:
+            tuple: The current version and the changed ids, or None for the ids if
+                some of them are no longer in the changelog.
+        """
+        steps = self.changes_steps(since)
+        try:
+            queue = next(steps)
+            while True:
+                with self.redis.pipeline() as pipe:
+                    queue(pipe)
+                    queue = steps.send(pipe.execute())
+        except StopIteration as stop:
+            return stop.value
+
+    async def achanges(
+        self, redis: AsyncRedis, since: int
+    ) -> Tuple[int, Optional[List[str]]]:
+        """Async variant of ``changes`` using an asyncio client of the same Redis."""
+        steps = self.changes_steps(since)
+        try:
+            queue = next(steps)
+            while True:
+                async with redis.pipeline() as pipe:
+                    queue(pipe)
+                    queue = steps.send(await pipe.execute())
+        except StopIteration as stop:
+            return stop.value
+
+    def changes_steps(self, since: int) -> Generator:
+        """
+        ``changes`` as a generator yielding functions that queue the commands of one
+        pipelined round trip and receiving the replies, so callers can drive it
+        with either client, e.g. within the steps of a RedisMemory operation.
+        """
+        count = 1
+        while True:
+
+            def queue_changes(pipe, count=count):
+                pipe.get(self.version_key)
+                pipe.lrange(self.changelog_key, -count, -1)
+
+            version, entries = yield queue_changes
+            version, changed, count = self._slice(since, version, entries, count)
+            if count is None:
+                return version, changed
+
+    def _slice(
+        self, since: int, version: Optional[bytes], entries: list, read: int
+    ) -> Tuple[int, Optional[List[str]], Optional[int]]:
+        """
+        Pick the entries after ``since`` among the latest ``read`` ones.
+
+        Returns:
+            tuple: The version, the changed ids or None, and the number of latest
+                entries to read again if they were not all read.
+        """
+        version = int(version or 0)
+        count = version - since
+        if count <= 0:
+            return version, [], None
+        if count <= len(entries):
+            return version, [_decode(c) for c in entries[len(entries) - count :]], None
+        if read < count <= self.changelog_window:
+            return version, None, count
+        return version, None, None
+
+    def validate(self) -> None:
+        """Catch up with the changelog, evicting what other writers changed."""
+        start = self._version
+        self._apply(start, *self.changes(start))
+
+    async def avalidate(self, redis: AsyncRedis) -> None:
+        """Async variant of ``validate`` using an asyncio client of the same Redis."""
+        start = self._version
+        self._apply(start, *await self.achanges(redis, start))
+
+    def _apply(self, start: int, version: int, changes: Optional[List[str]]) -> None:
+        with self._lock:
+            self._stats["round_trips"] += 1
+            if version <= self._version:
+                return
+            if changes is not None:
+                # Skip the entries a concurrent reader applied meanwhile.
+                changes = changes[self._version - start :]
+            self._version = version
+            self._views.clear()
+            # None when the missed entries were trimmed from the changelog
+            if changes is None or INVALIDATE_ALL in changes:
+                self._solutions.clear()
+                return
+            for solution_id in set(changes):
+                self._solutions.pop(solution_id, None)
+
+    def get_many(self, solution_ids: List[str]) -> Tuple[Dict[str, Solution], List[str]]:
+        """
+        Look up solutions in the LRU.
+
+        Returns:
+            tuple: Copies of the cached solutions by id, and the ids that missed.
+        """
+        found, missing = {}, []
+        with self._lock:
+            for solution_id in solution_ids:
+                solution = self._solutions.get(solution_id)
+                if solution is None:
+                    missing.append(solution_id)
+                else:
+                    self._solutions.move_to_end(solution_id)
+                    found[solution_id] = solution.copy()
+            self._stats["hits"] += len(found)
+            self._stats["misses"] += len(missing)
+            if not missing and found:
+                self._stats["round_trips_saved"] += 1
+            elif missing:
+                self._stats["round_trips"] += 1
+        return found, missing
+
+    def put(self, solution: Solution) -> None:
+        """Store a solution freshly read from Redis."""
+        with self._lock:
+            self._put(solution)
+
+    def _put(self, solution: Solution) -> None:
+        if self.max_solutions <= 0:
+            return
+        self._solutions[solution.solution_id] = solution
+        self._solutions.move_to_end(solution.solution_id)
+        while len(self._solutions) > self.max_solutions:
+            self._solutions.popitem(last=False)
+
+    def view(
+        self, key: Hashable, loader: Callable[[], List[Solution]], round_trips: int
+    ) -> List[Solution]:
+        """
+        Get a cached list of solutions, loading it on a miss.
+
+        Args:
+            key (Hashable): Key of the view.
+            loader (Callable[[], List[Solution]]): Reads the view from Redis.
+            round_trips (int): Redis round trips made by the loader.
+
+        Returns:
+            List[Solution]: Copies of the solutions of the view.
+        """
+        cached, version = self._lookup_view(key, round_trips)
+        if cached is not None:
+            return cached
+        return self._store_view(key, loader(), version)
+
+    async def aview(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[List[Solution]]],
+        round_trips: int,
+    ) -> List[Solution]:
+        """Async variant of ``view`` taking a coroutine function as loader."""
+        cached, version = self._lookup_view(key, round_trips)
+        if cached is not None:
+            return cached
+        return self._store_view(key, await loader(), version)
+
+    def _lookup_view(
+        self, key: Hashable, round_trips: int
+    ) -> Tuple[Optional[List[Solution]], int]:
+        with self._lock:
+            solutions = self._views.get(key)
+            if solutions is not None:
+                self._stats["hits"] += 1
+                self._stats["round_trips_saved"] += round_trips
+                return [s.copy() for s in solutions], self._version
+            self._stats["misses"] += 1
+            self._stats["round_trips"] += round_trips
+            return None, self._version
+
+    def _store_view(
+        self, key: Hashable, solutions: List[Solution], version: int
+    ) -> List[Solution]:
+        with self._lock:
+            for solution in solutions:
+                self._put(solution)
+            # Do not keep a view loaded while another reader caught up with changes.
+            if version == self._version:
+                self._views[key] = solutions
+        return [s.copy() for s in solutions]
+
+    def stats(self, reset: bool = False) -> dict:
+        """
+        Get the cache counters.
+
+        Args:
+            reset (bool): Start counting from zero again after reading.
+
+        Returns:
+            dict: Hits, misses, hit ratio, Redis round trips made through the cache
+                and round trips saved by cache hits.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            if reset:
+                self._stats = _empty_stats()
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        stats["cached_solutions"] = len(self._solutions)
+        return stats
+
+
+def _decode(value) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _empty_stats() -> dict:
+    return {"hits": 0, "misses": 0, "round_trips": 0, "round_trips_saved": 0}
@@ -5,14 +5,13 @@ file storage implements Storage
 """
 
 import collections
-import json
 import os
 import uuid
 from functools import wraps
 from typing import Any, List, Union
 
 from loongflow.agentsdk.memory.grade.storage import Storage
-from loongflow.agentsdk.message import Message
+from loongflow.agentsdk.message import Message, dump_messages, load_messages
 
 
 def ensure_loaded(func):
@@ -33,8 +32,14 @@ class FileStorage(Storage):
     Provides persistence by saving messages to a local file.
     """
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, compact: bool = False):
+        """
+        Args:
+            file_path: JSON file the messages are persisted to.
+            compact: Write the file without indentation, smaller and faster to save.
+        """
         self.file_path = file_path
+        self.compact = compact
         os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
         self._cache: collections.OrderedDict[uuid.UUID, Message] | None = None
 
@@ -44,22 +49,20 @@ class FileStorage(Storage):
             self._cache = collections.OrderedDict()
             return
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                message_list = json.load(f)
-                self._cache = collections.OrderedDict(
-                        (uuid.UUID(msg_data['id']), Message.from_dict(msg_data))
-                        for msg_data in message_list
-                )
-        except (json.JSONDecodeError, FileNotFoundError, TypeError):
+            with open(self.file_path, 'rb') as f:
+                # Parsed and validated in one pass by pydantic-core
+                messages = load_messages(f.read())
+            self._cache = collections.OrderedDict((msg.id, msg) for msg in messages)
+        except (ValueError, FileNotFoundError, TypeError):
             self._cache = collections.OrderedDict()
 
     async def _save(self) -> None:
         """Saves all messages from the in-memory cache to the JSON file."""
         if self._cache is None:
             return
-        message_list = [msg.to_dict() for msg in self._cache.values()]
-        with open(self.file_path, 'w', encoding='utf-8') as f:
-            json.dump(message_list, f, indent=2, ensure_ascii=False)
+        data = dump_messages(list(self._cache.values()), indent=None if self.compact else 2)
+        with open(self.file_path, 'wb') as f:
+            f.write(data)
 
     @ensure_loaded
     async def add(self, messages: Union[Message, List[Message]]) -> None:
@@ -15,7 +15,7 @@ from loongflow.agentsdk.message.elements import (
     ToolStatus,
 )
 
-from loongflow.agentsdk.message.message import Message, Role
+from loongflow.agentsdk.message.message import Message, Role, dump_messages, load_messages
 
 __all__ = [
     "Message",
@@ -29,4 +29,6 @@ __all__ = [
     "ThinkElement",
     "ToolCallElement",
     "ToolOutputElement",
+    "dump_messages",
+    "load_messages",
 ]
@@ -9,7 +9,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Type
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from loongflow.agentsdk.message import ContentElement, Element, ElementT, MimeType, ThinkElement, ToolCallElement, \
     ToolOutputElement, ToolStatus
@@ -69,6 +69,15 @@ class Message(BaseModel):
         """Creates a Message instance from a dictionary."""
         return cls.model_validate(data, **kwargs)
 
+    def to_json(self, indent: int | None = None) -> bytes:
+        """Serializes the Message instance to JSON with the compiled pydantic serializer."""
+        return self.__pydantic_serializer__.to_json(self, indent=indent)
+
+    @classmethod
+    def from_json(cls, data: bytes | str, **kwargs) -> "Message":
+        """Creates a Message instance from JSON, without an intermediate dictionary."""
+        return cls.model_validate_json(data, **kwargs)
+
     @classmethod
     def from_text(cls,
                   data: str,
@@ -160,3 +169,17 @@ class Message(BaseModel):
             A list containing only instances of the specified element class.
         """
         return [element for element in self.content if isinstance(element, element_cls)]
+
+
+# Compiled once, (de)serializes a whole list in a single call into pydantic-core
+_MESSAGE_LIST = TypeAdapter(List[Message])
+
+
+def dump_messages(messages: List[Message], indent: int | None = None) -> bytes:
+    """Serializes a list of messages to a JSON array."""
+    return _MESSAGE_LIST.dump_json(messages, indent=indent)
+
+
+def load_messages(data: bytes | str) -> List[Message]:
+    """Creates the messages of a JSON array written by ``dump_messages``."""
+    return _MESSAGE_LIST.validate_json(data)
@@ -4,11 +4,21 @@ This file initializes the `agentsdk.models` package and exposes
 the main models for external import
 """
 
+from typing import TYPE_CHECKING
+
+from loongflow._lazy import attach
 from loongflow.agentsdk.models.base_llm_model import BaseLLMModel
-from loongflow.agentsdk.models.litellm_model import LiteLLMModel
 from loongflow.agentsdk.models.llm_request import CompletionRequest
 from loongflow.agentsdk.models.llm_response import CompletionResponse, CompletionUsage
 
+if TYPE_CHECKING:
+    from loongflow.agentsdk.models.litellm_model import LiteLLMModel
+
+# litellm takes seconds to import, load it with the first model
+__getattr__, __dir__ = attach(
+    __name__, attributes={"LiteLLMModel": "loongflow.agentsdk.models.litellm_model"}
+)
+
 __all__ = [
     "BaseLLMModel",
     "LiteLLMModel",
@@ -2,8 +2,20 @@
 """
 Formatter subpackage for LoongFlow models
 """
+from typing import TYPE_CHECKING
+
+from loongflow._lazy import attach
 from loongflow.agentsdk.models.formatter.base_formatter import BaseFormatter
-from loongflow.agentsdk.models.formatter.litellm_formatter import LiteLLMFormatter
+
+if TYPE_CHECKING:
+    from loongflow.agentsdk.models.formatter.litellm_formatter import LiteLLMFormatter
+
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "LiteLLMFormatter": "loongflow.agentsdk.models.formatter.litellm_formatter"
+    },
+)
 
 __all__ = [
     "BaseFormatter",
@@ -5,12 +5,13 @@ The adapter between LoongFlow message abstractions and the LiteLLM client interf
 """
 
 import ast
+import copy
 import json
 from typing import Any, Dict, List, Optional
 
 from litellm import ModelResponse, ModelResponseStream
 
-from loongflow.agentsdk.logger import get_logger
+from loongflow.agentsdk.logger import get_logger, lazy_json
 from loongflow.agentsdk.message import (
     ContentElement,
     Message,
@@ -45,6 +46,13 @@ class LiteLLMFormatter(BaseFormatter):
         "deepseek": "deepseek",
     }
 
+    # Providers taking explicit prompt cache breakpoints. The others (OpenAI,
+    # DeepSeek, ...) cache the longest previously seen prefix automatically.
+    CACHE_BREAKPOINT_PROVIDERS = {"anthropic", "bedrock", "vertex_ai"}
+    # Most breakpoints a request may carry
+    MAX_CACHE_BREAKPOINTS = 4
+    CACHE_CONTROL = {"type": "ephemeral"}
+
     def __init__(self):
         super().__init__()
         self._current_model_name = None
@@ -58,17 +66,21 @@ class LiteLLMFormatter(BaseFormatter):
         base_url:Optional[str] = None,
         api_key: Optional[str] = None,
         model_provider: Optional[str] = None,
+        prompt_cache: bool = False,
         **params,
     ) -> Dict[str, Any]:
         """
         Convert LoongFlow CompletionRequest into kwargs suitable for `litellm.acompletion`.
+
+        With ``prompt_cache``, the request is shaped for provider prompt caching:
+        tool declarations are ordered by name so the static prefix (tools, system
+        prompt, task) is byte-stable across the calls of a run, and cache
+        breakpoints are tagged for the providers taking them.
         """
         self._current_model_name = model_name
 
         llm_messages = self._convert_messages(request.messages, model_name)
-        logger.debug(
-            f"convert message after: {json.dumps(llm_messages, ensure_ascii=False)}"
-        )
+        logger.debug("convert message after: %s", lazy_json(llm_messages))
 
         provider_name = self.get_provider_for_model(
             model_name=model_name, model_provider=model_provider
@@ -109,7 +121,9 @@ class LiteLLMFormatter(BaseFormatter):
 
         # Tool/function calling support
         if request.tools is not None:
-            kwargs["tools"] = request.tools
+            kwargs["tools"] = (
+                self._stable_tools(request.tools) if prompt_cache else request.tools
+            )
         if request.tool_choice is not None:
             kwargs["tool_choice"] = request.tool_choice
         else:
@@ -125,8 +139,76 @@ class LiteLLMFormatter(BaseFormatter):
         if request.extra_headers is not None:
             kwargs["extra_headers"] = request.extra_headers
 
+        if prompt_cache and self.supports_cache_breakpoints(provider_name):
+            self._tag_cache_breakpoints(kwargs)
+
         return kwargs
 
+    def supports_cache_breakpoints(self, provider_name: str) -> bool:
+        """
+        Whether requests to the provider take explicit prompt cache breakpoints.
+
+        Only the resolved provider counts: a Claude model served behind an OpenAI
+        compatible endpoint does not accept ``cache_control``.
+        """
+        return provider_name in self.CACHE_BREAKPOINT_PROVIDERS
+
+    @staticmethod
+    def _stable_tools(tools: List[dict]) -> List[dict]:
+        """Tool declarations ordered by name, whatever their registration order."""
+        return sorted(
+            tools,
+            key=lambda tool: (tool.get("function") or {}).get("name") or tool.get("name") or "",
+        )
+
+    def _tag_cache_breakpoints(self, kwargs: Dict[str, Any]) -> None:
+        """
+        Tag the cache breakpoints of a request: the last tool declaration, the last
+        system message, the first user message (the task) and the last message, so
+        the next call of the conversation reads everything before it from cache.
+        The tagged tools and messages are copies, the request is left untouched.
+        """
+        tools = kwargs.get("tools")
+        if tools:
+            tools = list(tools)
+            tools[-1] = {**copy.deepcopy(tools[-1]), "cache_control": self.CACHE_CONTROL}
+            kwargs["tools"] = tools
+
+        messages = kwargs["messages"]
+        roles = [message.get("role") for message in messages]
+        candidates = []
+        system = [i for i, role in enumerate(roles) if role == "system"]
+        if system:
+            candidates.append(system[-1])
+        if "user" in roles:
+            candidates.append(roles.index("user"))
+        if messages:
+            candidates.append(len(messages) - 1)
+
+        budget = self.MAX_CACHE_BREAKPOINTS - (1 if tools else 0)
+        tagged = set()
+        for index in candidates:
+            if len(tagged) >= budget or index in tagged:
+                continue
+            message = self._with_cache_control(messages[index])
+            if message is not None:
+                messages[index] = message
+                tagged.add(index)
+
+    def _with_cache_control(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """A copy of ``message`` whose last content block carries a breakpoint."""
+        content = message.get("content")
+        if isinstance(content, str):
+            if not content:
+                return None
+            blocks = [{"type": "text", "text": content}]
+        elif isinstance(content, list) and content:
+            blocks = [dict(block) for block in content]
+        else:
+            return None
+        blocks[-1]["cache_control"] = self.CACHE_CONTROL
+        return {**message, "content": blocks}
+
     def parse_response(
         self,
         raw: ModelResponse | Dict[str, Any],
@@ -372,13 +454,7 @@ class LiteLLMFormatter(BaseFormatter):
         contents = self._extract_elements_from_choices(raw)
 
         # Token usage
-        usage = None
-        if getattr(raw, "usage", None):
-            usage = CompletionUsage(
-                completion_tokens=raw.usage.get("completion_tokens", 0),
-                prompt_tokens=raw.usage.get("prompt_tokens", 0),
-                total_tokens=raw.usage.get("total_tokens", 0),
-            )
+        usage = self._parse_usage(getattr(raw, "usage", None))
 
         return CompletionResponse(
             id=getattr(raw, "id", "unknown"),
@@ -391,6 +467,34 @@ class LiteLLMFormatter(BaseFormatter):
             content=contents,
         )
 
+    @staticmethod
+    def _parse_usage(usage: Any) -> Optional[CompletionUsage]:
+        """
+        Token usage of a response, with the prompt cache reads and writes reported
+        by OpenAI style (``prompt_tokens_details.cached_tokens``) and Anthropic
+        style (``cache_read_input_tokens``, ``cache_creation_input_tokens``) APIs.
+        """
+        if not usage:
+            return None
+
+        def field(obj: Any, name: str) -> Any:
+            if obj is None:
+                return None
+            if isinstance(obj, dict):
+                return obj.get(name)
+            return getattr(obj, name, None)
+
+        cached_tokens = field(field(usage, "prompt_tokens_details"), "cached_tokens")
+        if not cached_tokens:
+            cached_tokens = field(usage, "cache_read_input_tokens")
+        return CompletionUsage(
+            completion_tokens=field(usage, "completion_tokens") or 0,
+            prompt_tokens=field(usage, "prompt_tokens") or 0,
+            total_tokens=field(usage, "total_tokens") or 0,
+            cached_tokens=cached_tokens or 0,
+            cache_creation_tokens=field(usage, "cache_creation_input_tokens") or 0,
+        )
+
     def _parse_stream_response(self, raw: "ModelResponseStream") -> CompletionResponse:
         """
         Parse a single streamed delta chunk (ModelResponseStream) into CompletionResponse.
@@ -432,8 +536,9 @@ class LiteLLMFormatter(BaseFormatter):
         Parse a single streamed delta chunk (dict) into CompletionResponse.
         """
         choices = data.get("choices", [])
+        usage = self._parse_usage(data.get("usage"))
         if not choices:
-            return CompletionResponse(id=data.get("id", "stream"), content=[])
+            return CompletionResponse(id=data.get("id", "stream"), usage=usage, content=[])
 
         choice = choices[0]
         delta = choice.get("delta", {})
@@ -462,6 +567,7 @@ class LiteLLMFormatter(BaseFormatter):
 
         return CompletionResponse(
             id=data.get("id", "stream"),
+            usage=usage,
             finish_reason=finish_reason,
             content=elements,
         )
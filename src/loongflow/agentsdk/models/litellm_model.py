@@ -32,6 +32,7 @@ class LiteLLMModel(BaseLLMModel):
         api_key: Optional[str] = None,
         timeout: int = 600,
         model_provider: Optional[str] = None,
+        prompt_cache: bool = False,
         **kwargs,
     ):
         """
@@ -41,6 +42,8 @@ class LiteLLMModel(BaseLLMModel):
             model_name: Model name or deployment ID (e.g. "gpt-4o").
             base_url: Base URL of the model provider (e.g. OpenAI, Azure, Baidu).
             api_key: API key for authentication.
+            prompt_cache: Shape requests for provider prompt caching, see
+                `LiteLLMFormatter.format_request`.
         """
         # Disable litellm internal debug logging
         logging.getLogger("LiteLLM").setLevel(logging.WARNING)
@@ -51,6 +54,7 @@ class LiteLLMModel(BaseLLMModel):
         self.timeout = timeout
         self.formatter = LiteLLMFormatter()
         self.model_provider = model_provider
+        self.prompt_cache = prompt_cache
         self.generation_params = kwargs
 
     @classmethod
@@ -74,7 +78,7 @@ class LiteLLMModel(BaseLLMModel):
             raise KeyError(f"Config missing required fields: {missing}")
 
         # Separate known fields from generation parameters
-        known = {"model", "url", "api_key", "model_provider", "timeout"}
+        known = {"model", "url", "api_key", "model_provider", "timeout", "prompt_cache"}
         gen_params = {k: v for k, v in config.items() if k not in known}
 
         return cls(
@@ -83,6 +87,7 @@ class LiteLLMModel(BaseLLMModel):
             api_key=config["api_key"],
             model_provider=config.get("model_provider"),
             timeout=config.get("timeout", 600),
+            prompt_cache=bool(config.get("prompt_cache", False)),
             **gen_params,
         )
 
@@ -110,6 +115,7 @@ class LiteLLMModel(BaseLLMModel):
             stream=stream,
             timeout=self.timeout,
             model_provider=self.model_provider,
+            prompt_cache=self.prompt_cache,
             **self.generation_params,
         )
 
@@ -21,6 +21,12 @@ class CompletionUsage(BaseModel):
     total_tokens: int
     """Total number of tokens used in the request (prompt_tokens + completion_tokens)."""
 
+    cached_tokens: int = 0
+    """Number of prompt tokens read from the provider's prompt cache."""
+
+    cache_creation_tokens: int = 0
+    """Number of prompt tokens written to the provider's prompt cache."""
+
 class CompletionResponse(BaseModel):
     """LLM completion response."""
     id: str
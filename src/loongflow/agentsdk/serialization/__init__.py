@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+This file provides the entry of serialization.
+"""
+
+from loongflow.agentsdk.serialization.codec import (
+    Codec,
+    JsonCodec,
+    OrjsonCodec,
+    clean_nan_values,
+    dump_file,
+    dumps,
+    get_codec,
+    load_file,
+    loads,
+    register_codec,
+    set_default_codec,
+)
+
+__all__ = [
+    "Codec",
+    "JsonCodec",
+    "OrjsonCodec",
+    "clean_nan_values",
+    "dump_file",
+    "dumps",
+    "get_codec",
+    "load_file",
+    "loads",
+    "register_codec",
+    "set_default_codec",
+]
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This file provides the pluggable codecs used to serialize messages and solutions.
+
+Every codec writes JSON, so data written by one codec (Redis hashes, checkpoints,
+message stores) is read back by any other. NaN and infinite floats, from Python or
+numpy, are written as null by the encoder itself instead of by a recursive clean-up
+pass over every payload. The standard library codec is used by default. The
+faster ``orjson`` codec, installed with the ``orjson`` extra
+(``pip install loongflow[orjson]``), is used once selected with
+``set_default_codec("orjson")``.
+"""
+
+import json
+import math
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _numpy():
+    """numpy if it is imported, no numpy value can exist otherwise."""
+    return sys.modules.get("numpy")
+
+
+def clean_nan_values(obj: Any) -> Any:
+    """
+    Recursively clean NaN values from a data structure, replacing them with
+    None. This ensures JSON serialization works correctly.
+    """
+    if isinstance(obj, dict):
+        return {key: clean_nan_values(value) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return [clean_nan_values(item) for item in obj]
+    elif isinstance(obj, tuple):
+        return tuple(clean_nan_values(item) for item in obj)
+    elif isinstance(obj, float) and (math.isnan(obj) or math.isinf(obj)):
+        return None
+    np = _numpy()
+    if np is None:
+        return obj
+    elif isinstance(obj, np.floating) and (np.isnan(obj) or np.isinf(obj)):
+        return None
+    elif hasattr(obj, "dtype") and np.issubdtype(obj.dtype, np.floating):
+        # Handle numpy arrays and scalars
+        if np.isscalar(obj):
+            if np.isnan(obj) or np.isinf(obj):
+                return None
+            else:
+                return float(obj)
+        else:
+            # For numpy arrays, convert to list and clean recursively
+            return clean_nan_values(obj.tolist())
+    else:
+        return obj
+
+
+def _default(obj: Any) -> Any:
+    """Encode the numpy values the JSON encoders do not know natively."""
+    np = _numpy()
+    if np is not None:
+        if isinstance(obj, np.ndarray):
+            return clean_nan_values(obj.tolist())
+        if isinstance(obj, np.generic):
+            return clean_nan_values(obj.item())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class Codec(ABC):
+    """Serializes JSON compatible data to bytes and back."""
+
+    name: str = ""
+
+    @abstractmethod
+    def dumps(self, obj: Any, indent: Optional[int] = None) -> bytes:
+        """
+        Serialize ``obj``, compactly unless ``indent`` is given.
+
+        NaN and infinite floats are written as null.
+        """
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Deserialize data written by ``dumps``."""
+
+
+class JsonCodec(Codec):
+    """Codec based on the C accelerated encoder of the standard library."""
+
+    name = "json"
+
+    def dumps(self, obj: Any, indent: Optional[int] = None) -> bytes:
+        separators = (",", ":") if indent is None else (",", ": ")
+        try:
+            # Single pass for the common payload without NaN
+            text = json.dumps(
+                obj,
+                allow_nan=False,
+                default=_default,
+                ensure_ascii=False,
+                indent=indent,
+                separators=separators,
+            )
+        except ValueError:
+            text = json.dumps(
+                clean_nan_values(obj),
+                default=_default,
+                ensure_ascii=False,
+                indent=indent,
+                separators=separators,
+            )
+        return text.encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    """
+    Codec based on ``orjson``, serializing numpy arrays and NaN natively.
+
+    ``orjson`` only indents by 2 spaces and rejects integers beyond 64 bits. Other
+    indents and such integers are serialized by ``JsonCodec`` instead, so the
+    output is the same whichever codec is the default.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError(
+                "orjson is not installed, install it with `pip install loongflow[orjson]`."
+            )
+        self._option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        self._fallback = JsonCodec()
+
+    def dumps(self, obj: Any, indent: Optional[int] = None) -> bytes:
+        if indent not in (None, 2):
+            return self._fallback.dumps(obj, indent)
+        option = self._option if indent is None else self._option | orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=_default, option=option)
+        except orjson.JSONEncodeError:
+            # Integers beyond 64 bits, or a value neither encoder supports
+            return self._fallback.dumps(obj, indent)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+_codecs: Dict[str, Codec] = {JsonCodec.name: JsonCodec()}
+if orjson is not None:
+    _codecs[OrjsonCodec.name] = OrjsonCodec()
+_default_codec: Codec = _codecs[JsonCodec.name]
+
+
+def register_codec(codec: Codec) -> None:
+    """Register a codec under its name, replacing any codec of the same name."""
+    if not codec.name:
+        raise ValueError("A codec must have a name.")
+    _codecs[codec.name] = codec
+
+
+def get_codec(name: Optional[str] = None) -> Codec:
+    """Return the codec registered under ``name``, the default one if None."""
+    if name is None:
+        return _default_codec
+    try:
+        return _codecs[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown codec {name!r}, available codecs: {sorted(_codecs)}."
+        ) from None
+
+
+def set_default_codec(name: str) -> Codec:
+    """Use the codec registered under ``name`` by default and return it."""
+    global _default_codec
+    _default_codec = get_codec(name)
+    return _default_codec
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> bytes:
+    """Serialize ``obj`` with the default codec."""
+    return _default_codec.dumps(obj, indent)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize ``data`` with the default codec."""
+    return _default_codec.loads(data)
+
+
+def dump_file(obj: Any, path: str, compact: bool = False, indent: int = 4) -> None:
+    """
+    Write ``obj`` to ``path``.
+
+    Args:
+        obj (Any): JSON compatible data.
+        path (str): Destination file, replaced if it exists.
+        compact (bool): Write without whitespace, smaller and faster to write
+            and read than the indented form meant for humans.
+        indent (int): Indentation of the non compact form.
+    """
+    data = dumps(obj, None if compact else indent)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def load_file(path: str) -> Any:
+    """Read a file written by ``dump_file``, compact or not."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
@@ -5,8 +5,10 @@ This file provides the entry point of the tools.
 
 from loongflow.agentsdk.tools.agent_tool import AgentTool
 from loongflow.agentsdk.tools.base_tool import BaseTool
+from loongflow.agentsdk.tools.execute_code_tool import ExecuteCodeTool
 from loongflow.agentsdk.tools.function_tool import FunctionTool
 from loongflow.agentsdk.tools.ls_tool import LsTool
+from loongflow.agentsdk.tools.read_output_tool import ReadOutputTool
 from loongflow.agentsdk.tools.read_tool import ReadTool
 from loongflow.agentsdk.tools.shell_tool import ShellTool
 from loongflow.agentsdk.tools.todo_read_tool import TodoReadTool
@@ -24,9 +26,11 @@ __all__ = [
     "Toolkit",
     "LsTool",
     "ReadTool",
+    "ReadOutputTool",
     "TodoReadTool",
     "TodoWriteTool",
     "ShellTool",
+    "ExecuteCodeTool",
     "WriteTool",
     "AgentTool",
 ]
\ No newline at end of file
@@ -14,6 +14,12 @@ from typing_extensions import override
 from loongflow.agentsdk.message import ContentElement, MimeType
 from loongflow.agentsdk.tools.function_tool import FunctionTool, ToolResponse
 from loongflow.agentsdk.tools.tool_context import ToolContext
+from loongflow.agentsdk.tools.tool_output import (
+    DEFAULT_HEAD_BYTES,
+    DEFAULT_TAIL_BYTES,
+    output_files,
+    run_process,
+)
 
 
 class ExecuteCodeToolArgs(BaseModel):
@@ -56,9 +62,24 @@ class ExecuteCodeToolArgs(BaseModel):
 
 
 class ExecuteCodeTool(FunctionTool):
-    """Tool to execute Python code or Python scripts."""
+    """
+    Tool to execute Python code or Python scripts.
+
+    Outputs longer than ``head_bytes + tail_bytes`` are cut to their head and
+    tail, the full output is saved to a file the ReadOutput tool pages through.
+    """
 
-    def __init__(self):
+    def __init__(
+        self,
+        head_bytes: int = DEFAULT_HEAD_BYTES,
+        tail_bytes: int = DEFAULT_TAIL_BYTES,
+        spill_dir: Optional[str] = None,
+    ):
+        self.output_limits = {
+            "head_bytes": head_bytes,
+            "tail_bytes": tail_bytes,
+            "spill_dir": spill_dir,
+        }
         super().__init__(
             func=None,
             args_schema=ExecuteCodeToolArgs,
@@ -164,49 +185,17 @@ class ExecuteCodeTool(FunctionTool):
 
     def _run_python_code(self, code: str, timeout: int) -> dict[str, Any]:
         """Run inline Python code with timeout."""
-        start = time.time()
-        try:
-            proc = subprocess.run(
-                [sys.executable, "-c", code],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=timeout,
-            )
-            return {
-                "stdout": proc.stdout,
-                "stderr": proc.stderr,
-                "returncode": proc.returncode,
-                "error": proc.stderr.strip(),
-                "execution_time": time.time() - start,
-            }
-        except Exception as e:
-            return {
-                "stdout": "",
-                "stderr": "",
-                "returncode": -1,
-                "error": str(e),
-                "execution_time": time.time() - start,
-            }
+        return self._run([sys.executable, "-c", code], timeout)
 
     def _run_python_file(self, file_path: str, timeout: int) -> dict[str, Any]:
         """Run Python file with timeout."""
+        return self._run([sys.executable, file_path], timeout)
+
+    def _run(self, args: list[str], timeout: int) -> dict[str, Any]:
+        """Run a Python process, keeping the head and tail of its outputs."""
         start = time.time()
         try:
-            proc = subprocess.run(
-                [sys.executable, file_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=timeout,
-            )
-            return {
-                "stdout": proc.stdout,
-                "stderr": proc.stderr,
-                "returncode": proc.returncode,
-                "error": proc.stderr.strip(),
-                "execution_time": time.time() - start,
-            }
+            output = run_process(args, timeout=timeout, **self.output_limits)
         except Exception as e:
             return {
                 "stdout": "",
@@ -215,3 +204,15 @@ class ExecuteCodeTool(FunctionTool):
                 "error": str(e),
                 "execution_time": time.time() - start,
             }
+        stderr = output.stderr.text()
+        error = stderr.strip()
+        if output.timed_out:
+            error = str(subprocess.TimeoutExpired(args, timeout))
+        return {
+            "stdout": output.stdout.text(),
+            "stderr": stderr,
+            "returncode": -1 if output.timed_out else output.returncode,
+            "error": error,
+            "execution_time": time.time() - start,
+            **output_files(stdout=output.stdout, stderr=output.stderr),
+        }
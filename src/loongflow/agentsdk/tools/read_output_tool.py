@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+This file provides the ReadOutputTool implementation.
+"""
+
+import os
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+from typing_extensions import override
+
+from loongflow.agentsdk.message import ContentElement, MimeType
+from loongflow.agentsdk.tools.function_tool import FunctionTool, ToolResponse
+from loongflow.agentsdk.tools.tool_context import ToolContext
+from loongflow.agentsdk.tools.tool_output import DEFAULT_SPILL_DIR
+
+
+class ReadOutputToolArgs(BaseModel):
+    """
+    Arguments for ReadOutputTool.
+    - path: spill file of a truncated tool output.
+    - offset: byte offset to start reading from.
+    - limit: number of bytes to read.
+    """
+
+    path: str = Field(..., description="The spill file of a truncated tool output.")
+    offset: int = Field(0, ge=0, description="Byte offset to start reading from.")
+    limit: int = Field(8192, gt=0, description="Number of bytes to read.")
+
+
+class ReadOutputTool(FunctionTool):
+    """
+    ReadOutput tool: pages through the full output of a tool call whose output
+    was truncated to its head and tail.
+    """
+
+    def __init__(self, spill_dir: Optional[str] = None, max_limit: int = 64 * 1024):
+        """
+        Args:
+            spill_dir (Optional[str]): Directory of the spill files, the only one
+                the tool reads from.
+            max_limit (int): Largest slice returned by a call.
+        """
+        super().__init__(
+            func=None,
+            args_schema=ReadOutputToolArgs,
+            name="ReadOutput",
+            description=(
+                "Reads a slice of the full output of a previous tool call, when the output "
+                "was truncated and saved to a file. Give the file path and the byte offset "
+                "from the truncation note."
+            ),
+        )
+        self.spill_dir = os.path.realpath(spill_dir or DEFAULT_SPILL_DIR)
+        self.max_limit = max_limit
+
+    @override
+    def get_declaration(self) -> dict[str, Any]:
+        """Generate tool declaration from Pydantic model."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "parameters": ReadOutputToolArgs.model_json_schema(),
+        }
+
+    @override
+    async def arun(
+        self, *, args: dict[str, Any], tool_context: Optional[ToolContext] = None
+    ) -> ToolResponse:
+        """Run the tool asynchronously."""
+        return self.run(args=args, tool_context=tool_context)
+
+    @override
+    def run(
+        self, *, args: dict[str, Any], tool_context: Optional[ToolContext] = None
+    ) -> ToolResponse:
+        """Run the tool synchronously."""
+        validated_args, error = self._prepare_call_args(args, tool_context)
+        if error:
+            return self._error(error)
+
+        path = os.path.realpath(validated_args.get("path"))
+        offset = validated_args.get("offset")
+        limit = min(validated_args.get("limit"), self.max_limit)
+
+        if os.path.dirname(path) != self.spill_dir:
+            return self._error(f"Not a tool output file: {path}")
+        if not os.path.isfile(path):
+            return self._error(f"File not found: {path}")
+
+        try:
+            size = os.path.getsize(path)
+            with open(path, "rb") as f:
+                f.seek(offset)
+                data = f.read(limit)
+        except Exception as e:
+            return self._error(str(e))
+
+        end = offset + len(data)
+        result = {
+            "path": path,
+            "offset": offset,
+            "size": size,
+            "content": data.decode("utf-8", errors="replace"),
+            "next_offset": end if end < size else None,
+        }
+        return ToolResponse(
+            content=[
+                ContentElement(
+                    mime_type=MimeType.APPLICATION_JSON,
+                    data=result,
+                    metadata={"tool": self.name},
+                )
+            ]
+        )
+
+    @staticmethod
+    def _error(err: str) -> ToolResponse:
+        return ToolResponse(
+            content=[
+                ContentElement(
+                    mime_type=MimeType.TEXT_PLAIN,
+                    data=err,
+                    metadata={"error": True},
+                )
+            ],
+            err_msg=err,
+        )
@@ -4,7 +4,7 @@ This file provides the ReadTool implementation.
 """
 
 import os
-from typing import Any, Optional
+from typing import IO, Any, Iterator, Optional
 
 from pydantic import BaseModel, Field
 from typing_extensions import override
@@ -13,6 +13,26 @@ from loongflow.agentsdk.message import ContentElement, MimeType
 from loongflow.agentsdk.tools.function_tool import FunctionTool, ToolResponse
 from loongflow.agentsdk.tools.tool_context import ToolContext
 
+# Longest line returned, longer lines are cut
+MAX_LINE_CHARS = 2000
+# Longest content returned by a call, the rest is read with a further offset
+DEFAULT_MAX_OUTPUT_CHARS = 32 * 1024
+
+
+def _iter_lines(f: IO[str], max_chars: int) -> Iterator[str]:
+    """Lines of ``f`` cut to ``max_chars``, without reading long lines whole."""
+    while True:
+        line = f.readline(max_chars + 1)
+        if not line:
+            return
+        if len(line) > max_chars and not line.endswith("\n"):
+            # Skip the rest of the long line
+            rest = line
+            while rest and not rest.endswith("\n"):
+                rest = f.readline(64 * 1024)
+            line = line[:max_chars] + "...\n"
+        yield line
+
 
 class ReadToolArgs(BaseModel):
     """
@@ -33,9 +53,13 @@ class ReadTool(FunctionTool):
     """
     ReadTool: reads files from local filesystem with optional line range.
     Supports text files, images, PDFs, and Jupyter notebooks.
+
+    Text content is cut at ``max_output_chars``, the result then gives the
+    ``next_offset`` to continue reading from.
     """
 
-    def __init__(self):
+    def __init__(self, max_output_chars: int = DEFAULT_MAX_OUTPUT_CHARS):
+        self.max_output_chars = max_output_chars
         super().__init__(
             func=None,
             args_schema=ReadToolArgs,
@@ -184,26 +208,40 @@ class ReadTool(FunctionTool):
     ) -> ToolResponse:
         """Read text file with optional line range and return ToolResponse."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-
-            # Apply offset and limit
             start = offset - 1 if offset else 0
-            end = start + limit if limit else len(lines)
-            lines = lines[start:end]
+            end = start + limit if limit else None
 
-            # Format with line numbers
+            # Lines are read one at a time and the content stops at the budget,
+            # so a large file is never loaded whole
             formatted_lines = []
-            for i, line in enumerate(lines, start=start + 1):
-                line = line[:2000] + "..." if len(line) > 2000 else line
-                formatted_lines.append(f"{i:6d}  {line}")
+            size = 0
+            next_offset = None
+            with open(file_path, "r", encoding="utf-8") as f:
+                for i, line in enumerate(_iter_lines(f, MAX_LINE_CHARS)):
+                    if i < start:
+                        continue
+                    if end is not None and i >= end:
+                        break
+                    formatted = f"{i + 1:6d}  {line}"
+                    if formatted_lines and size + len(formatted) > self.max_output_chars:
+                        next_offset = i + 1
+                        break
+                    formatted_lines.append(formatted)
+                    size += len(formatted)
 
             result = {
                 "type": "text",
                 "path": file_path,
                 "content": "".join(formatted_lines),
-                "total_lines": len(lines),
+                "total_lines": len(formatted_lines),
             }
+            if next_offset is not None:
+                result["truncated"] = True
+                result["next_offset"] = next_offset
+                result["content"] += (
+                    f"... [output limit of {self.max_output_chars} chars reached, "
+                    f"continue with offset={next_offset}]\n"
+                )
 
             return ToolResponse(
                 content=[
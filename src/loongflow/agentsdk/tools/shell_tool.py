@@ -3,8 +3,6 @@
 This file provides the ShellTool implementation.
 """
 
-import asyncio
-import subprocess
 from typing import Any, List, Optional
 
 from pydantic import BaseModel, Field
@@ -13,6 +11,14 @@ from typing_extensions import override
 from loongflow.agentsdk.message import ContentElement, MimeType
 from loongflow.agentsdk.tools.function_tool import FunctionTool, ToolResponse
 from loongflow.agentsdk.tools.tool_context import ToolContext
+from loongflow.agentsdk.tools.tool_output import (
+    DEFAULT_HEAD_BYTES,
+    DEFAULT_TAIL_BYTES,
+    ProcessOutput,
+    output_files,
+    run_process,
+    run_shell_async,
+)
 
 
 class CommandItem(BaseModel):
@@ -36,9 +42,22 @@ class ShellToolArgs(BaseModel):
 class ShellTool(FunctionTool):
     """
     Shell tool: executes one or more shell commands.
+
+    Outputs longer than ``head_bytes + tail_bytes`` are cut to their head and
+    tail, the full output is saved to a file the ReadOutput tool pages through.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        head_bytes: int = DEFAULT_HEAD_BYTES,
+        tail_bytes: int = DEFAULT_TAIL_BYTES,
+        spill_dir: Optional[str] = None,
+    ):
+        self.output_limits = {
+            "head_bytes": head_bytes,
+            "tail_bytes": tail_bytes,
+            "spill_dir": spill_dir,
+        }
         super().__init__(
             func=None,
             args_schema=ShellToolArgs,
@@ -102,7 +121,7 @@ class ShellTool(FunctionTool):
             if not cmd:
                 results.append({"error": "Missing `command` field."})
                 continue
-            results.append(_run_command(cmd, cwd))
+            results.append(_run_command(cmd, cwd, **self.output_limits))
 
         return ToolResponse(
             content=[
@@ -165,7 +184,7 @@ class ShellTool(FunctionTool):
                 continue
 
             # Run command asynchronously (but sequentially)
-            result = await _run_command_async(cmd, cwd)
+            result = await _run_command_async(cmd, cwd, **self.output_limits)
             results.append(result)
 
         return ToolResponse(
@@ -179,42 +198,30 @@ class ShellTool(FunctionTool):
         )
 
 
-async def _run_command_async(command: str, dir: Optional[str] = None) -> dict[str, Any]:
+def _command_result(command: str, dir: Optional[str], output: ProcessOutput) -> dict[str, Any]:
+    return {
+        "command": command,
+        "dir": dir,
+        "returncode": output.returncode,
+        "stdout": output.stdout.text().strip(),
+        "stderr": output.stderr.text().strip(),
+        **output_files(stdout=output.stdout, stderr=output.stderr),
+    }
+
+
+async def _run_command_async(
+    command: str, dir: Optional[str] = None, **output_limits
+) -> dict[str, Any]:
     try:
-        process = await asyncio.create_subprocess_shell(
-            command,
-            cwd=dir or None,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await process.communicate()
-        return {
-            "command": command,
-            "dir": dir,
-            "returncode": process.returncode,
-            "stdout": stdout.decode().strip(),
-            "stderr": stderr.decode().strip(),
-        }
+        output = await run_shell_async(command, cwd=dir or None, **output_limits)
+        return _command_result(command, dir, output)
     except Exception as e:
         return {"command": command, "dir": dir, "error": str(e)}
 
 
-def _run_command(command: str, dir: Optional[str] = None) -> dict[str, Any]:
+def _run_command(command: str, dir: Optional[str] = None, **output_limits) -> dict[str, Any]:
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            cwd=dir or None,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-        return {
-            "command": command,
-            "dir": dir,
-            "returncode": result.returncode,
-            "stdout": result.stdout.strip(),
-            "stderr": result.stderr.strip(),
-        }
+        output = run_process(command, shell=True, cwd=dir or None, **output_limits)
+        return _command_result(command, dir, output)
     except Exception as e:
         return {"command": command, "dir": dir, "error": str(e)}
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+"""
+This file provides the bounded capture of tool outputs.
+
+Tool outputs end up in the ToolOutputElement of the message, then in the memory
+and in every later LLM request, so a program printing megabytes must not be
+captured whole. OutputBuffer keeps the head and the tail of a stream in memory
+and, once the stream is longer than both, streams it whole to a spill file that
+the ReadOutput tool pages through by offset. Spill files older than
+``DEFAULT_SPILL_RETENTION_SECONDS`` or beyond ``DEFAULT_MAX_SPILL_DIR_BYTES`` in
+total are removed, oldest first, whenever a new one is opened:
+
+    stdout = OutputBuffer("stdout")
+    for chunk in iter(lambda: pipe.read(CHUNK_SIZE), b""):
+        stdout.write(chunk)
+    result = {"stdout": stdout.text(), **output_files(stdout=stdout)}
+"""
+
+import asyncio
+import os
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import IO, Any, Dict, List, Optional, Union
+
+from loongflow.agentsdk.logger import get_logger
+
+# Bytes kept in memory from the start and from the end of an output
+DEFAULT_HEAD_BYTES = 8 * 1024
+DEFAULT_TAIL_BYTES = 8 * 1024
+# Longest output written to a spill file, the rest is only counted
+DEFAULT_MAX_SPILL_BYTES = 256 * 1024 * 1024
+# Directory of the spill files
+DEFAULT_SPILL_DIR = os.path.join(tempfile.gettempdir(), "loongflow_tool_output")
+# Age after which spill files are removed
+DEFAULT_SPILL_RETENTION_SECONDS = 24 * 3600
+# Largest total size of the spill files of a directory
+DEFAULT_MAX_SPILL_DIR_BYTES = 1024 * 1024 * 1024
+
+# Size of the reads from the pipes of a process
+CHUNK_SIZE = 64 * 1024
+
+logger = get_logger(__name__)
+
+
+class OutputBuffer:
+    """
+    Bounded capture of an output stream.
+
+    The first ``head_bytes`` and the last ``tail_bytes`` are kept in memory. The
+    stream is written to a spill file once it is longer than both, so memory use
+    does not depend on the size of the output.
+    """
+
+    def __init__(
+        self,
+        name: str = "output",
+        head_bytes: int = DEFAULT_HEAD_BYTES,
+        tail_bytes: int = DEFAULT_TAIL_BYTES,
+        spill_dir: Optional[str] = None,
+        max_spill_bytes: int = DEFAULT_MAX_SPILL_BYTES,
+        spill_retention_seconds: float = DEFAULT_SPILL_RETENTION_SECONDS,
+        max_spill_dir_bytes: int = DEFAULT_MAX_SPILL_DIR_BYTES,
+    ):
+        """
+        Args:
+            name (str): Name of the stream, used in the spill file name.
+            head_bytes (int): Bytes kept from the start of the stream.
+            tail_bytes (int): Bytes kept from the end of the stream.
+            spill_dir (Optional[str]): Directory of the spill file, defaults to
+                ``DEFAULT_SPILL_DIR``.
+            max_spill_bytes (int): Longest output written to the spill file.
+            spill_retention_seconds (float): Age after which spill files of the
+                directory are removed.
+            max_spill_dir_bytes (int): Largest total size of the spill files of
+                the directory.
+        """
+        self.name = name
+        self.head_bytes = head_bytes
+        self.tail_bytes = tail_bytes
+        self.spill_dir = spill_dir or DEFAULT_SPILL_DIR
+        self.max_spill_bytes = max_spill_bytes
+        self.spill_retention_seconds = spill_retention_seconds
+        self.max_spill_dir_bytes = max_spill_dir_bytes
+        self.total_bytes = 0
+        self.total_lines = 0
+        self.spill_path: Optional[str] = None
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._spill: Optional[IO[bytes]] = None
+        self._spilled_bytes = 0
+
+    @property
+    def truncated(self) -> bool:
+        """Whether part of the output is only in the spill file."""
+        return self.total_bytes > len(self._head) + len(self._tail)
+
+    def write(self, data: Union[bytes, str]) -> None:
+        """Append a chunk of the stream."""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if not data:
+            return
+        self.total_bytes += len(data)
+        self.total_lines += data.count(b"\n")
+
+        if self._spill is None and self.total_bytes > self.head_bytes + self.tail_bytes:
+            self._open_spill()
+        if self._spill is not None:
+            self._write_spill(data)
+
+        if len(self._head) < self.head_bytes:
+            taken = self.head_bytes - len(self._head)
+            self._head += data[:taken]
+            data = data[taken:]
+        if len(data) >= self.tail_bytes:
+            self._tail = bytearray(data[len(data) - self.tail_bytes:])
+        elif data:
+            self._tail += data
+            del self._tail[: max(0, len(self._tail) - self.tail_bytes)]
+
+    def close(self) -> None:
+        """Close the spill file, the buffer can still be rendered."""
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def text(self) -> str:
+        """
+        The output, or its head and tail around a note giving the omitted size
+        and where to page the full output from.
+        """
+        if not self.truncated:
+            return bytes(self._head + self._tail).decode("utf-8", errors="replace")
+        omitted = self.total_bytes - len(self._head) - len(self._tail)
+        note = (
+            f"\n... [{omitted} bytes omitted of {self.total_bytes} bytes, "
+            f"{self.total_lines} lines. Full output in {self.spill_path}, "
+            f"page it with ReadOutput(path, offset={len(self._head)})] ...\n"
+        )
+        return (
+            bytes(self._head).decode("utf-8", errors="ignore")
+            + note
+            + bytes(self._tail).decode("utf-8", errors="ignore")
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        """Size of the output and its spill file."""
+        return {
+            "path": self.spill_path,
+            "bytes": self.total_bytes,
+            "lines": self.total_lines,
+            "spilled_bytes": self._spilled_bytes,
+        }
+
+    def _open_spill(self) -> None:
+        os.makedirs(self.spill_dir, exist_ok=True)
+        # Room for this spill file, which may grow up to max_spill_bytes
+        prune_spill_dir(
+            self.spill_dir,
+            self.spill_retention_seconds,
+            max(0, self.max_spill_dir_bytes - self.max_spill_bytes),
+        )
+        self.spill_path = os.path.join(
+            self.spill_dir, f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}-{self.name}.log"
+        )
+        self._spill = open(self.spill_path, "wb")
+        # Everything before this write is still in memory
+        self._write_spill(bytes(self._head + self._tail))
+
+    def _write_spill(self, data: bytes) -> None:
+        room = self.max_spill_bytes - self._spilled_bytes
+        if room <= 0:
+            return
+        data = data[:room]
+        self._spill.write(data)
+        self._spilled_bytes += len(data)
+
+
+def prune_spill_dir(
+    spill_dir: str,
+    retention_seconds: float = DEFAULT_SPILL_RETENTION_SECONDS,
+    max_bytes: int = DEFAULT_MAX_SPILL_DIR_BYTES,
+) -> int:
+    """
+    Remove the spill files of ``spill_dir`` older than ``retention_seconds``, then
+    the oldest ones until the rest fits in ``max_bytes``.
+
+    Returns:
+        int: Number of removed files.
+    """
+    files = []
+    try:
+        with os.scandir(spill_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".log") and entry.is_file(follow_symlinks=False):
+                    stat = entry.stat(follow_symlinks=False)
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+    except OSError:
+        return 0
+
+    files.sort()
+    total = sum(size for _, size, _ in files)
+    oldest_kept = time.time() - retention_seconds
+    removed = 0
+    for mtime, size, path in files:
+        if mtime >= oldest_kept and total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError as e:
+            logger.warning(f"Failed to remove spill file {path}: {e}")
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+def output_files(**buffers: OutputBuffer) -> Dict[str, Any]:
+    """
+    The ``output_files`` entry of a tool result, giving the spill files of the
+    truncated ``buffers``, or nothing if none is truncated.
+    """
+    files = {name: buf.summary() for name, buf in buffers.items() if buf.truncated}
+    return {"output_files": files} if files else {}
+
+
+@dataclass
+class ProcessOutput:
+    """Bounded output of a finished process."""
+
+    returncode: int
+    stdout: OutputBuffer
+    stderr: OutputBuffer
+    timed_out: bool = False
+
+
+def _pump(pipe: IO[bytes], buf: OutputBuffer) -> None:
+    try:
+        for chunk in iter(lambda: pipe.read1(CHUNK_SIZE), b""):
+            buf.write(chunk)
+    except (OSError, ValueError):
+        pass
+    finally:
+        buf.close()
+
+
+def run_process(
+    args: Union[str, List[str]],
+    *,
+    shell: bool = False,
+    cwd: Optional[str] = None,
+    timeout: Optional[float] = None,
+    **buffer_kwargs,
+) -> ProcessOutput:
+    """
+    Run a process, streaming its stdout and stderr into OutputBuffers.
+
+    The process is killed once ``timeout`` seconds have passed, its output so far
+    is returned with ``timed_out`` set.
+
+    Args:
+        args (Union[str, List[str]]): Command, as for ``subprocess.Popen``.
+        shell (bool): Run the command through the shell.
+        cwd (Optional[str]): Working directory.
+        timeout (Optional[float]): Timeout in seconds.
+        **buffer_kwargs: Arguments of the OutputBuffers.
+    """
+    stdout = OutputBuffer("stdout", **buffer_kwargs)
+    stderr = OutputBuffer("stderr", **buffer_kwargs)
+    proc = subprocess.Popen(
+        args, shell=shell, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    pumps = [
+        threading.Thread(target=_pump, args=(proc.stdout, stdout), daemon=True),
+        threading.Thread(target=_pump, args=(proc.stderr, stderr), daemon=True),
+    ]
+    for pump in pumps:
+        pump.start()
+
+    timed_out = False
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        timed_out = True
+        proc.kill()
+        proc.wait()
+    for pump in pumps:
+        # Children of the process may still hold the pipes open
+        pump.join(timeout=1.0 if timed_out else None)
+    proc.stdout.close()
+    proc.stderr.close()
+    return ProcessOutput(proc.returncode, stdout, stderr, timed_out)
+
+
+async def _apump(stream: asyncio.StreamReader, buf: OutputBuffer) -> None:
+    try:
+        while True:
+            chunk = await stream.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            buf.write(chunk)
+    finally:
+        buf.close()
+
+
+async def run_shell_async(
+    command: str, *, cwd: Optional[str] = None, **buffer_kwargs
+) -> ProcessOutput:
+    """Asynchronous ``run_process`` of a shell command."""
+    stdout = OutputBuffer("stdout", **buffer_kwargs)
+    stderr = OutputBuffer("stderr", **buffer_kwargs)
+    process = await asyncio.create_subprocess_shell(
+        command,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    await asyncio.gather(
+        _apump(process.stdout, stdout), _apump(process.stderr, stderr)
+    )
+    await process.wait()
+    return ProcessOutput(process.returncode, stdout, stderr)
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+Minimal import surface for subprocess workers (evaluations, worker processes).
+
+Everything here imports without the heavy optional dependencies of the framework
+(litellm, the Claude SDK, redis, Flask), so a subprocess only pays for what it
+uses:
+
+    from loongflow.core import EvaluationResult, EvaluationStatus, get_logger
+"""
+
+from loongflow.agentsdk.logger import get_logger
+from loongflow.agentsdk.memory.evolution.base_memory import Solution
+from loongflow.agentsdk.message import (
+    ContentElement,
+    Message,
+    MimeType,
+    Role,
+    ThinkElement,
+    ToolCallElement,
+    ToolOutputElement,
+)
+from loongflow.agentsdk.serialization import dumps, loads
+from loongflow.framework.pes.evaluator.evaluator import (
+    EvaluationResult,
+    EvaluationStatus,
+)
+
+__all__ = [
+    "get_logger",
+    "Solution",
+    "Message",
+    "Role",
+    "MimeType",
+    "ContentElement",
+    "ThinkElement",
+    "ToolCallElement",
+    "ToolOutputElement",
+    "dumps",
+    "loads",
+    "EvaluationResult",
+    "EvaluationStatus",
+]
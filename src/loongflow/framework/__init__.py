@@ -6,9 +6,9 @@ This module provides the core implementations for different agent paradigms:
 - Base classes for building custom agents
 """
 
-from . import base
-from . import pes
-from . import react
-from . import claude_code
+from loongflow._lazy import attach
 
 __all__ = ["base", "pes", "react", "claude_code"]
+
+# Subpackages are imported on first access, see loongflow._lazy
+__getattr__, __dir__ = attach(__name__, submodules=__all__)
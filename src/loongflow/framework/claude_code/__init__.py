@@ -4,11 +4,27 @@
 This file is init file
 """
 
-from loongflow.framework.claude_code.claude_code_agent import ClaudeCodeAgent
+from typing import TYPE_CHECKING
+
+from loongflow._lazy import attach
 from loongflow.framework.claude_code.general_prompt import *
 
+if TYPE_CHECKING:
+    from loongflow.framework.claude_code.claude_code_agent import ClaudeCodeAgent
+    from loongflow.framework.claude_code.session_pool import ClaudeSessionPool
+
+# The Claude SDK is only imported with the agent
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "ClaudeCodeAgent": "loongflow.framework.claude_code.claude_code_agent",
+        "ClaudeSessionPool": "loongflow.framework.claude_code.session_pool",
+    },
+)
+
 __all__ = [
     "ClaudeCodeAgent",
+    "ClaudeSessionPool",
     "GENERAL_PLANNER_SYSTEM",
     "GENERAL_EXECUTOR_SYSTEM",
     "GENERAL_SUMMARY_SYSTEM",
@@ -5,7 +5,8 @@ This file defines the claude code agent
 
 import asyncio
 import os
-from typing import Optional, List, Dict, Any, Callable
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, Callable, AsyncIterator, Tuple
 
 from loongflow.agentsdk.logger import get_logger
 from loongflow.framework.base import AgentBase
@@ -18,6 +19,10 @@ from claude_agent_sdk import (
     create_sdk_mcp_server,
     tool,
 )
+from loongflow.framework.claude_code.session_pool import (
+    ClaudeSessionPool,
+    PooledSession,
+)
 
 logger = get_logger(__name__)
 
@@ -94,6 +99,7 @@ class ClaudeCodeAgent(AgentBase):
         setting_sources: Optional[List[str]] = None,
         max_turns: Optional[int] = None,
         max_thinking_tokens: Optional[int] = None,
+        session_pool: Optional[ClaudeSessionPool] = None,
     ):
         """
         Initialize ClaudeCodeAgent.
@@ -126,6 +132,8 @@ class ClaudeCodeAgent(AgentBase):
                            - "acceptEdits": Auto-approve file edits
                            - "acceptAll": Auto-approve all operations
             verbose: Whether to enable verbose logging
+            session_pool: Pool of warm Claude sessions to run on (optional)
+                         If not provided, every run starts and stops its own CLI session.
         """
         super().__init__()
 
@@ -156,6 +164,8 @@ class ClaudeCodeAgent(AgentBase):
         self.permission_mode = permission_mode or "acceptEdits"
         self.setting_sources = setting_sources or ["project"]
 
+        self.session_pool = session_pool
+
         apply_llm_config(api_key, url)
 
         # Build allowed tools list
@@ -329,6 +339,20 @@ class ClaudeCodeAgent(AgentBase):
 
         self.options = ClaudeAgentOptions(**options_kwargs)
 
+    @asynccontextmanager
+    async def _connect(
+        self,
+    ) -> AsyncIterator[Tuple[ClaudeSDKClient, Optional[PooledSession]]]:
+        """Connected client of a run, leased from the session pool if there is one."""
+        if self.session_pool is None:
+            async with ClaudeSDKClient(options=self.options) as client:
+                yield client, None
+        else:
+            async with self.session_pool.session(
+                self.options, self.custom_tools
+            ) as session:
+                yield session.client, session
+
     async def run(self, input_query: str, **kwargs) -> Message:
         """
         Execute the agent with the given query using ClaudeSDKClient.
@@ -372,7 +396,7 @@ class ClaudeCodeAgent(AgentBase):
         try:
             # Use ClaudeSDKClient for better connection management
             self.logger.debug("Connecting to Claude SDK...")
-            async with ClaudeSDKClient(options=self.options) as client:
+            async with self._connect() as (client, session):
                 self.logger.debug("Connection established, sending query")
                 # Send the query
                 await client.query(input_query)
@@ -412,6 +436,10 @@ class ClaudeCodeAgent(AgentBase):
 
                         # ResultMessage indicates completion
                         break
+                else:
+                    if session is not None:
+                        # The CLI stopped before the end of the run
+                        session.broken = True
 
         except ExceptionGroup as eg:
             # Handle TaskGroup exceptions (Python 3.11+)
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+"""
+This file defines the session pool of the claude code agent.
+
+Every ``ClaudeCodeAgent.run`` used to open its own ``ClaudeSDKClient``: spawn the
+CLI subprocess, handshake, register the custom tools and only then send the
+query. A ``ClaudeSessionPool`` keeps connected clients warm between runs that
+share a configuration (model, tools, permission mode, working directory, system
+prompt...), so that only the first run of a configuration pays for the setup.
+
+Between two runs a session is reset: the conversation is cleared with
+``/clear`` and the custom tools are rebound to the handlers of the next run, as
+the in-process MCP server of a session forwards every call to the handlers it is
+currently bound to. Sessions are recycled after ``max_age`` seconds or
+``max_uses`` runs, and discarded when a run fails or a health check does not
+answer.
+
+Usage:
+    pool = ClaudeSessionPool(max_age=900, max_uses=20)
+    agent = ClaudeCodeAgent(model="...", session_pool=pool)
+    result = await agent.run("...")
+    await pool.close()
+"""
+
+import asyncio
+import dataclasses
+import json
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from claude_agent_sdk import (
+    ClaudeAgentOptions,
+    ClaudeSDKClient,
+    ResultMessage,
+    create_sdk_mcp_server,
+    tool,
+)
+
+from loongflow.agentsdk.logger import get_logger
+
+logger = get_logger(__name__)
+
+SessionKey = Tuple[Any, ...]
+
+CLEAR_COMMAND = "/clear"
+
+
+def session_key(
+    options: ClaudeAgentOptions, custom_tools: Optional[Dict[str, Dict[str, Any]]] = None
+) -> SessionKey:
+    """
+    Key of the sessions a run with ``options`` and ``custom_tools`` can use.
+
+    Everything the CLI is started with is part of the key, except the in-process
+    MCP servers of the custom tools: only their names and schemas are, their
+    handlers are bound to the session for each run.
+    """
+    fields = {
+        field.name: getattr(options, field.name)
+        for field in dataclasses.fields(options)
+        if field.name != "mcp_servers"
+    }
+    tools = sorted(
+        (
+            name,
+            config.get("description", ""),
+            json.dumps(config.get("parameters", {}), sort_keys=True, default=str),
+        )
+        for name, config in (custom_tools or {}).items()
+    )
+    return (
+        json.dumps(fields, sort_keys=True, default=repr),
+        tuple(tools),
+    )
+
+
+class PooledSession:
+    """A connected client and the handlers its custom tools forward to."""
+
+    def __init__(self, key: SessionKey, client: ClaudeSDKClient):
+        self.key = key
+        self.client = client
+        self.handlers: Dict[str, Callable] = {}
+        self.created_at = time.monotonic()
+        self.uses = 0
+        # Set when the session must not be used again
+        self.broken = False
+
+    def bind(self, custom_tools: Optional[Dict[str, Dict[str, Any]]]) -> None:
+        """Forward the custom tool calls of the next run to ``custom_tools``."""
+        self.handlers = {
+            name: config["function"] for name, config in (custom_tools or {}).items()
+        }
+
+    def expired(self, max_age: float, max_uses: int) -> bool:
+        """Whether the session reached its recycle policy."""
+        return (
+            self.uses >= max_uses or time.monotonic() - self.created_at >= max_age
+        )
+
+    def forward(self, name: str) -> Callable:
+        """Custom tool function calling the handler ``name`` is bound to."""
+
+        async def call(args: Dict[str, Any]) -> Dict[str, Any]:
+            handler = self.handlers.get(name)
+            if handler is None:
+                return {
+                    "content": [{"type": "text", "text": f"Tool {name} is not bound"}],
+                    "is_error": True,
+                }
+            return await handler(args)
+
+        return call
+
+
+class ClaudeSessionPool:
+    """Warm ``ClaudeSDKClient`` sessions, keyed by ``session_key``."""
+
+    def __init__(
+        self,
+        max_idle_per_key: int = 4,
+        max_age: float = 900.0,
+        max_uses: int = 20,
+        reset_timeout: float = 30.0,
+        health_check_timeout: float = 5.0,
+        client_factory: Callable[[ClaudeAgentOptions], ClaudeSDKClient] = ClaudeSDKClient,
+    ):
+        """
+        Args:
+            max_idle_per_key (int): Idle sessions kept per key, extra ones are closed.
+            max_age (float): Seconds after which a session is recycled.
+            max_uses (int): Runs after which a session is recycled.
+            reset_timeout (float): Seconds allowed to clear a conversation.
+            health_check_timeout (float): Seconds allowed to answer a health check.
+            client_factory (Callable): Builds the client of a new session.
+        """
+        if max_idle_per_key < 0 or max_uses < 1 or max_age <= 0:
+            raise ValueError(
+                "max_idle_per_key must be >= 0, max_uses >= 1 and max_age > 0."
+            )
+        self.max_idle_per_key = max_idle_per_key
+        self.max_age = max_age
+        self.max_uses = max_uses
+        self.reset_timeout = reset_timeout
+        self.health_check_timeout = health_check_timeout
+        self.client_factory = client_factory
+        self._idle: Dict[SessionKey, List[PooledSession]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats = {"created": 0, "reused": 0, "recycled": 0, "discarded": 0}
+
+    @asynccontextmanager
+    async def session(
+        self,
+        options: ClaudeAgentOptions,
+        custom_tools: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> AsyncIterator[PooledSession]:
+        """
+        Lease a connected session for one run.
+
+        The session goes back to the pool when the block exits normally, it is
+        closed if the block raises or sets ``session.broken``.
+
+        Args:
+            options (ClaudeAgentOptions): Options of the run, its ``mcp_servers``
+                are replaced by the forwarding server of the session.
+            custom_tools (Optional[Dict[str, Dict[str, Any]]]): Custom tools of the
+                run, in the ``ClaudeCodeAgent`` format.
+        """
+        self._check_loop()
+        key = session_key(options, custom_tools)
+        session = await self._checkout(key, options, custom_tools)
+        session.bind(custom_tools)
+        try:
+            yield session
+        except BaseException:
+            session.broken = True
+            raise
+        finally:
+            session.uses += 1
+            await self._release(session)
+
+    async def close(self) -> None:
+        """Close every idle session."""
+        idle = [session for sessions in self._idle.values() for session in sessions]
+        self._idle.clear()
+        for session in idle:
+            await self._close(session)
+
+    def stats(self) -> Dict[str, int]:
+        """Counts of sessions created, reused, recycled and discarded, and idle."""
+        return {
+            **self._stats,
+            "idle": sum(len(sessions) for sessions in self._idle.values()),
+        }
+
+    def _check_loop(self) -> None:
+        """Sessions belong to the event loop they were connected in."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._idle:
+                logger.warning(
+                    "Claude session pool used from a new event loop, "
+                    "terminating its idle sessions."
+                )
+                idle = [
+                    session for sessions in self._idle.values() for session in sessions
+                ]
+                self._idle.clear()
+                for session in idle:
+                    self._terminate(session)
+                self._stats["discarded"] += len(idle)
+            self._loop = loop
+
+    async def _checkout(
+        self,
+        key: SessionKey,
+        options: ClaudeAgentOptions,
+        custom_tools: Optional[Dict[str, Dict[str, Any]]],
+    ) -> PooledSession:
+        idle = self._idle.get(key, [])
+        while idle:
+            session = idle.pop()
+            if session.expired(self.max_age, self.max_uses):
+                self._stats["recycled"] += 1
+                await self._close(session)
+            elif await self._healthy(session):
+                self._stats["reused"] += 1
+                return session
+            else:
+                self._stats["discarded"] += 1
+                await self._close(session)
+        return await self._connect(key, options, custom_tools)
+
+    async def _connect(
+        self,
+        key: SessionKey,
+        options: ClaudeAgentOptions,
+        custom_tools: Optional[Dict[str, Dict[str, Any]]],
+    ) -> PooledSession:
+        session = PooledSession(key, client=None)
+        if custom_tools:
+            server = create_sdk_mcp_server(
+                name="custom_tools",
+                version="1.0.0",
+                tools=[
+                    tool(
+                        name,
+                        config.get("description", f"Custom tool: {name}"),
+                        config.get("parameters", {}),
+                    )(session.forward(name))
+                    for name, config in custom_tools.items()
+                ],
+            )
+            options = dataclasses.replace(options, mcp_servers={"custom": server})
+        session.client = self.client_factory(options)
+        await session.client.connect()
+        self._stats["created"] += 1
+        return session
+
+    async def _healthy(self, session: PooledSession) -> bool:
+        """Whether the CLI of an idle session still answers control requests."""
+        try:
+            await asyncio.wait_for(
+                session.client.get_mcp_status(), self.health_check_timeout
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Discarding unhealthy Claude session: {e}")
+            return False
+
+    async def _reset(self, session: PooledSession) -> bool:
+        """Clear the conversation of a session so the next run starts afresh."""
+
+        async def clear():
+            await session.client.query(CLEAR_COMMAND)
+            async for message in session.client.receive_messages():
+                if isinstance(message, ResultMessage):
+                    return
+
+        try:
+            await asyncio.wait_for(clear(), self.reset_timeout)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to reset Claude session: {e}")
+            return False
+
+    async def _release(self, session: PooledSession) -> None:
+        session.handlers = {}
+        idle = self._idle.setdefault(session.key, [])
+        if session.broken:
+            self._stats["discarded"] += 1
+        elif session.expired(self.max_age, self.max_uses):
+            self._stats["recycled"] += 1
+        elif len(idle) >= self.max_idle_per_key:
+            pass
+        elif await self._reset(session):
+            idle.append(session)
+            return
+        else:
+            self._stats["discarded"] += 1
+        await self._close(session)
+
+    @staticmethod
+    async def _close(session: PooledSession) -> None:
+        try:
+            await session.client.disconnect()
+        except Exception as e:
+            logger.debug(f"Error while closing Claude session: {e}")
+
+    @staticmethod
+    def _terminate(session: PooledSession) -> None:
+        """
+        Stop the CLI of a session connected in another event loop.
+
+        ``disconnect`` cannot be awaited outside the loop the client was
+        connected in, so the CLI subprocess is terminated directly instead.
+        """
+        transport = getattr(session.client, "_transport", None)
+        process = getattr(transport, "_process", None)
+        if process is None or process.returncode is not None:
+            return
+        try:
+            process.terminate()
+        except Exception as e:
+            logger.debug(f"Error while terminating Claude session: {e}")
@@ -4,12 +4,32 @@
 all evolve module
 """
 
-from loongflow.framework.pes.pes_agent import PESAgent
-from loongflow.framework.pes.finalizer import LoongFlowFinalizer, Finalizer
-from loongflow.framework.pes.register import Worker
+from typing import TYPE_CHECKING
+
+from loongflow._lazy import attach
+from loongflow.framework.pes.register import ReusableWorker, Worker
+
+if TYPE_CHECKING:
+    from loongflow.framework.pes.finalizer import Finalizer, LoongFlowFinalizer
+    from loongflow.framework.pes.pes_agent import PESAgent
+    from loongflow.framework.pes.worker_pool import WorkerPool
+
+# The agent pulls in the database, the memories and their backends, subprocesses
+# importing the evaluator or the context do not need them
+__getattr__, __dir__ = attach(
+    __name__,
+    attributes={
+        "PESAgent": "loongflow.framework.pes.pes_agent",
+        "Finalizer": "loongflow.framework.pes.finalizer",
+        "LoongFlowFinalizer": "loongflow.framework.pes.finalizer",
+        "WorkerPool": "loongflow.framework.pes.worker_pool",
+    },
+)
 
 __all__ = [
     "Worker",
+    "ReusableWorker",
+    "WorkerPool",
     "PESAgent",
     "Finalizer",
     "LoongFlowFinalizer",
@@ -21,9 +21,11 @@ import yaml
 from pydantic import ValidationError
 
 from loongflow.agentsdk.logger.logger import TraceIdFilter
+from loongflow.agentsdk.logger.message_trace import start_message_trace
+from loongflow.agentsdk.logger.pipeline import start_log_pipeline
 from loongflow.framework.pes import PESAgent, Worker
 from loongflow.framework.pes.context import EvolveChainConfig
-from loongflow.framework.pes.evaluator import Evaluator
+from loongflow.framework.pes.evaluator import EvaluationScheduler, Evaluator
 
 
 class BasePESRunner(ABC):
@@ -318,10 +320,22 @@ class BasePESRunner(ABC):
             file_handler.addFilter(TraceIdFilter())
             root_logger.addHandler(file_handler)
 
+        if logger_config.async_logging:
+            start_log_pipeline(root_logger, queue_size=logger_config.queue_size)
+
+        if logger_config.message_trace:
+            start_message_trace(
+                Path(logger_config.log_path) / "messages.jsonl",
+                max_bytes=logger_config.message_trace_max_bytes,
+                backup_count=logger_config.message_trace_backup_count,
+                sample_rates=logger_config.message_trace_sample_rates,
+            )
+
         print(
             f"Logging configured. Level: {logger_config.level}, "
             f"Console: {logger_config.console_logging}, "
-            f"File: {logger_config.file_logging} (at {logger_config.log_path})"
+            f"File: {logger_config.file_logging} (at {logger_config.log_path}), "
+            f"Async: {logger_config.async_logging}"
         )
 
     # =========================================================================
@@ -414,6 +428,9 @@ class BasePESRunner(ABC):
 
         self._setup_logging(config)
 
+        # Concurrency limit of the evaluations of the whole process
+        EvaluationScheduler.configure_shared(config.evolve.evaluator.max_parallel_evaluations)
+
         # Prepare checkpoint path if provided
         checkpoint_path = Path(args.checkpoint_path) if args.checkpoint_path else None
 
@@ -11,6 +11,10 @@ from loongflow.framework.pes.context.config import (
     load_config,
 )
 from loongflow.framework.pes.context.context import Context
+from loongflow.framework.pes.context.prompt_context import (
+    PromptContextBuilder,
+    compact_evaluation,
+)
 from loongflow.framework.pes.context.workspace import Workspace
 
 __all__ = [
@@ -21,4 +25,6 @@ __all__ = [
     "EvaluatorConfig",
     "LLMConfig",
     "load_config",
+    "PromptContextBuilder",
+    "compact_evaluation",
 ]
@@ -4,7 +4,7 @@ EvolveChain configuration.
 """
 
 import os
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 import yaml
 from pydantic import BaseModel, Field, ValidationError, model_validator
@@ -35,6 +35,35 @@ class LoggerConfig(BaseModel):
         default=0,
         description="Number of backup log files to keep. 0 means logs are kept forever.",
     )
+    async_logging: bool = Field(
+        default=True,
+        description="Whether to write logs from a dedicated thread through a bounded queue "
+        "instead of on the event loop thread.",
+    )
+    queue_size: int = Field(
+        default=10000,
+        gt=0,
+        description="Maximum number of log records buffered by the asynchronous pipeline. "
+        "When it is nearly full, records below WARNING are sampled, then dropped.",
+    )
+    message_trace: bool = Field(
+        default=False,
+        description="Whether to write the messages passed to print_message as compact "
+        "JSON lines to 'messages.jsonl' in the log directory instead of rendering them.",
+    )
+    message_trace_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=0,
+        description="Size of the message trace file above which it is rotated, 0 disables rotation.",
+    )
+    message_trace_backup_count: int = Field(
+        default=5, ge=0, description="Number of rotated message trace files kept."
+    )
+    message_trace_sample_rates: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Fraction of the messages of each role written to the message trace, "
+        "e.g. {'tool': 0.2}. Roles not listed are always written.",
+    )
 
 
 class LLMConfig(BaseModel):
@@ -80,6 +109,11 @@ class LLMConfig(BaseModel):
         default=0.0,
         description="Price per token for prompt requests.",
     )
+    prompt_cache: bool = Field(
+        default=False,
+        description="Shape requests for provider prompt caching: a byte-stable static "
+        "prefix, and cache breakpoints for the providers taking them (Anthropic, Claude).",
+    )
 
 
 class EvaluatorConfig(BaseModel):
@@ -103,6 +137,64 @@ class EvaluatorConfig(BaseModel):
         gt=0,
         description="Timeout in seconds for a single evaluation run.",
     )
+    max_memory_mb: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Address space limit (RLIMIT_AS) in MB for each evaluation subprocess. "
+        "None means unlimited.",
+    )
+    max_cpu_seconds: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="CPU time limit (RLIMIT_CPU) in seconds for each evaluation subprocess. "
+        "None means unlimited.",
+    )
+    max_open_files: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Open file descriptor limit (RLIMIT_NOFILE) for each evaluation subprocess. "
+        "None means unlimited.",
+    )
+    max_processes: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Process and thread limit (RLIMIT_NPROC) for each evaluation subprocess. "
+        "Note that the kernel counts all processes of the current user. None means unlimited.",
+    )
+    cpu_affinity: Optional[List[int]] = Field(
+        default=None,
+        description="CPU cores the evaluation subprocesses are pinned to. None means no pinning.",
+    )
+    max_parallel_evaluations: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Maximum number of evaluations run at the same time, shared by all PES "
+        "cycles and evaluators of the process. A process-level setting, applied by the runner "
+        "when the run starts (EvaluationScheduler.configure_shared). None means one per "
+        "available CPU core.",
+    )
+    keep_eval_dirs: bool = Field(
+        default=True,
+        description="Whether to keep the eval_{id} directory of an evaluation once it ends, "
+        "whether it produced a result, failed or was cancelled.",
+    )
+    packages_path: Optional[str] = Field(
+        default=None,
+        description="Directory of the packages installed for missing modules of the evaluations. "
+        "If not set, defaults to a 'packages' subdirectory of the workspace.",
+    )
+    package_wheelhouse: Optional[str] = Field(
+        default=None,
+        description="Local directory of wheels and sdists missing packages are installed from.",
+    )
+    package_index_url: Optional[str] = Field(
+        default=None,
+        description="Package index missing packages are installed from. None means pip's default.",
+    )
+    package_offline: bool = Field(
+        default=False,
+        description="Whether missing packages are installed from package_wheelhouse only.",
+    )
     evolve_target: Optional[str] = Field(
         default=None,
         description="The specific target or goal for the evolution process, if applicable.",
@@ -149,6 +241,11 @@ class DatabaseConfig(BaseModel):
         description="Path to the directory for database outputs (e.g., checkpoints). "
         "If not set, defaults to a subdirectory within the root workspace.",
     )
+    compact_checkpoints: bool = Field(
+        default=False,
+        description="Write checkpoint files without indentation, smaller and "
+        "faster to save and load.",
+    )
 
     def to_dict(self) -> dict:
         """Convert configuration to dictionary for MemoryFactory"""
@@ -167,9 +264,45 @@ class DatabaseConfig(BaseModel):
             "feature_dimensions": self.feature_dimensions,
             "feature_scaling_method": self.feature_scaling_method,
             "output_path": self.output_path,
+            "compact_checkpoints": self.compact_checkpoints,
         }
 
 
+class WorkspaceConfig(BaseModel):
+    """Retention policies and disk quota of the evolution workspace."""
+
+    gc_enabled: bool = Field(
+        default=False,
+        description="Whether to garbage collect the workspace in the background during the run.",
+    )
+    gc_interval: int = Field(
+        default=10,
+        gt=0,
+        description="Number of completed evolution cycles between two collections.",
+    )
+    keep_top_k: int = Field(
+        default=5,
+        ge=0,
+        description="Iterations of the top k solutions of the database are always kept.",
+    )
+    keep_recent_iterations: int = Field(
+        default=10,
+        ge=0,
+        description="Number of latest iteration directories kept by the retention policy.",
+    )
+    max_bytes: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Byte quota of the workspace. Least recently used iterations beyond the "
+        "retention policy are evicted until it fits. None means unlimited.",
+    )
+    archive_retired: bool = Field(
+        default=False,
+        description="Pack retired iterations into a single tar archive per task instead of "
+        "deleting them. Quota evictions are always deleted.",
+    )
+
+
 class EvolveConfig(BaseModel):
     """Evolve configuration class."""
 
@@ -203,6 +336,10 @@ class EvolveConfig(BaseModel):
     evaluator: EvaluatorConfig = Field(
         ..., description="Configuration for the evaluation process."
     )
+    workspace: WorkspaceConfig = Field(
+        default_factory=WorkspaceConfig,
+        description="Retention policies and disk quota of the workspace.",
+    )
     max_iterations: int = Field(
         default=100, gt=0, description="The maximum number of evolution iterations."
     )
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Prompt context of the evolution workers: the parent and the inspiration solutions
+given to the planner and the executors.
+
+Embedding ``json.dumps(parent)`` puts the full code, evaluation and summary of the
+parent in every prompt, and again at every ReAct step. The builder keeps the code
+of one solution as the shared base, placed once in the system message, which is
+the same for every candidate and step so providers can cache it, and represents
+the solutions of the prompt as unified diffs against it. Evaluations are cut to
+their salient fields, and the solutions are packed into a token budget, the
+parent first:
+
+    builder = PromptContextBuilder(parent["solution"])
+    system_prompt = builder.system_prompt(EXECUTOR_SYSTEM_PROMPT)
+    parent_solution = builder.pack(parent, inspirations, budget_tokens=4000)
+"""
+
+import difflib
+import json
+from typing import Any, Iterable, List, Optional, Sequence
+
+# Evaluation fields kept in prompts, the others are logs and raw outputs
+SALIENT_EVALUATION_FIELDS = ("status", "score", "summary", "metrics")
+# Solution fields rendered in prompts, besides the code
+SOLUTION_FIELDS = ("solution_id", "score", "generate_plan", "summary", "evaluation")
+
+# Stands for the code of solutions equal to the base
+BASE_REFERENCE = "(identical to the base solution)"
+
+# Characters per token, the estimate of SimpleTokenCounter
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimated token count of ``text``."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+def _truncate(text: str, max_chars: Optional[int]) -> str:
+    if max_chars is None or len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}... [{len(text) - max_chars} more chars]"
+
+
+def compact_evaluation(
+    evaluation: Any,
+    fields: Sequence[str] = SALIENT_EVALUATION_FIELDS,
+    max_chars: Optional[int] = 1000,
+) -> Any:
+    """
+    The salient ``fields`` of an evaluation, given as a dict or a JSON string,
+    each cut to ``max_chars`` characters. Evaluations that are not JSON objects
+    are cut as a whole.
+    """
+    data = evaluation
+    if isinstance(evaluation, str):
+        try:
+            data = json.loads(evaluation)
+        except ValueError:
+            return _truncate(evaluation, max_chars)
+    if not isinstance(data, dict):
+        return _truncate(json.dumps(data, ensure_ascii=False, default=str), max_chars)
+
+    compact = {}
+    for name in fields:
+        if name not in data:
+            continue
+        value = data[name]
+        if isinstance(value, str):
+            value = _truncate(value, max_chars)
+        elif isinstance(value, (dict, list)):
+            text = json.dumps(value, ensure_ascii=False, default=str)
+            if max_chars is not None and len(text) > max_chars:
+                value = _truncate(text, max_chars)
+        compact[name] = value
+    return compact
+
+
+def solution_diff(base: str, code: str, name: str = "solution") -> str:
+    """Unified diff turning ``base`` into ``code``, empty if they are equal."""
+    return "".join(
+        difflib.unified_diff(
+            base.splitlines(keepends=True),
+            code.splitlines(keepends=True),
+            fromfile="base",
+            tofile=name,
+            n=2,
+        )
+    )
+
+
+class PromptContextBuilder:
+    """
+    Renders solutions for prompts against a shared base solution.
+
+    Solutions whose code is the base are rendered without code, the others with
+    the diff from the base, or with their full code when it is the shorter.
+    """
+
+    def __init__(
+        self,
+        base_solution: str = "",
+        evaluation_fields: Sequence[str] = SALIENT_EVALUATION_FIELDS,
+        max_field_chars: int = 1000,
+    ):
+        """
+        Args:
+            base_solution (str): Code of the base, usually the parent solution.
+            evaluation_fields (Sequence[str]): Evaluation fields kept.
+            max_field_chars (int): Longest text kept per field of a solution.
+        """
+        self.base_solution = base_solution or ""
+        self.evaluation_fields = tuple(evaluation_fields)
+        self.max_field_chars = max_field_chars
+
+    def base_section(self) -> str:
+        """The base solution, as placed in the system message."""
+        return (
+            "# Base Solution\n"
+            "The solutions in the following messages are given as unified diffs "
+            "against this base solution.\n"
+            f"```\n{self.base_solution}\n```"
+        )
+
+    def system_prompt(self, system_prompt: str) -> str:
+        """``system_prompt`` followed by the base solution."""
+        if not self.base_solution:
+            return system_prompt
+        return f"{system_prompt}\n\n{self.base_section()}"
+
+    def render(self, solution: dict, max_chars: Optional[int] = None) -> dict:
+        """
+        Prompt view of ``solution``: the fields of ``SOLUTION_FIELDS`` it has, the
+        evaluation cut to its salient fields, and the code as a diff.
+
+        Args:
+            solution (dict): Solution, as stored in the database.
+            max_chars (Optional[int]): Longest text kept per field, defaults to
+                ``max_field_chars``.
+        """
+        max_chars = self.max_field_chars if max_chars is None else max_chars
+        entry = {}
+        for name in SOLUTION_FIELDS:
+            value = solution.get(name)
+            if value is None or value == "":
+                continue
+            if name == "evaluation":
+                value = compact_evaluation(value, self.evaluation_fields, max_chars)
+            elif isinstance(value, str):
+                value = _truncate(value, max_chars)
+            entry[name] = value
+
+        code = solution.get("solution") or ""
+        if self.base_solution and code == self.base_solution:
+            entry["solution"] = BASE_REFERENCE
+        elif self.base_solution:
+            diff = solution_diff(
+                self.base_solution, code, solution.get("solution_id") or "solution"
+            )
+            if len(diff) < len(code):
+                entry["solution_diff"] = diff
+            else:
+                entry["solution"] = code
+        else:
+            entry["solution"] = code
+        return entry
+
+    def pack(
+        self,
+        parent: dict,
+        inspirations: Iterable[dict] = (),
+        budget_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Render the parent and the inspirations within ``budget_tokens``.
+
+        The parent is always included, with shorter fields if it does not fit in
+        the budget. Inspirations are then added in order while they fit, the ones
+        left out are counted at the end.
+
+        Returns:
+            str: The rendered solutions, to use in place of ``json.dumps(parent)``.
+        """
+        budget_chars = None if budget_tokens is None else budget_tokens * CHARS_PER_TOKEN
+
+        parent_entry = self.render(parent)
+        parent_text = self._dumps(parent_entry)
+        max_chars = self.max_field_chars
+        while budget_chars is not None and len(parent_text) > budget_chars and max_chars > 50:
+            max_chars //= 2
+            parent_entry = self.render(parent, max_chars)
+            parent_text = self._dumps(parent_entry)
+
+        inspirations = list(inspirations)
+        if not inspirations:
+            return parent_text
+
+        sections: List[str] = [f"## Parent\n{parent_text}"]
+        used = len(sections[0])
+        omitted = 0
+        for index, inspiration in enumerate(inspirations, 1):
+            text = f"## Inspiration {index}\n{self._dumps(self.render(inspiration))}"
+            if budget_chars is not None and used + len(text) > budget_chars:
+                omitted += 1
+                continue
+            sections.append(text)
+            used += len(text)
+        if omitted:
+            sections.append(f"({omitted} inspirations omitted to fit the context budget)")
+        return "\n\n".join(sections)
+
+    @staticmethod
+    def _dumps(entry: dict) -> str:
+        """Text form of a rendered solution, code and diffs fenced rather than escaped."""
+        lines = []
+        for name, value in entry.items():
+            if name in ("solution", "solution_diff") and value != BASE_REFERENCE:
+                fence = "diff" if name == "solution_diff" else ""
+                lines.append(f"{name}:\n```{fence}\n{value.rstrip()}\n```")
+            elif isinstance(value, (dict, list)):
+                lines.append(f"{name}: {json.dumps(value, ensure_ascii=False, default=str)}")
+            else:
+                lines.append(f"{name}: {value}")
+        return "\n".join(lines)
@@ -4,12 +4,37 @@
 Database for LoongFlow evolve paradigm.
 """
 
-from typing import Optional
+from typing import Optional, Sequence
 
 from loongflow.agentsdk.memory.evolution.base_memory import Solution
 from loongflow.agentsdk.memory.evolution.memory_factory import MemoryFactory
+from loongflow.agentsdk.serialization import clean_nan_values
 from loongflow.framework.pes.context.config import DatabaseConfig
 
+# Fields of the leaderboard entries, unless other fields are requested
+LEADERBOARD_FIELDS = ("solution_id", "score", "iteration", "island_id", "summary")
+# Longest text kept per field of a leaderboard entry
+LEADERBOARD_MAX_CHARS = 300
+
+
+def project_solution(
+    solution: Solution, fields: Sequence[str], max_chars: Optional[int] = None
+) -> dict:
+    """
+    Compact view of a solution: only ``fields``, texts cut to ``max_chars``.
+
+    Unknown and None fields are left out.
+    """
+    entry = {}
+    for name in fields:
+        value = getattr(solution, name, None)
+        if value is None or name == "metadata":
+            continue
+        if isinstance(value, str) and max_chars is not None and len(value) > max_chars:
+            value = f"{value[:max_chars]}... [{len(value) - max_chars} more chars]"
+        entry[name] = value
+    return clean_nan_values(entry)
+
 
 class EvolveDatabase:
     """
@@ -51,12 +76,32 @@ class EvolveDatabase:
         Returns:
             The sampled solution dict.
         """
-        exploration_rate = self.config.exploration_rate
-        # Check the last 5 iteration solutions, if there are no obviously diff, it means we stuck in local optimum
-        # If in local optimum, we should increase the exploration rate to select a random solution
         previous_solutions = self._evolution_memory.list_solutions(
             filter_type="desc", limit=5
         )
+        exploration_rate = self._exploration_rate(previous_solutions)
+        solution = self._evolution_memory.sample(island_id, exploration_rate)
+        return solution.to_dict() if solution is not None else {}
+
+    async def asample_solution(self, island_id: Optional[int] = None) -> dict:
+        """
+        Async variant of ``sample_solution``, it does not block the event loop.
+
+        Returns:
+            The sampled solution dict.
+        """
+        previous_solutions = await self._evolution_memory.alist_solutions(
+            filter_type="desc", limit=5
+        )
+        exploration_rate = self._exploration_rate(previous_solutions)
+        solution = await self._evolution_memory.asample(island_id, exploration_rate)
+        return solution.to_dict() if solution is not None else {}
+
+    def _exploration_rate(self, previous_solutions: list[Solution]) -> float:
+        """Raise the configured exploration rate when the evolution is stuck."""
+        exploration_rate = self.config.exploration_rate
+        # Check the last 5 iteration solutions, if there are no obviously diff, it means we stuck in local optimum
+        # If in local optimum, we should increase the exploration rate to select a random solution
         # calculate the delta of the last 5 iterations
         deltas = [
             abs(previous_solutions[i].score - previous_solutions[i + 1].score)
@@ -71,9 +116,7 @@ class EvolveDatabase:
 
         if exploration_rate >= 1:
             exploration_rate = 0.9
-
-        solution = self._evolution_memory.sample(island_id, exploration_rate)
-        return solution.to_dict() if solution is not None else {}
+        return exploration_rate
 
     async def add_solution(self, solution: Solution) -> str:
         """
@@ -125,6 +168,18 @@ class EvolveDatabase:
         """Get current status of the memory."""
         return self._evolution_memory.memory_status(island_id)
 
+    async def amemory_status(self, island_id: Optional[int] = None) -> dict:
+        """Async variant of ``memory_status``."""
+        return await self._evolution_memory.amemory_status(island_id)
+
+    def stats_version(self) -> Optional[int]:
+        """Get a counter changing whenever the population changes."""
+        return self._evolution_memory.stats_version()
+
+    async def astats_version(self) -> Optional[int]:
+        """Async variant of ``stats_version``."""
+        return await self._evolution_memory.astats_version()
+
     async def save_checkpoint(self, checkpoint_path: str, tag: str):
         """Save the current state of the database to a file at the specified path."""
         await self._evolution_memory.save_checkpoint(checkpoint_path, tag)
@@ -133,6 +188,10 @@ class EvolveDatabase:
         """Load the saved state of the database from a file at the specified path."""
         self._evolution_memory.load_checkpoint(checkpoint_path)
 
+    async def aload_checkpoint(self, checkpoint_path: str):
+        """Async variant of ``load_checkpoint``."""
+        await self._evolution_memory.aload_checkpoint(checkpoint_path)
+
     def get_parents_by_child_id(self, child_id: str, parent_cnt: int) -> list[dict]:
         """
         Get parents by child id.
@@ -147,6 +206,15 @@ class EvolveDatabase:
         solutions = self._evolution_memory.get_parents_by_child_id(child_id, parent_cnt)
         return [solution.to_dict() for solution in solutions]
 
+    async def aget_parents_by_child_id(
+        self, child_id: str, parent_cnt: int
+    ) -> list[dict]:
+        """Async variant of ``get_parents_by_child_id``."""
+        solutions = await self._evolution_memory.aget_parents_by_child_id(
+            child_id, parent_cnt
+        )
+        return [solution.to_dict() for solution in solutions]
+
     def get_childs_by_parent_id(self, parent_id: str, child_cnt: int) -> list[dict]:
         """
         Get childs by parent id.
@@ -161,6 +229,15 @@ class EvolveDatabase:
         solutions = self._evolution_memory.get_childs_by_parent_id(parent_id, child_cnt)
         return [solution.to_dict() for solution in solutions]
 
+    async def aget_childs_by_parent_id(
+        self, parent_id: str, child_cnt: int
+    ) -> list[dict]:
+        """Async variant of ``get_childs_by_parent_id``."""
+        solutions = await self._evolution_memory.aget_childs_by_parent_id(
+            parent_id, child_cnt
+        )
+        return [solution.to_dict() for solution in solutions]
+
     def get_solutions(self, solution_ids: list[str]) -> list[dict]:
         """
         Get solutions by ids.
@@ -174,6 +251,11 @@ class EvolveDatabase:
         solutions = self._evolution_memory.get_solutions(solution_ids)
         return [solution.to_dict() for solution in solutions]
 
+    async def aget_solutions(self, solution_ids: list[str]) -> list[dict]:
+        """Async variant of ``get_solutions``."""
+        solutions = await self._evolution_memory.aget_solutions(solution_ids)
+        return [solution.to_dict() for solution in solutions]
+
     def get_best_solutions(
         self, island_id: Optional[int] = None, top_k: Optional[int] = None
     ) -> list[dict]:
@@ -189,3 +271,63 @@ class EvolveDatabase:
         """
         solutions = self._evolution_memory.get_best_solutions(island_id, top_k)
         return [solution.to_dict() for solution in solutions]
+
+    async def aget_best_solutions(
+        self, island_id: Optional[int] = None, top_k: Optional[int] = None
+    ) -> list[dict]:
+        """Async variant of ``get_best_solutions``."""
+        solutions = await self._evolution_memory.aget_best_solutions(island_id, top_k)
+        return [solution.to_dict() for solution in solutions]
+
+    def get_leaderboard(
+        self,
+        island_id: Optional[int] = None,
+        top_k: Optional[int] = None,
+        fields: Optional[list[str]] = None,
+        max_chars: Optional[int] = None,
+        default_fields: Sequence[str] = LEADERBOARD_FIELDS,
+        default_max_chars: Optional[int] = LEADERBOARD_MAX_CHARS,
+    ) -> list[dict]:
+        """
+        Get compact entries of the best solutions, as served to agents.
+
+        The in-memory backend keeps the best solutions materialized on every write,
+        so this does not scan the population.
+
+        Args:
+            island_id (int): Island id, all islands if None.
+            top_k (int): Number of solutions, 1 if None.
+            fields (List[str]): Solution fields of the entries, ``default_fields`` if None.
+            max_chars (int): Longest text kept per field, ``default_max_chars`` if None.
+            default_fields (Sequence[str]): Fields used when ``fields`` is None.
+            default_max_chars (int): Longest text kept when ``max_chars`` is None,
+                None to keep the texts whole.
+
+        Returns:
+            List[dict]: Entries of the best solutions, best first.
+        """
+        solutions = self._evolution_memory.get_best_solutions(island_id, top_k)
+        return self._project(
+            solutions, fields or default_fields, max_chars or default_max_chars
+        )
+
+    async def aget_leaderboard(
+        self,
+        island_id: Optional[int] = None,
+        top_k: Optional[int] = None,
+        fields: Optional[list[str]] = None,
+        max_chars: Optional[int] = None,
+        default_fields: Sequence[str] = LEADERBOARD_FIELDS,
+        default_max_chars: Optional[int] = LEADERBOARD_MAX_CHARS,
+    ) -> list[dict]:
+        """Async variant of ``get_leaderboard``."""
+        solutions = await self._evolution_memory.aget_best_solutions(island_id, top_k)
+        return self._project(
+            solutions, fields or default_fields, max_chars or default_max_chars
+        )
+
+    @staticmethod
+    def _project(
+        solutions: list[Solution], fields: Sequence[str], max_chars: Optional[int]
+    ) -> list[dict]:
+        return [project_solution(solution, fields, max_chars) for solution in solutions]
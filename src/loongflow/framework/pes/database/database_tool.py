@@ -38,6 +38,14 @@ class GetBestSolutionsArgs(BaseModel):
     top_k: Optional[int] = Field(
         None, description="The count of the top k solutions to retrieve."
     )
+    fields: Optional[list[str]] = Field(
+        None,
+        description="Solution fields to return, e.g. 'solution_id', 'score', 'iteration', "
+        "'island_id', 'parent_id', 'summary', 'generate_plan', 'evaluation', 'solution'.",
+    )
+    max_chars: Optional[int] = Field(
+        None, gt=0, description="Longest text returned per field, longer texts are cut."
+    )
 
 
 class GetBestSolutionsTool(FunctionTool):
@@ -55,6 +63,8 @@ class GetBestSolutionsTool(FunctionTool):
             + "If only island_id is provided, only the top k solutions for that island will be returned. "
             + "If only top_k is provided, the global top k solutions across all islands will be returned."
             + "If neither are provided, the global best solution across all islands will be returned."
+            + "Optional 'fields' selects the solution fields returned and 'max_chars' limits their length, "
+            + "use Get_Solutions to read a full solution by its id."
             + "Returns a list of solutions with the corresponding information.",
         )
 
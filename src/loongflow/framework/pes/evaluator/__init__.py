@@ -5,10 +5,15 @@ all evaluator module
 """
 
 from .evaluator import EvaluationResult, EvaluationStatus, Evaluator, LoongFlowEvaluator
+from .provisioner import PackageProvisioner, ProvisionResult
+from .scheduler import EvaluationScheduler
 
 __all__ = [
     "Evaluator",
     "LoongFlowEvaluator",
     "EvaluationResult",
     "EvaluationStatus",
+    "EvaluationScheduler",
+    "PackageProvisioner",
+    "ProvisionResult",
 ]
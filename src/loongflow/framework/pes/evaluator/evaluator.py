@@ -2,24 +2,48 @@
 
 import asyncio
 import concurrent.futures
+import hashlib
 import importlib.util
 import json
 import multiprocessing
 import os
+import shutil
+import signal
 import sys
 import threading
 import time
 import traceback
 import uuid
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import psutil
 
 from loongflow.agentsdk.logger.logger import get_logger
 from loongflow.agentsdk.message.elements import ContentElement
 from loongflow.agentsdk.message.message import Message
 from loongflow.framework.pes.context import EvaluatorConfig, Context
+from loongflow.framework.pes.evaluator.provisioner import PackageProvisioner
+from loongflow.framework.pes.evaluator.scheduler import EvaluationScheduler
+
+try:
+    import resource
+except ImportError:  # Not available on Windows.
+    resource = None
+
+# Interval in seconds between two resource usage samples of an evaluation process.
+USAGE_POLL_INTERVAL = 0.1
+
+# File, next to the evaluation result, the evaluation process reports its usage in.
+USAGE_FILE_NAME = "resource_usage.json"
+
+T = TypeVar("T")
+
+# Whether the current evaluation already holds a slot of the shared scheduler.
+_holding_slot: ContextVar[bool] = ContextVar("holding_evaluation_slot", default=False)
 
 
 class EvaluationStatus(str, Enum):
@@ -44,6 +68,7 @@ class EvaluationResult:
     score: float = 0.0
     metrics: dict = field(default_factory=dict)
     artifacts: dict = field(default_factory=dict)
+    metadata: dict = field(default_factory=dict)
 
     @classmethod
     def from_any_dict(cls, data: dict) -> "EvaluationResult":
@@ -109,6 +134,64 @@ class EvaluationResult:
         return json.dumps(self.to_dict(), indent=indent)
 
 
+def _apply_resource_limits(limits: Dict[str, Any]) -> None:
+    """
+    Apply rlimit caps and CPU pinning to the current process.
+
+    Soft and hard limits are both lowered so the evaluated code cannot raise them
+    again, but never above the hard limit the process already has. For CPU time the
+    hard limit is one second above the soft one, so the process receives SIGXCPU
+    before it is killed.
+    """
+    rlimits = {
+        "max_memory_mb": ("RLIMIT_AS", 1024 * 1024, 0),
+        "max_cpu_seconds": ("RLIMIT_CPU", 1, 1),
+        "max_open_files": ("RLIMIT_NOFILE", 1, 0),
+        "max_processes": ("RLIMIT_NPROC", 1, 0),
+    }
+    for key, (name, unit, hard_grace) in rlimits.items():
+        value = limits.get(key)
+        if value is None or resource is None or not hasattr(resource, name):
+            continue
+        rlimit = getattr(resource, name)
+        soft = value * unit
+        _, current_hard = resource.getrlimit(rlimit)
+        hard = soft + hard_grace
+        if current_hard != resource.RLIM_INFINITY:
+            soft = min(soft, current_hard)
+            hard = min(hard, current_hard)
+        resource.setrlimit(rlimit, (soft, hard))
+
+    cpu_affinity = limits.get("cpu_affinity")
+    if cpu_affinity and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpu_affinity)
+
+
+def _run_with_resource_limits(target: Callable, limits: Dict[str, Any], *args) -> None:
+    """
+    Process target that applies the resource limits before running the evaluation target.
+    """
+    _apply_resource_limits(limits)
+    target(*args)
+
+
+def _run_with_packages(
+    site_path: Optional[str], target: Callable, limits: Dict[str, Any], *args
+) -> None:
+    """
+    Process target that makes the provisioned packages of the run importable, after
+    those of the interpreter, before running the evaluation target.
+    """
+    if site_path:
+        if site_path not in sys.path:
+            sys.path.append(site_path)
+        # Also for the subprocesses the evaluation starts
+        os.environ["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [os.environ.get("PYTHONPATH"), site_path])
+        )
+    _run_with_resource_limits(target, limits, *args)
+
+
 class Evaluator(ABC):
     @abstractmethod
     async def evaluate(
@@ -122,6 +205,97 @@ class Evaluator(ABC):
         """Interrupt evaluation"""
         pass
 
+    async def evaluate_many(
+        self, messages: List[Message], context: Optional[Context] = None
+    ) -> AsyncIterator[Tuple[int, "EvaluationResult"]]:
+        """
+        Evaluate several solutions, yielding results as they complete.
+
+        Evaluations go through the scheduler shared by all PES cycles of the process
+        (see ``_scheduled``), which bounds the number of concurrent evaluations to the available cores, queues
+        them fairly per cycle and starts the shortest expected ones first. Evaluations
+        still pending when the iterator is closed (e.g. with contextlib.aclosing) are
+        cancelled.
+
+        Args:
+            messages (List[Message]): The solutions to evaluate.
+            context (Optional[Context]): Context of the PES cycle, its trace id is used
+                as fair queuing group.
+
+        Yields:
+            Tuple[int, EvaluationResult]: Index of the solution in ``messages`` and its result,
+                a framework error result if its evaluation raised.
+        """
+
+        async def _evaluate_one(index: int, message: Message):
+            # A failing evaluation only fails its own solution, not the batch
+            try:
+                result = await self._scheduled(
+                    lambda: self.evaluate(message, context), message, context
+                )
+            except Exception as e:
+                get_logger(self.__class__.__name__).error(
+                    f"Evaluation of solution {index} failed: {e}\n{traceback.format_exc()}"
+                )
+                result = EvaluationResult(
+                    status=EvaluationStatus.FRAMEWORK_ERROR,
+                    summary=f"Evaluation failed with an exception: {e}",
+                )
+            return index, result
+
+        tasks = [
+            asyncio.ensure_future(_evaluate_one(i, message))
+            for i, message in enumerate(messages)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _scheduled(
+        self,
+        job: Callable[[], Awaitable[T]],
+        message: Message,
+        context: Optional[Context] = None,
+    ) -> T:
+        """
+        Run ``job``, evaluating ``message``, in a slot of the shared scheduler.
+
+        Evaluators call this from ``evaluate`` around their CPU-bound work, so that
+        direct ``evaluate`` calls are bounded and queued like those of
+        ``evaluate_many``. A job started while the evaluation already holds a slot
+        runs right away.
+        """
+        if _holding_slot.get():
+            return await job()
+
+        async def _hold() -> T:
+            token = _holding_slot.set(True)
+            try:
+                return await job()
+            finally:
+                _holding_slot.reset(token)
+
+        return await EvaluationScheduler.shared().run(
+            _hold,
+            group=context.trace_id if context is not None else "default",
+            family=self._scheduling_family(),
+            key=self._scheduling_key(message),
+        )
+
+    def _scheduling_family(self) -> str:
+        """Family of this evaluator's jobs for the shared scheduler duration estimates."""
+        return self.__class__.__name__
+
+    @staticmethod
+    def _scheduling_key(message: Message) -> str:
+        """Key of a solution for the shared scheduler duration estimates."""
+        elements = message.get_elements(ContentElement)
+        data = elements[0].data if elements else message.id
+        return hashlib.sha1(str(data).encode("utf-8")).hexdigest()
+
 
 class LoongFlowEvaluator(Evaluator):
     """
@@ -134,7 +308,107 @@ class LoongFlowEvaluator(Evaluator):
         self._thread_executor = concurrent.futures.ThreadPoolExecutor()
 
         self._active_processes: Dict[str, multiprocessing.Process] = {}
+        self._resource_usage: Dict[str, dict] = {}
+        self._cancelled_evals: set = set()
         self._processes_lock = threading.Lock()
+        self._provisioner: Optional[PackageProvisioner] = None
+
+    @property
+    def provisioner(self) -> PackageProvisioner:
+        """Provisioner of the packages missing from the evaluations of the run."""
+        if self._provisioner is None:
+            packages_path = self.config.packages_path or os.path.join(
+                self.config.workspace_path or os.getcwd(), "packages"
+            )
+            self._provisioner = PackageProvisioner.shared(
+                packages_path,
+                wheelhouse=self.config.package_wheelhouse,
+                index_url=self.config.package_index_url,
+                offline=self.config.package_offline,
+            )
+        return self._provisioner
+
+    def _scheduling_family(self) -> str:
+        """Evaluations running the same evaluate code share duration estimates."""
+        return hashlib.sha1(self.config.evaluate_code.encode("utf-8")).hexdigest()
+
+    def _resource_limits(self) -> Dict[str, Any]:
+        """Collect the configured resource limits for the evaluation subprocess."""
+        return {
+            "max_memory_mb": self.config.max_memory_mb,
+            "max_cpu_seconds": self.config.max_cpu_seconds,
+            "max_open_files": self.config.max_open_files,
+            "max_processes": self.config.max_processes,
+            "cpu_affinity": self.config.cpu_affinity,
+        }
+
+    @staticmethod
+    def _sample_resource_usage(proc: psutil.Process, usage: dict) -> None:
+        """
+        Sample CPU time and RSS of the evaluation process and all its children.
+
+        Samples give the live usage of a running evaluation and the usage of one
+        that is killed. They miss short-lived children and peaks between two
+        samples, so they are replaced by the usage the evaluation process reports
+        when it exits (see ``_report_resource_usage``).
+        """
+        try:
+            procs = [proc] + proc.children(recursive=True)
+        except psutil.Error:
+            return
+
+        cpu_time = 0.0
+        rss = 0
+        for p in procs:
+            try:
+                with p.oneshot():
+                    times = p.cpu_times()
+                    rss += p.memory_info().rss
+                cpu_time += (
+                    times.user + times.system + times.children_user + times.children_system
+                )
+            except psutil.Error:
+                continue
+
+        usage["cpu_time_seconds"] = max(usage.get("cpu_time_seconds", 0.0), cpu_time)
+        usage["peak_rss_bytes"] = max(usage.get("peak_rss_bytes", 0), rss)
+
+    @staticmethod
+    def _report_resource_usage(base_dir: str) -> None:
+        """
+        Write the resource usage of the evaluation process to ``base_dir``.
+
+        Called by the evaluation process right before it exits. getrusage covers
+        the whole life of the process and of the children it waited for, peaks
+        included.
+        """
+        if resource is None:
+            return
+        own = resource.getrusage(resource.RUSAGE_SELF)
+        children = resource.getrusage(resource.RUSAGE_CHILDREN)
+        # Kilobytes on Linux, bytes on macOS
+        scale = 1 if sys.platform == "darwin" else 1024
+        usage = {
+            "cpu_time_seconds": own.ru_utime
+            + own.ru_stime
+            + children.ru_utime
+            + children.ru_stime,
+            "peak_rss_bytes": max(own.ru_maxrss, children.ru_maxrss) * scale,
+        }
+        try:
+            with open(os.path.join(base_dir, USAGE_FILE_NAME), "w") as f:
+                json.dump(usage, f)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _read_resource_usage(base_dir: str, usage: dict) -> None:
+        """Replace the sampled usage by the one the evaluation process reported."""
+        try:
+            with open(os.path.join(base_dir, USAGE_FILE_NAME), "r") as f:
+                usage.update(json.load(f))
+        except (OSError, ValueError):
+            pass
 
     @staticmethod
     def _run_evaluate_target(evaluator_file_path: str, llm_file_path: str):
@@ -200,6 +474,7 @@ class LoongFlowEvaluator(Evaluator):
                 json.dump(result_data, f, ensure_ascii=False, indent=2)
         except Exception as write_err:
             logger.error(f"[Child PID:{pid}] Failed to write result file: {write_err}")
+        LoongFlowEvaluator._report_resource_usage(base_dir)
 
         logger.debug(f"[Child PID:{pid}] Process logic finished. Forcing exit.")
 
@@ -225,24 +500,51 @@ class LoongFlowEvaluator(Evaluator):
         )
 
         # Note: We no longer pass a Queue
-        process_args = (evaluator_file_path, llm_file_path)
-        process = multiprocessing.Process(
-            target=self.__class__._run_evaluate_target, args=process_args
+        process_args = (
+            self.provisioner.site_path,
+            self.__class__._run_evaluate_target,
+            self._resource_limits(),
+            evaluator_file_path,
+            llm_file_path,
         )
+        process = multiprocessing.Process(target=_run_with_packages, args=process_args)
 
+        usage = {}
         with self._processes_lock:
+            if eval_id in self._cancelled_evals:
+                self._cancelled_evals.discard(eval_id)
+                return {"error": "Evaluation was cancelled (interrupted) before start."}
             self._active_processes[eval_id] = process
+            self._resource_usage[eval_id] = usage
 
         try:
+            start_time = time.monotonic()
             process.start()
-            process.join(timeout=self.config.timeout)
+            with self._processes_lock:
+                # Cancelled or interrupted while starting.
+                cancelled = eval_id not in self._active_processes
+            if cancelled:
+                process.terminate()
+            try:
+                ps_process = psutil.Process(process.pid)
+            except psutil.Error:
+                ps_process = None
+
+            deadline = start_time + self.config.timeout
+            while process.is_alive() and time.monotonic() < deadline:
+                if ps_process is not None:
+                    self._sample_resource_usage(ps_process, usage)
+                process.join(
+                    min(USAGE_POLL_INTERVAL, max(deadline - time.monotonic(), 0))
+                )
+            usage["wall_time_seconds"] = time.monotonic() - start_time
 
             if process.is_alive():
                 self._logger.debug(
                     f"[Parent] TIMEOUT: Process (pid: {process.pid}) is still alive after {self.config.timeout}s."
                 )
                 process.terminate()
-                process.join(timeout=5)
+                process.join(5)
                 if process.is_alive():
                     self._logger.debug(
                         f"[Parent] Process (pid: {process.pid}) did not terminate gracefully, killing."
@@ -255,6 +557,8 @@ class LoongFlowEvaluator(Evaluator):
             self._logger.debug(
                 f"[Parent] Process joined. Exit code: {process.exitcode}"
             )
+            base_dir = os.path.dirname(evaluator_file_path)
+            self._read_resource_usage(base_dir, usage)
 
             if process.exitcode != 0:
                 self._logger.debug(
@@ -263,7 +567,6 @@ class LoongFlowEvaluator(Evaluator):
                 # We still try to read the file, as the child might have written an error dict before crashing/exiting
 
             # Read the result from the file
-            base_dir = os.path.dirname(evaluator_file_path)
             output_file_path = os.path.join(base_dir, "evaluation_result.json")
             log_file_path = os.path.join(base_dir, "evaluation_process.log")
 
@@ -291,6 +594,12 @@ class LoongFlowEvaluator(Evaluator):
                     except:
                         pass
 
+                if process.exitcode == -signal.SIGXCPU:
+                    return {
+                        "error": f"Evaluation process exceeded the CPU time limit "
+                        f"({self.config.max_cpu_seconds}s), exit code: {process.exitcode}",
+                        "traceback": crash_log,
+                    }
                 if process.exitcode != 0:
                     return {
                         "error": f"Evaluation process exited with non-zero code: {process.exitcode}",
@@ -343,6 +652,8 @@ class LoongFlowEvaluator(Evaluator):
 
         self._logger.info(f"Starting evaluation {eval_id} in {temp_dir}")
 
+        result = None
+        future: Optional[concurrent.futures.Future] = None
         try:
             evaluate_code = self.config.evaluate_code
             llm_filename = f"llm_code_{eval_id}.py"
@@ -354,48 +665,88 @@ class LoongFlowEvaluator(Evaluator):
             with open(evaluator_file_path, "w", encoding="utf-8") as f:
                 f.write(evaluate_code)
 
-            loop = asyncio.get_running_loop()
+            async def _run_process() -> dict:
+                nonlocal future
+                future = self._thread_executor.submit(
+                    self._execute_in_process_with_timeout,
+                    eval_id,
+                    evaluator_file_path,
+                    llm_file_path,
+                )
+                return await asyncio.wrap_future(future)
 
-            result_dict = await loop.run_in_executor(
-                self._thread_executor,
-                self._execute_in_process_with_timeout,
-                eval_id,
-                evaluator_file_path,
-                llm_file_path,
-            )
+            # Only the evaluation process takes a slot of the shared scheduler
+            result_dict = await self._scheduled(_run_process, message, context)
 
             if isinstance(result_dict, dict) and "error" in result_dict:
                 if "interrupted" in str(result_dict["error"]):
-                    return EvaluationResult(score=0.0, metrics=result_dict)
-                return EvaluationResult(score=0.0, metrics=result_dict)
+                    result = EvaluationResult(score=0.0, metrics=result_dict)
+                    return result
+                result = EvaluationResult(score=0.0, metrics=result_dict)
+                return result
 
             result = EvaluationResult.from_any_dict(result_dict)
             self._logger.info(f"Evaluation completed. \
 Status: {result.status}, Score: {result.score}, Summary: {result.summary}")
             return result
+        except asyncio.CancelledError:
+            self._logger.info(f"Evaluation {eval_id} cancelled, terminating its process.")
+            self._cancel_process(eval_id)
+            if future is not None:
+                # Once the worker is done it can no longer start the process
+                future.add_done_callback(lambda _: self._forget_cancelled(eval_id))
+            else:
+                self._forget_cancelled(eval_id)
+            raise
         except TimeoutError as e:
             self._logger.error(str(e))
-            return EvaluationResult(
+            result = EvaluationResult(
                 score=0.0,
                 status=EvaluationStatus.FRAMEWORK_ERROR,
                 summary="Evaluation execution timed out.",
                 metrics={"error": str(e)},
             )
+            return result
         except Exception as e:
             self._logger.error(
                 f"Unexpected error in evaluation orchestration: {e}", exc_info=True
             )
             if isinstance(e, RuntimeError) and "cannot schedule new futures" in str(e):
-                return EvaluationResult(
+                result = EvaluationResult(
                     score=0.0,
                     status=EvaluationStatus.FRAMEWORK_ERROR,
                     summary="Evaluation execution was interrupted.",
                     metrics={"error": "Evaluator was interrupted."},
                 )
+                return result
             raise
         finally:
-            # shutil.rmtree(temp_dir, ignore_errors=True)
-            pass
+            with self._processes_lock:
+                usage = self._resource_usage.pop(eval_id, {})
+            if result is not None:
+                result.metadata.update(usage)
+            if not self.config.keep_eval_dirs:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def _cancel_process(self, eval_id: str) -> None:
+        """
+        Terminate the process of a cancelled evaluation, or prevent it from starting.
+        """
+        with self._processes_lock:
+            process = self._active_processes.pop(eval_id, None)
+            if process is None:
+                self._cancelled_evals.add(eval_id)
+                return
+        try:
+            if process.is_alive():
+                process.terminate()
+        except Exception as e:
+            self._logger.error(f"Error terminating process of evaluation {eval_id}: {e}")
+
+    def _forget_cancelled(self, eval_id: str) -> None:
+        """Drop the cancellation mark of an evaluation whose worker has finished."""
+        with self._processes_lock:
+            self._cancelled_evals.discard(eval_id)
 
     def _extract_evolution_context(
         self, message: Message
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This file provides the package provisioner of the evaluation environments.
+
+When an evaluation failed on a missing module, the executors used to ask the LLM
+for a pip command and run it with a blocking ``subprocess.run``: the event loop
+of the cycle stalled for the whole install, and concurrent cycles raced on the
+site-packages of the interpreter. A ``PackageProvisioner`` instead:
+
+- resolves the module to a requirement, first against the wheels of a local
+  wheelhouse (by the top-level modules they declare), then against a table of
+  well-known module names, falling back to the module name itself;
+- installs it with pip in a subprocess awaited by the event loop, into the
+  package directory of the run rather than the interpreter, with ``--no-index``
+  when the provisioner is offline;
+- runs one install at a time per package directory, across threads and
+  processes, and shares the result of an install with every concurrent request
+  for the same requirement.
+
+Evaluation processes see the package directory of their evaluator after the
+packages of the interpreter, so a provisioned package never shadows one the
+framework depends on.
+
+Layout:
+{packages_path}/site/...     installed packages
+{packages_path}/.lock        install lock
+"""
+
+import asyncio
+import concurrent.futures
+import importlib
+import importlib.metadata
+import os
+import re
+import sys
+import threading
+import time
+import zipfile
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from loongflow.agentsdk.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows.
+    fcntl = None
+
+logger = get_logger(__name__)
+
+# Top-level modules whose distribution has another name.
+MODULE_DISTRIBUTIONS = {
+    "Bio": "biopython",
+    "Crypto": "pycryptodome",
+    "OpenSSL": "pyOpenSSL",
+    "PIL": "Pillow",
+    "attr": "attrs",
+    "bs4": "beautifulsoup4",
+    "cv2": "opencv-python-headless",
+    "dateutil": "python-dateutil",
+    "docx": "python-docx",
+    "dotenv": "python-dotenv",
+    "google.protobuf": "protobuf",
+    "jwt": "PyJWT",
+    "magic": "python-magic",
+    "pptx": "python-pptx",
+    "serial": "pyserial",
+    "skimage": "scikit-image",
+    "sklearn": "scikit-learn",
+    "yaml": "PyYAML",
+    "zmq": "pyzmq",
+}
+
+WHEEL_SUFFIX = ".whl"
+SDIST_SUFFIXES = (".tar.gz", ".zip")
+
+
+def canonical_name(name: str) -> str:
+    """PEP 503 normalized name of a distribution."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _requirement_name(requirement: str) -> str:
+    """Distribution name of a requirement such as ``numpy>=1.26`` or ``scikit-learn``."""
+    return canonical_name(re.split(r"[\s\[<>=!~;@]", requirement.strip(), 1)[0])
+
+
+@dataclass
+class ProvisionResult:
+    """Outcome of a provisioning request."""
+
+    # Requirement installed, None if the module could not be resolved
+    requirement: Optional[str]
+    success: bool
+    # "installed", "cached" (already installed in the run) or "unresolved"
+    status: str
+    message: str = ""
+    output: str = ""
+    duration: float = 0.0
+
+
+class PackageProvisioner:
+    """
+    Installs the packages missing from the evaluations of a run.
+
+    Provisioners are thread safe and can be shared by coroutines running on
+    different event loops, ``PackageProvisioner.shared`` returns the provisioner
+    of a package directory.
+    """
+
+    _shared: Dict[str, "PackageProvisioner"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        packages_path: str,
+        wheelhouse: Optional[str] = None,
+        index_url: Optional[str] = None,
+        offline: bool = False,
+        install_timeout: float = 600.0,
+        python: Optional[str] = None,
+    ):
+        """
+        Args:
+            packages_path (str): Directory of the packages installed for the run.
+            wheelhouse (Optional[str]): Directory of wheels and sdists to install from.
+            index_url (Optional[str]): Package index to install from, pip's default
+                index if None.
+            offline (bool): Install from the wheelhouse only, requests for packages
+                it does not hold fail without running pip.
+            install_timeout (float): Seconds allowed to an install.
+            python (Optional[str]): Interpreter running pip, the current one if None.
+        """
+        if offline and not wheelhouse:
+            raise ValueError("An offline provisioner needs a wheelhouse.")
+        self.packages_path = os.path.abspath(packages_path)
+        self.site_path = os.path.join(self.packages_path, "site")
+        self.wheelhouse = os.path.abspath(wheelhouse) if wheelhouse else None
+        self.index_url = index_url
+        self.offline = offline
+        self.install_timeout = install_timeout
+        self.python = python or sys.executable
+
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        # Results of the successful installs, by requirement
+        self._installed: Dict[str, ProvisionResult] = {}
+        self._wheelhouse_index: Optional[Tuple[int, Dict[str, str], Dict[str, str]]] = None
+
+    @classmethod
+    def shared(cls, packages_path: str, **kwargs) -> "PackageProvisioner":
+        """
+        Get the provisioner of ``packages_path``, creating it with ``kwargs`` on first use.
+        """
+        key = os.path.abspath(packages_path)
+        with cls._shared_lock:
+            provisioner = cls._shared.get(key)
+            if provisioner is None:
+                provisioner = cls(packages_path, **kwargs)
+                cls._shared[key] = provisioner
+            return provisioner
+
+    def resolve(self, module: str) -> Optional[str]:
+        """
+        Requirement providing ``module``, None if an offline provisioner cannot
+        provide it.
+        """
+        top_level = module.split(".")[0]
+        by_module, by_name = self._index_wheelhouse()
+        for name in (module, top_level):
+            if name in by_module:
+                return by_module[name]
+        distribution = (
+            MODULE_DISTRIBUTIONS.get(module)
+            or MODULE_DISTRIBUTIONS.get(top_level)
+            or top_level
+        )
+        if self.offline and canonical_name(distribution) not in by_name:
+            return None
+        return distribution
+
+    async def provision(self, module: str) -> ProvisionResult:
+        """Install the package providing ``module``, e.g. from a ``No module named`` error."""
+        requirement = self.resolve(module)
+        if requirement is None:
+            return ProvisionResult(
+                requirement=None,
+                success=False,
+                status="unresolved",
+                message=f"No package providing '{module}' in the wheelhouse {self.wheelhouse}",
+            )
+        return await self.install(requirement)
+
+    async def install(self, requirement: str, upgrade: bool = False) -> ProvisionResult:
+        """
+        Install ``requirement`` in the package directory of the run.
+
+        Concurrent requests for the same requirement share one install, later ones
+        return the cached result of the first successful install.
+        """
+        key = f"{requirement.strip()}{' --upgrade' if upgrade else ''}"
+        with self._lock:
+            cached = self._installed.get(key)
+            if cached is not None:
+                return ProvisionResult(
+                    requirement=cached.requirement,
+                    success=True,
+                    status="cached",
+                    message=cached.message,
+                )
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+        if not owner:
+            return await asyncio.wrap_future(future)
+
+        result = ProvisionResult(
+            requirement=requirement, success=False, status="installed"
+        )
+        try:
+            result = await self._install(requirement, upgrade)
+        except asyncio.CancelledError:
+            result.message = f"Install of {requirement} was cancelled"
+            raise
+        except Exception as e:
+            logger.error(f"Failed to install {requirement}: {e}")
+            result.message = f"Failed to install {requirement}: {e}"
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+                if result.success:
+                    self._installed[key] = result
+            future.set_result(result)
+        return result
+
+    def environment(self) -> Dict[str, str]:
+        """Environment variables giving a subprocess the packages of the run."""
+        paths = [self.site_path]
+        if os.environ.get("PYTHONPATH"):
+            paths.append(os.environ["PYTHONPATH"])
+        return {"PYTHONPATH": os.pathsep.join(paths)}
+
+    def command(self, requirement: str, upgrade: bool = False) -> List[str]:
+        """pip command installing ``requirement``."""
+        command = [
+            self.python,
+            "-m",
+            "pip",
+            "install",
+            "--target",
+            self.site_path,
+            "--disable-pip-version-check",
+            "--no-input",
+        ]
+        if upgrade:
+            command.append("--upgrade")
+        if self.wheelhouse:
+            command += ["--find-links", self.wheelhouse]
+        if self.offline:
+            command.append("--no-index")
+        elif self.index_url:
+            command += ["--index-url", self.index_url]
+        command.append(requirement)
+        return command
+
+    async def _install(self, requirement: str, upgrade: bool) -> ProvisionResult:
+        start = time.monotonic()
+        lock_file = await asyncio.to_thread(self._acquire_lock)
+        try:
+            if not upgrade and self._has_distribution(requirement):
+                # Installed by another process of the run
+                return ProvisionResult(
+                    requirement=requirement,
+                    success=True,
+                    status="cached",
+                    message=f"{requirement} is already installed",
+                )
+            command = self.command(requirement, upgrade)
+            logger.info(f"Installing {requirement}: {' '.join(command)}")
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+            )
+            try:
+                stdout, _ = await asyncio.wait_for(
+                    process.communicate(), self.install_timeout
+                )
+            except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+                process.kill()
+                await process.wait()
+                if isinstance(e, asyncio.CancelledError):
+                    raise
+                return ProvisionResult(
+                    requirement=requirement,
+                    success=False,
+                    status="installed",
+                    message=f"Install of {requirement} timed out "
+                    f"after {self.install_timeout}s",
+                    duration=time.monotonic() - start,
+                )
+        finally:
+            self._release_lock(lock_file)
+
+        output = stdout.decode("utf-8", errors="replace")
+        success = process.returncode == 0
+        if success:
+            importlib.invalidate_caches()
+            logger.info(f"Installed {requirement} in {self.site_path}")
+        else:
+            logger.error(f"Failed to install {requirement}: {output[-2000:]}")
+        return ProvisionResult(
+            requirement=requirement,
+            success=success,
+            status="installed",
+            message=(
+                f"Successfully installed {requirement}"
+                if success
+                else f"Failed to install {requirement}"
+            ),
+            output=output,
+            duration=time.monotonic() - start,
+        )
+
+    def _has_distribution(self, requirement: str) -> bool:
+        if not os.path.isdir(self.site_path):
+            return False
+        name = _requirement_name(requirement)
+        if name != canonical_name(requirement.strip()):
+            # Version constraints are left to pip
+            return False
+        return any(
+            canonical_name(dist.metadata["Name"] or "") == name
+            for dist in importlib.metadata.distributions(path=[self.site_path])
+        )
+
+    def _acquire_lock(self):
+        """Lock the package directory against installs of other processes."""
+        os.makedirs(self.packages_path, exist_ok=True)
+        lock_file = open(os.path.join(self.packages_path, ".lock"), "a+")
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        return lock_file
+
+    @staticmethod
+    def _release_lock(lock_file) -> None:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        lock_file.close()
+
+    def _index_wheelhouse(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Requirements of the wheelhouse by top-level module and by distribution name.
+
+        The index is rebuilt when the wheelhouse directory changes.
+        """
+        if not self.wheelhouse:
+            return {}, {}
+        try:
+            mtime = os.stat(self.wheelhouse).st_mtime_ns
+        except OSError:
+            return {}, {}
+        index = self._wheelhouse_index
+        if index is not None and index[0] == mtime:
+            return index[1], index[2]
+
+        by_module: Dict[str, str] = {}
+        by_name: Dict[str, str] = {}
+        for filename in sorted(os.listdir(self.wheelhouse)):
+            if filename.endswith(WHEEL_SUFFIX):
+                name = filename.split("-", 1)[0]
+                by_name.setdefault(canonical_name(name), name)
+                for module in _wheel_top_level(os.path.join(self.wheelhouse, filename)):
+                    by_module.setdefault(module, name)
+            elif filename.endswith(SDIST_SUFFIXES):
+                name = filename.rsplit("-", 1)[0]
+                by_name.setdefault(canonical_name(name), name)
+        for name in list(by_name.values()):
+            # A distribution provides the module of its own name unless told otherwise
+            by_module.setdefault(name.replace("-", "_"), name)
+        self._wheelhouse_index = (mtime, by_module, by_name)
+        return by_module, by_name
+
+
+def _wheel_top_level(path: str) -> List[str]:
+    """Top-level modules installed by a wheel."""
+    try:
+        with zipfile.ZipFile(path) as wheel:
+            names = wheel.namelist()
+            for name in names:
+                if name.endswith(".dist-info/top_level.txt"):
+                    content = wheel.read(name).decode("utf-8")
+                    return [line.strip() for line in content.splitlines() if line.strip()]
+    except (OSError, zipfile.BadZipFile, UnicodeDecodeError):
+        return []
+    modules = set()
+    for name in names:
+        top = name.split("/", 1)[0]
+        if top.endswith((".dist-info", ".data")):
+            continue
+        modules.add(top[:-3] if top.endswith(".py") else top)
+    return sorted(modules)
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This file provides the evaluation scheduler shared by all PES cycles in a process.
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def available_cores() -> int:
+    """Number of CPU cores this process is allowed to run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(len(os.sched_getaffinity(0)), 1)
+    return os.cpu_count() or 1
+
+
+class EvaluationScheduler:
+    """
+    Core-aware scheduler for evaluation jobs.
+
+    At most ``max_concurrency`` jobs run at the same time, by default one per
+    available core. Waiting jobs are queued per group (one group per PES cycle) and
+    groups are served round-robin, so a cycle submitting many candidates cannot
+    starve the others. Inside a group the job with the shortest expected duration
+    runs first. Expected durations come from the durations recorded for the same
+    key, falling back to the mean duration of its family, then of all jobs.
+
+    The scheduler is thread safe and can be shared by coroutines running on
+    different event loops.
+    """
+
+    _shared: Optional["EvaluationScheduler"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_concurrency: Optional[int] = None, max_history: int = 10000):
+        """
+        Args:
+            max_concurrency (Optional[int]): Maximum number of jobs running at the same
+                time. Defaults to the number of available cores.
+            max_history (int): Maximum number of per-key durations remembered.
+        """
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError(
+                f"Scheduler concurrency must be positive, got {max_concurrency}."
+            )
+        self.max_concurrency = max_concurrency or available_cores()
+        self.max_history = max_history
+
+        self._lock = threading.Lock()
+        self._running = 0
+        self._seq = itertools.count()
+        # group -> heap of (expected duration, seq, future)
+        self._queues: Dict[str, List[Tuple[float, int, asyncio.Future]]] = {}
+        self._rotation: Deque[str] = deque()
+
+        self._durations: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._family_stats: Dict[str, List[float]] = {}
+        self._total_stats = [0.0, 0]
+        self._completed = 0
+
+    @classmethod
+    def shared(cls) -> "EvaluationScheduler":
+        """Get the scheduler shared by all evaluators of this process."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def configure_shared(cls, max_concurrency: Optional[int] = None) -> "EvaluationScheduler":
+        """
+        Set the concurrency limit of the shared scheduler, a process-level setting.
+
+        Called once by the runner of the process (see ``BaseRunner``), not by the
+        evaluators, so that one evaluator cannot change the limit of all others.
+
+        Args:
+            max_concurrency (Optional[int]): Maximum number of evaluations running at
+                the same time, None for one per available core.
+
+        Returns:
+            EvaluationScheduler: The shared scheduler.
+        """
+        scheduler = cls.shared()
+        scheduler.set_max_concurrency(max_concurrency or available_cores())
+        return scheduler
+
+    def set_max_concurrency(self, max_concurrency: int) -> None:
+        """
+        Change the number of jobs allowed to run at the same time.
+
+        Waiting jobs are started right away if the limit grows. Running jobs are
+        never interrupted if it shrinks.
+        """
+        if max_concurrency <= 0:
+            raise ValueError(
+                f"Scheduler concurrency must be positive, got {max_concurrency}."
+            )
+        with self._lock:
+            self.max_concurrency = max_concurrency
+            self._dispatch()
+
+    def expected_duration(self, family: str, key: str) -> float:
+        """
+        Expected duration in seconds of a job.
+
+        Args:
+            family (str): Family of the job, e.g. a hash of the evaluation code.
+            key (str): Key of the job inside its family, e.g. a hash of the solution.
+
+        Returns:
+            float: The recorded duration for the key, else the mean of the family,
+                else the mean of all jobs, else 0.
+        """
+        with self._lock:
+            return self._expected_duration(family, key)
+
+    def _expected_duration(self, family: str, key: str) -> float:
+        duration = self._durations.get((family, key))
+        if duration is not None:
+            return duration
+        total, count = self._family_stats.get(family, (0.0, 0))
+        if count:
+            return total / count
+        total, count = self._total_stats
+        return total / count if count else 0.0
+
+    def record_duration(self, family: str, key: str, duration: float) -> None:
+        """Record the duration of a finished job."""
+        with self._lock:
+            self._durations[(family, key)] = duration
+            self._durations.move_to_end((family, key))
+            while len(self._durations) > self.max_history:
+                self._durations.popitem(last=False)
+            stats = self._family_stats.setdefault(family, [0.0, 0])
+            stats[0] += duration
+            stats[1] += 1
+            self._total_stats[0] += duration
+            self._total_stats[1] += 1
+
+    async def run(
+        self,
+        job: Callable[[], Awaitable[T]],
+        group: str = "default",
+        family: str = "default",
+        key: str = "",
+    ) -> T:
+        """
+        Wait for a free slot, run the job and record its duration.
+
+        Args:
+            job (Callable[[], Awaitable[T]]): Coroutine function running the evaluation.
+            group (str): Fair queuing group, typically the trace id of the PES cycle.
+            family (str): Family of the job used for duration estimates.
+            key (str): Key of the job used for duration estimates.
+
+        Returns:
+            T: The result of the job.
+        """
+        await self._acquire(group, family, key)
+        start = time.monotonic()
+        try:
+            result = await job()
+        finally:
+            self._release(finished=True)
+        self.record_duration(family, key, time.monotonic() - start)
+        return result
+
+    async def _acquire(self, group: str, family: str, key: str) -> None:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self._running < self.max_concurrency and not self._rotation:
+                self._running += 1
+                return
+            entry = (self._expected_duration(family, key), next(self._seq), future)
+            if group not in self._queues:
+                self._queues[group] = []
+                self._rotation.append(group)
+            heapq.heappush(self._queues[group], entry)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                granted = future.done() and not future.cancelled()
+                if not granted:
+                    self._remove(group, future)
+            if granted:
+                self._release()
+            raise
+
+    def _remove(self, group: str, future: asyncio.Future) -> None:
+        queue = self._queues.get(group)
+        if not queue:
+            return
+        queue[:] = [entry for entry in queue if entry[2] is not future]
+        heapq.heapify(queue)
+        if not queue:
+            del self._queues[group]
+            self._rotation.remove(group)
+
+    def _release(self, finished: bool = False) -> None:
+        with self._lock:
+            self._running -= 1
+            if finished:
+                self._completed += 1
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Start waiting jobs while slots are free, must be called with the lock held."""
+        while self._rotation and self._running < self.max_concurrency:
+            group = self._rotation.popleft()
+            queue = self._queues[group]
+            _, _, future = heapq.heappop(queue)
+            if queue:
+                self._rotation.append(group)
+            else:
+                del self._queues[group]
+            if future.done():
+                continue
+            try:
+                future.get_loop().call_soon_threadsafe(_grant, future, self)
+            except RuntimeError:
+                # The event loop of the waiting job is already closed.
+                continue
+            self._running += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler counters.
+
+        Returns:
+            dict: Concurrency limit, running and completed jobs, and waiting jobs per group.
+        """
+        with self._lock:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "running": self._running,
+                "completed": self._completed,
+                "waiting": {group: len(queue) for group, queue in self._queues.items()},
+            }
+
+
+def _grant(future: asyncio.Future, scheduler: EvaluationScheduler) -> None:
+    """Wake up a waiting job, giving the slot back if it was cancelled meanwhile."""
+    if future.cancelled():
+        scheduler._release()
+        return
+    future.set_result(None)
@@ -4,7 +4,10 @@
 all executor module
 """
 from .executor import Executor
+from .result_channel import CandidateRecord, ResultChannel
 
 __all__ = [
     "Executor",
+    "CandidateRecord",
+    "ResultChannel",
 ]
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+In-process channel of the candidate results of an executor cycle.
+
+Executors used to discover the outcome of their candidates by globbing the
+solution and evaluation files of each candidate folder, pairing them by file
+name suffix and reading every evaluation JSON again after each round. The
+evaluation tools now publish a ``CandidateRecord`` when they finish, and the
+executor reads the records of a candidate directly. The files are still written
+next to the records, as the durable mirror later stages read by path.
+
+Channels are per cycle, i.e. per executor directory, and shared inside the
+process:
+
+    channel = ResultChannel.for_context(context)
+    channel.publish(CandidateRecord(candidate="0_1", attempt="a3f", score=0.8, ...))
+    records = channel.records("0_1")
+    ResultChannel.release(context)
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from loongflow.agentsdk.logger import get_logger
+from loongflow.framework.pes.context import Context, Workspace
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CandidateRecord:
+    """The outcome of one evaluation of a candidate."""
+
+    # Candidate folder name, "{round_idx}_{candidate_idx}"
+    candidate: str
+    # Suffix shared by the solution and evaluation files of the attempt
+    attempt: str
+    score: float
+    solution_file_path: str
+    evaluation_file_path: str
+    # Evaluation fields as written to the evaluation file
+    evaluation: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+
+class ResultChannel:
+    """
+    Records published by the evaluation tools of an executor cycle.
+
+    Records are kept per candidate in publication order, publishing and reading
+    are thread safe. At most ``MAX_OPEN_CHANNELS`` channels are kept, the least
+    recently used ones are dropped, so a cycle that never releases its channel
+    does not grow the process.
+    """
+
+    MAX_OPEN_CHANNELS = 64
+
+    _channels: "OrderedDict[str, ResultChannel]" = OrderedDict()
+    _channels_lock = threading.Lock()
+
+    def __init__(self, key: str):
+        """
+        Args:
+            key (str): Key of the cycle, the absolute path of its executor directory.
+        """
+        self.key = key
+        self._lock = threading.Lock()
+        self._records: Dict[str, List[CandidateRecord]] = {}
+
+    @staticmethod
+    def cycle_key(context: Context) -> str:
+        """Key of the cycle of ``context``."""
+        return os.path.abspath(Workspace.get_executor_path(context, create=False))
+
+    @classmethod
+    def for_context(cls, context: Context) -> "ResultChannel":
+        """Get the channel of the cycle of ``context``, creating it on first use."""
+        key = cls.cycle_key(context)
+        with cls._channels_lock:
+            channel = cls._channels.get(key)
+            if channel is None:
+                channel = cls(key)
+                cls._channels[key] = channel
+                while len(cls._channels) > cls.MAX_OPEN_CHANNELS:
+                    evicted, _ = cls._channels.popitem(last=False)
+                    logger.debug(f"Dropping the result channel of {evicted}")
+            else:
+                cls._channels.move_to_end(key)
+            return channel
+
+    @classmethod
+    def release(cls, context: Context) -> None:
+        """Drop the channel of the cycle of ``context`` once its executor is done."""
+        with cls._channels_lock:
+            cls._channels.pop(cls.cycle_key(context), None)
+
+    def publish(self, record: CandidateRecord) -> None:
+        """Publish the outcome of an evaluation."""
+        with self._lock:
+            self._records.setdefault(record.candidate, []).append(record)
+
+    def records(self, candidate: str) -> List[CandidateRecord]:
+        """Records of ``candidate``, in publication order."""
+        with self._lock:
+            return list(self._records.get(candidate, ()))
@@ -70,7 +70,7 @@ class LoongFlowFinalizer(Finalizer):
             status_prefix = "Process was interrupted."
 
         try:
-            memory_status = database.memory_status()
+            memory_status = await database.amemory_status()
             global_status: Dict[str, Any] = memory_status.get("global_status", {})
 
             best_score = global_status.get("best_score")
@@ -86,7 +86,7 @@ class LoongFlowFinalizer(Finalizer):
 
             best_solution_list = []
             best_evaluation_list = []
-            best_solutions = database.get_best_solutions(top_k=3)
+            best_solutions = await database.aget_best_solutions(top_k=1)
             if best_solutions and len(best_solutions) > 0:
                 best_solution_list.append(best_solutions[0].get("solution", ""))
                 best_evaluation_list.append(best_solutions[0].get("evaluation", ""))
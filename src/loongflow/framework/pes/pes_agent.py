@@ -27,9 +27,10 @@ from loongflow.framework.pes.register import (
     PLANNER,
     SUMMARY,
     Worker,
-    get_worker,
     register_worker,
 )
+from loongflow.framework.pes.worker_pool import WorkerPool
+from loongflow.framework.pes.workspace_gc import WorkspaceManager
 
 
 class PESAgent(AgentBase):
@@ -75,6 +76,20 @@ class PESAgent(AgentBase):
         self.task_id = uuid.uuid4()  # Unique ID for this agent's run
         self._stop_event = asyncio.Event()
         self._running_tasks: Set[asyncio.Task] = set()
+        # Last memory status read and the stats version it was read at
+        self._status_cache: Optional[tuple[Optional[int], dict]] = None
+
+        # Worker instances are leased per concurrency slot, see ReusableWorker
+        self._worker_pool = WorkerPool(self.max_workers)
+
+        # Background workspace collection, see WorkspaceManager
+        self._workspace_manager: Optional[WorkspaceManager] = None
+        if self.config.evolve.workspace.gc_enabled:
+            self._workspace_manager = WorkspaceManager.from_config(
+                self.config.evolve, task_id=str(self.task_id)
+            )
+        self._gc_task: Optional[asyncio.Task] = None
+        self._active_iterations: Set[int] = set()
 
         # Locks
         self._iteration_lock = asyncio.Lock()  # Lock for starting new tasks
@@ -182,6 +197,7 @@ class PESAgent(AgentBase):
 
         previous_prompt_tokens = self.total_prompt_tokens
         previous_completion_tokens = self.total_completion_tokens
+        self._active_iterations.add(iteration_id)
 
         try:
             # 1. Prepare context and configurations for this cycle
@@ -228,13 +244,14 @@ class PESAgent(AgentBase):
             evaluator = self.evaluator
 
             # 2. --- Planner Step ---
-            planner = get_worker(
+            with self._worker_pool.lease(
                 planner_name,
                 PLANNER,
+                context,
                 config=planner_config,
                 db=self.database,
-            )
-            planner_result = await planner.run(context, None)
+            ) as planner:
+                planner_result = await planner.run(context, None)
             plan_content = planner_result.get_elements(ContentElement)
             if plan_content and len(plan_content) > 0:
                 async with self._token_lock:
@@ -249,14 +266,15 @@ class PESAgent(AgentBase):
                 return
 
             # 3. --- Executor Step ---
-            executor = get_worker(
+            with self._worker_pool.lease(
                 executor_name,
                 EXECUTOR,
+                context,
                 config=executor_config,
                 evaluator=evaluator,
                 db=self.database,
-            )
-            executor_result = await executor.run(context, planner_result)
+            ) as executor:
+                executor_result = await executor.run(context, planner_result)
             executor_content = executor_result.get_elements(ContentElement)
             if executor_content and len(executor_content) > 0:
                 async with self._token_lock:
@@ -271,13 +289,14 @@ class PESAgent(AgentBase):
                 return
 
             # 4. --- Summary Step ---
-            summary = get_worker(
+            with self._worker_pool.lease(
                 summary_name,
                 SUMMARY,
+                context,
                 config=summary_config,
                 db=self.database,
-            )
-            summary_result = await summary.run(context, executor_result)
+            ) as summary:
+                summary_result = await summary.run(context, executor_result)
             summary_content = summary_result.get_elements(ContentElement)
             if summary_content and len(summary_content) > 0:
                 async with self._token_lock:
@@ -326,6 +345,8 @@ class PESAgent(AgentBase):
                 exc_info=True,
             )
             time.sleep(3)
+        finally:
+            self._active_iterations.discard(iteration_id)
 
     async def _handle_cycle_completion_and_checkpoint(self, iteration_id: int):
         """
@@ -345,6 +366,38 @@ class PESAgent(AgentBase):
         if should_save:
             await self._save_checkpoint(iteration_id, current_count)
 
+        gc_interval = self.config.evolve.workspace.gc_interval
+        if self._workspace_manager is not None and current_count % gc_interval == 0:
+            self._schedule_workspace_gc()
+
+    def _schedule_workspace_gc(self) -> None:
+        """Start a background workspace collection unless one is still running."""
+        if self._gc_task is not None and not self._gc_task.done():
+            return
+        self._gc_task = asyncio.create_task(self._collect_workspace())
+
+    async def _collect_workspace(self) -> None:
+        """
+        Collect the workspace in a worker thread, keeping the iterations of the
+        best solutions and of the running cycles.
+        """
+        try:
+            protected = set(self._active_iterations)
+            top_k = self.config.evolve.workspace.keep_top_k
+            if top_k > 0:
+                best = await self.database.aget_best_solutions(top_k=top_k)
+                protected.update(solution.get("iteration") for solution in best)
+            report = await asyncio.to_thread(self._workspace_manager.collect, protected)
+            self.logger.info(
+                f"Workspace collected in {report.seconds:.2f}s: reclaimed "
+                f"{report.reclaimed_bytes} bytes and {report.reclaimed_inodes} inodes, "
+                f"removed {report.removed_eval_dirs} evaluation directories, "
+                f"retired iterations {report.retired_iterations}. "
+                f"Usage: {report.usage_bytes} bytes, {report.usage_inodes} inodes."
+            )
+        except Exception as e:
+            self.logger.error(f"Workspace collection failed: {e}", exc_info=True)
+
     async def _save_checkpoint(self, iteration_id: int, completion_count: int) -> None:
         """
         Saves a checkpoint with the specific naming convention.
@@ -374,6 +427,19 @@ class PESAgent(AgentBase):
                 exc_info=True,
             )
 
+    async def _memory_status(self) -> dict:
+        """Get the memory status, reused while the population is unchanged."""
+        version = await self.database.astats_version()
+        if (
+            version is not None
+            and self._status_cache is not None
+            and self._status_cache[0] == version
+        ):
+            return self._status_cache[1]
+        status = await self.database.amemory_status()
+        self._status_cache = (version, status)
+        return status
+
     async def _try_start_new_cycle(self) -> bool:
         """
         Atomically checks conditions and starts a new evolution cycle if possible.
@@ -475,8 +541,9 @@ class PESAgent(AgentBase):
                             exc_info=True,
                         )
 
-                    # Check for stop conditions after each completed cycle
-                    global_status = self.database.memory_status()
+                    # Check for stop conditions after each completed cycle, the
+                    # status is only re-read when the population changed
+                    global_status = await self._memory_status()
                     best_score = global_status.get("global_status", {}).get(
                         "best_score", 0.0
                     )
@@ -535,6 +602,9 @@ class PESAgent(AgentBase):
             else:
                 self.logger.info("Main loop finished. Cleaning up running tasks...")
             await self._cleanup_tasks()
+            if self._gc_task is not None:
+                # The collection runs in a thread, let it finish rather than cancel it
+                await self._gc_task
 
         # Calculate total tokens and cost (ensure this happens regardless of exit path)
         if total_tokens == 0.0 and total_cost == 0.0:
@@ -561,6 +631,9 @@ class PESAgent(AgentBase):
                 f"Total tokens: {total_tokens}, Total Cost: {round(total_cost, 6)}."
             )
 
+        self.logger.info(f"Worker pool stats: {self._worker_pool.stats()}")
+        self._worker_pool.clear()
+
         self.logger.info("Evolution process concluded. Invoking Finalizer.")
         final_message = await self.finalizer.finalize(
             self.database,
@@ -40,6 +40,27 @@ class Worker(abc.ABC):
         pass
 
 
+class ReusableWorker(Worker):
+    """
+    Worker whose instances can be leased from a pool and reused across cycles.
+
+    Workers that build expensive state in ``__init__`` (LLM models, toolkits,
+    memories) can implement this interface so that ``PESAgent`` keeps them
+    alive between evolution cycles instead of constructing them every time.
+    Workers that only implement ``Worker`` are created per cycle as before.
+    """
+
+    @abc.abstractmethod
+    def reset(self, context: Any) -> None:
+        """
+        Reset per-cycle state before the instance is used for a new cycle.
+
+        Args:
+            context(Any): Context of the evolution cycle the worker is leased for
+        """
+        pass
+
+
 def register_worker(name: str, phase: str, worker_class: type):
     """Register an agent implementation
 
@@ -64,6 +85,35 @@ def register_worker(name: str, phase: str, worker_class: type):
         )
 
 
+def get_worker_class(name: str, phase: str) -> type:
+    """
+    Retrieve a registered worker class by name without instantiating it.
+
+    Args:
+        name (str): The name of the worker to retrieve.
+        phase (str): The phase of the worker, one of planner/executor/summary.
+
+    Returns:
+        type: The registered worker class.
+
+    Raises:
+        KeyError: If the agent is not registered.
+    """
+    _worker_class = None
+    phase = phase.lower()
+    if phase == PLANNER:
+        _worker_class = _planner_registry.get(name)
+    elif phase == EXECUTOR:
+        _worker_class = _executor_registry.get(name)
+    elif phase == SUMMARY:
+        _worker_class = _summary_registry.get(name)
+
+    if _worker_class is None:
+        raise KeyError(f"Worker '{name}' not found in Phase '{phase}'.")
+
+    return _worker_class
+
+
 def get_worker(name: str, phase: str, **kwargs) -> Worker:
     """
     Retrieve a registered worker (Planner, Executor, or Summary) by name.
@@ -91,17 +141,7 @@ def get_worker(name: str, phase: str, **kwargs) -> Worker:
     Raises:
         KeyError: If the agent is not registered.
     """
-    _worker_class = None
-    phase = phase.lower()
-    if phase == PLANNER:
-        _worker_class = _planner_registry[name]
-    elif phase == EXECUTOR:
-        _worker_class = _executor_registry[name]
-    elif phase == SUMMARY:
-        _worker_class = _summary_registry[name]
-
-    if _worker_class is None:
-        raise KeyError(f"Worker '{name}' not found in Phase '{phase}'.")
+    _worker_class = get_worker_class(name, phase)
 
     sig = inspect.signature(_worker_class.__init__)
 
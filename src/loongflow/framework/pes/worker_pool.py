@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This file provides the worker pool used by PESAgent to reuse planner、executor、summary
+instances across evolution cycles.
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple
+
+from loongflow.agentsdk.logger import get_logger
+from loongflow.framework.pes.register import (
+    ReusableWorker,
+    Worker,
+    get_worker,
+    get_worker_class,
+)
+
+logger = get_logger(__name__)
+
+
+class WorkerPool:
+    """
+    Pool of pre-initialized worker instances, leased per concurrency slot.
+
+    Workers implementing ``ReusableWorker`` are kept idle after a successful
+    run and handed to the next cycle after ``reset(context)``. At most ``size``
+    idle instances are kept per (phase, name), which matches the number of
+    concurrent evolution cycles. Workers that do not implement the lifecycle
+    are constructed for every lease and dropped afterwards.
+    """
+
+    def __init__(self, size: int):
+        """
+        Args:
+            size (int): Maximum number of idle instances kept per worker.
+        """
+        if size <= 0:
+            raise ValueError(f"Worker pool size must be positive, got {size}.")
+        self.size = size
+        self._idle: Dict[Tuple[str, str], List[Worker]] = defaultdict(list)
+        self._created = 0
+        self._reused = 0
+        self._discarded = 0
+
+    @contextmanager
+    def lease(self, name: str, phase: str, context: Any, **kwargs) -> Iterator[Worker]:
+        """
+        Lease a worker instance for one cycle.
+
+        The instance is returned to the pool when the block exits normally. If the
+        block raises (including cancellation), the instance is discarded because
+        its internal state can no longer be trusted.
+
+        Args:
+            name (str): The registered name of the worker.
+            phase (str): The phase of the worker, one of planner/executor/summary.
+            context (Any): Context of the evolution cycle.
+            **kwargs: Constructor arguments, forwarded to ``get_worker``.
+
+        Yields:
+            Worker: The leased worker instance.
+        """
+        worker = self.acquire(name, phase, context, **kwargs)
+        try:
+            yield worker
+        except BaseException:
+            self._discard(name, phase)
+            raise
+        self.release(name, phase, worker)
+
+    def acquire(self, name: str, phase: str, context: Any, **kwargs) -> Worker:
+        """
+        Take an idle instance or create a new one.
+
+        Args:
+            name (str): The registered name of the worker.
+            phase (str): The phase of the worker.
+            context (Any): Context of the evolution cycle.
+            **kwargs: Constructor arguments, forwarded to ``get_worker``.
+
+        Returns:
+            Worker: A worker ready to run the given cycle.
+        """
+        key = (phase.lower(), name)
+        idle = self._idle[key]
+        while idle:
+            worker = idle.pop()
+            try:
+                worker.reset(context)
+            except Exception as e:
+                logger.warning(
+                    f"Worker '{name}' ({phase}) failed to reset, discarding instance: {e}"
+                )
+                self._discarded += 1
+                continue
+            self._reused += 1
+            return worker
+
+        worker = get_worker(name, phase, **kwargs)
+        self._created += 1
+        if isinstance(worker, ReusableWorker):
+            worker.reset(context)
+        return worker
+
+    def release(self, name: str, phase: str, worker: Worker) -> None:
+        """
+        Return a worker after a successful run.
+
+        Args:
+            name (str): The registered name of the worker.
+            phase (str): The phase of the worker.
+            worker (Worker): The instance obtained from ``acquire``.
+        """
+        key = (phase.lower(), name)
+        idle = self._idle[key]
+        if not isinstance(worker, ReusableWorker) or len(idle) >= self.size:
+            self._discarded += 1
+            return
+        # Re-registering a name replaces the class, never hand out stale instances.
+        if type(worker) is not get_worker_class(name, phase):
+            self._discarded += 1
+            return
+        idle.append(worker)
+
+    def _discard(self, name: str, phase: str) -> None:
+        self._discarded += 1
+        logger.debug(f"Discarded worker '{name}' ({phase}) after a failed run.")
+
+    def clear(self) -> None:
+        """Drop all idle instances."""
+        self._idle.clear()
+
+    def stats(self) -> dict:
+        """
+        Get pool counters.
+
+        Returns:
+            dict: created/reused/discarded instance counts and idle instances per worker.
+        """
+        return {
+            "created": self._created,
+            "reused": self._reused,
+            "discarded": self._discarded,
+            "idle": {f"{phase}:{name}": len(v) for (phase, name), v in self._idle.items()},
+        }
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+This file provides the workspace garbage collector used by PESAgent to bound the
+disk usage of long evolution runs.
+
+Managed layout, see ``Workspace``:
+{root}/{task_id}/{iteration}/...   iteration directories, one per evolution cycle
+{root}/{task_id}/retired.tar       archive of the retired iterations, if enabled
+{eval_root}/eval_{uuid}/...        transient evaluation directories
+Other entries of the root (logs, database checkpoints) are never removed.
+"""
+
+import os
+import shutil
+import tarfile
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Iterable, List, Optional, Set, Tuple
+
+from loongflow.agentsdk.logger import get_logger
+from loongflow.framework.pes.context.config import EvolveConfig
+
+logger = get_logger(__name__)
+
+# Archive of the retired iterations of a task, appended to as iterations retire.
+RETIRED_ARCHIVE = "retired.tar"
+EVAL_DIR_PREFIX = "eval_"
+
+
+@dataclass
+class WorkspaceGCReport:
+    """Outcome of one collection."""
+
+    # Net bytes freed, the growth of the archives deducted
+    reclaimed_bytes: int = 0
+    # Files and directories removed
+    reclaimed_inodes: int = 0
+    removed_eval_dirs: int = 0
+    retired_iterations: List[int] = field(default_factory=list)
+    archived_iterations: List[int] = field(default_factory=list)
+    # Paths removed to get under the byte quota, least recently used first
+    evicted: List[str] = field(default_factory=list)
+    # Usage of the workspace after the collection
+    usage_bytes: int = 0
+    usage_inodes: int = 0
+    seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Convert the report to a dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class _Unit:
+    """A removable directory of the workspace."""
+
+    path: str
+    bytes: int
+    inodes: int
+    # Latest access or modification time of its entries
+    last_used: float
+    iteration: Optional[int] = None
+
+
+def _measure(path: str) -> Tuple[int, int, float]:
+    """(bytes, inodes, last used time) of a directory tree, the root included."""
+    total_bytes, inodes, last_used = 0, 1, 0.0
+    stack = [path]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    stat = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                inodes += 1
+                if entry.is_dir(follow_symlinks=False):
+                    # Scanning a directory updates its access time, only count writes
+                    last_used = max(last_used, stat.st_mtime)
+                    stack.append(entry.path)
+                else:
+                    last_used = max(last_used, stat.st_mtime, stat.st_atime)
+                    total_bytes += stat.st_size
+    return total_bytes, inodes, last_used
+
+
+def _is_task_dir(name: str) -> bool:
+    try:
+        uuid.UUID(name)
+    except ValueError:
+        return False
+    return True
+
+
+class WorkspaceManager:
+    """
+    Retention policies and a byte quota over the workspace of an evolution run.
+
+    A collection removes, in order:
+    1. Evaluation directories older than ``transient_grace_seconds``, their results
+       are recorded in the evaluation history and the database by then.
+    2. Iteration directories that are neither among the ``keep_recent_iterations``
+       latest iterations nor protected by the caller, typically the iterations of
+       the top-k solutions and of the running cycles. Retired iterations are
+       appended to a per-task tar archive first if ``archive_retired`` is set.
+    3. If the workspace still exceeds ``max_bytes``, the least recently used
+       unprotected iteration directories, recent ones included, until it fits.
+
+    Only the iterations of ``task_id``, the current run, are managed, so runs
+    sharing the workspace never retire each other's iterations.
+
+    Collections are serialized, so it is safe to run them from a background thread
+    while evolution cycles write to other iterations.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        eval_root: Optional[str] = None,
+        keep_recent_iterations: int = 10,
+        max_bytes: Optional[int] = None,
+        archive_retired: bool = False,
+        transient_grace_seconds: float = 0.0,
+        task_id: Optional[str] = None,
+    ):
+        """
+        Args:
+            root (str): Root of the iteration directories, the evolve workspace.
+            eval_root (Optional[str]): Directory of the evaluation directories.
+            keep_recent_iterations (int): Number of latest iterations always kept.
+            max_bytes (Optional[int]): Byte quota of the root and the evaluation
+                directories. None means unlimited.
+            archive_retired (bool): Pack retired iterations into an archive
+                instead of deleting them.
+            transient_grace_seconds (float): Minimum age of an evaluation
+                directory before it is removed, it may still be in use before.
+            task_id (Optional[str]): Task whose iterations are managed. None
+                manages the iterations of every task of the root, only meant for
+                offline cleanups of a workspace no run is using.
+        """
+        if keep_recent_iterations < 0:
+            raise ValueError(
+                f"keep_recent_iterations must not be negative, got {keep_recent_iterations}."
+            )
+        self.root = root
+        self.eval_root = eval_root
+        self.keep_recent_iterations = keep_recent_iterations
+        self.max_bytes = max_bytes
+        self.archive_retired = archive_retired
+        self.transient_grace_seconds = transient_grace_seconds
+        self.task_id = None if task_id is None else str(task_id)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(
+        cls, config: EvolveConfig, task_id: Optional[str] = None
+    ) -> "WorkspaceManager":
+        """
+        Create a manager of the iterations of ``task_id`` from the ``workspace``
+        section of the evolve config.
+        """
+        workspace = config.workspace
+        return cls(
+            root=config.workspace_path,
+            eval_root=config.evaluator.workspace_path,
+            keep_recent_iterations=workspace.keep_recent_iterations,
+            max_bytes=workspace.max_bytes,
+            archive_retired=workspace.archive_retired,
+            transient_grace_seconds=config.evaluator.timeout,
+            task_id=task_id,
+        )
+
+    def usage(self) -> Tuple[int, int]:
+        """(bytes, inodes) used by the workspace and the evaluation directories."""
+        total_bytes, inodes = 0, 0
+        for path in self._measured_roots():
+            size, count, _ = _measure(path)
+            total_bytes, inodes = total_bytes + size, inodes + count
+        return total_bytes, inodes
+
+    def collect(self, protected_iterations: Iterable[int] = ()) -> WorkspaceGCReport:
+        """
+        Run one collection.
+
+        Args:
+            protected_iterations (Iterable[int]): Iterations that must be kept,
+                e.g. the iterations of the best solutions and of running cycles.
+
+        Returns:
+            WorkspaceGCReport: What was reclaimed and the usage afterwards.
+        """
+        with self._lock:
+            start = time.perf_counter()
+            protected = {i for i in protected_iterations if i is not None}
+            report = WorkspaceGCReport()
+            now = time.time()
+
+            eval_dirs = self._eval_dirs()
+            for unit in eval_dirs:
+                if now - unit.last_used >= self.transient_grace_seconds:
+                    self._remove(unit, report)
+                    report.removed_eval_dirs += 1
+
+            iterations = self._iteration_dirs()
+            recent = sorted({u.iteration for u in iterations}, reverse=True)
+            kept = protected | set(recent[: self.keep_recent_iterations])
+            survivors = []
+            for unit in iterations:
+                if unit.iteration in kept:
+                    survivors.append(unit)
+                    continue
+                if self.archive_retired and not self._archive(unit, report):
+                    # Kept until it can be archived, retried on the next pass
+                    continue
+                self._remove(unit, report)
+                report.retired_iterations.append(unit.iteration)
+
+            if self.max_bytes is not None:
+                self._enforce_quota(survivors, protected, report)
+
+            report.usage_bytes, report.usage_inodes = self.usage()
+            report.retired_iterations.sort()
+            report.archived_iterations.sort()
+            report.seconds = time.perf_counter() - start
+            return report
+
+    def _enforce_quota(
+        self, iterations: List[_Unit], protected: Set[int], report: WorkspaceGCReport
+    ) -> None:
+        usage, _ = self.usage()
+        # Evaluation directories left are still in use, only iterations are evicted
+        candidates = [u for u in iterations if u.iteration not in protected]
+        candidates.sort(key=lambda u: u.last_used)
+        for unit in candidates:
+            if usage <= self.max_bytes:
+                break
+            self._remove(unit, report)
+            usage -= unit.bytes
+            report.evicted.append(unit.path)
+            report.retired_iterations.append(unit.iteration)
+        if usage > self.max_bytes:
+            logger.warning(
+                f"Workspace usage {usage} bytes exceeds the quota of {self.max_bytes} "
+                "bytes with only protected directories left."
+            )
+
+    def _measured_roots(self) -> List[str]:
+        roots = [self.root]
+        if self.eval_root and not os.path.abspath(self.eval_root).startswith(
+            os.path.abspath(self.root) + os.sep
+        ):
+            roots.append(self.eval_root)
+        return [path for path in roots if os.path.isdir(path)]
+
+    def _eval_dirs(self) -> List[_Unit]:
+        if not self.eval_root or not os.path.isdir(self.eval_root):
+            return []
+        units = []
+        with os.scandir(self.eval_root) as entries:
+            for entry in entries:
+                if entry.name.startswith(EVAL_DIR_PREFIX) and entry.is_dir(
+                    follow_symlinks=False
+                ):
+                    units.append(_Unit(entry.path, *_measure(entry.path)))
+        return units
+
+    def _iteration_dirs(self) -> List[_Unit]:
+        if not os.path.isdir(self.root):
+            return []
+        if self.task_id is not None:
+            task_dirs = [os.path.join(self.root, self.task_id)]
+        else:
+            with os.scandir(self.root) as tasks:
+                task_dirs = [
+                    task.path
+                    for task in tasks
+                    if _is_task_dir(task.name) and task.is_dir(follow_symlinks=False)
+                ]
+        units = []
+        for task_dir in task_dirs:
+            if not os.path.isdir(task_dir):
+                continue
+            with os.scandir(task_dir) as entries:
+                for entry in entries:
+                    if entry.name.isdigit() and entry.is_dir(follow_symlinks=False):
+                        units.append(
+                            _Unit(
+                                entry.path,
+                                *_measure(entry.path),
+                                iteration=int(entry.name),
+                            )
+                        )
+        return units
+
+    def _archive(self, unit: _Unit, report: WorkspaceGCReport) -> bool:
+        """Append ``unit`` to the archive of its task, returns whether it succeeded."""
+        archive = os.path.join(os.path.dirname(unit.path), RETIRED_ARCHIVE)
+        existed = os.path.exists(archive)
+        before = os.path.getsize(archive) if existed else 0
+        try:
+            with tarfile.open(archive, "a") as tar:
+                tar.add(unit.path, arcname=os.path.basename(unit.path))
+        except (OSError, tarfile.TarError) as e:
+            logger.error(f"Failed to archive {unit.path}, keeping it: {e}")
+            return False
+        report.reclaimed_bytes -= os.path.getsize(archive) - before
+        if not existed:
+            report.reclaimed_inodes -= 1
+        report.archived_iterations.append(unit.iteration)
+        return True
+
+    @staticmethod
+    def _remove(unit: _Unit, report: WorkspaceGCReport) -> None:
+        shutil.rmtree(unit.path, ignore_errors=True)
+        if os.path.exists(unit.path):
+            # Partially removed, measure what is left
+            left_bytes, left_inodes, _ = _measure(unit.path)
+            report.reclaimed_bytes += unit.bytes - left_bytes
+            report.reclaimed_inodes += unit.inodes - left_inodes
+            return
+        report.reclaimed_bytes += unit.bytes
+        report.reclaimed_inodes += unit.inodes
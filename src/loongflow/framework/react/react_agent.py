@@ -119,7 +119,7 @@ class ReActAgent(ReactAgentBase):
             ).prompt_tokens
 
             logger.info(
-                f"Trace ID: {trace_id}: Agent: {self.name} Reason output: {thoughts}"
+                "Trace ID: %s: Agent: %s Reason output: %s", trace_id, self.name, thoughts
             )
             await self.context.add(thoughts)
 
@@ -134,7 +134,7 @@ class ReActAgent(ReactAgentBase):
                     "usage", default_completion_usage
                 ).prompt_tokens
                 logger.info(
-                    f"Trace ID: {trace_id}: Agent: {self.name} Act output: {output}"
+                    "Trace ID: %s: Agent: %s Act output: %s", trace_id, self.name, output
                 )
             await self.context.add(outputs)
 
@@ -147,7 +147,10 @@ class ReActAgent(ReactAgentBase):
                     "usage", default_completion_usage
                 ).prompt_tokens
                 logger.info(
-                    f"Trace ID: {trace_id}: Agent: {self.name} Finalizer output: {final_resp}"
+                    "Trace ID: %s: Agent: %s Finalizer output: %s",
+                    trace_id,
+                    self.name,
+                    final_resp,
                 )
                 await self.context.add(final_resp)
 
@@ -165,7 +168,10 @@ class ReActAgent(ReactAgentBase):
                     "usage", default_completion_usage
                 ).prompt_tokens
                 logger.info(
-                    f"Trace ID: {trace_id}: Agent: {self.name} Observation output: {observations}"
+                    "Trace ID: %s: Agent: %s Observation output: %s",
+                    trace_id,
+                    self.name,
+                    observations,
                 )
                 await self.context.add(observations)
 
@@ -174,7 +180,7 @@ class ReActAgent(ReactAgentBase):
         total_completion_tokens += message.metadata.get("completion_tokens", 0)
         total_prompt_tokens += message.metadata.get("prompt_tokens", 0)
         logger.info(
-            f"Trace ID: {trace_id}: Agent: {self.name} Summarize output: {message}"
+            "Trace ID: %s: Agent: %s Summarize output: %s", trace_id, self.name, message
         )
         await self.context.add(message)
         message.metadata["total_completion_tokens"] = total_completion_tokens
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the content-hashed skill store of the General Agent.
+"""
+
+import os
+import shutil
+import stat
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from agents.general_agent import utils
+from agents.general_agent.skill_store import MANIFEST_NAME, SkillStore, read_skill_manifest
+
+SKILL_MD = """---
+name: "Data Explorer"
+description: Explore tabular data
+---
+
+Run scripts/explore.py on the data.
+"""
+
+
+def write_skill(root: Path, name: str, files: int = 3, size: int = 16) -> Path:
+    skill = root / name
+    (skill / "scripts").mkdir(parents=True, exist_ok=True)
+    (skill / "SKILL.md").write_text(SKILL_MD, encoding="utf-8")
+    script = skill / "scripts" / "explore.py"
+    script.write_text("print('explore')\n")
+    script.chmod(0o755)
+    for i in range(files):
+        (skill / "assets").mkdir(exist_ok=True)
+        (skill / "assets" / f"asset_{i}.bin").write_bytes(os.urandom(size))
+    return skill
+
+
+def load_by_copy(source: Path, skill_names, work_dir: str) -> None:
+    """Skill loading before the store: remove, copy and list every skill."""
+    target_dir = Path(work_dir) / ".claude" / "skills"
+    target_dir.mkdir(parents=True, exist_ok=True)
+    for skill_name in skill_names:
+        skill_dst = target_dir / skill_name
+        if skill_dst.exists():
+            shutil.rmtree(skill_dst)
+        shutil.copytree(source / skill_name, skill_dst, copy_function=shutil.copy2)
+        copied_files = [p for p in (source / skill_name).glob("**/*") if p.is_file()]
+        assert copied_files
+
+
+class SkillStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp(prefix="skill_store_test_"))
+        self.source = self.root / "skills"
+        self.skill = write_skill(self.source, "data-explorer")
+        self.store_dir = self.root / "store"
+        self.store = SkillStore(str(self.source), str(self.store_dir))
+        self.work_dir = str(self.root / "work")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def loaded(self, work_dir: str = None, skill: str = "data-explorer") -> Path:
+        return Path(work_dir or self.work_dir) / ".claude" / "skills" / skill
+
+
+class TestSkillStore(SkillStoreTestCase):
+    def test_skills_are_copied_on_request(self):
+        self.store = SkillStore(str(self.source), str(self.store_dir), link_mode="copy")
+        self.store.materialize(["data-explorer"], self.work_dir)
+        digest = self.store.snapshot("data-explorer").digest
+        stored = self.store_dir / digest / "SKILL.md"
+        loaded = self.loaded() / "SKILL.md"
+        self.assertNotEqual(os.stat(loaded).st_ino, os.stat(stored).st_ino)
+
+        # Editing the workspace copy leaves the store alone, and is repaired
+        loaded.write_text("edited in the workspace")
+        self.assertEqual(stored.read_text(encoding="utf-8"), SKILL_MD)
+        self.assertEqual(
+            self.store.materialize(["data-explorer"], self.work_dir), {"data-explorer": True}
+        )
+        self.assertEqual(loaded.read_text(encoding="utf-8"), SKILL_MD)
+
+    def test_skills_are_hardlinked_from_a_read_only_store(self):
+        self.assertEqual(
+            self.store.materialize(["data-explorer"], self.work_dir), {"data-explorer": True}
+        )
+
+        digest = self.store.snapshot("data-explorer").digest
+        stored = self.store_dir / digest / "SKILL.md"
+        loaded = self.loaded() / "SKILL.md"
+        self.assertEqual(loaded.read_text(encoding="utf-8"), SKILL_MD)
+        self.assertEqual(os.stat(loaded).st_ino, os.stat(stored).st_ino)
+        self.assertFalse(os.stat(stored).st_mode & stat.S_IWUSR)
+        self.assertTrue(os.access(self.loaded() / "scripts" / "explore.py", os.X_OK))
+
+        manifest = read_skill_manifest(self.work_dir)["data-explorer"]
+        self.assertEqual(manifest["digest"], digest)
+        self.assertEqual(manifest["name"], "Data Explorer")
+        self.assertEqual(len(manifest["files"]), 5)
+
+    def test_unchanged_skills_are_skipped(self):
+        self.store.materialize(["data-explorer"], self.work_dir)
+        self.assertEqual(
+            self.store.materialize(["data-explorer"], self.work_dir), {"data-explorer": False}
+        )
+
+        # A new run of the same content reuses the stored snapshot
+        store = SkillStore(str(self.source), str(self.store_dir))
+        self.assertEqual(
+            store.materialize(["data-explorer"], self.work_dir), {"data-explorer": False}
+        )
+        self.assertEqual(len(os.listdir(self.store_dir)), 1)
+
+    def test_changed_skills_are_reloaded(self):
+        self.store.materialize(["data-explorer"], self.work_dir)
+        before = self.store.snapshot("data-explorer").digest
+        (self.skill / "assets" / "asset_0.bin").unlink()
+        (self.skill / "README.md").write_text("new")
+
+        self.assertEqual(
+            self.store.materialize(["data-explorer"], self.work_dir), {"data-explorer": True}
+        )
+        self.assertNotEqual(self.store.snapshot("data-explorer").digest, before)
+        self.assertTrue((self.loaded() / "README.md").exists())
+        self.assertFalse((self.loaded() / "assets" / "asset_0.bin").exists())
+
+    def test_damaged_work_directories_are_repaired(self):
+        self.store.materialize(["data-explorer"], self.work_dir)
+        (self.loaded() / "SKILL.md").unlink()
+
+        self.assertEqual(
+            self.store.materialize(["data-explorer"], self.work_dir), {"data-explorer": True}
+        )
+        self.assertEqual((self.loaded() / "SKILL.md").read_text(encoding="utf-8"), SKILL_MD)
+
+    def test_linked_skills_are_not_hashed_again(self):
+        work_dirs = [str(self.root / "work" / str(i)) for i in range(3)]
+        self.store.materialize(["data-explorer"], work_dirs[0])
+        with patch(
+            "agents.general_agent.skill_store._hash_file", side_effect=AssertionError
+        ):
+            for work_dir in work_dirs:
+                self.store.materialize(["data-explorer"], work_dir)
+                self.store.materialize(["data-explorer"], work_dir)
+
+    def test_in_place_edits_through_hardlinks_are_repaired_by_the_next_run(self):
+        self.store.materialize(["data-explorer"], self.work_dir)
+        other_work_dir = str(self.root / "other")
+        self.store.materialize(["data-explorer"], other_work_dir)
+
+        # Edited in place by a process ignoring the read-only mode
+        loaded = self.loaded() / "SKILL.md"
+        loaded.chmod(0o644)
+        with open(loaded, "r+", encoding="utf-8") as f:
+            f.write("EDITED")
+
+        store = SkillStore(str(self.source), str(self.store_dir))
+        for work_dir in (self.work_dir, other_work_dir):
+            self.assertEqual(
+                store.materialize(["data-explorer"], work_dir), {"data-explorer": True}
+            )
+            self.assertEqual(
+                (self.loaded(work_dir) / "SKILL.md").read_text(encoding="utf-8"), SKILL_MD
+            )
+        stored = self.store_dir / store.snapshot("data-explorer").digest / "SKILL.md"
+        self.assertEqual(stored.read_text(encoding="utf-8"), SKILL_MD)
+
+    def test_damaged_snapshots_are_rebuilt_by_the_next_run(self):
+        store = SkillStore(str(self.source), str(self.store_dir), link_mode="hardlink")
+        store.materialize(["data-explorer"], self.work_dir)
+        stored = self.store_dir / store.snapshot("data-explorer").digest / "SKILL.md"
+        stored.chmod(0o644)
+        stored.write_text("edited in place")
+
+        store = SkillStore(str(self.source), str(self.store_dir), link_mode="hardlink")
+        self.assertEqual(
+            store.materialize(["data-explorer"], self.work_dir), {"data-explorer": True}
+        )
+        self.assertEqual(stored.read_text(encoding="utf-8"), SKILL_MD)
+        self.assertEqual((self.loaded() / "SKILL.md").read_text(encoding="utf-8"), SKILL_MD)
+
+    def test_symlink_and_copy_modes(self):
+        for link_mode in ("symlink", "copy"):
+            work_dir = str(self.root / link_mode)
+            store = SkillStore(str(self.source), str(self.store_dir), link_mode=link_mode)
+            store.materialize(["data-explorer"], work_dir)
+            loaded = self.loaded(work_dir)
+            self.assertEqual(loaded.is_symlink(), link_mode == "symlink")
+            self.assertEqual((loaded / "SKILL.md").read_text(encoding="utf-8"), SKILL_MD)
+            self.assertEqual(
+                store.materialize(["data-explorer"], work_dir), {"data-explorer": False}
+            )
+
+        with self.assertRaises(ValueError):
+            SkillStore(str(self.source), str(self.store_dir), link_mode="overlay")
+
+
+class TestLoadSkills(SkillStoreTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = patch.dict(utils._skill_stores, {"hardlink": self.store})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_load_and_format_skills(self):
+        utils.load_skills(["data-explorer"], self.work_dir)
+        self.assertTrue((self.loaded().parent / MANIFEST_NAME).is_file())
+        (self.loaded() / "SKILL.md").unlink()
+
+        # Described by the manifest, not by reading SKILL.md again
+        info = utils.format_loaded_skills(["data-explorer"], self.work_dir)
+        self.assertIn("- **Data Explorer**: Explore tabular data", info)
+
+    def test_missing_skills_are_rejected(self):
+        with self.assertRaises(FileNotFoundError):
+            utils.load_skills(["missing"], self.work_dir)
+        with self.assertRaises(ValueError):
+            utils.load_skills([], self.work_dir)
+
+
+@pytest.mark.benchmark
+class TestSkillStoreBenchmark(SkillStoreTestCase):
+    def test_benchmark_skill_provisioning(self):
+        skill_names = ["data-explorer", "report-writer"]
+        write_skill(self.source, "data-explorer", files=200, size=64 * 1024)
+        write_skill(self.source, "report-writer", files=200, size=64 * 1024)
+        work_dirs = [str(self.root / "work" / str(i)) for i in range(5)]
+
+        def provision(load) -> float:
+            start = time.perf_counter()
+            # Several components load the skills of each iteration's workspace
+            for work_dir in work_dirs:
+                for _ in range(3):
+                    load(work_dir)
+            return time.perf_counter() - start
+
+        before = provision(lambda work_dir: load_by_copy(self.source, skill_names, work_dir))
+        for work_dir in work_dirs:
+            shutil.rmtree(work_dir)
+        store = SkillStore(str(self.source), str(self.store_dir), link_mode="hardlink")
+        after = provision(lambda work_dir: store.materialize(skill_names, work_dir))
+        print(
+            f"Provisioning 2 skills of 200 x 64KB files 15 times: "
+            f"{before * 1e3:.0f}ms by copy, {after * 1e3:.0f}ms from the store"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
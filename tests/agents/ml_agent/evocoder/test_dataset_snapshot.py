@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the dataset snapshot shared by the ML stage evaluators.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+import numpy as np
+import pytest
+
+from agents.ml_agent.evocoder.dataset_snapshot import (
+    DatasetSnapshotStore,
+    load_validation_data,
+    snapshot_key,
+)
+from agents.ml_agent.evocoder.evaluator import (
+    EvoCoderEvaluatorConfig,
+    LoadDataEvaluator,
+    TrainAndPredictEvaluator,
+)
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+ROWS, COLS = 20_000, 20
+
+LOAD_DATA = '''
+import os
+import numpy as np
+
+DATA_PATH = {data_path!r}
+CALLS_PATH = {calls_path!r}
+
+def load_data(validation_mode=False):
+    with open(CALLS_PATH, "a") as f:
+        f.write("call\\n")
+    data = np.loadtxt(DATA_PATH, delimiter=",")
+    X, y = data[:, :-1], data[:, -1]
+    return X, y, X[:100].copy(), np.arange(100)
+'''
+
+CREATE_FEATURES = '''
+def create_features(X_tr, y_tr, X_val, y_val, X_te):
+    X_tr[:, 0] = -1.0  # writes through the attached arrays stay private
+    return X_tr, y_tr, X_val, y_val, X_te
+'''
+
+TRAIN_AND_PREDICT = '''
+import numpy as np
+
+def train_mean(X_tr, y_tr, X_val, y_val, X_te):
+    return np.full(len(y_val), y_tr.mean()), np.full(len(X_te), y_tr.mean())
+
+PREDICTION_ENGINES = {"mean": train_mean}
+'''
+
+
+def write_csv(path: str, rows: int = ROWS) -> None:
+    rng = np.random.default_rng(0)
+    np.savetxt(path, rng.random((rows, COLS + 1)), delimiter=",", fmt="%.6f")
+
+
+def run_evaluate_code(code: str, project_dir: str) -> dict:
+    """Run the evaluate code of an evaluator the way the child process does."""
+    namespace = {}
+    exec(compile(code, "evaluator_code", "exec"), namespace)
+    try:
+        return namespace["evaluate"](project_dir)
+    finally:
+        for module in ("load_data", "create_features", "train_and_predict"):
+            sys.modules.pop(module, None)
+        if project_dir in sys.path:
+            sys.path.remove(project_dir)
+
+
+class TestDatasetSnapshotStore(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="dataset_snapshot_test_")
+        self.store = DatasetSnapshotStore(os.path.join(self.root, "snapshots"))
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_arrays_are_memory_mapped_copy_on_write(self):
+        X = np.arange(12, dtype=np.float64).reshape(4, 3)
+        data = (X, np.array([0, 1, 0, 1]), X[:2], ["a", "b"])
+        self.assertTrue(self.store.save("key", data))
+
+        X_attached, y, X_test, ids = self.store.attach("key")
+        self.assertIsInstance(X_attached, np.memmap)
+        np.testing.assert_array_equal(X_attached, X)
+        self.assertEqual(ids, ["a", "b"])
+
+        X_attached[0, 0] = 100.0
+        np.testing.assert_array_equal(self.store.attach("key")[0], X)
+        self.assertIsNone(self.store.attach("missing"))
+
+    def test_unpicklable_data_is_not_saved(self):
+        X = np.arange(12, dtype=np.float64).reshape(4, 3)
+        data = (X, np.array([0, 1, 0, 1]), X[:2], [lambda: None])
+        self.assertFalse(self.store.save("key", data))
+        self.assertFalse(self.store.exists("key"))
+        self.assertEqual(os.listdir(self.store.root), [])
+
+    def test_loader_runs_once_per_load_data_source(self):
+        source = os.path.join(self.root, "load_data.py")
+        with open(source, "w") as f:
+            f.write("v1")
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return np.ones((3, 2)), np.zeros(3), np.ones((1, 2)), np.arange(1)
+
+        snapshots = self.store.root
+        for _ in range(3):
+            X, _, _, _ = load_validation_data(snapshots, source, loader)
+        self.assertEqual(len(calls), 1)
+        np.testing.assert_array_equal(X, np.ones((3, 2)))
+
+        with open(source, "w") as f:
+            f.write("v2")
+        load_validation_data(snapshots, source, loader)
+        load_validation_data(None, source, loader)
+        self.assertEqual(len(calls), 3)
+        self.assertNotEqual(snapshot_key(source), os.listdir(snapshots)[0])
+
+    @unittest.skipIf(pd is None, "pandas is not installed")
+    def test_pandas_round_trip(self):
+        X = pd.DataFrame(
+            {
+                "num": np.arange(5, dtype=np.float32),
+                "cat": list("abcab"),
+                "when": pd.date_range("2024-01-01", periods=5),
+            }
+        )
+        y = pd.Series(np.arange(5), name="target", index=list("vwxyz"))
+        data = (X, y, X.iloc[:2], pd.Series([7, 8]))
+        self.store.save("frames", data)
+
+        attached = self.store.attach("frames")
+        for original, restored in zip(data, attached):
+            if isinstance(original, pd.DataFrame):
+                pd.testing.assert_frame_equal(restored, original)
+            else:
+                pd.testing.assert_series_equal(restored, original)
+
+
+class TestStageEvaluatorsShareTheSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="dataset_snapshot_stage_test_")
+        self.project = os.path.join(self.root, "project")
+        os.makedirs(self.project)
+        self.calls_path = os.path.join(self.root, "calls.txt")
+        data_path = os.path.join(self.root, "train.csv")
+        write_csv(data_path, rows=500)
+        files = {
+            "load_data": LOAD_DATA.format(data_path=data_path, calls_path=self.calls_path),
+            "create_features": CREATE_FEATURES,
+            "train_and_predict": TRAIN_AND_PREDICT,
+        }
+        for name, content in files.items():
+            with open(os.path.join(self.project, f"{name}.py"), "w") as f:
+                f.write(content)
+        self.config = EvoCoderEvaluatorConfig(
+            workspace_path=os.path.join(self.root, "evaluate"),
+            snapshot_path=os.path.join(self.root, "snapshots"),
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def load_data_calls(self) -> int:
+        with open(self.calls_path) as f:
+            return len(f.readlines())
+
+    def test_later_stages_attach_to_the_validated_data(self):
+        load_code = LoadDataEvaluator(self.config).config.evaluate_code
+        train_code = TrainAndPredictEvaluator(self.config).config.evaluate_code
+
+        result = run_evaluate_code(load_code, self.project)
+        self.assertEqual(result["status"], "success", result)
+        self.assertEqual(self.load_data_calls(), 1)
+
+        for _ in range(3):
+            result = run_evaluate_code(train_code, self.project)
+            self.assertEqual(result["status"], "success", result)
+        self.assertEqual(self.load_data_calls(), 1)
+
+    def test_without_snapshot_path_data_is_loaded_every_time(self):
+        self.config.snapshot_path = None
+        train_code = TrainAndPredictEvaluator(self.config).config.evaluate_code
+        for _ in range(2):
+            run_evaluate_code(train_code, self.project)
+        self.assertEqual(self.load_data_calls(), 2)
+
+
+@pytest.mark.benchmark
+class TestDatasetSnapshotBenchmark(unittest.TestCase):
+    def test_benchmark_attach_vs_parse(self):
+        root = tempfile.mkdtemp(prefix="dataset_snapshot_bench_")
+        self.addCleanup(shutil.rmtree, root)
+        data_path = os.path.join(root, "train.csv")
+        write_csv(data_path)
+        source = os.path.join(root, "load_data.py")
+        with open(source, "w") as f:
+            f.write(data_path)
+
+        def loader():
+            data = np.loadtxt(data_path, delimiter=",")
+            return data[:, :-1], data[:, -1], data[:1000, :-1], np.arange(1000)
+
+        snapshots = os.path.join(root, "snapshots")
+        start = time.perf_counter()
+        expected = load_validation_data(snapshots, source, loader)
+        before = time.perf_counter() - start
+        after = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            attached = load_validation_data(snapshots, source, loader)
+            # Touch every page, as a stage would
+            total = float(np.asarray(attached[0]).sum())
+            after = min(after, time.perf_counter() - start)
+        print(
+            f"load_data of {ROWS}x{COLS}: parse and snapshot {before * 1e3:.0f}ms, "
+            f"attach {after * 1e3:.1f}ms"
+        )
+
+        self.assertAlmostEqual(total, float(expected[0].sum()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the non-blocking logging pipeline.
+"""
+
+import asyncio
+import logging
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from loongflow.agentsdk.logger import lazy, lazy_json, start_log_pipeline, stop_log_pipeline
+from loongflow.agentsdk.logger.context import set_log_id
+from loongflow.agentsdk.logger.pipeline import LogPipeline
+from loongflow.agentsdk.message import ContentElement, Message, Role, ToolCallElement
+from loongflow.agentsdk.models import CompletionResponse, CompletionUsage
+from loongflow.agentsdk.tools import FunctionTool, Toolkit
+from loongflow.framework.react import ReActAgent
+
+STEPS = 8
+PAYLOAD = "x" * 100_000
+# Stays below the compression threshold of the agent memory over all steps
+STEP_PAYLOAD = "x" * 10_000
+
+
+class RecordingHandler(logging.Handler):
+    """Keeps the emitted records, optionally waiting before each write."""
+
+    def __init__(self, delay: float = 0.0, gate: threading.Event = None):
+        super().__init__()
+        self.delay = delay
+        self.gate = gate
+        self.records = []
+        self.threads = set()
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait()
+        if self.delay:
+            # A contended disk or terminal
+            time.sleep(self.delay)
+        self.format(record)
+        self.records.append(record)
+        self.threads.add(threading.current_thread().name)
+
+
+class TestLogPipeline(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger("loongflow.tests.log_pipeline")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+
+    def tearDown(self):
+        stop_log_pipeline()
+        self.logger.handlers.clear()
+
+    def test_records_are_written_by_the_writer_thread(self):
+        handler = RecordingHandler()
+        self.logger.addHandler(handler)
+        pipeline = start_log_pipeline(self.logger)
+        set_log_id("caller-id")
+
+        self.logger.info("payload %s", lazy_json({"score": 1.0}))
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            self.logger.exception("failed")
+        stop_log_pipeline()
+
+        self.assertIn(handler, self.logger.handlers)
+        self.assertNotIn(pipeline.handler, self.logger.handlers)
+        self.assertEqual(
+            [r.getMessage() for r in handler.records][0], 'payload {"score": 1.0}'
+        )
+        self.assertIn("ValueError: boom", handler.records[1].getMessage())
+        self.assertEqual({r.log_id for r in handler.records}, {"caller-id"})
+        self.assertNotIn(threading.current_thread().name, handler.threads)
+
+    def test_lazy_payloads_are_not_rendered_for_disabled_levels(self):
+        self.logger.addHandler(RecordingHandler())
+        rendered = []
+
+        def render():
+            rendered.append(1)
+            return PAYLOAD
+
+        self.logger.debug("payload %s", lazy(render))
+        self.assertEqual(rendered, [])
+        self.logger.info("payload %s", lazy(render, max_chars=10))
+        self.assertEqual(rendered, [1])
+        self.assertEqual(
+            self.logger.handlers[0].records[0].getMessage(),
+            "payload xxxxxxxxxx... [99990 chars truncated]",
+        )
+
+    def test_backpressure_sheds_info_but_keeps_warnings(self):
+        gate = threading.Event()
+        handler = RecordingHandler(gate=gate)
+        self.logger.addHandler(handler)
+        pipeline = start_log_pipeline(self.logger, queue_size=50, sample_every=5)
+
+        for i in range(500):
+            self.logger.info("info %d", i)
+        stats = pipeline.stats()
+        # Warnings wait for room in the full queue rather than being dropped
+        threading.Timer(0.2, gate.set).start()
+        for i in range(5):
+            self.logger.warning("warning %d", i)
+        while pipeline.queue.qsize():
+            time.sleep(0.01)
+        self.logger.info("after the burst")
+        stop_log_pipeline()
+
+        messages = [r.getMessage() for r in handler.records]
+        self.assertGreater(stats["dropped"], 400)
+        self.assertEqual(len([m for m in messages if m.startswith("warning")]), 5)
+        self.assertIn(
+            f"Log pipeline dropped {stats['dropped']} records below WARNING "
+            "under backpressure.",
+            messages,
+        )
+        self.assertEqual(messages[-1], "after the burst")
+
+    def test_shed_records_are_not_rendered(self):
+        gate = threading.Event()
+        self.logger.addHandler(RecordingHandler(gate=gate))
+        start_log_pipeline(self.logger, queue_size=20, sample_every=1000)
+        rendered = []
+
+        def render():
+            rendered.append(1)
+            return "payload"
+
+        for _ in range(200):
+            self.logger.info("payload %s", lazy(render))
+        gate.set()
+        stop_log_pipeline()
+
+        # Rendered once per kept record only, on enqueue or by the writer
+        self.assertLess(len(rendered), 40)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs fork")
+    def test_forked_child_logs_to_the_original_handlers(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "child.log")
+            self.logger.addHandler(logging.FileHandler(path))
+            start_log_pipeline(self.logger)
+
+            pid = os.fork()
+            if pid == 0:
+                self.logger.error("from the child")
+                logging.shutdown()
+                os._exit(0)
+            os.waitpid(pid, 0)
+            stop_log_pipeline()
+            for handler in self.logger.handlers:
+                handler.close()
+
+            with open(path) as f:
+                self.assertEqual(f.read(), "from the child\n")
+
+    def test_rejects_empty_queue(self):
+        with self.assertRaises(ValueError):
+            LogPipeline(self.logger, queue_size=0)
+
+
+def read_data() -> str:
+    """Read the task data."""
+    return STEP_PAYLOAD
+
+
+def react_agent() -> ReActAgent:
+    """An agent reading large data every step before answering."""
+    model = AsyncMock()
+    usage = CompletionUsage(completion_tokens=10, prompt_tokens=100, total_tokens=110)
+    step = CompletionResponse(
+        id="step",
+        usage=usage,
+        content=[
+            ContentElement(data="Reading the data again. " + STEP_PAYLOAD),
+            ToolCallElement(target="read_data", arguments={}),
+        ],
+    )
+    answer = CompletionResponse(
+        id="answer",
+        usage=usage,
+        content=[
+            ToolCallElement(
+                target="generate_final_answer", arguments={"response": "done"}
+            )
+        ],
+    )
+
+    async def respond(response):
+        yield response
+
+    model.generate = MagicMock(
+        side_effect=[respond(step) for _ in range(STEPS - 1)] + [respond(answer)]
+    )
+    toolkit = Toolkit()
+    toolkit.register_tool(FunctionTool(read_data))
+    return ReActAgent.create_default(
+        model, "You are a helpful assistant", toolkit=toolkit, max_steps=STEPS
+    )
+
+
+@pytest.mark.benchmark
+class TestLogPipelineBenchmark(unittest.TestCase):
+    def setUp(self):
+        self.root = logging.getLogger()
+        self.saved = (list(self.root.handlers), self.root.level)
+        self.root.handlers.clear()
+        self.root.setLevel(logging.INFO)
+
+    def tearDown(self):
+        stop_log_pipeline()
+        self.root.handlers[:] = self.saved[0]
+        self.root.setLevel(self.saved[1])
+
+    def step_latency(self) -> float:
+        message = Message.from_text(sender="user", role=Role.USER, data="Go.")
+        agent = react_agent()
+        start = time.perf_counter()
+        result = asyncio.run(agent.run(message))
+        elapsed = time.perf_counter() - start
+        self.assertIn("done", str(result.get_elements(ContentElement)[0].data))
+        return elapsed / STEPS
+
+    def test_benchmark_react_step_latency(self):
+        handler = RecordingHandler(delay=0.02)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+        self.root.addHandler(handler)
+        before = self.step_latency()
+        written = len(handler.records)
+
+        start_log_pipeline(self.root)
+        after = self.step_latency()
+        stop_log_pipeline()
+        print(
+            f"Log-heavy ReAct step latency: {before * 1e3:.1f}ms with a synchronous "
+            f"handler, {after * 1e3:.1f}ms through the pipeline"
+        )
+
+        self.assertEqual(len(handler.records), 2 * written)
+
+
+if __name__ == "__main__":
+    unittest.main()
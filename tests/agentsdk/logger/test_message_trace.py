@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the message trace sink.
+"""
+import io
+import json
+import os
+import queue
+import time
+import uuid
+
+import pytest
+
+from loongflow.agentsdk.logger import message_logger as ml
+from loongflow.agentsdk.logger import message_trace as mt
+from loongflow.agentsdk.message import (
+    ContentElement,
+    Message,
+    MimeType,
+    ToolOutputElement,
+    ToolStatus,
+)
+
+IMAGE = os.urandom(64 * 1024)
+LONG_TEXT = "line of a long tool output\n" * 2000
+
+
+def create_tool_message(i: int, image: bytes = IMAGE) -> Message:
+    return Message(
+        role="tool",
+        sender=f"tester_{i}",
+        metadata={"step": i},
+        content=[
+            ToolOutputElement(
+                call_id=uuid.uuid4(),
+                tool_name=f"TestTool_{i}",
+                status=ToolStatus.SUCCESS,
+                result=[
+                    ContentElement(mime_type=MimeType.TEXT_PLAIN, data=LONG_TEXT),
+                    ContentElement(mime_type=MimeType.IMAGE_PNG, data=image),
+                ],
+            )
+        ],
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_running_trace():
+    yield
+    mt.stop_message_trace()
+
+
+def test_payloads_are_offloaded_and_restored(tmp_path):
+    sink = mt.MessageTraceSink(tmp_path / "messages.jsonl")
+    messages = [create_tool_message(i) for i in range(3)]
+    messages.append(Message.from_text("short question", sender="user"))
+    for msg in messages:
+        assert sink.record(msg)
+    sink.close()
+
+    lines = (tmp_path / "messages.jsonl").read_text().splitlines()
+    assert len(lines) == 4
+    # Compact lines referencing the payloads, which are stored once
+    assert all(len(line) < 2000 for line in lines)
+    assert mt.BLOB_KEY in lines[0] and mt.TEXT_KEY in lines[0]
+    assert len(list((tmp_path / "payloads").glob("*/*"))) == 2
+
+    restored = list(mt.read_message_trace(tmp_path / "messages.jsonl"))
+    assert [m.id for m in restored] == [m.id for m in messages]
+    result = restored[1].content[0].result
+    assert result[0].data == LONG_TEXT
+    assert result[1].data == IMAGE
+    assert restored[3].content[0].data == "short question"
+    assert restored[1].metadata == {"step": 1}
+
+    unresolved = next(mt.read_message_trace(tmp_path / "messages.jsonl", resolve_payloads=False))
+    assert unresolved.content[0].result[1].data.startswith(f"<{len(IMAGE)} bytes sha256:")
+
+
+def test_rotation(tmp_path):
+    sink = mt.MessageTraceSink(tmp_path / "messages.jsonl", max_bytes=2000, backup_count=2)
+    for i in range(60):
+        sink.record(Message.from_text(f"message {i} " * 10, sender="user"))
+    sink.close()
+
+    names = sorted(p.name for p in tmp_path.glob("messages.jsonl*"))
+    assert names == ["messages.jsonl", "messages.jsonl.1", "messages.jsonl.2"]
+    assert all(p.stat().st_size < 2500 for p in tmp_path.glob("messages.jsonl*"))
+    newest = []
+    for name in names[::-1]:
+        newest += list(mt.read_message_trace(tmp_path / name))
+    assert newest[-1].content[0].data.startswith("message 59 ")
+
+
+def test_sampling_per_role(tmp_path):
+    messages = [Message.from_text(f"{i}", role="tool") for i in range(400)]
+    messages += [Message.from_text(f"{i}", role="assistant") for i in range(10)]
+    sink = mt.MessageTraceSink(tmp_path / "messages.jsonl", sample_rates={"tool": 0.25})
+    kept = [msg.id for msg in messages if sink.record(msg)]
+    sink.close()
+
+    tool_kept = len(kept) - 10
+    assert 60 < tool_kept < 140
+    assert sink.stats()["sampled_out"] == 400 - tool_kept
+    # The same messages are kept by every sink
+    other = mt.MessageTraceSink(tmp_path / "other.jsonl", sample_rates={"tool": 0.25})
+    assert [msg.id for msg in messages if other.keeps(msg)] == kept
+    other.close()
+
+
+def test_full_queue_drops(tmp_path):
+    sink = mt.MessageTraceSink(tmp_path / "messages.jsonl")
+    drained = sink.queue
+    # A queue the writer thread does not drain, already full
+    sink.queue = queue.Queue(1)
+    sink.queue.put(None)
+    assert not sink.record(Message.from_text("dropped"))
+    assert sink.stats()["dropped"] == 1
+    sink.queue = drained
+    sink.close()
+
+
+def test_print_message_writes_to_running_trace(tmp_path, capsys):
+    mt.start_message_trace(tmp_path / "messages.jsonl")
+    ml.print_message([create_tool_message(0), Message.from_text("hello")])
+    mt.stop_message_trace()
+
+    assert capsys.readouterr().out == ""
+    assert len((tmp_path / "messages.jsonl").read_text().splitlines()) == 2
+
+    # The viewer renders the pretty form offline
+    mt.main([str(tmp_path / "messages.jsonl"), "--role", "tool"])
+    out = capsys.readouterr().out
+    assert "TestTool_0" in out
+    assert "hello" not in out
+
+
+@pytest.mark.benchmark
+def test_benchmark_print_message(tmp_path, monkeypatch):
+    from rich.console import Console
+
+    messages = [create_tool_message(i, image=os.urandom(4096)) for i in range(30)]
+
+    # Before: rendered on the calling thread as panels, or logged with inline base64
+    monkeypatch.setattr(ml, "_console", Console(file=io.StringIO(), width=120))
+    start = time.perf_counter()
+    ml.print_message(messages)
+    before = time.perf_counter() - start
+    logged = sum(len(ml._render_log_data(msg, True)) for msg in messages)
+
+    sink = mt.start_message_trace(tmp_path / "messages.jsonl")
+    start = time.perf_counter()
+    ml.print_message(messages)
+    after = time.perf_counter() - start
+    sink.flush()
+    written = (tmp_path / "messages.jsonl").stat().st_size + sum(
+        p.stat().st_size for p in (tmp_path / "payloads").glob("*/*")
+    )
+
+    print(
+        f"\nprint_message of {len(messages)} messages: rendering {before * 1000:.1f}ms, "
+        f"trace {after * 1000:.2f}ms on the caller; log {logged} chars, "
+        f"trace {written} bytes with payloads"
+    )
+    assert written < logged / 3
+    assert json.loads((tmp_path / "messages.jsonl").read_text().splitlines()[0])["role"] == "tool"
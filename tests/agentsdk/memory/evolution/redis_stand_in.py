@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Small in-process RESP3 server standing in for Redis in the redis memory tests.
+"""
+
+import socketserver
+import threading
+from collections import Counter
+
+
+class RespStandIn(socketserver.ThreadingTCPServer):
+    """Minimal Redis stand-in speaking RESP3 for the string, hash, set, list and
+    sorted set commands used here."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _RespHandler)
+        self.strings = {}
+        self.hashes = {}
+        self.sets = {}
+        self.lists = {}
+        self.zsets = {}
+        self.calls = Counter()
+        self.max_hset_fields = 0
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self.server_address[1]}/0"
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def execute(self, name, args):
+        with self.lock:
+            self.calls[name] += 1
+            return getattr(self, f"cmd_{name.lower()}", self.cmd_unknown)(*args)
+
+    def cmd_unknown(self, *args):
+        return Exception("ERR unknown command")
+
+    def cmd_hello(self, *args):
+        return {b"server": b"stand-in", b"proto": 3}
+
+    def cmd_client(self, *args):
+        return "OK"
+
+    def cmd_ping(self, *args):
+        return "PONG"
+
+    def cmd_exists(self, *keys):
+        return sum(1 for k in keys if k in self.hashes or k in self.sets)
+
+    def cmd_del(self, *keys):
+        removed = 0
+        for k in keys:
+            for store in (self.strings, self.hashes, self.sets, self.lists, self.zsets):
+                removed += store.pop(k, None) is not None
+        return removed
+
+    def cmd_get(self, key):
+        return self.strings.get(key)
+
+    def cmd_incrby(self, key, increment):
+        value = int(self.strings.get(key, 0)) + int(increment)
+        self.strings[key] = str(value).encode()
+        return value
+
+    def cmd_hset(self, key, *pairs):
+        self.max_hset_fields = max(self.max_hset_fields, len(pairs) // 2)
+        h = self.hashes.setdefault(key, {})
+        added = 0
+        for field, value in zip(pairs[0::2], pairs[1::2]):
+            added += field not in h
+            h[field] = value
+        return added
+
+    def cmd_hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def cmd_hmget(self, key, *fields):
+        h = self.hashes.get(key, {})
+        return [h.get(f) for f in fields]
+
+    def cmd_hincrby(self, key, field, increment):
+        h = self.hashes.setdefault(key, {})
+        value = int(h.get(field, b"0")) + int(increment)
+        h[field] = str(value).encode()
+        return value
+
+    def cmd_hincrbyfloat(self, key, field, increment):
+        h = self.hashes.setdefault(key, {})
+        value = float(h.get(field, b"0")) + float(increment)
+        h[field] = repr(value).encode()
+        return h[field]
+
+    def cmd_hexists(self, key, field):
+        return int(field in self.hashes.get(key, {}))
+
+    def cmd_hdel(self, key, *fields):
+        h = self.hashes.get(key, {})
+        return sum(1 for f in fields if h.pop(f, None) is not None)
+
+    def cmd_hlen(self, key):
+        return len(self.hashes.get(key, {}))
+
+    def cmd_hkeys(self, key):
+        return list(self.hashes.get(key, {}))
+
+    def cmd_hvals(self, key):
+        return list(self.hashes.get(key, {}).values())
+
+    def cmd_hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def cmd_hscan(self, key, cursor, *options):
+        opts = dict(zip(options[0::2], options[1::2]))
+        count = int(opts.get(b"COUNT", b"10"))
+        fields = sorted(self.hashes.get(key, {}))
+        start = int(cursor)
+        end = start + count
+        h = self.hashes.get(key, {})
+        page = [x for f in fields[start:end] for x in (f, h[f])]
+        next_cursor = end if end < len(fields) else 0
+        return [str(next_cursor).encode(), page]
+
+    def cmd_sadd(self, key, *members):
+        s = self.sets.setdefault(key, set())
+        added = len(set(members) - s)
+        s.update(members)
+        return added
+
+    def cmd_srem(self, key, *members):
+        s = self.sets.get(key, set())
+        removed = len(s & set(members))
+        s.difference_update(members)
+        return removed
+
+    def cmd_smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    def cmd_scard(self, key):
+        return len(self.sets.get(key, set()))
+
+    def cmd_rpush(self, key, *values):
+        lst = self.lists.setdefault(key, [])
+        lst.extend(values)
+        return len(lst)
+
+    def cmd_llen(self, key):
+        return len(self.lists.get(key, []))
+
+    def cmd_ltrim(self, key, start, stop):
+        self.lists[key] = self.cmd_lrange(key, start, stop)
+        return "OK"
+
+    def cmd_lrange(self, key, start, stop):
+        lst = self.lists.get(key, [])
+        start, stop = int(start), int(stop)
+        stop = len(lst) if stop == -1 else stop + 1
+        return lst[start:stop]
+
+
+    def cmd_zadd(self, key, *pairs):
+        z = self.zsets.setdefault(key, {})
+        added = 0
+        for score, member in zip(pairs[0::2], pairs[1::2]):
+            added += member not in z
+            z[member] = float(score)
+        return added
+
+    def cmd_zrem(self, key, *members):
+        z = self.zsets.get(key, {})
+        return sum(1 for m in members if z.pop(m, None) is not None)
+
+    def cmd_zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    def cmd_zscore(self, key, member):
+        return self.zsets.get(key, {}).get(member)
+
+    def cmd_zmscore(self, key, *members):
+        z = self.zsets.get(key, {})
+        return [z.get(m) for m in members]
+
+    def cmd_zcount(self, key, low, high):
+        return sum(
+            1
+            for score in self.zsets.get(key, {}).values()
+            if _in_bound(score, low, True) and _in_bound(score, high, False)
+        )
+
+    def cmd_zrange(self, key, start, stop, *options):
+        ranked = sorted(self.zsets.get(key, {}).items(), key=lambda x: (x[1], x[0]))
+        return self._range(ranked, start, stop, options)
+
+    def cmd_zrevrange(self, key, start, stop, *options):
+        ranked = sorted(self.zsets.get(key, {}).items(), key=lambda x: (x[1], x[0]))
+        return self._range(ranked[::-1], start, stop, options)
+
+    @staticmethod
+    def _range(ranked, start, stop, options):
+        start, stop = int(start), int(stop)
+        page = ranked[start : None if stop == -1 else stop + 1]
+        if b"WITHSCORES" in [o.upper() for o in options]:
+            return [[member, score] for member, score in page]
+        return [member for member, _ in page]
+
+
+def _in_bound(score, bound, lower):
+    """Check a score against a ZCOUNT bound like b"1.5", b"(1.5" or b"-inf"."""
+    exclusive = bound.startswith(b"(")
+    value = float(bound[1:] if exclusive else bound)
+    if lower:
+        return score > value if exclusive else score >= value
+    return score < value if exclusive else score <= value
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        transaction = None
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            args = [self._read_bulk() for _ in range(int(line[1:]))]
+            name = args[0].decode().upper()
+            if name == "MULTI":
+                transaction, reply = [], "OK"
+            elif name == "EXEC":
+                reply = [self.server.execute(n, a) for n, a in transaction]
+                transaction = None
+            elif transaction is not None:
+                transaction.append((name, args[1:]))
+                reply = "QUEUED"
+            else:
+                reply = self.server.execute(name, args[1:])
+            self.wfile.write(self._encode(reply))
+
+    def _read_bulk(self):
+        length = int(self.rfile.readline()[1:])
+        data = self.rfile.read(length + 2)
+        return data[:-2]
+
+    def _encode(self, value):
+        if value is None:
+            return b"_\r\n"
+        if isinstance(value, Exception):
+            return f"-{value}\r\n".encode()
+        if isinstance(value, str):
+            return f"+{value}\r\n".encode()
+        if isinstance(value, float):
+            return f",{value!r}\r\n".encode()
+        if isinstance(value, int):
+            return f":{value}\r\n".encode()
+        if isinstance(value, bytes):
+            return b"$%d\r\n%s\r\n" % (len(value), value)
+        if isinstance(value, dict):
+            return f"%{len(value)}\r\n".encode() + b"".join(
+                self._encode(k) + self._encode(v) for k, v in value.items()
+            )
+        if isinstance(value, set):
+            return f"~{len(value)}\r\n".encode() + b"".join(
+                self._encode(v) for v in value
+            )
+        return f"*{len(value)}\r\n".encode() + b"".join(
+            self._encode(v) for v in value
+        )
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the async variants of the evolution memories.
+"""
+
+import asyncio
+import json
+import random
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+import pytest
+from redis_stand_in import RespStandIn
+
+from loongflow.agentsdk.memory.evolution.base_memory import Solution
+from loongflow.agentsdk.memory.evolution.in_memory import InMemory
+from loongflow.agentsdk.memory.evolution.redis_memory import RedisMemory
+
+
+async def max_loop_lag(work, interval: float = 0.001) -> float:
+    """Run ``work`` while a heartbeat measures the longest event loop stall."""
+    lag = 0.0
+    done = False
+
+    async def heartbeat():
+        nonlocal lag
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            lag = max(lag, time.perf_counter() - start - interval)
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    try:
+        await work()
+    finally:
+        done = True
+        await beat
+    return lag
+
+
+class TestInMemoryAsync(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        random.seed(0)
+        self.memory = InMemory(
+            num_islands=4, population_size=5000, elite_archive_size=50
+        )
+        for i in range(1500):
+            await self.memory.add_solution(
+                Solution(solution=f"solution {i}", score=random.random())
+            )
+
+    async def test_sample_runs_off_the_loop(self):
+        threads = []
+        sample = self.memory.sample
+
+        def recording_sample(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return sample(*args, **kwargs)
+
+        self.memory.sample = recording_sample
+        self.assertIsNotNone(await self.memory.asample())
+        self.assertNotIn(threading.get_ident(), threads)
+
+    @pytest.mark.benchmark
+    async def test_benchmark_sample_loop_lag(self):
+        async def blocking():
+            for _ in range(5):
+                self.memory.sample()
+
+        async def non_blocking():
+            for _ in range(5):
+                self.assertIsNotNone(await self.memory.asample())
+
+        blocked = await max_loop_lag(blocking)
+        lag = await max_loop_lag(non_blocking)
+        print(f"\nLongest event loop stall: {blocked * 1e3:.1f}ms -> {lag * 1e3:.1f}ms")
+
+    async def test_concurrent_add_solution(self):
+        added = []
+
+        async def add():
+            added[:] = await asyncio.gather(
+                *[
+                    self.memory.add_solution(
+                        Solution(solution=f"extra {i}", score=random.random())
+                    )
+                    for i in range(50)
+                ]
+            )
+
+        await add()
+
+        self.assertEqual(len(set(added)), 50)
+        self.assertTrue(all(sid in self.memory.solutions for sid in added))
+        status = await self.memory.amemory_status()
+        self.assertEqual(status, self.memory.memory_status())
+
+    async def test_async_reads_match_sync_reads(self):
+        best = await self.memory.aget_best_solutions(top_k=3)
+        self.assertEqual(best, self.memory.get_best_solutions(top_k=3))
+        latest = await self.memory.alist_solutions("desc", limit=5)
+        self.assertEqual(latest, self.memory.list_solutions("desc", limit=5))
+        ids = [s.solution_id for s in best]
+        self.assertEqual(
+            [s.solution_id for s in await self.memory.aget_solutions(ids)], ids
+        )
+
+
+class TestRedisMemoryAsync(unittest.TestCase):
+    def setUp(self):
+        self.server = RespStandIn()
+        self.memory = RedisMemory(num_islands=3, redis_url=self.server.url)
+        self.ids = [f"sol-{i:03d}" for i in range(30)]
+        with self.memory.redis.pipeline(transaction=False) as pipe:
+            for i, sid in enumerate(self.ids):
+                solution = json.dumps(
+                    {
+                        "solution_id": sid,
+                        "score": i / 100,
+                        "island_id": i % 3,
+                        "timestamp": time.time() + i,
+                    }
+                )
+                pipe.hset(self.memory.solutions_key, sid, solution)
+                pipe.hset(self.memory.populations_key, sid, solution)
+                pipe.sadd(f"{self.memory.islands_key}:{i % 3}", sid)
+            pipe.sadd(self.memory.elites_key, *self.ids[-5:])
+            pipe.hset(self.memory.metadata_key, "last_iteration", 7)
+            pipe.execute()
+
+    def tearDown(self):
+        self.memory.redis_pool.disconnect()
+        self.server.stop()
+
+    def test_native_async_reads(self):
+        async def read():
+            best = await self.memory.aget_best_solutions(island_id=1, top_k=2)
+            latest = await self.memory.alist_solutions("desc", limit=3)
+            fetched = await self.memory.aget_solutions(self.ids[:4])
+            sampled = await self.memory.asample()
+            status = await self.memory.amemory_status(island_id=2)
+            return best, latest, fetched, sampled, status
+
+        best, latest, fetched, sampled, status = asyncio.run(read())
+
+        self.assertEqual([s.solution_id for s in best], ["sol-028", "sol-025"])
+        self.assertEqual(
+            [s.solution_id for s in latest], ["sol-029", "sol-028", "sol-027"]
+        )
+        self.assertEqual([s.solution_id for s in fetched], self.ids[:4])
+        self.assertIn(sampled.solution_id, self.ids)
+        self.assertEqual(status["global_status"]["current_iteration"], 7)
+        self.assertEqual(status["island_status"]["best_score"], 0.29)
+        self.assertEqual(status, self.memory.memory_status(island_id=2))
+
+    def test_async_reads_share_the_cache(self):
+        self.memory.get_best_solutions()
+        self.server.calls.clear()
+
+        asyncio.run(self.memory.aget_best_solutions())
+        # A fresh event loop gets its own client, still served from the cache.
+        asyncio.run(self.memory.aget_best_solutions())
+
+        self.assertEqual(self.server.calls["HVALS"], 0)
+        self.assertEqual(self.server.calls["LRANGE"], 2)
+
+    def test_native_async_writes(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        blocking_client = self.memory.redis
+
+        async def write():
+            added = await asyncio.gather(
+                *[
+                    self.memory.add_solution(
+                        Solution(
+                            solution=f"extra {i}",
+                            score=0.5 + i / 100,
+                            parent_id=self.ids[i],
+                        )
+                    )
+                    for i in range(10)
+                ]
+            )
+            await self.memory.update_solution(added[0], score=0.99)
+            parents = await self.memory.aget_parents_by_child_id(added[3], 1)
+            await self.memory.save_checkpoint(tmp, tag="async", archive=True)
+            return added, parents
+
+        # Every Redis command must go through the asyncio client
+        self.memory.redis = None
+        try:
+            added, parents = asyncio.run(write())
+        finally:
+            self.memory.redis = blocking_client
+
+        self.assertEqual(len(set(added)), 10)
+        self.assertEqual([s.solution_id for s in parents], [self.ids[3]])
+        # Migrated copies join the population too
+        population = self.memory.redis.hlen(self.memory.populations_key)
+        self.assertGreaterEqual(population, len(self.ids) + 10)
+        self.assertEqual(self.memory.get_best_solutions()[0].solution_id, added[0])
+        self.assertEqual(self.memory.population_stats()["global"]["count"], population)
+
+        loaded = RedisMemory(num_islands=3, redis_url=self.server.url)
+        self.addCleanup(loaded.redis_pool.disconnect)
+        checkpoint = f"{tmp}/checkpoints/checkpoint-async"
+        asyncio.run(loaded.aload_checkpoint(checkpoint))
+        self.assertEqual(loaded.memory_status(), self.memory.memory_status())
+
+
+if __name__ == "__main__":
+    unittest.main()
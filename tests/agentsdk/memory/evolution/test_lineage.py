@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the lineage index of the evolution memories.
+"""
+
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+import unittest
+
+import pytest
+from redis_stand_in import RespStandIn
+
+from loongflow.agentsdk.memory.evolution.base_memory import Solution
+from loongflow.agentsdk.memory.evolution.in_memory import InMemory
+from loongflow.agentsdk.memory.evolution.lineage import LineageIndex
+from loongflow.agentsdk.memory.evolution.redis_memory import RedisMemory
+
+NUM_NODES = 100_000
+
+
+def evolution_records(n: int, seed: int = 0) -> list[tuple[str, str, float]]:
+    """(id, parent id, score) of an evolution run breeding from recent solutions."""
+    rng = random.Random(seed)
+    records = []
+    for i in range(n):
+        parent = None
+        if i >= 10 and rng.random() > 0.001:
+            parent = records[rng.randrange(max(0, i - 200), i)][0]
+        records.append((f"s{i}", parent, i / n + rng.random() * 0.1))
+    return records
+
+
+class Reference:
+    """Brute-force answers computed from the raw parent links."""
+
+    def __init__(self, records):
+        self.parent = {sid: parent for sid, parent, _ in records}
+        self.score = {sid: score for sid, _, score in records}
+        self.children = {}
+        for sid, parent, _ in records:
+            if parent is not None:
+                self.children.setdefault(parent, []).append(sid)
+
+    def ancestors(self, sid):
+        chain = []
+        while self.parent[sid] is not None:
+            sid = self.parent[sid]
+            chain.append(sid)
+        return chain
+
+    def subtree(self, sid):
+        result, stack = [], [sid]
+        while stack:
+            for child in self.children.get(stack.pop(), ()):
+                result.append(child)
+                stack.append(child)
+        return result
+
+    def best(self, sid):
+        return max([sid] + self.subtree(sid), key=self.score.get)
+
+
+class TestLineageIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.records = evolution_records(NUM_NODES)
+        cls.reference = Reference(cls.records)
+        start = time.perf_counter()
+        cls.index = LineageIndex()
+        for sid, parent, score in cls.records:
+            cls.index.add(sid, parent, score)
+        cls.add_seconds = time.perf_counter() - start
+
+    def assert_matches_reference(self, index, reference, sids):
+        for sid in sids:
+            ancestors = reference.ancestors(sid)
+            self.assertEqual(index.ancestors(sid), ancestors)
+            self.assertEqual(index.depth(sid), len(ancestors))
+            self.assertEqual(
+                sorted(index.subtree(sid)), sorted(reference.subtree(sid))
+            )
+            self.assertEqual(index.best_in_subtree(sid), reference.best(sid))
+
+    def test_incremental_index_at_scale(self):
+        print(f"Indexed {NUM_NODES} solutions in {self.add_seconds:.2f}s")
+        self.assertEqual(len(self.index), NUM_NODES)
+        rng = random.Random(1)
+        sample = rng.sample([sid for sid, _, _ in self.records], 200)
+        self.assert_matches_reference(
+            self.index, self.reference, sample + ["s0", "s5"]
+        )
+
+    def test_bulk_build_matches_incremental(self):
+        shuffled = list(self.records)
+        random.Random(2).shuffle(shuffled)
+        built = LineageIndex.build((sid, p, score, None) for sid, p, score in shuffled)
+
+        self.assertEqual(built._depth, self.index._depth)
+        self.assertEqual(built._best, self.index._best)
+
+    def test_out_of_order_adds(self):
+        records = self.records[:3000]
+        index = LineageIndex()
+        for sid, parent, score in reversed(records):
+            index.add(sid, parent, score)
+
+        rng = random.Random(3)
+        self.assert_matches_reference(
+            index, Reference(records), rng.sample([sid for sid, _, _ in records], 50)
+        )
+
+    @pytest.mark.benchmark
+    def test_benchmark_queries(self):
+        rng = random.Random(4)
+        sample = rng.sample([sid for sid, _, _ in self.records], 1000)
+
+        start = time.perf_counter()
+        for sid in sample:
+            self.index.depth(sid)
+            self.index.best_in_subtree(sid)
+            self.index.children(sid)
+            self.index.ancestors(sid, limit=10)
+        indexed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for sid in sample[:20]:
+            [s for s, p, _ in self.records if p == sid]
+        scanned = (time.perf_counter() - start) * len(sample) / 20
+        print(
+            f"1000 lineage queries over {NUM_NODES} solutions: "
+            f"{indexed * 1e3:.1f}ms indexed, {scanned * 1e3:.0f}ms by scanning"
+        )
+
+    def test_score_updates_refresh_best(self):
+        index = LineageIndex()
+        index.add("root", None, 0.1)
+        index.add("a", "root", 0.5)
+        index.add("b", "a", 0.9)
+        index.add("c", "root", 0.3)
+
+        self.assertEqual(index.best_in_subtree("root"), "b")
+        index.update_score("b", 0.2)
+        self.assertEqual(index.best_in_subtree("root"), "a")
+        self.assertEqual(index.best_in_subtree("b"), "b")
+        index.update_score("c", 0.8)
+        self.assertEqual(index.best_in_subtree("root"), "c")
+        self.assertEqual(index.best_in_subtree("a"), "a")
+
+    def test_migrated_copies_alias_their_source(self):
+        index = LineageIndex()
+        index.add("root", None, 0.1)
+        index.add("a", "root", 0.5)
+        index.add("a_migrated_1", "root", 0.5, source_id="a")
+        index.add("b", "a_migrated_1", 0.7)
+
+        self.assertEqual(index.children("root"), ["a"])
+        self.assertEqual(index.children("a"), ["b"])
+        self.assertEqual(index.subtree("root"), ["a", "b"])
+        self.assertEqual(index.depth("b"), 2)
+        self.assertEqual(index.ancestors("b"), ["a_migrated_1", "root"])
+        self.assertEqual(index.best_in_subtree("root"), "b")
+
+
+class TestInMemoryLineage(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.memory = InMemory(
+            num_islands=3,
+            population_size=30,
+            elite_archive_size=10,
+            migration_interval=5,
+        )
+        self.ids = []
+        for i in range(120):
+            parent = random.choice(self.ids[-20:]) if self.ids else None
+            self.ids.append(
+                self.memory._add_solution(
+                    Solution(
+                        solution=f"solution {i}",
+                        score=random.random(),
+                        parent_id=parent,
+                    )
+                )
+            )
+        self.reference = Reference(
+            [(sid, self.memory.solutions[sid].parent_id, None) for sid in self.ids]
+        )
+
+    def test_lineage_survives_eviction_and_migration(self):
+        evicted = [sid for sid in self.ids if sid not in self.memory.populations]
+        self.assertTrue(evicted)
+        self.assertTrue(any("_migrated_" in sid for sid in self.memory.solutions))
+
+        for sid in self.ids:
+            self.assertEqual(
+                [s.solution_id for s in self.memory.get_ancestors(sid)],
+                self.reference.ancestors(sid),
+            )
+            self.assertEqual(
+                self.memory.get_lineage_depth(sid), len(self.reference.ancestors(sid))
+            )
+            subtree = self.reference.subtree(sid)
+            self.assertEqual(
+                sorted(s.solution_id for s in self.memory.get_subtree(sid)),
+                sorted(subtree),
+            )
+            best = max(
+                [sid] + subtree, key=lambda x: self.memory.solutions[x].score
+            )
+            self.assertEqual(self.memory.get_best_in_subtree(sid).solution_id, best)
+
+    def test_parents_and_children(self):
+        sid = self.ids[-1]
+        parents = self.memory.get_parents_by_child_id(sid, 3)
+        self.assertEqual(
+            [s.solution_id for s in parents], self.reference.ancestors(sid)[:3]
+        )
+        root = self.ids[0]
+        self.assertEqual(
+            [s.solution_id for s in self.memory.get_childs_by_parent_id(root, 100)],
+            self.reference.children[root],
+        )
+        with self.assertRaises(ValueError):
+            self.memory.get_subtree("unknown")
+
+    def test_checkpoint_rebuilds_lineage(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            asyncio.run(self.memory.save_checkpoint(tmp, "lineage"))
+            restored = InMemory(num_islands=3, population_size=30)
+            restored.load_checkpoint(
+                os.path.join(tmp, "checkpoints", "checkpoint-lineage")
+            )
+
+        self.assertEqual(restored.lineage._depth, self.memory.lineage._depth)
+        self.assertEqual(restored.lineage._best, self.memory.lineage._best)
+        self.assertCountEqual(
+            restored.lineage.children(self.ids[0]),
+            self.memory.lineage.children(self.ids[0]),
+        )
+
+
+class TestRedisMemoryLineage(unittest.TestCase):
+    def setUp(self):
+        self.server = RespStandIn()
+        self.memory = RedisMemory(num_islands=3, redis_url=self.server.url)
+
+    def tearDown(self):
+        self.memory.redis_pool.disconnect()
+        self.server.stop()
+
+    def write(self, records, memory=None):
+        memory = memory or self.memory
+        batch = {
+            sid: json.dumps({"solution_id": sid, "parent_id": parent, "score": score})
+            for sid, parent, score in records
+        }
+        with memory.redis.pipeline() as pipe:
+            memory._queue_solutions(pipe, batch, {})
+            memory._cache.publish(batch, pipe)
+            pipe.execute()
+
+    def test_lineage_at_scale(self):
+        records = evolution_records(NUM_NODES)
+        for i in range(0, NUM_NODES, 5000):
+            self.write(records[i : i + 5000])
+        reference = Reference(records)
+
+        start = time.perf_counter()
+        depth = self.memory.get_lineage_depth("s99999")
+        print(f"Synced {NUM_NODES} lineage entries in {time.perf_counter() - start:.2f}s")
+        self.assertEqual(depth, len(reference.ancestors("s99999")))
+
+        for sid in random.Random(5).sample([r[0] for r in records], 30):
+            self.assertEqual(
+                self.memory.get_lineage_depth(sid), len(reference.ancestors(sid))
+            )
+            self.assertEqual(
+                self.memory.get_best_in_subtree(sid).solution_id, reference.best(sid)
+            )
+            self.assertEqual(
+                [s.solution_id for s in self.memory.get_ancestors(sid, limit=5)],
+                reference.ancestors(sid)[:5],
+            )
+
+        # Later writes are applied incrementally from the changelog
+        self.server.calls.clear()
+        self.write([("late", "s99999", 5.0)])
+        root = reference.ancestors("s99999")[-1]
+        self.assertEqual(self.memory.get_best_in_subtree(root).solution_id, "late")
+        self.assertEqual(self.server.calls["HSCAN"], 0)
+
+    def test_other_clients_share_the_lineage(self):
+        records = evolution_records(500)
+        self.write(records)
+        other = RedisMemory(
+            num_islands=3, redis_url=self.server.url, memory_id=self.memory.memory_id
+        )
+        try:
+            children = Reference(records).children["s0"]
+            self.assertCountEqual(
+                [s.solution_id for s in other.get_childs_by_parent_id("s0", 100)],
+                children,
+            )
+            self.write([("new", "s0", 0.5)], memory=other)
+            self.assertCountEqual(
+                [s.solution_id for s in self.memory.get_childs_by_parent_id("s0", 100)],
+                children + ["new"],
+            )
+        finally:
+            other.redis_pool.disconnect()
+
+    def test_backfills_missing_lineage_entries(self):
+        with self.memory.redis.pipeline(transaction=False) as pipe:
+            for sid, parent in (("a", None), ("b", "a"), ("c", "b")):
+                solution = {"solution_id": sid, "parent_id": parent, "score": 0.1}
+                pipe.hset(self.memory.solutions_key, sid, json.dumps(solution))
+            pipe.execute()
+
+        self.assertEqual(
+            [s.solution_id for s in self.memory.get_parents_by_child_id("c", 5)],
+            ["b", "a"],
+        )
+        self.assertEqual(self.memory.redis.hlen(self.memory.lineage_key), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
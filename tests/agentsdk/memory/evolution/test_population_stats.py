@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the running population statistics of the evolution memories.
+"""
+
+import heapq
+import json
+import random
+import statistics
+import time
+import unittest
+from operator import attrgetter
+
+import pytest
+from redis_stand_in import RespStandIn
+
+from loongflow.agentsdk.memory.evolution.base_memory import Solution
+from loongflow.agentsdk.memory.evolution.in_memory import InMemory
+from loongflow.agentsdk.memory.evolution.population_stats import (
+    HISTOGRAM_BINS,
+    ScoreStats,
+)
+from loongflow.agentsdk.memory.evolution.redis_memory import RedisMemory
+
+
+def scan_status(solutions: list[Solution]) -> dict:
+    """Status fields recomputed by scanning every solution, as before."""
+    top = heapq.nlargest(3, solutions, key=attrgetter("score"))
+    scores = [s.score for s in solutions]
+    avg = sum(scores) / len(scores)
+    return {
+        "top_3_scores": [s.score for s in top],
+        "best_score": top[0].score,
+        "avg_score": round(avg, 6),
+        "better_ratio": round(len([s for s in scores if s > avg]) / len(scores), 2),
+    }
+
+
+def histogram(scores: list[float]) -> list[int]:
+    low, high = min(scores), max(scores)
+    width = (high - low) / HISTOGRAM_BINS
+    counts = [0] * HISTOGRAM_BINS
+    for score in scores:
+        index = int((score - low) / width) if width else HISTOGRAM_BINS - 1
+        counts[min(index, HISTOGRAM_BINS - 1)] += 1
+    return counts
+
+
+class TestScoreStats(unittest.TestCase):
+    def test_matches_brute_force_through_adds_and_removals(self):
+        rng = random.Random(0)
+        stats = ScoreStats()
+        scores = {}
+        for step in range(3000):
+            sid = f"s{rng.randrange(800)}"
+            if rng.random() < 0.3:
+                stats.discard(sid)
+                scores.pop(sid, None)
+            else:
+                scores[sid] = round(rng.random(), 3)
+                stats.add(sid, scores[sid], iteration=step)
+
+        summary = stats.summary()
+        values = list(scores.values())
+        mean = statistics.fmean(values)
+        self.assertEqual(summary.count, len(values))
+        self.assertAlmostEqual(summary.mean, mean)
+        self.assertAlmostEqual(summary.variance, statistics.pvariance(values))
+        self.assertEqual((summary.min, summary.max), (min(values), max(values)))
+        self.assertEqual(summary.above_mean, len([v for v in values if v > mean]))
+        self.assertEqual(
+            [score for score, _ in summary.top], sorted(values, reverse=True)[:3]
+        )
+        self.assertEqual(list(summary.histogram), histogram(values))
+
+    def test_empty_and_unscored(self):
+        stats = ScoreStats()
+        stats.add("a", None)
+        self.assertEqual(len(stats), 0)
+        self.assertEqual(stats.summary().status()["best_score"], 0)
+
+
+class TestInMemoryPopulationStats(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.memory = InMemory(
+            num_islands=3,
+            population_size=40,
+            elite_archive_size=10,
+            migration_interval=6,
+        )
+        for i in range(150):
+            self.memory._add_solution(
+                Solution(solution=f"solution {i}", score=random.random())
+            )
+
+    def test_status_matches_a_full_scan(self):
+        snapshot = self.memory._snapshot
+        self.assertTrue(any("_migrated_" in sid for sid in snapshot.population))
+        for island_id in (None, 1, 2):
+            status = self.memory.memory_status(island_id)
+            expected = scan_status(list(snapshot.population.values()))
+            section = status["global_status"]
+            self.assertEqual(section["best_score"], expected["best_score"])
+            self.assertEqual(section["avg_score"], expected["avg_score"])
+            self.assertEqual(section["better_ratio"], expected["better_ratio"])
+            if island_id:
+                expected = scan_status(list(snapshot.islands[island_id]))
+                section = status["island_status"]
+                self.assertEqual(section["best_score"], expected["best_score"])
+                self.assertEqual(section["avg_score"], expected["avg_score"])
+
+    def test_population_stats(self):
+        stats = self.memory.population_stats()
+        snapshot = self.memory._snapshot
+        scores = [s.score for s in snapshot.population.values()]
+
+        self.assertEqual(stats["global"]["count"], len(self.memory.populations))
+        self.assertAlmostEqual(stats["global"]["variance"], statistics.pvariance(scores))
+        self.assertEqual(sum(stats["global"]["histogram"]), len(scores))
+        self.assertEqual(
+            [s["count"] for s in stats["islands"]],
+            [len(island) for island in snapshot.islands],
+        )
+        self.assertEqual(
+            stats["elite_threshold"], min(s.score for s in snapshot.elites)
+        )
+
+    def test_stats_version_tracks_writes_only(self):
+        version = self.memory.stats_version()
+        self.memory.memory_status()
+        self.memory.sample()
+        self.assertEqual(self.memory.stats_version(), version)
+
+        self.memory._add_solution(Solution(solution="new", score=2.0))
+        self.assertGreater(self.memory.stats_version(), version)
+        self.assertEqual(self.memory.memory_status()["global_status"]["best_score"], 2.0)
+
+    @pytest.mark.benchmark
+    def test_benchmark_status(self):
+        memory = InMemory(num_islands=4, population_size=50000)
+        rng = random.Random(1)
+        for i in range(50000):
+            solution = Solution(
+                solution_id=f"s{i}", score=rng.random(), island_id=i % 4, iteration=i
+            )
+            memory.populations[solution.solution_id] = solution
+            memory.islands[i % 4].add(solution.solution_id)
+        memory._rebuild_stats()
+        memory._publish_snapshot()
+        snapshot = memory._snapshot
+
+        start = time.perf_counter()
+        for _ in range(5):
+            scan_status(list(snapshot.population.values()))
+            scan_status(list(snapshot.islands[2]))
+        before = (time.perf_counter() - start) / 5
+        start = time.perf_counter()
+        for _ in range(5):
+            memory.memory_status(island_id=2)
+        after = (time.perf_counter() - start) / 5
+        print(
+            f"memory_status over 50000 solutions: scan {before * 1e3:.2f}ms, "
+            f"running aggregates {after * 1e3:.3f}ms"
+        )
+
+
+class TestRedisPopulationStats(unittest.TestCase):
+    def setUp(self):
+        self.server = RespStandIn()
+        self.memory = RedisMemory(
+            num_islands=3,
+            population_size=20,
+            elite_archive_size=5,
+            redis_url=self.server.url,
+        )
+        rng = random.Random(2)
+        self.solutions = {}
+        with self.memory.redis.pipeline(transaction=False) as pipe:
+            for i in range(30):
+                solution = Solution(
+                    solution_id=f"sol-{i:03d}",
+                    score=round(rng.random(), 4),
+                    island_id=i % 3,
+                    iteration=i + 1,
+                )
+                self.solutions[solution.solution_id] = solution
+                solution_json = json.dumps(solution.to_dict())
+                pipe.hset(self.memory.solutions_key, solution.solution_id, solution_json)
+                pipe.hset(
+                    self.memory.populations_key, solution.solution_id, solution_json
+                )
+                pipe.sadd(f"{self.memory.islands_key}:{i % 3}", solution.solution_id)
+            pipe.sadd(self.memory.elites_key, *list(self.solutions)[-5:])
+            pipe.hset(self.memory.metadata_key, "last_iteration", 30)
+            pipe.execute()
+
+    def tearDown(self):
+        self.memory.redis_pool.disconnect()
+        self.server.stop()
+
+    def assert_status_matches(self, solutions):
+        status = self.memory.memory_status(island_id=1)
+        expected = scan_status(solutions)
+        self.assertEqual(status["global_status"]["best_score"], expected["best_score"])
+        self.assertEqual(status["global_status"]["avg_score"], expected["avg_score"])
+        self.assertEqual(
+            status["global_status"]["better_ratio"], expected["better_ratio"]
+        )
+        island = scan_status([s for s in solutions if s.island_id == 1])
+        self.assertEqual(status["island_status"]["best_score"], island["best_score"])
+        self.assertEqual(status["island_status"]["avg_score"], island["avg_score"])
+
+    def test_index_is_built_on_first_read(self):
+        self.assert_status_matches(list(self.solutions.values()))
+        stats = self.memory.population_stats()
+        scores = [s.score for s in self.solutions.values()]
+        self.assertEqual(stats["global"]["count"], 30)
+        self.assertAlmostEqual(stats["global"]["variance"], statistics.pvariance(scores))
+        self.assertEqual(stats["global"]["histogram"], histogram(scores))
+        self.assertEqual(
+            stats["elite_threshold"],
+            min(s.score for s in list(self.solutions.values())[-5:]),
+        )
+
+    def test_updates_and_evictions_keep_the_index(self):
+        self.memory.memory_status()
+        self.memory._update_solution("sol-004", score=5.0)
+        self.solutions["sol-004"].score = 5.0
+        self.assert_status_matches(list(self.solutions.values()))
+
+        self.memory._enforce_population_limit()
+        remaining = [
+            self.solutions[key.decode()]
+            for key in self.memory.redis.hkeys(self.memory.populations_key)
+        ]
+        self.assertEqual(len(remaining), 20)
+        self.assert_status_matches(remaining)
+
+    def test_status_reads_no_solutions(self):
+        self.memory.memory_status(island_id=1)
+        self.server.calls.clear()
+        version = self.memory.stats_version()
+
+        self.memory.memory_status(island_id=1)
+
+        self.assertEqual(self.server.calls["HVALS"], 0)
+        self.assertEqual(self.server.calls["HGETALL"], 1)
+        self.assertEqual(self.memory.stats_version(), version)
+
+
+if __name__ == "__main__":
+    unittest.main()
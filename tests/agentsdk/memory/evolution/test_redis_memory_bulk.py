@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the bulk checkpoint import and streaming export of RedisMemory.
+
+They run against a small in-process RESP server standing in for Redis, so no
+Redis instance is needed.
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from redis_stand_in import RespStandIn
+
+from loongflow.agentsdk.memory.evolution.redis_memory import (
+    ARCHIVE_FILENAME,
+    RedisMemory,
+)
+
+
+class TestRedisMemoryBulkCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.server = RespStandIn()
+        self.tmp = tempfile.mkdtemp()
+        self.memory = self._memory()
+        self.ids = self._populate(self.memory, 2500)
+
+    def tearDown(self):
+        self.memory.redis_pool.disconnect()
+        self.server.stop()
+        shutil.rmtree(self.tmp)
+
+    def _memory(self) -> RedisMemory:
+        return RedisMemory(
+            num_islands=3,
+            population_size=5000,
+            redis_url=self.server.url,
+            output_path=self.tmp,
+        )
+
+    def _populate(self, memory: RedisMemory, n: int) -> list:
+        """Write solutions straight into the memory keys, every 5th one unscored."""
+        ids = [f"sol-{i:05d}" for i in range(n)]
+        with memory.redis.pipeline(transaction=False) as pipe:
+            for i, sid in enumerate(ids):
+                solution = {
+                    "solution_id": sid,
+                    "solution": f"code {i}",
+                    "score": i / n if i % 5 else None,
+                    "island_id": i % 3,
+                    "timestamp": time.time(),
+                }
+                pipe.hset(memory.solutions_key, sid, json.dumps(solution))
+                if i % 5:
+                    pipe.hset(memory.populations_key, sid, json.dumps(solution))
+                    pipe.sadd(f"{memory.islands_key}:{i % 3}", sid)
+            pipe.sadd(memory.elites_key, ids[-1], ids[-2])
+            pipe.hset(
+                memory.metadata_key,
+                mapping={"best_solution_id": ids[-1], "last_iteration": 42},
+            )
+            pipe.hset(f"{memory.islands_key}:2:best", "best_solution_id", ids[-2])
+            pipe.hset(f"{memory.island_feature_maps_key}:1", "3-1-2", ids[-1])
+            pipe.execute()
+        return ids
+
+    def _assert_restored(self, loaded: RedisMemory, population: int = 2000):
+        redis = loaded.redis
+        self.assertEqual(redis.hlen(loaded.solutions_key), len(self.ids))
+        self.assertEqual(redis.hlen(loaded.populations_key), population)
+        self.assertEqual(
+            redis.hget(loaded.solutions_key, self.ids[7]),
+            self.memory.redis.hget(self.memory.solutions_key, self.ids[7]),
+        )
+        for i in range(3):
+            self.assertEqual(
+                redis.smembers(f"{loaded.islands_key}:{i}"),
+                self.memory.redis.smembers(f"{self.memory.islands_key}:{i}"),
+            )
+        self.assertEqual(
+            redis.smembers(loaded.elites_key), {b"sol-02499", b"sol-02498"}
+        )
+        self.assertEqual(
+            redis.hget(loaded.metadata_key, "best_solution_id"), b"sol-02499"
+        )
+        self.assertEqual(redis.hget(loaded.metadata_key, "last_iteration"), b"42")
+        self.assertEqual(
+            redis.hget(f"{loaded.islands_key}:2:best", "best_solution_id"),
+            b"sol-02498",
+        )
+        self.assertEqual(
+            redis.hget(f"{loaded.island_feature_maps_key}:1", "3-1-2"), b"sol-02499"
+        )
+
+    def test_archive_round_trip(self):
+        archive = os.path.join(self.tmp, "memory.jsonl.gz")
+        exported = self.memory.export_archive(archive, batch_size=500)
+
+        self.assertEqual(exported["solutions"], len(self.ids))
+        self.assertGreater(exported["solutions_per_second"], 0)
+        self.assertEqual(self.server.calls["HSCAN"], 5)
+        self.assertEqual(self.server.calls["HGETALL"], 4)
+        with gzip.open(archive, "rt") as f:
+            lines = f.readlines()
+        self.assertEqual(len(lines), len(self.ids) + 2)
+        self.assertEqual(json.loads(lines[-1]), {"end": {"solutions": len(self.ids)}})
+
+        loaded = self._memory()
+        self.server.calls.clear()
+        imported = loaded.import_archive(archive, batch_size=400)
+
+        self.assertEqual(imported["solutions"], len(self.ids))
+        self.assertEqual(self.server.max_hset_fields, 400)
+        self.assertLess(self.server.calls["HSET"], 30)
+        self._assert_restored(loaded)
+
+    def test_truncated_archive_is_rejected(self):
+        archive = os.path.join(self.tmp, "memory.jsonl.gz")
+        self.memory.export_archive(archive)
+        with gzip.open(archive, "rt") as f:
+            lines = f.readlines()
+        with gzip.open(archive, "wt") as f:
+            f.writelines(lines[:100])
+
+        loaded = self._memory()
+        with self.assertRaises(ValueError):
+            loaded.import_archive(archive, batch_size=10)
+        # Rejected before any solution is written
+        self.assertEqual(loaded.redis.hlen(loaded.solutions_key), 0)
+
+    def test_corrupt_archive_is_rejected(self):
+        archive = os.path.join(self.tmp, "memory.jsonl.gz")
+        self.memory.export_archive(archive)
+        with open(archive, "rb") as f:
+            data = f.read()
+        with open(archive, "wb") as f:
+            f.write(data[: len(data) // 2])
+
+        loaded = self._memory()
+        with self.assertRaises(ValueError):
+            loaded.import_archive(archive, batch_size=10)
+        self.assertEqual(loaded.redis.hlen(loaded.solutions_key), 0)
+
+    def test_checkpoint_directory_round_trip(self):
+        asyncio.run(self.memory.save_checkpoint(tag="files", batch_size=300))
+        checkpoint = os.path.join(self.tmp, "checkpoints", "checkpoint-files")
+
+        self.assertEqual(
+            len(os.listdir(os.path.join(checkpoint, "solutions"))), len(self.ids)
+        )
+        self.assertTrue(os.path.exists(os.path.join(checkpoint, "best_solution.json")))
+
+        loaded = self._memory()
+        self.server.calls.clear()
+        loaded.load_checkpoint(checkpoint, batch_size=1000)
+
+        self.assertLess(self.server.calls["HSET"], 30)
+        # One file per solution does not record the population membership.
+        self._assert_restored(loaded, population=len(self.ids))
+
+    def test_archived_checkpoint_round_trip(self):
+        asyncio.run(self.memory.save_checkpoint(tag="archive", archive=True))
+        checkpoint = os.path.join(self.tmp, "checkpoints", "checkpoint-archive")
+
+        self.assertEqual(
+            sorted(os.listdir(checkpoint)), ["best_solution.json", ARCHIVE_FILENAME]
+        )
+
+        loaded = self._memory()
+        loaded.load_checkpoint(checkpoint)
+        self._assert_restored(loaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the client-side solution cache of RedisMemory.
+
+Two memories attached to the same memory id play two PES processes sharing one
+Redis, here the in-process stand-in.
+"""
+
+import asyncio
+import json
+import time
+import unittest
+
+from redis_stand_in import RespStandIn
+
+from loongflow.agentsdk.memory.evolution.redis_memory import RedisMemory
+
+
+class TestSolutionCache(unittest.TestCase):
+    def setUp(self):
+        self.server = RespStandIn()
+        self.writer = self._memory()
+        self.reader = self._memory(memory_id=self.writer.memory_id)
+        self.ids = [f"sol-{i:03d}" for i in range(30)]
+        with self.writer.redis.pipeline(transaction=False) as pipe:
+            for i, sid in enumerate(self.ids):
+                solution = json.dumps(
+                    {
+                        "solution_id": sid,
+                        "score": i / 100,
+                        "island_id": i % 3,
+                        "timestamp": time.time() + i,
+                    }
+                )
+                pipe.hset(self.writer.solutions_key, sid, solution)
+                pipe.hset(self.writer.populations_key, sid, solution)
+                pipe.sadd(f"{self.writer.islands_key}:{i % 3}", sid)
+            pipe.sadd(self.writer.elites_key, *self.ids[-5:])
+            pipe.execute()
+        self.server.calls.clear()
+
+    def tearDown(self):
+        self.writer.redis_pool.disconnect()
+        self.reader.redis_pool.disconnect()
+        self.server.stop()
+
+    def _memory(self, **kwargs) -> RedisMemory:
+        return RedisMemory(num_islands=3, redis_url=self.server.url, **kwargs)
+
+    def test_repeated_reads_are_served_locally(self):
+        for _ in range(5):
+            best = self.reader.get_best_solutions(top_k=3)
+            self.assertEqual([s.solution_id for s in best], self.ids[:-4:-1])
+            self.assertIsNotNone(self.reader.sample())
+
+        self.assertEqual(self.server.calls["HVALS"], 1)
+        self.assertEqual(self.server.calls["SMEMBERS"], 1)
+        stats = self.reader.cache_stats()
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["hits"], 13)
+        self.assertEqual(stats["round_trips_saved"], 9 * 1 + 4 * 2)
+
+    def test_solutions_lru_fetches_only_missing_ids(self):
+        self.reader.get_solutions(self.ids[:2])
+        solutions = self.reader.get_solutions(self.ids[:3])
+
+        self.assertEqual([s.solution_id for s in solutions], self.ids[:3])
+        self.assertEqual(self.server.calls["HMGET"], 2)
+        self.assertEqual(self.reader.cache_stats()["hits"], 2)
+
+    def test_returned_solutions_are_copies(self):
+        self.reader.get_solutions(self.ids[:1])[0].score = 42
+        self.reader.get_best_solutions()[0].score = 42
+
+        self.assertEqual(self.reader.get_solutions(self.ids[:1])[0].score, 0.0)
+        self.assertEqual(self.reader.get_best_solutions()[0].score, 0.29)
+
+    def test_writes_of_another_process_invalidate(self):
+        target = self.ids[0]
+        self.assertEqual(self.reader.get_solutions([target])[0].score, 0.0)
+        self.assertEqual(self.reader.get_best_solutions()[0].solution_id, self.ids[-1])
+
+        asyncio.run(self.writer.update_solution(target, score=0.99))
+
+        self.assertEqual(self.reader.get_solutions([target])[0].score, 0.99)
+        self.assertEqual(self.reader.get_best_solutions()[0].solution_id, target)
+        self.assertEqual(
+            self.reader.memory_status()["global_status"]["best_score"], 0.99
+        )
+
+    def test_changelog_is_bounded(self):
+        for memory in (self.writer, self.reader):
+            memory._cache.changelog_window = 5
+        self.reader.get_solutions(self.ids)
+        self.reader.get_best_solutions()
+
+        # Within the window only the changed solutions are read again
+        for sid in self.ids[:3]:
+            asyncio.run(self.writer.update_solution(sid, score=0.5))
+        self.server.calls.clear()
+        solutions = self.reader.get_solutions(self.ids)
+        self.assertEqual([s.score for s in solutions[:4]], [0.5, 0.5, 0.5, 0.03])
+        self.assertEqual(self.server.calls["HMGET"], 1)
+
+        # Further behind than the window, everything is read again
+        for sid in self.ids[3:10]:
+            asyncio.run(self.writer.update_solution(sid, score=0.6))
+        self.assertEqual(len(self.server.lists[self.writer.changelog_key.encode()]), 5)
+        self.assertEqual(self.reader.stats_version(), 10)
+        self.assertEqual(self.reader.get_best_solutions()[0].score, 0.6)
+        self.assertEqual(self.reader.cache_stats()["cached_solutions"], 30)
+        solutions = self.reader.get_solutions(self.ids)
+        self.assertEqual([s.score for s in solutions[:11]], [0.5] * 3 + [0.6] * 7 + [0.1])
+
+    def test_lru_is_bounded(self):
+        reader = self._memory(memory_id=self.writer.memory_id, cache_size=10)
+        self.addCleanup(reader.redis_pool.disconnect)
+        reader.get_solutions(self.ids)
+
+        self.assertEqual(reader.cache_stats()["cached_solutions"], 10)
+        self.assertEqual(len(reader.get_solutions(self.ids)), len(self.ids))
+
+    def test_memory_status_reports_cache_efficiency(self):
+        self.reader.memory_status()
+        self.reader.get_best_solutions()
+        self.reader.cache_stats(reset=True)
+        # The status reads the score index, the cache serves the solution reads
+        self.reader.get_best_solutions()
+        with self.assertLogs(
+            "loongflow.agentsdk.memory.evolution.redis_memory", "INFO"
+        ) as logs:
+            self.reader.memory_status()
+
+        self.assertTrue(any("hit ratio 100.0%" in line for line in logs.output))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+"""
+This file provides a local OpenAI compatible chat completion server simulating a
+provider prompt cache, to measure how much of the prompts of a run is reusable.
+
+The server keeps the prefixes of the requests it has seen and reports, for every
+request, the prompt tokens found in its cache in ``usage.prompt_tokens_details``,
+the way providers do. Two cache models are simulated:
+
+- ``explicit``: prefixes are cached at the ``cache_control`` breakpoints of the
+  requests only, like Anthropic.
+- ``automatic``: prefixes are cached every ``block_chars`` characters, like
+  OpenAI and DeepSeek.
+
+Uncached prompt tokens can be given a processing time, so latency savings show up
+in wall-clock time. ``GET /stats`` returns the totals and the prefix reuse ratio:
+
+    with MockCacheServer(mode="automatic") as server:
+        model = LiteLLMModel("mock", base_url=server.url, api_key="mock",
+                             model_provider="openai", prompt_cache=True)
+        ...
+        print(server.stats()["reuse_ratio"])
+
+    python tests/agentsdk/models/mock_server.py --port 8001 --mode automatic
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+# Characters per token, the estimate of SimpleTokenCounter
+CHARS_PER_TOKEN = 4
+
+
+def _without_cache_control(value: Any) -> Any:
+    """``value`` without its ``cache_control`` tags, which are not prompt content."""
+    if isinstance(value, dict):
+        return {k: _without_cache_control(v) for k, v in value.items() if k != "cache_control"}
+    if isinstance(value, list):
+        return [_without_cache_control(v) for v in value]
+    return value
+
+
+def _has_cache_control(value: Any) -> bool:
+    if isinstance(value, dict):
+        return "cache_control" in value or any(_has_cache_control(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_has_cache_control(v) for v in value)
+    return False
+
+
+def prompt_segments(body: Dict[str, Any]) -> List[Tuple[str, bool]]:
+    """
+    The prompt of a chat completion request as the provider sees it: the tool
+    declarations then the messages, each serialized, with whether it ends on a
+    cache breakpoint.
+    """
+    segments = []
+    for item in list(body.get("tools") or []) + list(body.get("messages") or []):
+        text = json.dumps(_without_cache_control(item), sort_keys=True, ensure_ascii=False)
+        segments.append((text, _has_cache_control(item)))
+    return segments
+
+
+class PromptCache:
+    """Prefix cache of a simulated provider."""
+
+    def __init__(self, mode: str = "explicit", block_chars: int = 512):
+        if mode not in ("explicit", "automatic"):
+            raise ValueError(f"Unknown prompt cache mode: {mode}")
+        self.mode = mode
+        self.block_chars = block_chars
+        self._prefixes = set()
+        self._lock = threading.Lock()
+
+    def lookup(self, segments: List[Tuple[str, bool]]) -> Tuple[int, int]:
+        """
+        Look up and store the prefixes of a prompt.
+
+        Returns:
+            (prompt_chars, cached_chars): Length of the prompt, and of its longest
+            prefix found in the cache.
+        """
+        digest = hashlib.sha256()
+        candidates: List[Tuple[int, str]] = []
+        length = 0
+        for text, breakpoint in segments:
+            data = text.encode("utf-8")
+            offset = 0
+            if self.mode == "automatic":
+                # Every block boundary inside the segment ends a cacheable prefix
+                while True:
+                    cut = self.block_chars - length % self.block_chars
+                    if offset + cut > len(data):
+                        break
+                    digest.update(data[offset:offset + cut])
+                    offset += cut
+                    length += cut
+                    candidates.append((length, digest.hexdigest()))
+            digest.update(data[offset:])
+            length += len(data) - offset
+            if self.mode == "explicit" and breakpoint:
+                candidates.append((length, digest.hexdigest()))
+
+        with self._lock:
+            cached = max(
+                (end for end, key in candidates if key in self._prefixes), default=0
+            )
+            self._prefixes.update(key for _, key in candidates)
+        return length, cached
+
+
+class MockCacheServer:
+    """OpenAI compatible chat completion server with a simulated prompt cache."""
+
+    def __init__(
+        self,
+        mode: str = "explicit",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        block_chars: int = 512,
+        seconds_per_token: float = 0.0,
+        seconds_per_cached_token: float = 0.0,
+        reply: str = "ok",
+    ):
+        """
+        Args:
+            mode (str): ``explicit`` or ``automatic`` cache model.
+            host (str): Address to listen on.
+            port (int): Port to listen on, 0 for a free one.
+            block_chars (int): Cache granularity of the ``automatic`` mode.
+            seconds_per_token (float): Processing time of an uncached prompt token.
+            seconds_per_cached_token (float): Processing time of a cached prompt token.
+            reply (str): Content of the completions.
+        """
+        self.cache = PromptCache(mode, block_chars)
+        self.seconds_per_token = seconds_per_token
+        self.seconds_per_cached_token = seconds_per_cached_token
+        self.reply = reply
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self._stats_lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server, to use as the model ``base_url``."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "MockCacheServer":
+        """Serve from a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="mock-cache-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve from the calling thread until interrupted."""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        """Stop serving."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockCacheServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        """Request and token totals, and the share of prompt tokens read from cache."""
+        with self._stats_lock:
+            return {
+                "requests": self.requests,
+                "prompt_tokens": self.prompt_tokens,
+                "cached_tokens": self.cached_tokens,
+                "reuse_ratio": (
+                    self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+                ),
+            }
+
+    def complete(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer a chat completion request."""
+        prompt_chars, cached_chars = self.cache.lookup(prompt_segments(body))
+        prompt_tokens = max(1, prompt_chars // CHARS_PER_TOKEN)
+        cached_tokens = cached_chars // CHARS_PER_TOKEN
+        with self._stats_lock:
+            self.requests += 1
+            self.prompt_tokens += prompt_tokens
+            self.cached_tokens += cached_tokens
+
+        delay = (prompt_tokens - cached_tokens) * self.seconds_per_token + (
+            cached_tokens * self.seconds_per_cached_token
+        )
+        if delay > 0:
+            time.sleep(delay)
+
+        completion_tokens = max(1, len(self.reply) // CHARS_PER_TOKEN)
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "mock"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": self.reply},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "prompt_tokens_details": {"cached_tokens": cached_tokens},
+            },
+        }
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip("/").endswith("/stats"):
+                    self._reply(200, server.stats())
+                else:
+                    self._reply(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+            def do_POST(self):
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self._reply(404, {"error": {"message": f"Unknown path {self.path}"}})
+                    return
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError as e:
+                    self._reply(400, {"error": {"message": f"Invalid JSON: {e}"}})
+                    return
+                self._reply(200, server.complete(body))
+
+            def _reply(self, status: int, payload: Dict[str, Any]) -> None:
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the server in the foreground."""
+    parser = argparse.ArgumentParser(description="Mock chat completion server with a prompt cache.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--mode", choices=("explicit", "automatic"), default="explicit")
+    parser.add_argument("--block-chars", type=int, default=512)
+    parser.add_argument("--seconds-per-token", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    server = MockCacheServer(
+        mode=args.mode,
+        host=args.host,
+        port=args.port,
+        block_chars=args.block_chars,
+        seconds_per_token=args.seconds_per_token,
+    )
+    print(f"Serving {args.mode} prompt cache at {server.url}, stats at {server.url}/stats")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
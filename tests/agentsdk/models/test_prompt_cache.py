@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the prompt cache shaping of LiteLLMFormatter, against the mock
+prompt cache server.
+"""
+
+import json
+import time
+import urllib.request
+
+import pytest
+
+from loongflow.agentsdk.message import Message, Role
+from loongflow.agentsdk.models.formatter.litellm_formatter import LiteLLMFormatter
+from loongflow.agentsdk.models.litellm_model import LiteLLMModel
+from loongflow.agentsdk.models.llm_request import CompletionRequest
+from mock_server import MockCacheServer, PromptCache
+
+SYSTEM_PROMPT = "You are the executor of an evolution run. " * 400
+TASK = "Pack 26 circles in a unit square to maximize the sum of radii. " * 100
+
+
+def make_tool(name: str) -> dict:
+    return {
+        "type": "function",
+        "function": {
+            "name": name,
+            "description": f"The {name} tool. " * 20,
+            "parameters": {"type": "object", "properties": {"path": {"type": "string"}}},
+        },
+    }
+
+
+def make_request(step: int, tool_names=("Write", "Read", "Evaluate", "Shell")) -> CompletionRequest:
+    messages = [
+        Message.from_text(SYSTEM_PROMPT, role=Role.SYSTEM),
+        Message.from_text(TASK, role=Role.USER),
+    ]
+    for i in range(step):
+        messages.append(Message.from_text(f"Attempt {i}: " + "x = 1\n" * 200, role=Role.ASSISTANT))
+        messages.append(Message.from_text(f"Evaluation {i}: score {i / 10}", role=Role.USER))
+    return CompletionRequest(messages=messages, tools=[make_tool(n) for n in tool_names])
+
+
+def breakpoints(kwargs: dict) -> list:
+    tagged = [("tool", t["function"]["name"]) for t in kwargs.get("tools") or [] if "cache_control" in t]
+    for index, message in enumerate(kwargs["messages"]):
+        content = message["content"]
+        if isinstance(content, list) and any("cache_control" in block for block in content):
+            tagged.append(("message", index))
+    return tagged
+
+
+def test_breakpoints_for_claude():
+    formatter = LiteLLMFormatter()
+    request = make_request(3)
+    kwargs = formatter.format_request(request, "claude-sonnet", prompt_cache=True)
+
+    assert [t["function"]["name"] for t in kwargs["tools"]] == ["Evaluate", "Read", "Shell", "Write"]
+    assert breakpoints(kwargs) == [("tool", "Write"), ("message", 0), ("message", 1), ("message", 7)]
+    assert kwargs["messages"][0]["content"][0]["text"] == SYSTEM_PROMPT.strip()
+    # The request itself is left untouched
+    assert [t["function"]["name"] for t in request.tools] == ["Write", "Read", "Evaluate", "Shell"]
+    assert not any("cache_control" in t for t in request.tools)
+
+
+def test_breakpoints_follow_the_resolved_provider():
+    formatter = LiteLLMFormatter()
+    # A Claude model behind an OpenAI compatible endpoint takes no cache_control
+    proxied = formatter.format_request(
+        make_request(1), "claude-sonnet", model_provider="openai", prompt_cache=True
+    )
+    assert breakpoints(proxied) == []
+
+    bedrock = formatter.format_request(
+        make_request(1), "my-deployment", model_provider="bedrock", prompt_cache=True
+    )
+    assert breakpoints(bedrock) != []
+
+
+def test_automatic_cache_providers_get_stable_prefix_only():
+    formatter = LiteLLMFormatter()
+    kwargs = formatter.format_request(make_request(1), "gpt-4o", prompt_cache=True)
+
+    assert [t["function"]["name"] for t in kwargs["tools"]] == ["Evaluate", "Read", "Shell", "Write"]
+    assert breakpoints(kwargs) == []
+
+    # Same static prefix whatever the tool registration order
+    other = formatter.format_request(
+        make_request(1, ("Shell", "Evaluate", "Write", "Read")), "gpt-4o", prompt_cache=True
+    )
+    assert json.dumps(other["tools"]) == json.dumps(kwargs["tools"])
+
+    plain = formatter.format_request(make_request(1), "claude-sonnet")
+    assert [t["function"]["name"] for t in plain["tools"]][0] == "Write"
+    assert breakpoints(plain) == []
+
+
+def test_cached_tokens_are_parsed():
+    formatter = LiteLLMFormatter()
+    openai_style = formatter._parse_usage(
+        {"prompt_tokens": 100, "completion_tokens": 5, "total_tokens": 105,
+         "prompt_tokens_details": {"cached_tokens": 80}}
+    )
+    assert openai_style.cached_tokens == 80
+    anthropic_style = formatter._parse_usage(
+        {"prompt_tokens": 100, "completion_tokens": 5, "total_tokens": 105,
+         "cache_read_input_tokens": 60, "cache_creation_input_tokens": 40}
+    )
+    assert (anthropic_style.cached_tokens, anthropic_style.cache_creation_tokens) == (60, 40)
+    assert formatter._parse_usage(None) is None
+
+
+def test_prompt_cache_modes():
+    explicit = PromptCache("explicit")
+    assert explicit.lookup([("a" * 1000, True), ("b" * 100, False)]) == (1100, 0)
+    assert explicit.lookup([("a" * 1000, True), ("c" * 100, False)]) == (1100, 1000)
+
+    automatic = PromptCache("automatic", block_chars=256)
+    automatic.lookup([("a" * 1000, False), ("b" * 100, False)])
+    assert automatic.lookup([("a" * 1000, False), ("c" * 100, False)]) == (1100, 768)
+
+
+def mock_model(server: MockCacheServer, prompt_cache: bool) -> LiteLLMModel:
+    """A model talking to ``server``, tagging breakpoints when its cache is explicit."""
+    model = LiteLLMModel(
+        "mock", base_url=server.url, api_key="mock",
+        model_provider="openai", prompt_cache=prompt_cache,
+    )
+    if server.cache.mode == "explicit":
+        # The mock speaks the OpenAI API but caches at breakpoints, like Anthropic
+        model.formatter.CACHE_BREAKPOINT_PROVIDERS = {"openai"}
+    return model
+
+
+async def test_cached_tokens_surface_in_usage():
+    with MockCacheServer(mode="explicit") as server:
+        model = mock_model(server, prompt_cache=True)
+        first = [r async for r in model.generate(make_request(1))][-1]
+        second = [r async for r in model.generate(make_request(2))][-1]
+
+        with urllib.request.urlopen(f"{server.url}/stats") as response:
+            stats = json.load(response)
+
+    assert first.error_code is None, first.error_message
+    assert first.usage.cached_tokens == 0
+    assert second.usage.cached_tokens > second.usage.prompt_tokens / 2
+    assert stats["requests"] == 2
+    assert stats["cached_tokens"] == second.usage.cached_tokens
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("mode", ["explicit"])
+async def test_benchmark_prompt_cache(mode):
+    candidates, steps = 3, 5
+
+    async def run(prompt_cache: bool) -> tuple:
+        with MockCacheServer(mode=mode, seconds_per_token=1e-5) as server:
+            model = mock_model(server, prompt_cache)
+            start = time.perf_counter()
+            for _ in range(candidates):
+                for step in range(steps):
+                    async for response in model.generate(make_request(step)):
+                        assert response.error_code is None, response.error_message
+            return time.perf_counter() - start, server.stats()
+
+    before_time, before = await run(False)
+    after_time, after = await run(True)
+    print(
+        f"\n{candidates} candidates x {steps} steps ({mode} cache): "
+        f"reuse {before['reuse_ratio']:.0%} -> {after['reuse_ratio']:.0%}, "
+        f"{before_time:.2f}s -> {after_time:.2f}s"
+    )
+    assert before["reuse_ratio"] == 0
+    assert after["reuse_ratio"] > 0.8
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the serialization codecs and the fast paths of messages and solutions.
+"""
+
+import asyncio
+import json
+import math
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from dataclasses import asdict
+
+import numpy as np
+import pytest
+
+from loongflow.agentsdk.memory.evolution import InMemory, Solution
+from loongflow.agentsdk.memory.grade.storage.file_storage import FileStorage
+from loongflow.agentsdk.message import (
+    ContentElement,
+    Message,
+    Role,
+    ToolCallElement,
+    dump_messages,
+    load_messages,
+)
+from loongflow.agentsdk.serialization import (
+    Codec,
+    JsonCodec,
+    OrjsonCodec,
+    clean_nan_values,
+    dumps,
+    get_codec,
+    loads,
+    register_codec,
+)
+from loongflow.agentsdk.serialization.codec import orjson
+
+COUNT = 10_000
+
+
+def make_solution(i: int) -> Solution:
+    return Solution(
+        solution=f"def solve():\n    return {i}\n" * 20,
+        solution_id=f"sol-{i}",
+        parent_id=f"sol-{i - 1}",
+        iteration=i,
+        score=i / COUNT if i % 100 else float("nan"),
+        evaluation="Evaluation of the candidate " * 10,
+        metadata={"metrics": {"accuracy": 0.9, "loss": [0.5, 0.25]}, "tags": ["a"]},
+    )
+
+
+def make_message(i: int) -> Message:
+    return Message.from_elements(
+        sender="agent",
+        role=Role.ASSISTANT,
+        elements=[
+            ContentElement(data=f"Step {i} reasoning " * 20),
+            ToolCallElement(target="run_code", arguments={"code": "print(1)", "i": i}),
+        ],
+        metadata={"usage": {"prompt_tokens": 100, "completion_tokens": 20}},
+    )
+
+
+class TestCodecs(unittest.TestCase):
+    def test_nan_and_numpy_are_encoded_as_null(self):
+        data = {
+            "nan": float("nan"),
+            "inf": [1.0, float("inf")],
+            "np_nan": np.float32("nan"),
+            "array": np.array([1.0, np.nan]),
+            "int": np.int64(3),
+        }
+        decoded = loads(dumps(data))
+        self.assertEqual(
+            decoded,
+            {"nan": None, "inf": [1.0, None], "np_nan": None, "array": [1.0, None], "int": 3},
+        )
+        self.assertEqual(decoded, json.loads(json.dumps(clean_nan_values(data), default=int)))
+
+    def test_compact_and_indented_forms_are_interchangeable(self):
+        codec = JsonCodec()
+        data = {"a": [1, 2], "text": "é"}
+        compact = codec.dumps(data)
+        self.assertEqual(compact, '{"a":[1,2],"text":"é"}'.encode("utf-8"))
+        self.assertIn(b"\n    ", codec.dumps(data, indent=4))
+        self.assertEqual(json.loads(codec.dumps(data, indent=4)), codec.loads(compact))
+
+    def test_registry(self):
+        class ReprCodec(Codec):
+            name = "repr"
+
+            def dumps(self, obj, indent=None):
+                return repr(obj).encode()
+
+            def loads(self, data):
+                return data
+
+        register_codec(ReprCodec())
+        self.assertIsInstance(get_codec("repr"), ReprCodec)
+        with self.assertRaises(ValueError):
+            get_codec("missing")
+
+    def test_json_is_the_default(self):
+        self.assertEqual(get_codec().name, JsonCodec.name)
+
+
+@unittest.skipIf(orjson is None, "orjson is not installed")
+class TestOrjsonCodec(unittest.TestCase):
+    def test_output_matches_the_json_codec(self):
+        codec, reference = OrjsonCodec(), JsonCodec()
+        data = {"a": [1, 2], "nan": float("nan"), "array": np.array([0.5, np.nan])}
+        for indent in (None, 2, 4):
+            with self.subTest(indent=indent):
+                self.assertEqual(
+                    json.loads(codec.dumps(data, indent)),
+                    json.loads(reference.dumps(data, indent)),
+                )
+        self.assertIn(b"\n    \"a\"", codec.dumps(data, indent=4))
+
+    def test_big_integers_fall_back_to_json(self):
+        data = {"big": 2**70, "small": 1}
+        self.assertEqual(OrjsonCodec().loads(OrjsonCodec().dumps(data)), data)
+
+
+class TestFastPaths(unittest.TestCase):
+    def test_solution_json_matches_to_dict(self):
+        solution = make_solution(100)
+        solution.metadata["array"] = np.array([0.5, np.nan])
+
+        data = json.loads(solution.to_json())
+
+        self.assertEqual(data, json.loads(json.dumps(solution.to_dict(), default=list)))
+        self.assertIsNone(data["score"])
+        self.assertEqual(data["metadata"]["array"], [0.5, None])
+        restored = Solution.from_json(json.dumps(solution.to_dict(), default=list))
+        self.assertEqual(restored.solution_id, solution.solution_id)
+        self.assertIsNone(restored.score)
+
+    def test_to_dict_does_not_share_containers(self):
+        solution = make_solution(1)
+        data = solution.to_dict()
+        data["metadata"]["metrics"]["accuracy"] = 0.0
+        self.assertEqual(solution.metadata["metrics"]["accuracy"], 0.9)
+
+    def test_message_json_round_trip(self):
+        messages = [make_message(i) for i in range(3)]
+        messages[0].metadata["score"] = float("nan")
+
+        restored = load_messages(dump_messages(messages))
+
+        self.assertEqual([m.to_dict() for m in restored], [m.to_dict() for m in messages])
+        self.assertEqual(Message.from_json(messages[1].to_json()), messages[1])
+        self.assertEqual(json.loads(messages[2].to_json()), messages[2].to_dict())
+
+    def test_file_storage_reads_both_forms(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        messages = [make_message(i) for i in range(5)]
+        sizes = {}
+        for compact in (False, True):
+            path = os.path.join(root, f"compact_{compact}", "messages.json")
+            storage = FileStorage(path, compact=compact)
+            asyncio.run(storage.add(messages))
+            sizes[compact] = os.path.getsize(path)
+            restored = asyncio.run(FileStorage(path).get_all())
+            self.assertEqual([m.id for m in restored], [m.id for m in messages])
+        self.assertLess(sizes[True], sizes[False])
+
+    def test_compact_checkpoint_round_trip(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        memory = InMemory(num_islands=2, population_size=20, compact_checkpoints=True)
+        for i in range(1, 11):
+            memory._add_solution(make_solution(i))
+        asyncio.run(memory.save_checkpoint(root, tag="compact"))
+        checkpoint = os.path.join(root, "checkpoints", "checkpoint-compact")
+        with open(os.path.join(checkpoint, "metadata.json")) as f:
+            self.assertEqual(len(f.read().splitlines()), 1)
+
+        restored = InMemory(num_islands=2, population_size=20)
+        restored.load_checkpoint(checkpoint)
+
+        self.assertEqual(set(restored.solutions), set(memory.solutions))
+        self.assertEqual(restored.best_solution_id, memory.best_solution_id)
+
+
+@pytest.mark.benchmark
+class TestSerializationBenchmark(unittest.TestCase):
+    def test_benchmark_throughput(self):
+        solutions = [make_solution(i) for i in range(COUNT)]
+        messages = [make_message(i) for i in range(COUNT)]
+
+        start = time.perf_counter()
+        solution_data = [json.dumps(clean_nan_values(asdict(s))) for s in solutions]
+        for data in solution_data:
+            Solution.from_dict(json.loads(data))
+        message_data = json.dumps([m.to_dict() for m in messages], indent=2)
+        [Message.from_dict(m) for m in json.loads(message_data)]
+        before = time.perf_counter() - start
+
+        start = time.perf_counter()
+        solution_data = [s.to_json() for s in solutions]
+        restored = [Solution.from_json(data) for data in solution_data]
+        restored_messages = load_messages(dump_messages(messages))
+        after = time.perf_counter() - start
+        print(
+            f"Serialize and deserialize {COUNT} solutions and {COUNT} messages with "
+            f"the {get_codec().name} codec: {before * 1e3:.0f}ms before, "
+            f"{after * 1e3:.0f}ms on the fast paths"
+        )
+
+        self.assertTrue(math.isnan(solutions[0].score))
+        self.assertIsNone(restored[0].score)
+        self.assertEqual(restored[-1].metadata, solutions[-1].metadata)
+        self.assertEqual(restored_messages[-1], messages[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the bounded capture of tool outputs and the ReadOutput tool.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import pytest
+
+from loongflow.agentsdk.tools import ReadOutputTool, ReadTool, ShellTool
+from loongflow.agentsdk.tools.execute_code_tool import ExecuteCodeTool
+from loongflow.agentsdk.tools.tool_output import (
+    OutputBuffer,
+    output_files,
+    prune_spill_dir,
+    run_process,
+)
+
+# Prints 15MB of numbered lines
+VERBOSE_CODE = "import sys\nfor i in range(1_000_000):\n    sys.stdout.write(f'line {i:09d}\\n')"
+
+
+def test_short_output_is_kept_whole(tmp_path):
+    buf = OutputBuffer(head_bytes=10, tail_bytes=10, spill_dir=str(tmp_path))
+    for chunk in ["hello ", "world", "\n"]:
+        buf.write(chunk)
+    buf.close()
+
+    assert buf.text() == "hello world\n"
+    assert not buf.truncated
+    assert buf.spill_path is None
+    assert output_files(stdout=buf) == {}
+
+
+def test_long_output_spills(tmp_path):
+    data = "".join(f"{i:04d}\n" for i in range(1000))
+    buf = OutputBuffer("stdout", head_bytes=20, tail_bytes=15, spill_dir=str(tmp_path))
+    for start in range(0, len(data), 7):
+        buf.write(data[start:start + 7])
+    buf.close()
+
+    text = buf.text()
+    assert text.startswith("0000\n0001\n0002\n0003\n")
+    assert text.endswith("0997\n0998\n0999\n")
+    assert f"{len(data) - 35} bytes omitted of {len(data)} bytes, 1000 lines" in text
+    with open(buf.spill_path) as f:
+        assert f.read() == data
+    assert output_files(stdout=buf)["output_files"]["stdout"]["bytes"] == len(data)
+
+
+def test_spill_file_is_capped(tmp_path):
+    buf = OutputBuffer(head_bytes=4, tail_bytes=4, spill_dir=str(tmp_path), max_spill_bytes=100)
+    for _ in range(50):
+        buf.write(b"x" * 10)
+    buf.close()
+    assert buf.total_bytes == 500
+    assert buf.summary()["spilled_bytes"] == 100
+
+
+def test_old_spill_files_are_removed(tmp_path):
+    now = time.time()
+    for i, age in enumerate([3 * 86400, 2 * 3600, 3600, 60]):
+        path = tmp_path / f"{i}-stdout.log"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (now - age, now - age))
+    (tmp_path / "notes.txt").write_text("not a spill file")
+
+    assert prune_spill_dir(str(tmp_path), retention_seconds=86400, max_bytes=250) == 2
+    assert sorted(os.listdir(tmp_path)) == ["2-stdout.log", "3-stdout.log", "notes.txt"]
+
+    # Opening a spill file makes room for it
+    buf = OutputBuffer(
+        head_bytes=4, tail_bytes=4, spill_dir=str(tmp_path),
+        max_spill_bytes=100, max_spill_dir_bytes=200,
+    )
+    buf.write(b"y" * 50)
+    buf.close()
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        ["3-stdout.log", "notes.txt", os.path.basename(buf.spill_path)]
+    )
+
+
+def test_timeout_keeps_partial_output(tmp_path):
+    code = "import time\nprint('started', flush=True)\ntime.sleep(10)"
+    start = time.time()
+    output = run_process([sys.executable, "-c", code], timeout=1, spill_dir=str(tmp_path))
+    assert time.time() - start < 5
+    assert output.timed_out
+    assert output.stdout.text() == "started\n"
+
+    result = ExecuteCodeTool(spill_dir=str(tmp_path)).run(
+        args={"mode": "code", "code": code, "timeout": 1}
+    ).content[0].data
+    assert result["returncode"] == -1
+    assert "timed out" in result["error"]
+    assert result["stdout"] == "started\n"
+
+
+@pytest.mark.asyncio
+async def test_shell_output_is_paged(tmp_path):
+    shell = ShellTool(head_bytes=1000, tail_bytes=1000, spill_dir=str(tmp_path))
+    resp = await shell.arun(args={"commands": [{"command": "seq 1 100000"}]})
+    result = resp.content[0].data["results"][0]
+
+    assert result["returncode"] == 0
+    assert result["stdout"].startswith("1\n2\n3\n")
+    assert result["stdout"].endswith("99999\n100000")
+    assert len(result["stdout"]) < 2500
+    spill = result["output_files"]["stdout"]
+    assert spill["lines"] == 100000
+
+    reader = ReadOutputTool(spill_dir=str(tmp_path))
+    page = reader.run(args={"path": spill["path"], "offset": 1000, "limit": 100}).content[0].data
+    full = "".join(f"{i}\n" for i in range(1, 100001))
+    assert page["content"] == full[1000:1100]
+    assert page["next_offset"] == 1100
+    assert page["size"] == len(full)
+
+    last = reader.run(args={"path": spill["path"], "offset": len(full) - 7}).content[0].data
+    assert last["content"] == "100000\n"
+    assert last["next_offset"] is None
+
+    # Same output through the synchronous path
+    sync = shell.run(args={"commands": [{"command": "seq 1 100000"}]}).content[0].data["results"][0]
+    assert sync["stdout"].endswith("99999\n100000")
+    assert sync["output_files"]["stdout"]["bytes"] == len(full)
+
+
+def test_read_output_only_reads_spill_files(tmp_path):
+    (tmp_path / "secret.txt").write_text("secret")
+    reader = ReadOutputTool(spill_dir=str(tmp_path / "spill"))
+    resp = reader.run(args={"path": str(tmp_path / "secret.txt")})
+    assert "Not a tool output file" in resp.err_msg
+    resp = reader.run(args={"path": str(tmp_path / "spill" / ".." / "secret.txt")})
+    assert "Not a tool output file" in resp.err_msg
+
+
+def test_read_tool_stops_at_budget(tmp_path):
+    path = tmp_path / "big.txt"
+    path.write_text("".join(f"row {i}\n" for i in range(100000)) + "x" * 100000 + "\nend\n")
+    tool = ReadTool(max_output_chars=1000)
+
+    data = tool.run(args={"file_path": str(path)}).content[0].data
+    assert data["truncated"]
+    assert len(data["content"]) < 1200
+    next_offset = data["next_offset"]
+    assert f"continue with offset={next_offset}" in data["content"]
+
+    data = tool.run(args={"file_path": str(path), "offset": next_offset, "limit": 2}).content[0].data
+    assert data["content"].startswith(f"{next_offset:6d}  row {next_offset - 1}\n")
+    assert data["total_lines"] == 2
+
+    # Long lines are cut without being read whole
+    tool = ReadTool(max_output_chars=3000)
+    data = tool.run(args={"file_path": str(path), "offset": 100001}).content[0].data
+    lines = data["content"].splitlines()
+    assert lines[0].endswith("x" * 10 + "...")
+    assert len(lines[0]) < 2100
+    assert lines[1] == "100002  end"
+
+
+@pytest.mark.benchmark
+def test_benchmark_verbose_program(tmp_path):
+    # Before: the full output captured in memory and put in the tool result
+    tracemalloc.start()
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", VERBOSE_CODE],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    before_message = len(json.dumps({"stdout": proc.stdout, "stderr": proc.stderr}))
+    before_time = time.perf_counter() - start
+    before_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del proc
+
+    # After: head and tail in the result, the rest spilled to disk
+    tracemalloc.start()
+    start = time.perf_counter()
+    resp = ExecuteCodeTool(spill_dir=str(tmp_path)).run(
+        args={"mode": "code", "code": VERBOSE_CODE, "timeout": 60}
+    )
+    after_message = len(json.dumps(resp.content[0].data))
+    after_time = time.perf_counter() - start
+    after_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(
+        f"\n15MB of output: message {before_message} -> {after_message} chars, "
+        f"peak memory {before_peak / 2**20:.1f}MB -> {after_peak / 2**20:.1f}MB, "
+        f"{before_time:.2f}s -> {after_time:.2f}s"
+    )
+    assert resp.content[0].data["output_files"]["stdout"]["bytes"] == 15_000_000
+    assert after_message < 20_000
+    assert after_peak < before_peak / 20
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Import-time budget of the modules loaded by runners and subprocess workers.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Cumulative import time of loongflow.core, measured around 0.4s. Generous, so a
+# loaded machine stays under it.
+IMPORT_BUDGET_SECONDS = 3.0
+HEAVY_MODULES = ("litellm", "claude_agent_sdk", "flask", "redis", "openai")
+
+
+def import_in_subprocess(module: str) -> tuple[float, set]:
+    """(cumulative import seconds, heavy modules loaded) of a fresh interpreter."""
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([os.path.join(ROOT, "src"), ROOT]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=env,
+        timeout=120,
+        check=True,
+    )
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and line.split("|")[-1].strip() == module:
+            cumulative_us = int(line.split("|")[1])
+    return cumulative_us / 1e6, set(filter(None, result.stdout.strip().split(",")))
+
+
+class TestImportTime(unittest.TestCase):
+    def test_core_import_budget(self):
+        seconds, heavy = import_in_subprocess("loongflow.core")
+        self.assertEqual(heavy, set())
+        self.assertLess(seconds, IMPORT_BUDGET_SECONDS)
+
+    def test_packages_do_not_load_optional_dependencies(self):
+        for module in (
+            "loongflow.core",
+            "loongflow.agentsdk",
+            "loongflow.agentsdk.memory.evolution",
+            "loongflow.framework.pes",
+            "loongflow.framework.claude_code",
+            "loongflow.framework.pes.evaluator",
+        ):
+            with self.subTest(module=module):
+                _, heavy = import_in_subprocess(module)
+                self.assertEqual(heavy, set())
+
+    def test_runner_defers_model_and_backend_imports(self):
+        _, heavy = import_in_subprocess("agents.math_agent.math_evolve_agent")
+        self.assertEqual(heavy, set())
+
+    @pytest.mark.benchmark
+    def test_benchmark_import_time(self):
+        for module in ("loongflow.core", "agents.math_agent.math_evolve_agent"):
+            seconds, _ = import_in_subprocess(module)
+            print(f"import {module}: {seconds * 1e3:.0f}ms")
+
+    def test_lazy_exports_resolve(self):
+        import loongflow.agentsdk
+        import loongflow.framework.pes as pes
+        from loongflow.agentsdk.memory.evolution import InMemory, MemoryFactory
+        from loongflow.framework.pes.pes_agent import PESAgent
+
+        self.assertIs(pes.PESAgent, PESAgent)
+        self.assertIn("PESAgent", dir(pes))
+        self.assertIn("tools", dir(loongflow.agentsdk))
+        self.assertTrue(hasattr(loongflow.agentsdk.tools, "Toolkit"))
+        self.assertIsNotNone(InMemory)
+        self.assertIsNotNone(MemoryFactory)
+        with self.assertRaises(AttributeError):
+            pes.NotAnExport
+
+
+if __name__ == "__main__":
+    unittest.main()
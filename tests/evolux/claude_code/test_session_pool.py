@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the Claude session pool, against a local stub of the Claude CLI.
+"""
+
+import asyncio
+import dataclasses
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import time
+import unittest
+
+import pytest
+
+from loongflow.framework.claude_code import ClaudeCodeAgent, ClaudeSessionPool
+
+# Seconds the stub takes to start, like the CLI loading before its handshake
+STARTUP_DELAY = 0.3
+
+STUB_CLI = '''#!{python}
+"""Speaks the stream-json protocol of the Claude CLI, without a model."""
+import json
+import os
+import sys
+import time
+
+if "-v" in sys.argv:
+    print("2.1.0 (Claude Code)")
+    sys.exit(0)
+
+time.sleep({startup_delay})
+with open(os.path.join({log_dir!r}, f"{{os.getpid()}}.spawn"), "w"):
+    pass
+history = []
+
+
+def send(message):
+    sys.stdout.write(json.dumps(message) + "\\n")
+    sys.stdout.flush()
+
+
+def control_response(request_id, response):
+    send({{
+        "type": "control_response",
+        "response": {{"subtype": "success", "request_id": request_id, "response": response}},
+    }})
+
+
+def mcp_request(request_id, method, params):
+    send({{
+        "type": "control_request",
+        "request_id": f"cli_{{request_id}}",
+        "request": {{
+            "subtype": "mcp_message",
+            "server_name": "custom",
+            "message": {{
+                "jsonrpc": "2.0", "id": request_id, "method": method, "params": params,
+            }},
+        }},
+    }})
+    while True:
+        message = json.loads(sys.stdin.readline())
+        if message.get("type") == "control_response":
+            return message["response"]["response"]["mcp_response"]["result"]
+
+
+def call_tool(name):
+    mcp_request(1, "initialize", {{
+        "protocolVersion": "2024-11-05",
+        "capabilities": {{}},
+        "clientInfo": {{"name": "stub", "version": "1.0.0"}},
+    }})
+    result = mcp_request(2, "tools/call", {{"name": name, "arguments": {{"value": "x"}}}})
+    return result["content"][0]["text"]
+
+
+def finish(text):
+    send({{
+        "type": "assistant",
+        "message": {{"model": "stub", "content": [{{"type": "text", "text": text}}]}},
+    }})
+    send({{
+        "type": "result",
+        "subtype": "success",
+        "duration_ms": 1,
+        "duration_api_ms": 1,
+        "is_error": False,
+        "num_turns": 1,
+        "session_id": "stub",
+        "usage": {{"input_tokens": 3, "output_tokens": 2}},
+    }})
+
+
+for line in sys.stdin:
+    message = json.loads(line)
+    if message["type"] == "control_request":
+        subtype = message["request"]["subtype"]
+        if subtype == "initialize":
+            control_response(message["request_id"], {{"commands": []}})
+        elif subtype == "mcp_status":
+            control_response(message["request_id"], {{"mcpServers": []}})
+        continue
+    if message["type"] != "user":
+        continue
+    prompt = message["message"]["content"]
+    if prompt == "/clear":
+        history.clear()
+        finish("cleared")
+        continue
+    if prompt == "exit":
+        sys.exit(0)
+    history.append(prompt)
+    text = f"pid={{os.getpid()}} history={{len(history)}}"
+    if prompt.startswith("call "):
+        text += " tool=" + call_tool(prompt[len("call "):])
+    finish(text)
+'''
+
+
+def tool_handler(label):
+    async def handler(args):
+        return {"content": [{"type": "text", "text": f"{label}:{args['value']}"}]}
+
+    return handler
+
+
+def running(pid: int) -> bool:
+    """Whether ``pid`` is a process that did not exit, zombies excluded."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] not in ("Z", "X")
+    except FileNotFoundError:
+        return False
+
+
+class StubCLITestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="claude_session_pool_test_")
+        self.cli = os.path.join(self.root, "claude")
+        with open(self.cli, "w") as f:
+            f.write(
+                STUB_CLI.format(
+                    python=sys.executable,
+                    startup_delay=STARTUP_DELAY,
+                    log_dir=self.root,
+                )
+            )
+        os.chmod(self.cli, os.stat(self.cli).st_mode | stat.S_IEXEC)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def spawns(self) -> int:
+        return len([name for name in os.listdir(self.root) if name.endswith(".spawn")])
+
+    def agent(self, pool=None, model="stub-model", label="first", **kwargs):
+        agent = ClaudeCodeAgent(
+            model=model,
+            work_dir=self.root,
+            tool_list=["Read"],
+            custom_tools={
+                "evaluate_candidate": {
+                    "function": tool_handler(label),
+                    "description": "Evaluate a candidate.",
+                    "parameters": {"value": str},
+                }
+            },
+            session_pool=pool,
+            **kwargs,
+        )
+        agent.options = dataclasses.replace(agent.options, cli_path=self.cli)
+        return agent
+
+    @staticmethod
+    def reply(message) -> dict:
+        return dict(item.split("=", 1) for item in message.content[0].data.split())
+
+
+class TestClaudeSessionPool(StubCLITestCase):
+    async def test_sessions_are_reused_and_reset(self):
+        pool = ClaudeSessionPool()
+        first = self.reply(await self.agent(pool).run("hello"))
+        second = self.reply(await self.agent(pool).run("hello again"))
+        await pool.close()
+
+        self.assertEqual(self.spawns(), 1)
+        self.assertEqual(first["pid"], second["pid"])
+        # The conversation of the previous candidate was cleared
+        self.assertEqual(second["history"], "1")
+        self.assertEqual(pool.stats()["reused"], 1)
+        self.assertEqual(pool.stats()["idle"], 0)
+
+    async def test_custom_tools_call_the_handlers_of_the_current_run(self):
+        pool = ClaudeSessionPool()
+        first = await self.agent(pool, label="first").run("call evaluate_candidate")
+        second = await self.agent(pool, label="second").run("call evaluate_candidate")
+        await pool.close()
+
+        self.assertEqual(self.reply(first)["tool"], "first:x")
+        self.assertEqual(self.reply(second)["tool"], "second:x")
+        self.assertEqual(self.spawns(), 1)
+        self.assertEqual(second.metadata["input_tokens"], 3)
+
+    async def test_sessions_are_keyed_by_configuration(self):
+        pool = ClaudeSessionPool()
+        await self.agent(pool, model="model-a").run("hello")
+        await self.agent(pool, model="model-b").run("hello")
+        await self.agent(pool, model="model-a", permission_mode="plan").run("hello")
+        await self.agent(pool, model="model-a").run("hello")
+        await pool.close()
+
+        self.assertEqual(self.spawns(), 3)
+
+    async def test_sessions_are_recycled_after_max_uses(self):
+        pool = ClaudeSessionPool(max_uses=2)
+        pids = [self.reply(await self.agent(pool).run("hello"))["pid"] for _ in range(5)]
+        await pool.close()
+
+        self.assertEqual(len(set(pids)), 3)
+        self.assertEqual(pool.stats()["recycled"], 2)
+
+    async def test_sessions_are_recycled_after_max_age(self):
+        pool = ClaudeSessionPool(max_age=0.01)
+        await self.agent(pool).run("hello")
+        await self.agent(pool).run("hello")
+        await pool.close()
+
+        self.assertEqual(self.spawns(), 2)
+
+    async def test_dead_sessions_are_replaced(self):
+        pool = ClaudeSessionPool(health_check_timeout=1.0)
+        # The CLI exits before the end of the run, its session is not reused
+        await self.agent(pool).run("exit")
+        reply = self.reply(await self.agent(pool).run("hello"))
+        await pool.close()
+
+        self.assertEqual(reply["history"], "1")
+        self.assertEqual(self.spawns(), 2)
+        self.assertEqual(pool.stats()["discarded"], 1)
+
+    async def test_concurrent_runs_use_separate_sessions(self):
+        pool = ClaudeSessionPool()
+        replies = await asyncio.gather(
+            *(self.agent(pool).run(f"hello {i}") for i in range(3))
+        )
+        again = await asyncio.gather(
+            *(self.agent(pool).run(f"hello {i}") for i in range(3))
+        )
+        await pool.close()
+
+        self.assertEqual(len({self.reply(r)["pid"] for r in replies}), 3)
+        self.assertEqual({self.reply(r)["history"] for r in again}, {"1"})
+        self.assertEqual(self.spawns(), 3)
+
+    async def test_idle_sessions_are_terminated_in_a_new_event_loop(self):
+        pool = ClaudeSessionPool()
+        first = int(self.reply(await self.agent(pool).run("hello"))["pid"])
+
+
+        async def run_elsewhere():
+            try:
+                return await self.agent(pool).run("hello")
+            finally:
+                await pool.close()
+
+        # Another loop, as in a second asyncio.run, cannot reuse the session
+        second = await asyncio.to_thread(asyncio.run, run_elsewhere())
+
+        self.assertNotEqual(int(self.reply(second)["pid"]), first)
+        self.assertEqual(pool.stats()["discarded"], 1)
+        deadline = time.monotonic() + 5
+        while running(first) and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        self.assertFalse(running(first))
+
+    def test_rejects_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            ClaudeSessionPool(max_uses=0)
+
+
+@pytest.mark.benchmark
+class TestClaudeSessionPoolBenchmark(StubCLITestCase):
+    async def run_candidates(self, pool, candidates: int) -> float:
+        start = time.perf_counter()
+        for i in range(candidates):
+            result = await self.agent(pool, label=str(i)).run("call evaluate_candidate")
+            self.assertEqual(self.reply(result)["tool"], f"{i}:x")
+        return time.perf_counter() - start
+
+    async def test_benchmark_candidate_latency(self):
+        candidates = 5
+        before = await self.run_candidates(None, candidates)
+        pool = ClaudeSessionPool()
+        after = await self.run_candidates(pool, candidates)
+        await pool.close()
+        print(
+            f"{candidates} candidates against a CLI starting in {STARTUP_DELAY}s: "
+            f"{before * 1e3:.0f}ms with a session per candidate, "
+            f"{after * 1e3:.0f}ms with the pool"
+        )
+
+        self.assertEqual(self.spawns(), candidates + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
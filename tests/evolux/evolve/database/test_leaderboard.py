@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the leaderboard the database serves to the planners and the finalizer.
+"""
+
+import asyncio
+import heapq
+import json
+import random
+import time
+import unittest
+from unittest import mock
+from operator import attrgetter
+
+import pytest
+
+from loongflow.agentsdk.memory.evolution import Solution
+from loongflow.agentsdk.memory.evolution.in_memory import InMemory
+from loongflow.framework.pes.context.config import DatabaseConfig
+from loongflow.framework.pes.database import EvolveDatabase, GetBestSolutionsTool
+from loongflow.framework.pes.database.database import LEADERBOARD_FIELDS
+
+
+def make_solution(rng: random.Random, index: int, island_id: int, code_size: int = 64) -> Solution:
+    return Solution(
+        solution=f"# solution {index}\n" + "x = 1\n" * (code_size // 6),
+        solution_id=f"s{index}",
+        island_id=island_id,
+        iteration=index,
+        score=round(rng.random(), 6) + index * 1e-9,
+        evaluation=json.dumps({"metric": index, "log": "ok " * 50}),
+        generate_plan="plan " * 40,
+        summary=f"summary of solution {index} " * 20,
+    )
+
+
+def scan_best(memory: InMemory, island_id, top_k: int) -> list:
+    """Best solutions recomputed by scanning the population, as before."""
+    snapshot = memory._snapshot
+    members = (
+        snapshot.islands[island_id]
+        if island_id is not None
+        else snapshot.population.values()
+    )
+    return heapq.nlargest(top_k, members, key=attrgetter("score"))
+
+
+class TestInMemoryLeaderboard(unittest.TestCase):
+    def test_matches_scan_through_evictions_migrations_and_updates(self):
+        rng = random.Random(0)
+        memory = InMemory(
+            num_islands=3,
+            population_size=60,
+            migration_interval=5,
+            leaderboard_size=10,
+            output_path="/tmp/leaderboard_test",
+        )
+
+        async def fill():
+            for index in range(200):
+                await memory.add_solution(make_solution(rng, index, index % 3))
+                if index % 25 == 0 and memory.populations:
+                    solution_id = rng.choice(list(memory.populations))
+                    await memory.update_solution(solution_id, score=rng.random() / 10)
+                for island_id in (None, 0, 1, 2):
+                    for top_k in (1, 5, 10, 15):
+                        # Migrated copies tie with their originals, compare scores
+                        self.assertEqual(
+                            [s.score for s in memory.get_best_solutions(island_id, top_k)],
+                            [s.score for s in scan_best(memory, island_id, top_k)],
+                        )
+
+        asyncio.run(fill())
+        self.assertEqual(len(memory._snapshot.leaders), 10)
+
+    def test_async_reads_do_not_leave_the_loop(self):
+        rng = random.Random(1)
+        memory = InMemory(num_islands=2, output_path="/tmp/leaderboard_test")
+
+        async def run():
+            for index in range(20):
+                await memory.add_solution(make_solution(rng, index, index % 2))
+            with mock.patch("asyncio.to_thread", side_effect=AssertionError("to_thread")):
+                return await memory.aget_best_solutions(top_k=3), await memory.amemory_status()
+
+        best, status = asyncio.run(run())
+        self.assertEqual(
+            [s.score for s in best], [s.score for s in scan_best(memory, None, 3)]
+        )
+        self.assertEqual(status["global_status"]["best_score"], best[0].score)
+
+
+class TestDatabaseLeaderboard(unittest.TestCase):
+    def setUp(self):
+        self.database = EvolveDatabase(
+            DatabaseConfig(storage_type="in_memory", population_size=500)
+        )
+        rng = random.Random(2)
+
+        async def fill():
+            for index in range(30):
+                await self.database.add_solution(make_solution(rng, index, index % 3))
+
+        asyncio.run(fill())
+
+    def test_compact_entries(self):
+        full = self.database.get_best_solutions(top_k=5)
+        entries = self.database.get_leaderboard(top_k=5)
+
+        self.assertEqual([e["solution_id"] for e in entries], [s["solution_id"] for s in full])
+        self.assertEqual(set(entries[0]), set(LEADERBOARD_FIELDS))
+        self.assertEqual(entries[0]["score"], full[0]["score"])
+        self.assertIn("more chars]", entries[0]["summary"])
+        self.assertLess(len(json.dumps(entries)), len(json.dumps(full)) / 3)
+
+    def test_field_selection_and_size_limit(self):
+        entries = asyncio.run(
+            self.database.aget_leaderboard(
+                island_id=1, top_k=2, fields=["solution_id", "solution"], max_chars=20
+            )
+        )
+
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(set(entries[0]), {"solution_id", "solution"})
+        self.assertTrue(entries[0]["solution"].startswith("# solution"))
+        self.assertLessEqual(len(entries[0]["solution"].split("...")[0]), 20)
+        best = self.database.get_best_solutions(island_id=1, top_k=1)[0]
+        self.assertEqual(entries[0]["solution_id"], best["solution_id"])
+
+    def test_texts_kept_whole_when_not_limited(self):
+        full = self.database.get_best_solutions(top_k=3)
+        entries = self.database.get_leaderboard(top_k=3, default_max_chars=None)
+        self.assertEqual(entries[0]["summary"], full[0]["summary"])
+        # An explicit limit still applies
+        entries = self.database.get_leaderboard(top_k=3, max_chars=10, default_max_chars=None)
+        self.assertIn("more chars]", entries[0]["summary"])
+
+    def test_tool(self):
+        tool = GetBestSolutionsTool(self.database.aget_leaderboard)
+        response = asyncio.run(
+            tool.arun(args={"top_k": 3, "fields": ["solution_id", "score"]})
+        )
+        data = response.content[0].data
+
+        self.assertEqual(len(data), 3)
+        self.assertEqual(set(data[0]), {"solution_id", "score"})
+
+    @pytest.mark.benchmark
+    def test_benchmark_best_solutions_tool(self):
+        database = EvolveDatabase(
+            DatabaseConfig(storage_type="in_memory", population_size=3000)
+        )
+        rng = random.Random(3)
+
+        async def fill():
+            for index in range(2000):
+                await database.add_solution(
+                    make_solution(rng, index, index % 3, code_size=2000)
+                )
+
+        asyncio.run(fill())
+        memory = database._evolution_memory._memory
+
+        def before():
+            # Scan of the population and full solution dicts, as before
+            solutions = scan_best(memory, None, 5)
+            return json.dumps([solution.to_dict() for solution in solutions])
+
+        def after():
+            return json.dumps(database.get_leaderboard(top_k=5))
+
+        def best_of(fn, repeat=50):
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fn()
+                best = min(best, time.perf_counter() - start)
+            return best
+
+        before_time, after_time = best_of(before), best_of(after)
+        before_size, after_size = len(before()), len(after())
+        print(
+            f"\ntop 5 of 2000 solutions: scan {before_time * 1e6:.0f}us/{before_size} chars, "
+            f"leaderboard {after_time * 1e6:.0f}us/{after_size} chars"
+        )
+        self.assertLess(after_size, before_size / 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
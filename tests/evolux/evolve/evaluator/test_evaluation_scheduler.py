@@ -0,0 +1,219 @@
+# test_evaluation_scheduler.py
+
+import asyncio
+import unittest
+from contextlib import aclosing
+from typing import Optional
+
+from loongflow.agentsdk.message import ContentElement, Message
+from loongflow.framework.pes.context import Context, EvaluatorConfig
+from loongflow.framework.pes.evaluator import (
+    EvaluationResult,
+    EvaluationScheduler,
+    EvaluationStatus,
+    Evaluator,
+    LoongFlowEvaluator,
+)
+from loongflow.framework.pes.evaluator.scheduler import available_cores
+
+
+class SleepEvaluator(Evaluator):
+    """Evaluator sleeping for the number of seconds given in the message."""
+
+    def __init__(self):
+        self.started = []
+        self.running = 0
+        self.max_running = 0
+
+    async def evaluate(
+        self, message: Message, context: Optional[Context] = None
+    ) -> EvaluationResult:
+        delay = float(message.get_elements(ContentElement)[0].data)
+        self.started.append(delay)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.running -= 1
+        return EvaluationResult(status=EvaluationStatus.SUCCESS, score=delay)
+
+    def interrupt(self):
+        pass
+
+
+class ScheduledSleepEvaluator(SleepEvaluator):
+    """SleepEvaluator taking a slot of the shared scheduler in evaluate."""
+
+    async def evaluate(
+        self, message: Message, context: Optional[Context] = None
+    ) -> EvaluationResult:
+        return await self._scheduled(
+            lambda: super(ScheduledSleepEvaluator, self).evaluate(message, context),
+            message,
+            context,
+        )
+
+
+class TestEvaluationScheduler(unittest.IsolatedAsyncioTestCase):
+    async def _job(self, order: list, name: str, delay: float = 0.01):
+        order.append(name)
+        await asyncio.sleep(delay)
+        return name
+
+    async def test_concurrency_is_bounded(self):
+        scheduler = EvaluationScheduler(max_concurrency=2)
+        running, peak = 0, 0
+
+        async def job():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+
+        await asyncio.gather(*[scheduler.run(job) for _ in range(6)])
+
+        self.assertEqual(peak, 2)
+        self.assertEqual(scheduler.stats()["completed"], 6)
+        self.assertEqual(scheduler.stats()["running"], 0)
+
+    async def test_groups_are_served_round_robin(self):
+        scheduler = EvaluationScheduler(max_concurrency=1)
+        order = []
+        blocker = asyncio.create_task(scheduler.run(lambda: self._job(order, "blocker")))
+        await asyncio.sleep(0)
+        tasks = [
+            asyncio.create_task(scheduler.run(lambda i=i: self._job(order, f"a{i}"), group="a"))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        tasks.append(
+            asyncio.create_task(scheduler.run(lambda: self._job(order, "b0"), group="b"))
+        )
+        await asyncio.gather(blocker, *tasks)
+
+        self.assertEqual(order, ["blocker", "a0", "b0", "a1", "a2"])
+
+    async def test_shortest_expected_job_first(self):
+        scheduler = EvaluationScheduler(max_concurrency=1)
+        scheduler.record_duration("eval", "slow", 5.0)
+        scheduler.record_duration("eval", "fast", 0.1)
+        self.assertAlmostEqual(scheduler.expected_duration("eval", "unknown"), 2.55)
+        self.assertAlmostEqual(scheduler.expected_duration("other", "x"), 2.55)
+        order = []
+        blocker = asyncio.create_task(scheduler.run(lambda: self._job(order, "blocker")))
+        await asyncio.sleep(0)
+        tasks = [
+            asyncio.create_task(
+                scheduler.run(lambda k=k: self._job(order, k), family="eval", key=k)
+            )
+            for k in ("slow", "unknown", "fast")
+        ]
+        await asyncio.gather(blocker, *tasks)
+
+        self.assertEqual(order, ["blocker", "fast", "unknown", "slow"])
+
+    async def test_cancelled_waiting_job_leaves_queue(self):
+        scheduler = EvaluationScheduler(max_concurrency=1)
+        order = []
+        blocker = asyncio.create_task(
+            scheduler.run(lambda: self._job(order, "blocker", 0.05))
+        )
+        await asyncio.sleep(0)
+        waiting = asyncio.create_task(scheduler.run(lambda: self._job(order, "waiting")))
+        await asyncio.sleep(0)
+        self.assertEqual(scheduler.stats()["waiting"], {"default": 1})
+
+        waiting.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiting
+        await blocker
+
+        self.assertEqual(order, ["blocker"])
+        self.assertEqual(scheduler.stats()["waiting"], {})
+        self.assertEqual(scheduler.stats()["running"], 0)
+
+    async def test_evaluate_many_yields_as_completed(self):
+        scheduler = EvaluationScheduler.shared()
+        previous = scheduler.max_concurrency
+        scheduler.set_max_concurrency(4)
+        self.addCleanup(scheduler.set_max_concurrency, previous)
+
+        evaluator = SleepEvaluator()
+        delays = [0.3, 0.1, 0.2]
+        messages = [Message.from_text(str(d)) for d in delays]
+        results = [
+            (index, result.score)
+            async for index, result in evaluator.evaluate_many(
+                messages, Context(task="test", trace_id="cycle")
+            )
+        ]
+
+        self.assertEqual(results, [(1, 0.1), (2, 0.2), (0, 0.3)])
+        self.assertEqual(evaluator.max_running, 3)
+
+    async def test_evaluate_many_isolates_failures(self):
+        evaluator = SleepEvaluator()
+        # "boom" is not a delay, its evaluation raises
+        messages = [Message.from_text(d) for d in ("0.05", "boom", "0.1")]
+        results = dict(
+            [item async for item in evaluator.evaluate_many(messages)]
+        )
+
+        self.assertEqual(sorted(results), [0, 1, 2])
+        self.assertEqual(results[1].status, EvaluationStatus.FRAMEWORK_ERROR)
+        self.assertIn("boom", results[1].summary)
+        self.assertEqual((results[0].score, results[2].score), (0.05, 0.1))
+
+    async def test_evaluate_many_cancels_pending_on_early_stop(self):
+        scheduler = EvaluationScheduler.shared()
+        previous = scheduler.max_concurrency
+        scheduler.set_max_concurrency(1)
+        self.addCleanup(scheduler.set_max_concurrency, previous)
+
+        evaluator = SleepEvaluator()
+        messages = [Message.from_text(str(d)) for d in (0.05, 0.05, 0.05)]
+        async with aclosing(evaluator.evaluate_many(messages)) as results:
+            async for _ in results:
+                break
+        await asyncio.sleep(0.1)
+
+        self.assertLess(len(evaluator.started), len(messages))
+        self.assertEqual(scheduler.stats()["running"], 0)
+        self.assertEqual(scheduler.stats()["waiting"], {})
+
+    async def test_direct_evaluations_are_scheduled(self):
+        scheduler = EvaluationScheduler.shared()
+        previous = scheduler.max_concurrency
+        scheduler.set_max_concurrency(2)
+        self.addCleanup(scheduler.set_max_concurrency, previous)
+
+        evaluator = ScheduledSleepEvaluator()
+        messages = [Message.from_text("0.02") for _ in range(6)]
+        await asyncio.gather(*[evaluator.evaluate(message) for message in messages])
+        self.assertEqual(evaluator.max_running, 2)
+
+        # evaluate_many holds the slot its evaluate calls run in
+        evaluator = ScheduledSleepEvaluator()
+        results = [item async for item in evaluator.evaluate_many(messages)]
+        self.assertEqual(len(results), 6)
+        self.assertEqual(evaluator.max_running, 2)
+        self.assertEqual(scheduler.stats()["running"], 0)
+
+    def test_concurrency_is_a_process_setting(self):
+        scheduler = EvaluationScheduler.shared()
+        previous = scheduler.max_concurrency
+        self.addCleanup(scheduler.set_max_concurrency, previous)
+
+        EvaluationScheduler.configure_shared(3)
+        LoongFlowEvaluator(
+            EvaluatorConfig(evaluate_code="", workspace_path=".", max_parallel_evaluations=1)
+        )
+        self.assertEqual(scheduler.max_concurrency, 3)
+        EvaluationScheduler.configure_shared(None)
+        self.assertEqual(scheduler.max_concurrency, available_cores())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 # test_evaluator.py
 
 import asyncio
+import os
 import shutil
 import tempfile
 import time
@@ -9,7 +10,11 @@ from unittest.mock import MagicMock
 
 from loongflow.agentsdk.message import Message, ContentElement
 from loongflow.framework.pes.context import EvaluatorConfig
-from loongflow.framework.pes.evaluator import LoongFlowEvaluator, EvaluationResult
+from loongflow.framework.pes.evaluator import (
+    EvaluationResult,
+    EvaluationScheduler,
+    LoongFlowEvaluator,
+)
 
 CONFIGURABLE_EVALUATOR_CODE = """
 import time
@@ -38,6 +43,27 @@ def evaluate(llm_file_path: str) -> dict:
     }
 """
 
+RESOURCE_HUNGRY_EVALUATOR_CODE = """
+import subprocess
+import sys
+import time
+
+def evaluate(llm_file_path: str) -> dict:
+    with open(llm_file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    if "# BURN_CPU" in content:
+        while True:
+            pass
+    if "# ALLOCATE" in content:
+        blocks = [bytearray(64 * 1024 * 1024) for _ in range(64)]
+    if "# HOLD_MEMORY" in content:
+        block = bytearray(128 * 1024 * 1024)
+        time.sleep(0.5)
+    if "# SHORT_SPIKE" in content:
+        subprocess.run([sys.executable, "-c", "bytearray(256 * 1024 * 1024)"], check=True)
+    return {"status": "success", "score": 1.0, "summary": "done"}
+"""
+
 
 class TestLoongFlowEvaluator(unittest.IsolatedAsyncioTestCase):
     """
@@ -64,12 +90,18 @@ class TestLoongFlowEvaluator(unittest.IsolatedAsyncioTestCase):
         print(f"Cleaned up temporary workspace: {self.workspace_path}")
         print(f"--- Finished test: {self._testMethodName} ---")
 
-    def _create_evaluator(self, timeout: float = 5.0) -> LoongFlowEvaluator:
+    def _create_evaluator(
+        self,
+        timeout: float = 5.0,
+        evaluate_code: str = CONFIGURABLE_EVALUATOR_CODE,
+        **limits,
+    ) -> LoongFlowEvaluator:
         """Helpful function that creates an instance of LoongFlowEvaluator"""
         config = EvaluatorConfig(
             workspace_path=self.workspace_path,
-            evaluate_code=CONFIGURABLE_EVALUATOR_CODE,
+            evaluate_code=evaluate_code,
             timeout=timeout,
+            **limits,
         )
         self.evaluator = LoongFlowEvaluator(config)
         return self.evaluator
@@ -98,6 +130,16 @@ class TestLoongFlowEvaluator(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result.metrics.get("status"), "success")
         self.assertNotIn("error", result.metrics)
 
+    async def test_eval_dirs_removed_once_recorded(self):
+        """
+        Tests that eval directories are dropped after the result unless kept.
+        """
+        evaluator = self._create_evaluator(timeout=5, keep_eval_dirs=False)
+        result = await evaluator.evaluate(self._create_message("# SLEEP: 0"))
+
+        self.assertEqual(result.score, 1.0)
+        self.assertEqual(os.listdir(self.workspace_path), [])
+
     async def test_evaluate_timeout(self):
         """
         Tests a timeout scenario where the evaluation task takes too long to complete.
@@ -173,6 +215,11 @@ class TestLoongFlowEvaluator(unittest.IsolatedAsyncioTestCase):
         # Total timeout set to 5 seconds, enough for concurrent tasks but not for serial completion
         timeout = 5
 
+        # Evaluations run in slots of the shared scheduler, one per core by default
+        scheduler = EvaluationScheduler.shared()
+        self.addCleanup(scheduler.set_max_concurrency, scheduler.max_concurrency)
+        EvaluationScheduler.configure_shared(num_concurrent_tasks)
+
         evaluator = self._create_evaluator(timeout=timeout)
         llm_code = f"# SLEEP: {sleep_per_task}\n# Concurrent task"
         message = self._create_message(llm_code)
@@ -204,6 +251,121 @@ class TestLoongFlowEvaluator(unittest.IsolatedAsyncioTestCase):
         # Set a reasonable upper limit, e.g., single task time + 2 seconds overhead
         self.assertLess(duration, sleep_per_task + 2)
 
+    async def test_evaluate_records_resource_usage(self):
+        """
+        Tests that wall time, CPU time and peak RSS are recorded in the result metadata.
+        """
+        evaluator = self._create_evaluator(
+            timeout=10, evaluate_code=RESOURCE_HUNGRY_EVALUATOR_CODE
+        )
+        result = await evaluator.evaluate(self._create_message("# HOLD_MEMORY"))
+        print("Result metadata:", result.metadata)
+
+        self.assertEqual(result.score, 1.0)
+        self.assertGreater(result.metadata["wall_time_seconds"], 0.5)
+        self.assertGreater(result.metadata["cpu_time_seconds"], 0.0)
+        self.assertGreater(result.metadata["peak_rss_bytes"], 128 * 1024 * 1024)
+        self.assertEqual(len(evaluator._resource_usage), 0)
+
+    async def test_evaluate_records_short_lived_peaks(self):
+        """
+        Tests that the peak RSS covers children too short-lived to be sampled.
+        """
+        evaluator = self._create_evaluator(
+            timeout=10, evaluate_code=RESOURCE_HUNGRY_EVALUATOR_CODE
+        )
+        result = await evaluator.evaluate(self._create_message("# SHORT_SPIKE"))
+
+        self.assertEqual(result.score, 1.0)
+        self.assertGreater(result.metadata["peak_rss_bytes"], 256 * 1024 * 1024)
+        self.assertGreater(result.metadata["cpu_time_seconds"], 0.0)
+
+    async def test_evaluate_cpu_limit(self):
+        """
+        Tests that a busy loop is stopped by the CPU time limit before the wall-clock timeout.
+        """
+        evaluator = self._create_evaluator(
+            timeout=30,
+            evaluate_code=RESOURCE_HUNGRY_EVALUATOR_CODE,
+            max_cpu_seconds=1,
+        )
+        start_time = time.perf_counter()
+        result = await evaluator.evaluate(self._create_message("# BURN_CPU"))
+        duration = time.perf_counter() - start_time
+
+        self.assertEqual(result.score, 0.0)
+        self.assertIn("CPU time limit", result.metrics["error"])
+        self.assertLess(duration, 10)
+        self.assertGreaterEqual(result.metadata["cpu_time_seconds"], 0.5)
+
+    async def test_evaluate_memory_limit(self):
+        """
+        Tests that allocations above the address space limit fail inside the evaluation.
+        """
+        evaluator = self._create_evaluator(
+            timeout=30,
+            evaluate_code=RESOURCE_HUNGRY_EVALUATOR_CODE,
+            max_memory_mb=1024,
+        )
+        result = await evaluator.evaluate(self._create_message("# ALLOCATE"))
+
+        self.assertEqual(result.score, 0.0)
+        self.assertIn("traceback", result.metrics)
+        self.assertIn("MemoryError", result.metrics["traceback"])
+        self.assertLess(result.metadata["peak_rss_bytes"], 1024 * 1024 * 1024)
+
+    async def test_evaluate_cancel_terminates_process(self):
+        """
+        Tests that cancelling an evaluation terminates its subprocess.
+        """
+        evaluator = self._create_evaluator(timeout=20)
+        eval_task = asyncio.create_task(
+            evaluator.evaluate(self._create_message("# SLEEP: 10"))
+        )
+        await asyncio.sleep(1)
+        process = next(iter(evaluator._active_processes.values()))
+
+        start_time = time.perf_counter()
+        eval_task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await eval_task
+        process.join(timeout=5)
+
+        self.assertFalse(process.is_alive())
+        self.assertLess(time.perf_counter() - start_time, 5)
+        self.assertEqual(len(evaluator._active_processes), 0)
+
+    async def test_cancel_cleans_up(self):
+        """
+        Tests that cancelled evaluations leave no cancellation mark nor eval directory.
+        """
+        evaluator = self._create_evaluator(timeout=20, keep_eval_dirs=False)
+        eval_task = asyncio.create_task(
+            evaluator.evaluate(self._create_message("# SLEEP: 10"))
+        )
+        await asyncio.sleep(1)
+        eval_task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await eval_task
+        self.assertEqual(os.listdir(self.workspace_path), [])
+
+        # Cancelled before its worker started the process
+        eval_task = asyncio.create_task(
+            evaluator.evaluate(self._create_message("# SLEEP: 0"))
+        )
+        await asyncio.sleep(0)
+        eval_task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await eval_task
+
+        # Forgotten once the worker threads are done
+        for _ in range(50):
+            if not evaluator._cancelled_evals:
+                break
+            await asyncio.sleep(0.1)
+        self.assertEqual(evaluator._cancelled_evals, set())
+        self.assertEqual(len(evaluator._active_processes), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,226 @@
+# test_provisioner.py
+
+import asyncio
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+import zipfile
+from unittest import mock
+from unittest.mock import MagicMock
+
+import pytest
+
+from loongflow.agentsdk.message import ContentElement, Message
+from loongflow.framework.pes.context import EvaluatorConfig
+from loongflow.framework.pes.evaluator import LoongFlowEvaluator, PackageProvisioner
+from loongflow.framework.pes.evaluator.provisioner import canonical_name
+
+IMPORTING_EVALUATOR_CODE = """
+def evaluate(llm_file_path: str) -> dict:
+    try:
+        import lfdemo
+    except ImportError as e:
+        return {"status": "execution_failed", "score": 0.0, "summary": str(e)}
+    return {"status": "success", "score": lfdemo.SCORE, "summary": lfdemo.__file__}
+"""
+
+
+def build_wheel(wheelhouse: str, name: str, module: str, version: str = "1.0") -> str:
+    """Write a pure-python wheel installing ``module``."""
+    dist_info = f"{name}-{version}.dist-info"
+    files = {
+        f"{module}/__init__.py": "SCORE = 0.75\n",
+        f"{dist_info}/METADATA": (
+            f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+        ),
+        f"{dist_info}/WHEEL": (
+            "Wheel-Version: 1.0\nGenerator: test\nRoot-Is-Purelib: true\n"
+            "Tag: py3-none-any\n"
+        ),
+        f"{dist_info}/top_level.txt": f"{module}\n",
+    }
+    files[f"{dist_info}/RECORD"] = "".join(f"{path},,\n" for path in files) + (
+        f"{dist_info}/RECORD,,\n"
+    )
+    path = os.path.join(wheelhouse, f"{name}-{version}-py3-none-any.whl")
+    with zipfile.ZipFile(path, "w") as wheel:
+        for file_name, content in files.items():
+            wheel.writestr(file_name, content)
+    return path
+
+
+class TestPackageProvisioner(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="provisioner_test_")
+        self.wheelhouse = os.path.join(self.root, "wheelhouse")
+        os.makedirs(self.wheelhouse)
+        build_wheel(self.wheelhouse, "lf_demo_dist", "lfdemo")
+        self.packages_path = os.path.join(self.root, "packages")
+        self.evaluator = None
+
+    def tearDown(self):
+        if self.evaluator:
+            self.evaluator.interrupt()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _provisioner(self, **kwargs) -> PackageProvisioner:
+        kwargs.setdefault("wheelhouse", self.wheelhouse)
+        kwargs.setdefault("offline", True)
+        return PackageProvisioner(self.packages_path, **kwargs)
+
+    def test_resolve(self):
+        provisioner = self._provisioner(offline=False)
+        # From the top-level modules the wheels declare
+        self.assertEqual(provisioner.resolve("lfdemo"), "lf_demo_dist")
+        self.assertEqual(provisioner.resolve("lfdemo.sub"), "lf_demo_dist")
+        # From the well-known module names, then the module name itself
+        self.assertEqual(provisioner.resolve("sklearn.linear_model"), "scikit-learn")
+        self.assertEqual(provisioner.resolve("tqdm"), "tqdm")
+
+        offline = self._provisioner()
+        self.assertEqual(offline.resolve("lf_demo_dist"), "lf_demo_dist")
+        self.assertIsNone(offline.resolve("tqdm"))
+        self.assertEqual(canonical_name("Foo_Bar.baz"), "foo-bar-baz")
+
+    def test_offline_needs_wheelhouse(self):
+        with self.assertRaises(ValueError):
+            PackageProvisioner(self.packages_path, offline=True)
+
+    def test_command(self):
+        command = self._provisioner().command("lf_demo_dist", upgrade=True)
+        self.assertEqual(command[:4], [sys.executable, "-m", "pip", "install"])
+        self.assertIn("--no-index", command)
+        self.assertIn("--upgrade", command)
+        self.assertEqual(command[command.index("--target") + 1], os.path.join(self.packages_path, "site"))
+        self.assertEqual(command[command.index("--find-links") + 1], self.wheelhouse)
+
+        online = self._provisioner(offline=False, index_url="http://mirror/simple")
+        command = online.command("tqdm")
+        self.assertNotIn("--no-index", command)
+        self.assertEqual(command[command.index("--index-url") + 1], "http://mirror/simple")
+
+    async def test_unresolved_module_does_not_run_pip(self):
+        provisioner = self._provisioner()
+        with mock.patch("asyncio.create_subprocess_exec") as create:
+            result = await provisioner.provision("not_in_wheelhouse")
+        create.assert_not_called()
+        self.assertFalse(result.success)
+        self.assertEqual(result.status, "unresolved")
+
+    async def test_concurrent_requests_share_one_install(self):
+        provisioner = self._provisioner()
+        calls = []
+        create = asyncio.create_subprocess_exec
+
+        async def counting_create(*args, **kwargs):
+            calls.append(args)
+            return await create(*args, **kwargs)
+
+        ticks = 0
+        done = asyncio.Event()
+
+        async def ticker():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticking = asyncio.ensure_future(ticker())
+        with mock.patch("asyncio.create_subprocess_exec", counting_create):
+            results = await asyncio.gather(
+                *(provisioner.provision("lfdemo") for _ in range(4))
+            )
+            done.set()
+            await ticking
+            again = await provisioner.provision("lfdemo")
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(r.success for r in results), results[0].output)
+        self.assertEqual(again.status, "cached")
+        # The event loop kept running while pip did
+        self.assertGreater(ticks, 5)
+        self.assertTrue(
+            os.path.isfile(os.path.join(provisioner.site_path, "lfdemo", "__init__.py"))
+        )
+        # Nothing was installed in the interpreter
+        probe = subprocess.run(
+            [sys.executable, "-c", "import lfdemo"], capture_output=True
+        )
+        self.assertNotEqual(probe.returncode, 0)
+
+    async def test_installed_by_another_process_is_not_reinstalled(self):
+        first = self._provisioner()
+        self.assertTrue((await first.provision("lfdemo")).success)
+        # A provisioner of another process sharing the package directory
+        second = self._provisioner()
+        with mock.patch("asyncio.create_subprocess_exec") as create:
+            result = await second.provision("lfdemo")
+        create.assert_not_called()
+        self.assertTrue(result.success)
+        self.assertEqual(result.status, "cached")
+
+    async def test_evaluation_sees_provisioned_packages(self):
+        config = EvaluatorConfig(
+            workspace_path=os.path.join(self.root, "evaluator"),
+            evaluate_code=IMPORTING_EVALUATOR_CODE,
+            timeout=30,
+            packages_path=self.packages_path,
+            package_wheelhouse=self.wheelhouse,
+            package_offline=True,
+        )
+        self.evaluator = LoongFlowEvaluator(config)
+        message = MagicMock(spec=Message)
+        message.get_elements.return_value = [ContentElement(data="pass")]
+
+        missing = await self.evaluator.evaluate(message)
+        self.assertIn("No module named 'lfdemo'", missing.summary)
+
+        result = await self.evaluator.provisioner.provision("lfdemo")
+        self.assertTrue(result.success, result.output)
+        self.assertIs(
+            self.evaluator.provisioner, PackageProvisioner.shared(self.packages_path)
+        )
+
+        evaluated = await self.evaluator.evaluate(message)
+        self.assertEqual(evaluated.score, 0.75)
+        self.assertTrue(evaluated.summary.startswith(self.evaluator.provisioner.site_path))
+
+    @pytest.mark.benchmark
+    async def test_benchmark_concurrent_missing_package(self):
+        candidates = 3
+        provisioner = self._provisioner()
+
+        # Before: every candidate ran its own blocking pip install
+        site_path = os.path.join(self.root, "blocking_site")
+        start = time.perf_counter()
+        for _ in range(candidates):
+            subprocess.run(
+                [
+                    sys.executable, "-m", "pip", "install", "--target", site_path,
+                    "--disable-pip-version-check", "--no-input", "--upgrade",
+                    "--no-index", "--find-links", self.wheelhouse, "lf_demo_dist",
+                ],
+                capture_output=True,
+                check=True,
+            )
+        before = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(provisioner.provision("lfdemo") for _ in range(candidates))
+        )
+        after = time.perf_counter() - start
+
+        print(
+            f"\n{candidates} candidates missing a package: "
+            f"blocking pip {before:.2f}s, provisioner {after:.2f}s"
+        )
+        self.assertTrue(all(r.success for r in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
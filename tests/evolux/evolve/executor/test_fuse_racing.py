@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the racing policy of the fuse executor.
+"""
+
+import asyncio
+import json
+import tempfile
+import unittest
+
+from agents.math_agent.executor.execute_fuse.execute_agent_fuse import (
+    EvolveExecuteAgentFuse,
+    ExecuteAgentFuseConfig,
+    ExecutionContext,
+)
+from loongflow.agentsdk.message import ContentElement
+from loongflow.agentsdk.models import CompletionResponse, CompletionUsage
+from loongflow.framework.pes.context import Context, LLMConfig
+from loongflow.framework.pes.evaluator import (
+    EvaluationResult,
+    EvaluationStatus,
+    Evaluator,
+)
+
+
+class FakeFuseAgent(EvolveExecuteAgentFuse):
+    """Fuse agent whose candidates report a score instead of running ReAct.
+
+    A candidate without a score never gets to its evaluation. The others keep
+    working after their evaluation until every candidate has reported, so only the
+    racing policy stops a round early, whatever the scheduling.
+    """
+
+    def __init__(self, config, scores):
+        super().__init__(config, evaluator=None)
+        self.scores = scores
+        self.all_reported = asyncio.Event()
+        self.reported = 0
+        self.finished = []
+        self.cancelled = []
+
+    async def gen_one_candidate(
+        self,
+        context,
+        parent_ctx,
+        round_idx,
+        candidate_idx,
+        previous_attempts,
+        on_evaluation=None,
+    ):
+        try:
+            score = self.scores[candidate_idx]
+            if score is None:
+                await asyncio.Event().wait()
+            on_evaluation(EvaluationResult(status=EvaluationStatus.SUCCESS, score=score))
+            self.reported += 1
+            if self.reported == len(self.scores):
+                self.all_reported.set()
+            # Keep working after the evaluation, like a ReAct loop would.
+            await self.all_reported.wait()
+        except asyncio.CancelledError:
+            self.cancelled.append(candidate_idx)
+            raise
+        self.finished.append(candidate_idx)
+        return json.dumps({"content": "done", "total_prompt_tokens": 1})
+
+
+class ChatModel:
+    """Model whose first generation returns the solution "0.99", the others never return."""
+
+    def __init__(self):
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate(self, request):
+        self.calls += 1
+        if self.calls > 1:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+        yield CompletionResponse(
+            id=str(self.calls),
+            content=[ContentElement(data="```python\n0.99\n```")],
+            usage=CompletionUsage(completion_tokens=1, prompt_tokens=1, total_tokens=2),
+        )
+
+
+class ScoreEvaluator(Evaluator):
+    """Evaluator scoring a solution with the number it holds."""
+
+    async def evaluate(self, message, context=None):
+        score = float(message.get_elements(ContentElement)[0].data)
+        return EvaluationResult(status=EvaluationStatus.SUCCESS, score=score)
+
+    def interrupt(self):
+        pass
+
+
+class TestFuseRacing(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.context = Context(task="test", base_path=tempfile.mkdtemp())
+        self.parent_ctx = ExecutionContext(
+            parent_info_file_path="",
+            parent_core=0.95,
+            parent_solution="",
+            stage1_plan="",
+            stage1_plan_file_path="",
+        )
+        self.llm_config = LLMConfig(
+            model="openai/mock-model", url="http://localhost", api_key="mock"
+        )
+
+    def _agent(self, scores, **racing) -> FakeFuseAgent:
+        config = ExecuteAgentFuseConfig(llm_config=self.llm_config, **racing)
+        return FakeFuseAgent(config, scores)
+
+    async def _run_round(self, agent: FakeFuseAgent) -> dict:
+        # A round the policy fails to stop would otherwise hang
+        return await asyncio.wait_for(
+            agent.gen_multi_candidate(
+                self.context, self.parent_ctx, 0, len(agent.scores), ""
+            ),
+            timeout=30,
+        )
+
+    async def test_wait_all_runs_every_candidate(self):
+        agent = self._agent([0.99, 0.5, 0.6])
+        results = await self._run_round(agent)
+
+        self.assertEqual(sorted(agent.finished), [0, 1, 2])
+        self.assertFalse(any(r.cancelled for r in results["candidates"]))
+        self.assertEqual(results["total_prompt_tokens"], 3)
+
+    async def test_first_improvement_cancels_siblings(self):
+        agent = self._agent([None, 0.99, None], racing_policy="first_improvement")
+        results = await self._run_round(agent)
+
+        self.assertEqual(sorted(agent.cancelled), [0, 1, 2])
+        cancelled = {r.candidate_idx: r.cancelled for r in results["candidates"]}
+        self.assertEqual(cancelled, {0: True, 1: False, 2: True})
+        self.assertIn("won the round", results["candidates"][1].reason)
+
+    async def test_first_improvement_respects_margin(self):
+        agent = self._agent(
+            [0.96, 0.97],
+            racing_policy="first_improvement",
+            racing_margin=0.05,
+        )
+        await self._run_round(agent)
+
+        self.assertEqual(sorted(agent.finished), [0, 1])
+
+    async def test_score_threshold_policy(self):
+        agent = self._agent(
+            [0.97, None],
+            racing_policy="score_threshold",
+            racing_score_threshold=0.96,
+        )
+        await self._run_round(agent)
+
+        self.assertEqual(agent.finished, [])
+        self.assertEqual(sorted(agent.cancelled), [0, 1])
+
+    async def test_chat_candidates_race_their_generation(self):
+        config = ExecuteAgentFuseConfig(
+            llm_config=self.llm_config, racing_policy="first_improvement"
+        )
+        agent = EvolveExecuteAgentFuse(config, evaluator=ScoreEvaluator())
+        agent.model = ChatModel()
+        self.parent_ctx.parent_core = 0.5
+
+        results = await asyncio.wait_for(
+            agent.gen_multi_candidate(self.context, self.parent_ctx, 0, 3, ""), timeout=30
+        )
+
+        # Evaluated without waiting for the other generations, which are cancelled
+        self.assertEqual((agent.model.calls, agent.model.cancelled), (3, 2))
+        winner = [r for r in results["candidates"] if not r.cancelled]
+        self.assertEqual([(r.candidate_idx, r.score) for r in winner], [(0, 0.99)])
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            ExecuteAgentFuseConfig(racing_policy="fastest")
+        with self.assertRaises(ValueError):
+            ExecuteAgentFuseConfig(racing_policy="score_threshold")
+
+
+if __name__ == "__main__":
+    unittest.main()
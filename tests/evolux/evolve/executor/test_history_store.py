@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the append-only evaluation history of the executor tools.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from agents.math_agent.executor.execute_react.build_tool import (
+    build_best_evaluations_tool,
+    build_evaluator_solution_tool,
+    get_history_log_path,
+)
+from agents.math_agent.executor.execute_react.history_store import EvaluationHistory
+from loongflow.framework.pes.context import Context, Workspace
+from loongflow.framework.pes.evaluator import EvaluationResult, EvaluationStatus
+
+
+class TestEvaluationHistory(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "history.log")
+
+    def tearDown(self):
+        EvaluationHistory.reset(self.path)
+        shutil.rmtree(self.tmp)
+
+    def _read_lines(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_best_and_top_k(self):
+        history = EvaluationHistory(self.path, top_k=3)
+        for i, score in enumerate([0.2, 0.9, None, 0.5, 0.7, 0.1]):
+            history.append({"id": i, "score": score})
+
+        self.assertEqual(len(history), 6)
+        self.assertEqual(history.best()["id"], 1)
+        self.assertEqual([r["id"] for r in history.top()], [1, 4, 3])
+        self.assertEqual([r["id"] for r in history.top(1)], [1])
+        history.close()
+        self.assertEqual([r["id"] for r in self._read_lines()], list(range(6)))
+
+    def test_summaries_rebuilt_from_file(self):
+        history = EvaluationHistory(self.path)
+        history.append({"id": "a", "score": 0.3})
+        history.append({"id": "b", "score": 0.8})
+        history.close()
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{\n  "legacy": "entry"\n}\n')
+
+        reloaded = EvaluationHistory(self.path)
+        self.assertEqual(reloaded.best()["id"], "b")
+        self.assertEqual(len(reloaded), 2)
+        reloaded.close()
+
+    def test_concurrent_appends(self):
+        history = EvaluationHistory.for_path(self.path)
+        threads, per_thread = 8, 200
+
+        def writer(t):
+            for i in range(per_thread):
+                history.append({"thread": t, "i": i, "score": t * per_thread + i})
+
+        workers = [threading.Thread(target=writer, args=(t,)) for t in range(threads)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+
+        lines = self._read_lines()
+        self.assertEqual(len(lines), threads * per_thread)
+        self.assertEqual(history.best()["score"], threads * per_thread - 1)
+
+    def test_for_path_shares_and_reset_truncates(self):
+        first = EvaluationHistory.for_path(self.path)
+        first.append({"score": 1.0})
+        self.assertIs(EvaluationHistory.for_path(self.path), first)
+
+        EvaluationHistory.reset(self.path)
+        fresh = EvaluationHistory.for_path(self.path)
+        self.assertIsNot(fresh, first)
+        self.assertIsNone(fresh.best())
+        self.assertEqual(os.path.getsize(self.path), 0)
+
+    def test_evicted_store_keeps_appending(self):
+        history = EvaluationHistory.for_path(self.path)
+        history.close()
+        history.append({"score": 0.5})
+
+        self.assertEqual(len(self._read_lines()), 1)
+
+    def test_held_stores_are_not_evicted(self):
+        EvaluationHistory.acquire(self.path)
+        self.addCleanup(EvaluationHistory.release, self.path)
+        held = EvaluationHistory.for_path(self.path)
+        held.append({"score": 0.9})
+
+        others = [
+            os.path.join(self.tmp, f"other_{i}.log")
+            for i in range(EvaluationHistory.MAX_OPEN_STORES + 1)
+        ]
+        for path in others:
+            EvaluationHistory.for_path(path)
+            self.addCleanup(EvaluationHistory.reset, path)
+
+        self.assertIs(EvaluationHistory.for_path(self.path), held)
+        self.assertNotIn(os.path.abspath(others[0]), EvaluationHistory._stores)
+
+    def test_release_closes_the_store_of_the_run(self):
+        EvaluationHistory.acquire(self.path)
+        EvaluationHistory.acquire(self.path)
+        history = EvaluationHistory.for_path(self.path)
+        history.append({"score": 0.4})
+
+        EvaluationHistory.release(self.path)
+        self.assertIs(EvaluationHistory.for_path(self.path), history)
+        EvaluationHistory.release(self.path)
+        self.assertIsNone(history._fd)
+        self.assertNotIn(os.path.abspath(self.path), EvaluationHistory._stores)
+        self.assertEqual(EvaluationHistory.for_path(self.path).best()["score"], 0.4)
+
+
+class TestEvaluateSolutionHistory(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.context = Context(task="test", base_path=self.tmp)
+        self.candidate_paths = [
+            Workspace.get_executor_candidate_path(self.context, f"0_{i}")
+            for i in range(3)
+        ]
+
+    def tearDown(self):
+        EvaluationHistory.reset(get_history_log_path(self.context))
+        shutil.rmtree(self.tmp)
+
+    async def test_parallel_candidates_share_best_so_far(self):
+        class Evaluator:
+            async def evaluate(self, message, context=None):
+                score = float(message.content[0].data)
+                await asyncio.sleep(0.01)
+                return EvaluationResult(status=EvaluationStatus.SUCCESS, score=score)
+
+        async def run_candidate(candidate_path, score):
+            os.makedirs(candidate_path, exist_ok=True)
+            solution = os.path.join(candidate_path, "solution.py")
+            with open(solution, "w") as f:
+                f.write(str(score))
+            tool = build_evaluator_solution_tool(
+                Evaluator(), self.context, candidate_path
+            )
+            return await tool.func(code_file_path=solution)
+
+        results = await asyncio.gather(
+            *[
+                run_candidate(path, score)
+                for path, score in zip(self.candidate_paths, [0.4, 0.9, 0.6])
+            ]
+        )
+
+        self.assertTrue(all("error" not in r for r in results))
+        self.assertEqual(max(r["best_score_so_far"] for r in results), 0.9)
+
+        best = await build_best_evaluations_tool(self.context).func(top_k=2)
+        self.assertEqual(best["total_evaluations"], 3)
+        self.assertEqual([r["score"] for r in best["best"]], [0.9, 0.6])
+        self.assertTrue(os.path.exists(best["best"][0]["evaluation_file_path"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the result channel executors collect candidate results from.
+"""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from agents.math_agent.executor.execute_fuse.execute_agent_fuse import (
+    EvolveExecuteAgentFuse,
+    ExecuteAgentFuseConfig,
+)
+from agents.math_agent.executor.execute_react.build_tool import publish_evaluation
+from loongflow.framework.pes.context import Context, LLMConfig, Workspace
+from loongflow.framework.pes.executor import CandidateRecord, ResultChannel
+
+
+def _record(candidate: str, attempt: str, score: float) -> CandidateRecord:
+    return CandidateRecord(
+        candidate=candidate,
+        attempt=attempt,
+        score=score,
+        solution_file_path=f"solution_{attempt}.py",
+        evaluation_file_path=f"evaluation_{attempt}.json",
+        evaluation={"score": score},
+    )
+
+
+def _write_evaluation(context: Context, candidate_path: str, random_str: str, score: float):
+    """Write the files of an evaluation like the evaluation tool does, then publish it."""
+    evaluation = {"status": "success", "score": score, "summary": "ok", "metrics": {}}
+    Workspace.write_executor_file(
+        context, f"{candidate_path}/solution_{random_str}.py", "print(1)\n"
+    )
+    Workspace.write_executor_file(
+        context, f"{candidate_path}/evaluation_{random_str}.json", json.dumps(evaluation)
+    )
+    publish_evaluation(context, candidate_path, random_str, evaluation)
+
+
+def _glob_results(candidate_path: str):
+    """The directory scan the executors used before the result channel."""
+    p = Path(candidate_path)
+    sol_map = {s.name[len("solution") : -len(".py")]: s for s in p.glob("solution*.py")}
+    eval_map = {
+        e.name[len("evaluation") : -len(".json")]: e for e in p.glob("evaluation*.json")
+    }
+    results = []
+    for key in sorted(set(sol_map) & set(eval_map)):
+        with open(eval_map[key], "r", encoding="utf-8") as f:
+            results.append((str(sol_map[key]), float(json.load(f).get("score", 0.0))))
+    return results
+
+
+class TestResultChannel(unittest.TestCase):
+    def setUp(self):
+        self.context = Context(task="test", base_path=tempfile.mkdtemp())
+        self.addCleanup(ResultChannel.release, self.context)
+
+    def test_records_per_candidate_in_order(self):
+        channel = ResultChannel.for_context(self.context)
+        channel.publish(_record("0_0", "a", 0.1))
+        channel.publish(_record("0_1", "b", 0.2))
+        channel.publish(_record("0_0", "c", 0.3))
+
+        self.assertIs(ResultChannel.for_context(self.context), channel)
+        self.assertEqual([r.attempt for r in channel.records("0_0")], ["a", "c"])
+        self.assertEqual([r.attempt for r in channel.records("0_1")], ["b"])
+        self.assertEqual(channel.records("1_0"), [])
+
+    def test_channels_are_per_cycle(self):
+        ResultChannel.for_context(self.context).publish(_record("0_0", "a", 0.1))
+        other = Context(task="test", base_path=self.context.base_path)
+        other.current_iteration = self.context.current_iteration + 1
+        self.addCleanup(ResultChannel.release, other)
+
+        self.assertEqual(ResultChannel.for_context(other).records("0_0"), [])
+
+    def test_release_drops_records(self):
+        ResultChannel.for_context(self.context).publish(_record("0_0", "a", 0.1))
+        ResultChannel.release(self.context)
+
+        self.assertEqual(ResultChannel.for_context(self.context).records("0_0"), [])
+
+    def test_least_recently_used_channels_are_dropped(self):
+        contexts = [
+            Context(task="test", base_path=tempfile.mkdtemp()) for _ in range(3)
+        ]
+        for context in contexts:
+            self.addCleanup(ResultChannel.release, context)
+        with mock.patch.object(ResultChannel, "_channels", type(ResultChannel._channels)()):
+            with mock.patch.object(ResultChannel, "MAX_OPEN_CHANNELS", 2):
+                first = ResultChannel.for_context(contexts[0])
+                ResultChannel.for_context(contexts[1])
+                # Using the first channel again makes the second one the oldest
+                self.assertIs(ResultChannel.for_context(contexts[0]), first)
+                ResultChannel.for_context(contexts[2])
+
+                self.assertEqual(
+                    set(ResultChannel._channels),
+                    {ResultChannel.cycle_key(contexts[0]), ResultChannel.cycle_key(contexts[2])},
+                )
+
+
+class TestLoadResultsForCandidate(unittest.TestCase):
+    def setUp(self):
+        self.context = Context(task="test", base_path=tempfile.mkdtemp())
+        self.addCleanup(ResultChannel.release, self.context)
+        config = ExecuteAgentFuseConfig(
+            llm_config=LLMConfig(
+                model="openai/mock-model", url="http://localhost", api_key="mock"
+            )
+        )
+        self.agent = EvolveExecuteAgentFuse(config, evaluator=None)
+        self.candidate_path = Workspace.get_executor_candidate_path(self.context, "0_1")
+
+    def test_published_evaluations_are_results(self):
+        _write_evaluation(self.context, self.candidate_path, "abc", 0.5)
+        _write_evaluation(self.context, self.candidate_path, "def", 0.7)
+
+        with mock.patch.object(Path, "glob", side_effect=AssertionError("globbed")):
+            results = self.agent.load_results_for_candidate(self.context, 0, 1, "llm")
+
+        self.assertEqual([r.score for r in results], [0.5, 0.7])
+        self.assertEqual([r.random_idx for r in results], ["_abc", "_def"])
+        self.assertTrue(all(r.source == "disk" for r in results))
+        self.assertEqual(
+            results[0].solution_file_path, f"{self.candidate_path}/solution_abc.py"
+        )
+        self.assertTrue(os.path.isfile(results[1].evaluation_file_path))
+        self.assertEqual(json.loads(results[1].reason)["score"], 0.7)
+
+    def test_no_evaluation_falls_back_to_llm(self):
+        # A solution written without an evaluation is not a result
+        Workspace.write_executor_file(
+            self.context, f"{self.candidate_path}/solution_abc.py", "print(1)\n"
+        )
+
+        results = self.agent.load_results_for_candidate(self.context, 0, 1, "llm said")
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].source, "llm")
+        self.assertEqual(results[0].reason, "llm said")
+
+    @pytest.mark.benchmark
+    def test_benchmark_collect_results(self):
+        rounds, candidates, attempts = 4, 8, 6
+        for round_idx in range(rounds):
+            for candidate_idx in range(candidates):
+                path = Workspace.get_executor_candidate_path(
+                    self.context, f"{round_idx}_{candidate_idx}"
+                )
+                for attempt in range(attempts):
+                    _write_evaluation(self.context, path, f"{attempt:03x}", attempt / 10)
+
+        def collect_glob():
+            return [
+                _glob_results(
+                    Workspace.get_executor_candidate_path(
+                        self.context, f"{round_idx}_{candidate_idx}"
+                    )
+                )
+                for round_idx in range(rounds)
+                for candidate_idx in range(candidates)
+            ]
+
+        def collect_channel():
+            return [
+                self.agent.load_results_for_candidate(
+                    self.context, round_idx, candidate_idx, ""
+                )
+                for round_idx in range(rounds)
+                for candidate_idx in range(candidates)
+            ]
+
+        def best_of(fn, repeat=5):
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fn()
+                best = min(best, time.perf_counter() - start)
+            return best
+
+        self.assertEqual(
+            [[score for _, score in c] for c in collect_glob()],
+            [[r.score for r in c] for c in collect_channel()],
+        )
+        before = best_of(collect_glob)
+        after = best_of(collect_channel)
+        print(
+            f"\ncollect {rounds * candidates * attempts} results: "
+            f"glob {before * 1000:.1f}ms, channel {after * 1000:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the prompt context of the evolution workers.
+"""
+
+import json
+import tempfile
+import unittest
+
+from agents.math_agent.executor.execute_chat.execute_agent_chat import (
+    EvolveExecuteAgentChat,
+    ExecuteAgentChatConfig,
+)
+from agents.math_agent.executor.execute_fuse.execute_agent_fuse import (
+    EvolveExecuteAgentFuse,
+    ExecuteAgentFuseConfig,
+)
+from agents.math_agent.executor.execute_react.execute_agent_react import (
+    EvolveExecuteAgentReact,
+    ExecuteAgentReactConfig,
+)
+from loongflow.agentsdk.message import Message, MimeType
+from loongflow.framework.pes.context import (
+    Context,
+    LLMConfig,
+    PromptContextBuilder,
+    Workspace,
+    compact_evaluation,
+)
+from loongflow.framework.pes.context.prompt_context import (
+    BASE_REFERENCE,
+    estimate_tokens,
+)
+
+BASE_CODE = "".join(
+    f"def step_{i}(x):\n    return x * {i} + {i * 7}\n\n" for i in range(150)
+)
+
+
+def make_solution(solution_id: str, code: str, score: float) -> dict:
+    return {
+        "solution_id": solution_id,
+        "solution": code,
+        "score": score,
+        "generate_plan": "Tune the steps. " * 30,
+        "summary": "The steps were tuned. " * 30,
+        "evaluation": json.dumps(
+            {
+                "status": "success",
+                "score": score,
+                "summary": "all checks passed",
+                "metrics": {"error": 1 - score},
+                "stdout": "iteration log line\n" * 2000,
+                "artifacts": {"trace": list(range(500))},
+            }
+        ),
+        "metadata": {"sample_count": 3},
+    }
+
+
+def mutate(code: str, index: int) -> str:
+    return code.replace(f"return x * {index} +", f"return x ** 2 * {index} +")
+
+
+class TestCompactEvaluation(unittest.TestCase):
+    def test_salient_fields(self):
+        evaluation = compact_evaluation(make_solution("a", "", 0.5)["evaluation"])
+        self.assertEqual(set(evaluation), {"status", "score", "summary", "metrics"})
+        self.assertEqual(evaluation["metrics"], {"error": 0.5})
+
+    def test_long_values_are_cut(self):
+        evaluation = compact_evaluation(
+            {"summary": "x" * 5000, "metrics": {"values": list(range(2000))}},
+            max_chars=100,
+        )
+        self.assertTrue(evaluation["summary"].endswith("[4900 more chars]"))
+        self.assertIsInstance(evaluation["metrics"], str)
+        self.assertLess(len(evaluation["metrics"]), 150)
+
+        self.assertTrue(compact_evaluation("not json " * 50, max_chars=20).startswith("not json"))
+
+
+class TestPromptContextBuilder(unittest.TestCase):
+    def setUp(self):
+        self.builder = PromptContextBuilder(BASE_CODE)
+
+    def test_base_is_in_the_system_prompt(self):
+        self.assertIn(BASE_CODE, self.builder.system_prompt("You are an executor."))
+        self.assertEqual(PromptContextBuilder().system_prompt("prompt"), "prompt")
+
+    def test_render(self):
+        parent = self.builder.render(make_solution("parent", BASE_CODE, 0.5))
+        self.assertEqual(parent["solution"], BASE_REFERENCE)
+        self.assertNotIn("metadata", parent)
+
+        child = self.builder.render(make_solution("child", mutate(BASE_CODE, 3), 0.6))
+        self.assertNotIn("solution", child)
+        self.assertIn("+    return x ** 2 * 3 + 21", child["solution_diff"])
+        self.assertLess(len(child["solution_diff"]), 500)
+
+        # A rewrite is shorter in full than as a diff
+        other = self.builder.render(make_solution("other", "print(1)\n", 0.1))
+        self.assertEqual(other["solution"], "print(1)\n")
+
+    def test_pack_fits_the_budget(self):
+        parent = make_solution("parent", BASE_CODE, 0.5)
+        inspirations = [
+            make_solution(f"s{i}", mutate(BASE_CODE, i), 0.6) for i in range(10)
+        ]
+
+        everything = self.builder.pack(parent, inspirations)
+        self.assertIn("## Inspiration 10", everything)
+
+        packed = self.builder.pack(parent, inspirations, budget_tokens=1500)
+        self.assertLessEqual(estimate_tokens(packed), 1500)
+        self.assertIn("## Parent", packed)
+        self.assertIn("## Inspiration 1\n", packed)
+        self.assertIn("inspirations omitted", packed)
+
+        # The parent is kept with shorter fields when alone over the budget
+        tight = self.builder.pack(parent, budget_tokens=100)
+        self.assertIn(BASE_REFERENCE, tight)
+        self.assertLess(estimate_tokens(tight), 300)
+
+    def test_executor_parent_context(self):
+        context = Context(task="test", base_path=tempfile.mkdtemp())
+        parent = make_solution("parent", BASE_CODE, 0.5)
+        Workspace.write_planner_parent_info(context, json.dumps(parent))
+        message = Message.from_text(
+            data={"parent_info_file_path": Workspace.get_planner_parent_info_path(context)},
+            mime_type=MimeType.APPLICATION_JSON,
+        )
+        llm_config = LLMConfig(
+            model="openai/mock-model", url="http://localhost", api_key="mock"
+        )
+        executors = [
+            (EvolveExecuteAgentFuse, ExecuteAgentFuseConfig),
+            (EvolveExecuteAgentReact, ExecuteAgentReactConfig),
+            (EvolveExecuteAgentChat, ExecuteAgentChatConfig),
+        ]
+        for executor, config in executors:
+            with self.subTest(executor=executor.__name__):
+                agent = executor(config(llm_config=llm_config), evaluator=None)
+
+                parent_ctx = agent._parse_message_inputs(message)
+
+                self.assertEqual(parent_ctx.parent_core, 0.5)
+                self.assertNotIn("step_149", parent_ctx.parent_solution)
+                self.assertNotIn("iteration log line", parent_ctx.parent_solution)
+                self.assertIn("step_149", parent_ctx.prompt_context.system_prompt(""))
+
+    def test_benchmark_prompt_tokens(self):
+        candidates, steps = 4, 8
+        parent = make_solution("parent", BASE_CODE, 0.5)
+        inspirations = [
+            make_solution(f"s{i}", mutate(BASE_CODE, i), 0.4) for i in range(3)
+        ]
+
+        # Before: the parent and the inspirations as JSON in every prompt
+        before_context = json.dumps([parent] + inspirations)
+        before = estimate_tokens(before_context) * candidates * steps
+
+        # After: the base once in the shared system prompt, diffs in the prompts
+        after_context = self.builder.pack(parent, inspirations, budget_tokens=4000)
+        after = estimate_tokens(self.builder.base_section()) + (
+            estimate_tokens(after_context) * candidates * steps
+        )
+
+        print(
+            f"\nparent and {len(inspirations)} inspirations over {candidates} candidates "
+            f"x {steps} steps: json {before} tokens, packed {after} tokens"
+        )
+        self.assertLess(after, before / 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests and setup benchmark for loongflow.framework.pes.worker_pool.
+"""
+
+import asyncio
+import time
+import tracemalloc
+import unittest
+
+import pytest
+
+from loongflow.agentsdk.memory.grade import GradeMemory, MemoryConfig
+from loongflow.agentsdk.message import Message
+from loongflow.agentsdk.models import LiteLLMModel
+from loongflow.agentsdk.token import SimpleTokenCounter
+from loongflow.agentsdk.tools import Toolkit
+from loongflow.framework.pes.compressor import EvolveCompressor
+from loongflow.framework.pes.context import Context
+from loongflow.framework.pes.context.config import DatabaseConfig
+from loongflow.framework.pes.database import (
+    EvolveDatabase,
+    GetBestSolutionsTool,
+    GetChildsByParentTool,
+    GetMemoryStatusTool,
+    GetParentsByChildIdTool,
+    GetSolutionsTool,
+)
+from loongflow.framework.pes.register import (
+    PLANNER,
+    ReusableWorker,
+    Worker,
+    register_worker,
+)
+from loongflow.framework.pes.worker_pool import WorkerPool
+
+
+def _build_heavy_state(db: EvolveDatabase) -> dict:
+    """Mirror what the math planner builds in __init__ and per run."""
+    model = LiteLLMModel.from_config(
+        {"model": "openai/mock-model", "url": "http://localhost", "api_key": "mock"}
+    )
+    toolkit = Toolkit()
+    for tool in [
+        GetMemoryStatusTool(db.memory_status),
+        GetSolutionsTool(db.get_solutions),
+        GetBestSolutionsTool(db.get_best_solutions),
+        GetParentsByChildIdTool(db.get_parents_by_child_id),
+        GetChildsByParentTool(db.get_childs_by_parent_id),
+    ]:
+        toolkit.register_tool(tool)
+    memory = GradeMemory.create_default(
+        model=model,
+        compressor=EvolveCompressor(
+            model=model, token_counter=SimpleTokenCounter(), token_threshold=65536
+        ),
+        config=MemoryConfig(token_threshold=65536),
+    )
+    return {"model": model, "toolkit": toolkit, "memory": memory}
+
+
+class PlainPlanner(Worker):
+    """Worker without lifecycle, constructed per cycle."""
+
+    def __init__(self, config, db):
+        self.state = _build_heavy_state(db)
+
+    async def run(self, context, message):
+        return Message.from_text("plan")
+
+
+class PooledPlanner(ReusableWorker):
+    """Same worker, implementing the reuse lifecycle."""
+
+    def __init__(self, config, db):
+        self.state = _build_heavy_state(db)
+        self.resets = 0
+        self.iteration = None
+
+    def reset(self, context):
+        self.resets += 1
+        self.iteration = context.current_iteration
+
+    async def run(self, context, message):
+        if context.metadata.get("fail"):
+            raise RuntimeError("planner failed")
+        return Message.from_text("plan")
+
+
+class TestWorkerPool(unittest.TestCase):
+    def setUp(self):
+        register_worker("plain_planner", PLANNER, PlainPlanner)
+        register_worker("pooled_planner", PLANNER, PooledPlanner)
+        self.db = EvolveDatabase(DatabaseConfig(storage_type="in_memory"))
+
+    def _context(self, iteration: int, **metadata) -> Context:
+        return Context(task="test", current_iteration=iteration, metadata=metadata)
+
+    def test_reusable_worker_is_reused_and_reset(self):
+        pool = WorkerPool(size=2)
+        with pool.lease("pooled_planner", PLANNER, self._context(1), config={}, db=self.db) as first:
+            asyncio.run(first.run(self._context(1), None))
+        with pool.lease("pooled_planner", PLANNER, self._context(2), config={}, db=self.db) as second:
+            asyncio.run(second.run(self._context(2), None))
+
+        self.assertIs(first, second)
+        self.assertEqual(second.resets, 2)
+        self.assertEqual(second.iteration, 2)
+        self.assertEqual(pool.stats()["created"], 1)
+        self.assertEqual(pool.stats()["reused"], 1)
+
+    def test_plain_worker_keeps_per_cycle_construction(self):
+        pool = WorkerPool(size=2)
+        with pool.lease("plain_planner", PLANNER, self._context(1), config={}, db=self.db) as first:
+            pass
+        with pool.lease("plain_planner", PLANNER, self._context(2), config={}, db=self.db) as second:
+            pass
+
+        self.assertIsNot(first, second)
+        self.assertEqual(pool.stats()["created"], 2)
+        self.assertEqual(pool.stats()["reused"], 0)
+
+    def test_failed_run_discards_instance(self):
+        pool = WorkerPool(size=2)
+        context = self._context(1, fail=True)
+        with self.assertRaises(RuntimeError):
+            with pool.lease("pooled_planner", PLANNER, context, config={}, db=self.db) as worker:
+                asyncio.run(worker.run(context, None))
+        with pool.lease("pooled_planner", PLANNER, self._context(2), config={}, db=self.db) as fresh:
+            pass
+
+        self.assertIsNot(worker, fresh)
+        self.assertEqual(pool.stats()["discarded"], 1)
+
+    def test_idle_instances_bounded_by_slots(self):
+        pool = WorkerPool(size=2)
+        leases = [
+            pool.lease("pooled_planner", PLANNER, self._context(i), config={}, db=self.db)
+            for i in range(4)
+        ]
+        for lease in leases:
+            lease.__enter__()
+        for lease in leases:
+            lease.__exit__(None, None, None)
+
+        self.assertEqual(pool.stats()["idle"]["planner:pooled_planner"], 2)
+
+    @pytest.mark.benchmark
+    def test_benchmark_setup_overhead(self):
+        cycles = 50
+        pool = WorkerPool(size=4)
+        for label, name in (("before", "plain_planner"), ("after", "pooled_planner")):
+            created = pool.stats()["created"]
+            tracemalloc.start()
+            start = time.perf_counter()
+            for i in range(cycles):
+                with pool.lease(name, PLANNER, self._context(i), config={}, db=self.db):
+                    pass
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"[{label}] {cycles} cycles: setup {elapsed / cycles * 1e6:.1f}us/cycle, "
+                f"instances built {pool.stats()['created'] - created}, "
+                f"peak traced memory {peak / 1024:.1f}KiB"
+            )
+
+        self.assertEqual(pool.stats()["created"], cycles + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
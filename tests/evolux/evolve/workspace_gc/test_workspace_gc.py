@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the workspace garbage collector.
+"""
+
+import os
+import shutil
+import tarfile
+import tempfile
+import time
+import unittest
+import uuid
+
+from loongflow.framework.pes.workspace_gc import RETIRED_ARCHIVE, WorkspaceManager
+
+NUM_ITERATIONS = 30
+CANDIDATES = 4
+
+
+def touch(path: str, size: int, when: float) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+    os.utime(path, (when, when))
+
+
+class TestWorkspaceManager(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="workspace_gc_test_")
+        self.eval_root = os.path.join(self.root, "evaluator")
+        self.task = os.path.join(self.root, str(uuid.uuid4()))
+        now = time.time()
+        # Iteration i was last used i minutes after the first one
+        for i in range(1, NUM_ITERATIONS + 1):
+            when = now - 3600 + i * 60
+            executor = os.path.join(self.task, str(i), "executor")
+            touch(os.path.join(executor, "best_solution.py"), 100, when)
+            for c in range(CANDIDATES):
+                touch(os.path.join(executor, f"0_{c}", f"solution_{c}.py"), 100, when)
+            touch(os.path.join(self.task, str(i), "planner", "best_plan.txt"), 50, when)
+            for path, _, _ in os.walk(os.path.join(self.task, str(i))):
+                os.utime(path, (when, when))
+        for name, age in (("eval_old", 7200), ("eval_running", 5)):
+            touch(os.path.join(self.eval_root, name, "llm_code.py"), 100, now - age)
+        touch(os.path.join(self.root, "logs", "evolux.log"), 1000, now - 7200)
+        touch(os.path.join(self.root, "database", "checkpoint", "a.json"), 1000, now - 7200)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def iterations_on_disk(self) -> list[int]:
+        return sorted(int(name) for name in os.listdir(self.task) if name.isdigit())
+
+    def test_retention_policy(self):
+        manager = WorkspaceManager(
+            self.root,
+            self.eval_root,
+            keep_recent_iterations=5,
+            transient_grace_seconds=600,
+        )
+        before_bytes, before_inodes = manager.usage()
+
+        report = manager.collect(protected_iterations={3, 7, None})
+
+        self.assertEqual(self.iterations_on_disk(), [3, 7, 26, 27, 28, 29, 30])
+        self.assertEqual(os.listdir(self.eval_root), ["eval_running"])
+        self.assertEqual(report.removed_eval_dirs, 1)
+        self.assertEqual(len(report.retired_iterations), NUM_ITERATIONS - 7)
+        self.assertTrue(os.path.exists(os.path.join(self.root, "logs", "evolux.log")))
+        self.assertTrue(os.path.isdir(os.path.join(self.root, "database", "checkpoint")))
+
+        self.assertEqual(report.usage_bytes, before_bytes - report.reclaimed_bytes)
+        self.assertEqual(report.usage_inodes, before_inodes - report.reclaimed_inodes)
+        # executor, planner, the iteration and each candidate directory, 6 files
+        per_iteration = 3 + CANDIDATES + 2 + CANDIDATES
+        self.assertEqual(report.reclaimed_inodes, 23 * per_iteration + 2)
+        print(
+            f"Reclaimed {report.reclaimed_bytes} bytes and "
+            f"{report.reclaimed_inodes} inodes in {report.seconds * 1e3:.1f}ms"
+        )
+
+    def test_other_runs_are_left_alone(self):
+        other = os.path.join(self.root, str(uuid.uuid4()))
+        touch(os.path.join(other, "1", "executor", "best_solution.py"), 100, 0)
+        manager = WorkspaceManager(
+            self.root,
+            keep_recent_iterations=5,
+            max_bytes=1,
+            task_id=os.path.basename(self.task),
+        )
+
+        with self.assertLogs("loongflow.framework.pes.workspace_gc", "WARNING"):
+            report = manager.collect(protected_iterations={1})
+
+        self.assertEqual(self.iterations_on_disk(), [1])
+        self.assertNotIn(1, report.retired_iterations)
+        self.assertTrue(os.path.isdir(os.path.join(other, "1")))
+
+    def test_archive_retired_iterations(self):
+        manager = WorkspaceManager(
+            self.root, self.eval_root, keep_recent_iterations=20, archive_retired=True
+        )
+        before_bytes, _ = manager.usage()
+
+        report = manager.collect()
+
+        self.assertEqual(report.archived_iterations, list(range(1, 11)))
+        self.assertEqual(self.iterations_on_disk(), list(range(11, 31)))
+        with tarfile.open(os.path.join(self.task, RETIRED_ARCHIVE)) as tar:
+            names = tar.getnames()
+        self.assertIn("1/executor/0_3/solution_3.py", names)
+        self.assertIn("10/planner/best_plan.txt", names)
+        # Ten iterations of 13 inodes packed into a single file
+        self.assertEqual(report.reclaimed_inodes, 10 * 13 + 2 * 2 - 1)
+        self.assertEqual(report.usage_bytes, before_bytes - report.reclaimed_bytes)
+
+        # Later retirements are appended to the same archive
+        manager.keep_recent_iterations = 15
+        report = manager.collect()
+        self.assertEqual(report.archived_iterations, list(range(11, 16)))
+        with tarfile.open(os.path.join(self.task, RETIRED_ARCHIVE)) as tar:
+            self.assertIn("15/planner/best_plan.txt", tar.getnames())
+            self.assertIn("1/planner/best_plan.txt", tar.getnames())
+
+    def test_iterations_are_kept_when_archiving_fails(self):
+        manager = WorkspaceManager(
+            self.root, self.eval_root, keep_recent_iterations=20, archive_retired=True
+        )
+        archive = os.path.join(self.task, RETIRED_ARCHIVE)
+        with open(archive, "wb") as f:
+            f.write(b"not a tar archive" * 100)
+
+        with self.assertLogs(level="ERROR"):
+            report = manager.collect()
+
+        self.assertEqual(report.archived_iterations, [])
+        self.assertEqual(report.retired_iterations, [])
+        self.assertEqual(self.iterations_on_disk(), list(range(1, 31)))
+
+        # Retried on the next pass once the archive is usable
+        os.remove(archive)
+        report = manager.collect()
+        self.assertEqual(report.archived_iterations, list(range(1, 11)))
+        self.assertEqual(self.iterations_on_disk(), list(range(11, 31)))
+
+    def test_quota_evicts_least_recently_used(self):
+        manager = WorkspaceManager(self.root, self.eval_root, keep_recent_iterations=30)
+        usage, _ = manager.usage()
+        per_iteration = 100 + CANDIDATES * 100 + 50
+        # Room for all but eight iterations
+        manager.max_bytes = usage - 8 * per_iteration
+
+        report = manager.collect(protected_iterations={1, 2})
+
+        self.assertEqual(report.retired_iterations, list(range(3, 11)))
+        self.assertEqual(
+            report.evicted, [os.path.join(self.task, str(i)) for i in range(3, 11)]
+        )
+        self.assertLessEqual(report.usage_bytes, manager.max_bytes)
+        self.assertIn(1, self.iterations_on_disk())
+
+    def test_quota_never_evicts_protected(self):
+        manager = WorkspaceManager(
+            self.root, self.eval_root, keep_recent_iterations=0, max_bytes=1
+        )
+        with self.assertLogs("loongflow.framework.pes.workspace_gc", "WARNING"):
+            report = manager.collect(protected_iterations={5})
+
+        self.assertEqual(self.iterations_on_disk(), [5])
+        self.assertGreater(report.usage_bytes, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()